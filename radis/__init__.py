@@ -154,6 +154,88 @@ Parameters
 
     See more in  :py:meth:`radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
 
+"ADD_AT_ENGINE": "numba"
+    str: engine used to distribute the lines on the LDM grid.
+    ``"numba"`` computes the interpolation weights and adds the 8 contributions
+    of each line in a single pass, without temporary arrays of size
+    N (number of lines). ``"numpy"`` uses vectorized weights and ``np.add.at``.
+    The engine eventually used is stored in ``Spectrum.conditions['add_at_used']``
+    Default ``"numba"``
+
+    See more in  :py:func:`radis.lbl.broadening._add_at_LDM_jit`
+
+"LINESHAPE_CACHE": "factory"
+    str, or False: lineshape templates of the LDM are kept in a
+    least-recently-used cache and reused between spectra (ex: temperature
+    sweeps). If ``"factory"``, each :py:class:`~radis.lbl.factory.SpectrumFactory`
+    has its own cache. If ``"process"``, a single cache is shared by all factories.
+    If ``False``, templates are recalculated for each spectrum.
+    Default ``"factory"``
+
+    See more in  :py:class:`radis.lbl.broadening.LineshapeCache`
+
+"LINESHAPE_CACHE_SIZE": 100
+    float: memory budget (MB) of the lineshape cache.
+    Default ``100``
+
+"LINE_COLUMNS_CACHE": True
+    bool: per-line columns calculated by :py:class:`~radis.lbl.factory.SpectrumFactory`
+    (linestrength, populations, broadening HWHM, lineshift) are reused in
+    the next spectrum if the inputs they depend on are unchanged (ex: only
+    ``path_length`` changes, or only ``pressure`` : then the linestrength is
+    reused). The cache is cleared when a new line database is loaded; clear it
+    with ``sf._clear_columns_cache()`` if you modify the values of ``sf.df0``
+    manually. Default ``True``
+
+    See more in  :py:meth:`radis.lbl.base.BaseFactory._calc_cached_columns`
+
+"AUTOTUNE_FILE": "~/.radis_autotune.json"
+    str: file where the calibration of the broadening auto-tuner is stored.
+    The calibration is computed the first time ``optimization="auto"``,
+    ``broadening_method="auto"`` or ``chunksize="auto"`` is used in
+    :py:class:`~radis.lbl.factory.SpectrumFactory`, and recomputed if the
+    machine or the RADIS version change.
+    Default ``"~/.radis_autotune.json"``
+
+    See more in  :py:func:`radis.lbl.autotune.calibrate`
+
+"LINES_CACHE": True
+    bool: line databases loaded from the disk by
+    :py:meth:`~radis.lbl.loader.DatabankLoader.fetch_databank` and
+    :py:meth:`~radis.lbl.loader.DatabankLoader.load_databank` are kept in memory
+    and reused by the next factories of the Python process (ex: successive
+    :py:func:`~radis.lbl.calc.calc_spectrum` calls) if the database, molecule,
+    isotopes and columns are the same, the wavenumber range is within a
+    range already loaded, and the files were not modified since. Memory-mapped
+    databases (``'npy'`` engine) are not cached. Inspect the cache with ``radis.get_lines_cache().entries()``
+    and clear it with ``radis.clear_lines_cache()``. Default ``True``
+
+    See more in  :py:class:`radis.lbl.loader.LinesCache`
+
+"LINES_CACHE_SIZE": 500
+    float: memory budget (MB) of the line databases cache. Least recently
+    used databases are discarded first; larger databases are not cached.
+    Default ``500``
+
+"DATABASE_LOAD_N_JOBS": -1
+    int: number of threads used to read the files of line databases split in
+    several files (ex: HITEMP CO2 and H2O), with the ``'feather'``,
+    ``'parquet'`` and ``'npy'`` memory-mapping engines (PyTables is not
+    thread-safe : ``'pytables'`` files are always read sequentially). Follows
+    the :py:class:`joblib.Parallel` convention : ``-1`` uses all processors,
+    ``1`` reads the files sequentially. Default ``-1``
+
+    See more in  :py:meth:`radis.api.dbmanager.DatabaseManager.load`
+
+"PARQUET_ROW_GROUP_SIZE": 100000
+    int: number of lines per row group of line databases written with the
+    ``'parquet'`` memory-mapping engine. Lines are sorted by wavenumber, and
+    only the row groups overlapping the requested wavenumber range are read :
+    smaller row groups read fewer unnecessary lines, larger row groups compress
+    better. Default ``100000``
+
+    See more in  :py:meth:`radis.api.hdf5.DataFileManager.read_filter`
+
 "RESAMPLING_TOLERANCE_THRESHOLD" 5e-3
     an error if raises if areas do not match by a value above this threshold,
     during resampling. See :py:meth:`~radis.spectrum.spectrum.Spectrum.resample`
@@ -40,7 +40,7 @@ from datetime import date
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse as parse_date
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from numpy import DataSource
 
 LAST_VALID_DATE = (
@@ -63,6 +63,48 @@ def get_auto_MEMORY_MAPPING_ENGINE():
         return "vaex"
 
 
+def concat_columns(df_all):
+    """Concatenate the line databases ``df_all`` read from several files, column
+    by column, in arrays preallocated to the total number of lines.
+
+    Each DataFrame is released as soon as it is copied : the peak memory is
+    about the size of the output, instead of twice with :py:func:`pandas.concat`.
+    The index is reset.
+
+    Parameters
+    ----------
+    df_all: list of pandas DataFrame
+        with the same columns. Emptied on output.
+
+    Returns
+    -------
+    pandas DataFrame
+    """
+    columns = list(df_all[0].columns)
+    dtypes = {}
+    for c in columns:
+        if not all(
+            list(df.columns) == columns and isinstance(df[c].dtype, np.dtype)
+            for df in df_all
+        ):
+            # different columns, or extension dtypes (ex: categories)
+            return pd.concat(df_all, ignore_index=True)
+        dtypes[c] = np.result_type(*[df[c].dtype for df in df_all])
+
+    N = sum(len(df) for df in df_all)
+    # (pages are only allocated when written, in np.empty)
+    out = {c: np.empty(N, dtype=dtypes[c]) for c in columns}
+    start = 0
+    while df_all:
+        df = df_all.pop(0)
+        stop = start + len(df)
+        for c in columns:
+            out[c][start:stop] = df[c].to_numpy()
+        start = stop
+        del df
+    return pd.DataFrame(out, columns=columns, copy=False)
+
+
 # Add a zip opener to the datasource _file_openers
 def open_zip(zipname, mode="r", encoding=None, newline=None):
     output = BytesIO()
@@ -87,7 +129,7 @@ class DatabaseManager(object):
     molecule: str
     local_databases: str
         path to local database
-    engine: 'vaex', 'pytables', 'h5py', or 'default'
+    engine: 'vaex', 'pytables', 'h5py', 'parquet', 'npy', or 'default'
         memory-mapping library to use with this database. If 'default' use
         the value from ~/radis.json
 
@@ -95,7 +137,10 @@ class DatabaseManager(object):
     ----------------
     *input for :class:`~joblib.parallel.Parallel` loading of database*
     parallel: bool
-        if ``True``, use parallel loading.
+        if ``True``, use parallel loading. Files of a database split in several
+        files are also read in parallel threads by
+        :py:meth:`~radis.api.dbmanager.DatabaseManager.load` (except with the
+        ``'pytables'`` engine), see ``radis.config["DATABASE_LOAD_N_JOBS"]``.
         Default ``True``.
     nJobs: int
         Number of processors to use to load a database (useful for big
@@ -249,6 +294,12 @@ class DatabaseManager(object):
 
             if engine == "vaex":
                 local_files = [fname.replace(".h5", ".hdf5") for fname in local_files]
+            elif engine == "parquet":
+                local_files = [
+                    fname.replace(".h5", ".parquet") for fname in local_files
+                ]
+            elif engine == "npy":
+                local_files = [fname.replace(".h5", ".npydir") for fname in local_files]
 
         else:
             raise NotImplementedError
@@ -486,7 +537,16 @@ class DatabaseManager(object):
         within=[],
         output="pandas",
     ):
-        """
+        """Load the lines of all ``local_files`` in a single DataFrame.
+
+        With the ``'pytables'``, ``'feather'``, ``'parquet'`` and ``'npy'`` engines,
+        files are concatenated in preallocated columns with
+        :py:func:`~radis.api.dbmanager.concat_columns`. With the ``'feather'``,
+        ``'parquet'`` and ``'npy'`` engines they are read in parallel threads if
+        :py:attr:`parallel` (number of threads set by
+        ``radis.config["DATABASE_LOAD_N_JOBS"]``). PyTables is not thread-safe :
+        with the ``'pytables'`` engine files are read sequentially.
+
         Other Parameters
         ----------------
         columns: list of str
@@ -509,20 +569,41 @@ class DatabaseManager(object):
         """
         engine = self.engine
         mgr = self.get_datafile_manager()
-        if engine in ["pytables", "feather"]:
-            df_all = []
-            for local_file in local_files:
-                df_all.append(
-                    mgr.load(
-                        local_file,
-                        columns=columns,
-                        lower_bound=lower_bound,
-                        upper_bound=upper_bound,
-                        within=within,
-                        output=output,
+        if engine in ["pytables", "feather", "parquet", "npy"]:
+
+            def load_one_file(local_file):
+                return mgr.load(
+                    local_file,
+                    columns=columns,
+                    lower_bound=lower_bound,
+                    upper_bound=upper_bound,
+                    within=within,
+                    output=output,
+                )
+
+            n_jobs = 1
+            # (PyTables is not thread-safe : its files are read one after the other)
+            if self.parallel and len(local_files) > 1 and engine != "pytables":
+                from radis import config
+
+                n_jobs = min(
+                    effective_n_jobs(config["DATABASE_LOAD_N_JOBS"]), len(local_files)
+                )
+            if n_jobs > 1:
+                # File reading and decompression release the GIL : use threads
+                if self.verbose >= 2:
+                    print(
+                        f"Loading {len(local_files)} files in parallel ({n_jobs} threads)"
                     )
+                df_all = Parallel(n_jobs=n_jobs, prefer="threads")(
+                    delayed(load_one_file)(local_file) for local_file in local_files
                 )
-            return pd.concat(df_all)
+            else:
+                df_all = [load_one_file(local_file) for local_file in local_files]
+            if len(df_all) == 1:
+                # ex: 'npy' : return the memory-mapped columns directly (no copy)
+                return df_all[0]
+            return concat_columns(df_all)
 
         elif engine == "vaex":
             # vaex can open several files at the same time:
@@ -559,6 +640,14 @@ class DatabaseManager(object):
             nrows = len(df)
             df.close()
 
+        elif engine == "parquet":
+            import pyarrow.parquet as pq
+
+            nrows = pq.read_metadata(local_file).num_rows
+
+        elif engine == "npy":
+            nrows = self.get_datafile_manager()._read_npy_info(local_file)["nrows"]
+
         elif engine in ["h5py"]:
             raise NotImplementedError
         else:
@@ -3,13 +3,16 @@
 Defines the :py:class:`~radis.api.hdf5.DataFileManager` class
 """
 
+import json
 import os
 import pathlib
+import shutil
 import sys
-from os.path import abspath, exists, expanduser, splitext
+from os.path import abspath, exists, expanduser, isdir, join, splitext
 from time import time
 
 import h5py
+import numpy as np
 import pandas as pd
 from tables.exceptions import NoSuchNodeError
 
@@ -68,6 +71,83 @@ def update_pytables_to_vaex(fname, remove_initial=False, verbose=True, key="df")
     return fname_vaex
 
 
+SORT_COLUMNS = ["wav", "nu_lines"]
+"""list: columns by which 'parquet' and 'npy' line databases are sorted (first one
+found), so that each Parquet row group covers a narrow wavenumber range, and 'npy'
+columns can be sliced by binary search"""
+
+PARQUET_METADATA_KEY = b"radis_metadata"
+"""bytes: key of the RADIS metadata (JSON) in the schema metadata of 'parquet' files"""
+
+NPY_METADATA_FILE = "metadata.json"
+"""str: JSON file of 'npy' line databases (a directory with one .npy file per
+column), with the list of columns, number of rows, sort column, and RADIS metadata"""
+
+
+def _get_sort_column(columns):
+    """Return the column by which a 'parquet' or 'npy' line database is sorted,
+    or ``None``"""
+    for column in SORT_COLUMNS:
+        if column in columns:
+            return column
+    return None
+
+
+def _parquet_row_groups(metadata, lower_bound=[], upper_bound=[], within=[]):
+    """Return the row groups of a Parquet file that may contain rows within the
+    bounds, based on the min/max statistics of each row group (predicate
+    pushdown). Row groups without statistics are always kept.
+
+    Parameters
+    ----------
+    metadata: pyarrow.parquet.FileMetaData
+    lower_bound, upper_bound, within: list of tuples
+        see :py:meth:`~radis.api.hdf5.DataFileManager.read_filter`
+
+    Returns
+    -------
+    list of int
+    """
+    schema = metadata.schema.to_arrow_schema()
+
+    def get_stats(row_group, column):
+        if column not in schema.names:
+            return None
+        stats = row_group.column(schema.get_field_index(column)).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        return stats
+
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        keep = True
+        for column, lbound in lower_bound:
+            stats = get_stats(row_group, column)
+            if stats is not None and not stats.max > lbound:
+                keep = False
+        for column, ubound in upper_bound:
+            stats = get_stats(row_group, column)
+            if stats is not None and not stats.min < ubound:
+                keep = False
+        for column, withinv in within:
+            stats = get_stats(row_group, column)
+            if stats is not None and not any(
+                stats.min <= float(val) <= stats.max for val in withinv.split(",")
+            ):
+                keep = False
+        if keep:
+            row_groups.append(i)
+    return row_groups
+
+
+def _json_default(value):
+    """Convert Numpy scalars (and other non-JSON types) in metadata"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
 class HDF5Manager(object):
     def __init__(*args, **kwargs):
         raise DeprecationWarning("HDF5Manager replaced with DataFileManager")
@@ -86,6 +166,14 @@ class DataFileManager(object):
             'pytables' > Pandas's HDF5,  row-based
             'h5py'     > HDF5
             'feather'  > feather
+            'parquet'  > Parquet, column-based. Lines are sorted by wavenumber
+                         and stored in row groups of ``radis.config["PARQUET_ROW_GROUP_SIZE"]``
+                         lines : only the row groups overlapping the requested
+                         wavenumber range are read (see :py:meth:`~radis.api.hdf5.DataFileManager.read_filter`)
+            'npy'      > directory of .npy files (one per column), sorted by
+                         wavenumber. Columns are memory-mapped (copy-on-write)
+                         and sliced by binary search on the wavenumber : opening
+                         is independent of the database size
 
         Functions ::
 
@@ -190,30 +278,112 @@ class DataFileManager(object):
             if append == True:
                 # In vaex we cannot append. Here we write lots of small files then combine them.
                 # self.combine_temp_batch_files() should be called at the end.
-
-                # To start with, get an available temp file name :
-                base, ext = splitext(file)
-                i = 0
-                temp_batch_file = base + "_temp" + str(i).zfill(5) + ext
-                while temp_batch_file in self._temp_batch_files:
-                    i += 1
-                    temp_batch_file = base + "_temp" + str(i).zfill(5) + ext
-                file = temp_batch_file
-                # Check no remaining one from a non-cleaned previous run:
-                if exists(file):
-                    from radis.misc.printer import printr
-
-                    printr(f"Temp file {temp_batch_file} already exists: deleting it")
-                    os.remove(file)
+                file = self._get_temp_batch_file(file)
                 self._temp_batch_files.append(file)
             # Write:
             df.export_hdf5(file, group=key, mode="w")
         elif self.engine == "feather":
             df.to_feather(file)
+        elif self.engine == "parquet":
+            if append == True:
+                # Parquet files cannot be appended to. Here we write lots of small
+                # files then combine them.
+                # self.combine_temp_batch_files() should be called at the end.
+                file = self._get_temp_batch_file(file)
+                self._temp_batch_files.append(file)
+            self._write_parquet(file, df)
+        elif self.engine == "npy":
+            if append == True:
+                # write lots of small directories then combine them.
+                # self.combine_temp_batch_files() should be called at the end.
+                file = self._get_temp_batch_file(file)
+                self._temp_batch_files.append(file)
+            self._write_npy(file, df)
         else:
             raise NotImplementedError(self.engine)
             # h5py is not designed to write Pandas DataFrames
 
+    def _get_temp_batch_file(self, file):
+        """Get an available temp file name to write a batch of ``file``, and
+        delete remaining ones from a non-cleaned previous run"""
+        base, ext = splitext(file)
+        i = 0
+        temp_batch_file = base + "_temp" + str(i).zfill(5) + ext
+        while temp_batch_file in self._temp_batch_files:
+            i += 1
+            temp_batch_file = base + "_temp" + str(i).zfill(5) + ext
+        # Check no remaining one from a non-cleaned previous run:
+        if exists(temp_batch_file):
+            from radis.misc.printer import printr
+
+            printr(f"Temp file {temp_batch_file} already exists: deleting it")
+            if isdir(temp_batch_file):  # 'npy' engine
+                shutil.rmtree(temp_batch_file)
+            else:
+                os.remove(temp_batch_file)
+        return temp_batch_file
+
+    def _write_npy(self, file, df, metadata={}):
+        """Write ``df`` to a directory ``file`` with one .npy file per column,
+        sorted by wavenumber, and a JSON file with the list of columns and
+        ``metadata``. Text columns are stored as fixed-width strings (no pickle)
+        so that all columns can be memory-mapped."""
+        sort_column = _get_sort_column(df.columns)
+        if sort_column is not None:
+            df = df.sort_values(sort_column, kind="stable")
+        if exists(file):
+            shutil.rmtree(file)
+        os.makedirs(file)
+        for column in df.columns:
+            values = df[column].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            np.save(join(file, vaexsafe_colname(column) + ".npy"), values)
+        self._write_npy_info(
+            file,
+            {
+                "columns": list(df.columns),
+                "nrows": len(df),
+                "sort_column": sort_column,
+                "metadata": metadata,
+            },
+        )
+
+    def _write_npy_info(self, file, info):
+        with open(join(file, NPY_METADATA_FILE), "w") as f:
+            json.dump(info, f, default=_json_default)
+
+    def _read_npy_info(self, file):
+        with open(join(expanduser(file), NPY_METADATA_FILE)) as f:
+            return json.load(f)
+
+    def _write_parquet(self, file, df, metadata=None):
+        """Write ``df`` to a Parquet ``file``, sorted by wavenumber, in row groups
+        of ``radis.config["PARQUET_ROW_GROUP_SIZE"]`` lines with min/max statistics.
+        ``metadata`` is stored in the schema metadata"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from radis import config
+
+        sort_column = _get_sort_column(df.columns)
+        if sort_column is not None:
+            df = df.sort_values(sort_column, kind="stable")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if metadata is not None:
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    PARQUET_METADATA_KEY: json.dumps(metadata, default=_json_default),
+                }
+            )
+        pq.write_table(
+            table,
+            file,
+            row_group_size=config["PARQUET_ROW_GROUP_SIZE"],
+            write_statistics=True,
+        )
+
     def get_columns(self, local_file):
         """Get all columns (without loading all Dataframe)"""
         engine = self.engine
@@ -227,6 +397,12 @@ class DataFileManager(object):
         elif engine == "pytables":
             with pd.HDFStore(local_file, "r") as store:
                 columns = store.select("df", start=1, stop=1).columns
+        elif engine == "parquet":
+            import pyarrow.parquet as pq
+
+            columns = pq.read_schema(local_file).names
+        elif engine == "npy":
+            columns = self._read_npy_info(local_file)["columns"]
         elif engine in ["h5py"]:
             raise NotImplementedError
         else:
@@ -265,11 +441,133 @@ class DataFileManager(object):
             else:
                 df.export_hdf5(file, group=key, mode="w")
             df.close()
+        elif self.engine == "parquet":
+            if len(self._temp_batch_files) == 0:
+                if exists(file):
+                    return
+                raise ValueError(f"No batch temp files were written for {file}")
+            self._combine_parquet_batch_files(file)
+        elif self.engine == "npy":
+            if len(self._temp_batch_files) == 0:
+                if exists(file):
+                    return
+                raise ValueError(f"No batch temp files were written for {file}")
+            self._combine_npy_batch_files(file)
         self._close_temp_batch_files()
 
+    def _combine_npy_batch_files(self, file):
+        """Combine the 'npy' batch directories into ``file``, sorted by wavenumber.
+
+        Columns are copied batch after batch in memory-mapped .npy files if the
+        batches have the same columns and do not overlap in wavenumber (usual
+        case : line databases are parsed in increasing wavenumber order), else
+        all lines are loaded and sorted in memory.
+        """
+        batches = [(f, self._read_npy_info(f)) for f in self._temp_batch_files]
+        batches = [(f, info) for f, info in batches if info["nrows"] > 0]
+        if len(batches) == 0:
+            self._write_npy(file, pd.DataFrame())
+            return
+        info0 = batches[0][1]
+        columns, sort_column = info0["columns"], info0["sort_column"]
+
+        def load(f, column):
+            return np.load(join(f, vaexsafe_colname(column) + ".npy"), mmap_mode="r")
+
+        streamable = all(info["columns"] == columns for _, info in batches)
+        if streamable and sort_column is not None:
+            # sorted batches : order them by their first wavenumber
+            ranges = sorted(
+                (load(f, sort_column)[0], load(f, sort_column)[-1], f)
+                for f, _ in batches
+            )
+            streamable = all(r0[1] <= r1[0] for r0, r1 in zip(ranges[:-1], ranges[1:]))
+            batch_files = [r[2] for r in ranges]
+        else:
+            batch_files = [f for f, _ in batches]
+
+        if not streamable:
+            df = pd.concat([self._read_npy(f) for f in batch_files])
+            self._write_npy(file, df)
+            return
+
+        if exists(file):
+            shutil.rmtree(file)
+        os.makedirs(file)
+        nrows = sum(info["nrows"] for _, info in batches)
+        for column in columns:
+            arrays = [load(f, column) for f in batch_files]
+            dtype = np.result_type(*arrays)  # ex: strings of different widths
+            out = np.lib.format.open_memmap(
+                join(file, vaexsafe_colname(column) + ".npy"),
+                mode="w+",
+                dtype=dtype,
+                shape=(nrows,),
+            )
+            i = 0
+            for a in arrays:
+                out[i : i + len(a)] = a
+                i += len(a)
+            out.flush()
+            del out
+        self._write_npy_info(file, {**info0, "nrows": nrows})
+
+    def _combine_parquet_batch_files(self, file):
+        """Combine the Parquet batch files into ``file``, sorted by wavenumber.
+
+        Batches are streamed one by one if they have the same schema and their
+        wavenumber ranges do not overlap (usual case : line databases are parsed
+        in increasing wavenumber order), else all lines are loaded and sorted in
+        memory.
+        """
+        import pyarrow.parquet as pq
+
+        from radis import config
+
+        batch_files = self._temp_batch_files
+        schema = pq.read_schema(batch_files[0])
+        sort_column = _get_sort_column(schema.names)
+        same_schema = all(
+            pq.read_schema(f).equals(schema, check_metadata=False)
+            for f in batch_files[1:]
+        )
+        if sort_column is not None and same_schema:
+            # Get the wavenumber range of each batch, from the row group statistics
+            ranges = []
+            for f in batch_files:
+                metadata = pq.read_metadata(f)
+                i = metadata.schema.to_arrow_schema().get_field_index(sort_column)
+                stats = [
+                    metadata.row_group(j).column(i).statistics
+                    for j in range(metadata.num_row_groups)
+                ]
+                if any(s is None or not s.has_min_max for s in stats) or not stats:
+                    ranges = None
+                    break
+                ranges.append((min(s.min for s in stats), max(s.max for s in stats), f))
+            if ranges is not None:
+                ranges.sort(key=lambda r: r[0])
+                if all(r0[1] <= r1[0] for r0, r1 in zip(ranges[:-1], ranges[1:])):
+                    batch_files = [r[2] for r in ranges]
+                    sort_column = None  # already sorted
+
+        if sort_column is not None or not same_schema:
+            df = pd.concat([pq.read_table(f).to_pandas() for f in batch_files])
+            self._write_parquet(file, df)
+        else:
+            with pq.ParquetWriter(file, schema, write_statistics=True) as writer:
+                for f in batch_files:
+                    writer.write_table(
+                        pq.read_table(f),
+                        row_group_size=config["PARQUET_ROW_GROUP_SIZE"],
+                    )
+
     def _close_temp_batch_files(self):
         for i in range(len(self._temp_batch_files) - 1, -1, -1):
-            os.remove(self._temp_batch_files[i])
+            if isdir(self._temp_batch_files[i]):  # 'npy' engine
+                shutil.rmtree(self._temp_batch_files[i])
+            else:
+                os.remove(self._temp_batch_files[i])
             del self._temp_batch_files[i]
 
     def __del__(self):
@@ -372,7 +670,7 @@ class DataFileManager(object):
                 df = df
             else:
                 raise NotImplementedError(f"output {output} for engine {engine}")
-        elif engine == "feather":
+        elif engine in ["feather", "parquet", "npy"]:
             if output == "pandas":
                 df = df
             else:
@@ -503,11 +801,102 @@ class DataFileManager(object):
             fname = expanduser(fname)
             return pd.read_feather(fname)
 
+        elif self.engine == "parquet":
+            assert where is None
+            return self._read_parquet(fname, columns, **store_kwargs)
+
+        elif self.engine == "npy":
+            assert where is None
+            return self._read_npy(fname, columns, **store_kwargs)
+
         else:
             raise NotImplementedError(self.engine)
 
         return df
 
+    def _read_parquet(
+        self, fname, columns=None, lower_bound=[], upper_bound=[], within=[]
+    ):
+        """Read a Parquet file : only the requested ``columns`` (if they exist),
+        and only the row groups whose min/max statistics overlap the bounds.
+
+        Rows are not filtered here : see :py:meth:`~radis.api.hdf5.DataFileManager.read_filter`.
+        Columns used in the bounds are always loaded."""
+        import pyarrow.parquet as pq
+
+        fname = expanduser(fname)
+        pf = pq.ParquetFile(fname)
+        if columns is not None:
+            names = pf.schema_arrow.names
+            filter_columns = [c for c, _ in lower_bound + upper_bound + within]
+            columns = [
+                c
+                for c in names
+                if c in columns or c in filter_columns  # keep file order
+            ]
+        if lower_bound or upper_bound or within:
+            row_groups = _parquet_row_groups(
+                pf.metadata, lower_bound, upper_bound, within
+            )
+            table = pf.read_row_groups(row_groups, columns=columns)
+        else:
+            table = pf.read(columns=columns)
+        return table.to_pandas()
+
+    def _read_npy(self, fname, columns=None, lower_bound=[], upper_bound=[], within=[]):
+        """Open a 'npy' line database without copying : columns are
+        memory-mapped in copy-on-write mode (they can be modified in memory, the
+        files are never modified), and bounds on the sort column (``'wav'``) are
+        applied by binary search, as a slice. Other bounds are applied with a
+        boolean mask, which copies the selected lines only.
+
+        Only the requested ``columns`` (if they exist) are returned."""
+        fname = expanduser(fname)
+        info = self._read_npy_info(fname)
+        sort_column = info["sort_column"]
+        if columns is None:
+            columns = info["columns"]
+        else:
+            columns = [c for c in info["columns"] if c in columns]  # keep file order
+
+        def load(column):
+            return np.load(
+                join(fname, vaexsafe_colname(column) + ".npy"), mmap_mode="c"
+            )
+
+        # Slice with a binary search on the sorted column
+        start, stop = 0, info["nrows"]
+        mask_lower_bound, mask_upper_bound = [], []
+        for column, lbound in lower_bound:
+            if column == sort_column:
+                start = max(start, np.searchsorted(load(column), lbound, "right"))
+            else:
+                mask_lower_bound.append((column, lbound))
+        for column, ubound in upper_bound:
+            if column == sort_column:
+                stop = min(stop, np.searchsorted(load(column), ubound, "left"))
+            else:
+                mask_upper_bound.append((column, ubound))
+        stop = max(start, stop)
+
+        # Mask on the other columns (copies the selected lines)
+        b = True
+        for column, lbound in mask_lower_bound:
+            b &= load(column)[start:stop] > lbound
+        for column, ubound in mask_upper_bound:
+            b &= load(column)[start:stop] < ubound
+        for column, withinv in within:
+            b &= np.isin(
+                load(column)[start:stop], [float(val) for val in withinv.split(",")]
+            )
+
+        data = {}
+        for column in columns:
+            data[column] = load(column)[start:stop]
+            if b is not True:
+                data[column] = data[column][b]
+        return pd.DataFrame(data, copy=False)
+
     def read_filter(
         self,
         fname,
@@ -549,20 +938,42 @@ class DataFileManager(object):
             for column, withinv in within:
                 where.append(f"{column} in {withinv.split(',')}")
 
-        elif self.engine in ["vaex", "feather"]:
+        elif self.engine in ["vaex", "feather", "parquet"]:
             # Selection is done after opening the file time in vaex
             # see end of this function
             where = None
+        elif self.engine == "npy":
+            # Selection is done while opening the columns
+            return self._read_npy(
+                fname,
+                columns=columns,
+                lower_bound=lower_bound,
+                upper_bound=upper_bound,
+                within=within,
+                **store_kwargs,
+            )
         else:
             raise NotImplementedError(self.engine)
 
         # Load :
-        df = self.read(fname, columns=columns, where=where, **store_kwargs)
+        if self.engine == "parquet":
+            # only row groups overlapping the bounds are read from disk
+            df = self._read_parquet(
+                fname,
+                columns=columns,
+                lower_bound=lower_bound,
+                upper_bound=upper_bound,
+                within=within,
+                **store_kwargs,
+            )
+        else:
+            df = self.read(fname, columns=columns, where=where, **store_kwargs)
 
         #  Selection in vaex
-        if self.engine in ["vaex", "feather"]:
+        if self.engine in ["vaex", "feather", "parquet"]:
             # (note that in Vaex, the selection happens on disk whereas Feather
-            # is already loaded as a Pandas DataFrame in RAM)
+            # is already loaded as a Pandas DataFrame in RAM, and Parquet only
+            # the row groups that overlap the bounds)
 
             # Selection
             b = True
@@ -575,10 +986,17 @@ class DataFileManager(object):
                 for val in withinv.split(","):
                     b2 += df[column] == float(val)
                 b *= b2
-            if b is not True and False in b:
-                df = df[
-                    b
-                ].extract()  # note in Vaex mode, this is a vaex Expression, not the DataFrame yet
+            if self.engine == "vaex":
+                if b is not True and False in b:
+                    df = df[
+                        b
+                    ].extract()  # note in Vaex mode, this is a vaex Expression, not the DataFrame yet
+            elif b is not True:
+                # (on a pandas Series, `False in b` would look in the index)
+                df = df[b]
+            if self.engine == "parquet" and columns is not None:
+                # drop the columns only loaded for the selection
+                df = df[[c for c in df.columns if c in columns]]
 
         return df
 
@@ -596,6 +1014,10 @@ class DataFileManager(object):
             return pathlib.Path(fname).with_suffix(".hdf5")
         elif self.engine == "feather":
             return pathlib.Path(fname).with_suffix(".feather")
+        elif self.engine == "parquet":
+            return pathlib.Path(fname).with_suffix(".parquet")
+        elif self.engine == "npy":
+            return pathlib.Path(fname).with_suffix(".npydir")
         else:
             raise ValueError(self.engine)
 
@@ -673,6 +1095,34 @@ class DataFileManager(object):
                     else:
                         hf[key].attrs.update(_h5_compatible(metadata))
 
+        elif self.engine == "parquet":
+            # Parquet metadata is stored in the file footer, which cannot be
+            # modified in place : row groups are copied to a new file
+            import pyarrow.parquet as pq
+
+            fname = expanduser(fname)
+            metadata = {**self.read_metadata(fname), **metadata}
+            pf = pq.ParquetFile(fname)
+            schema = pf.schema_arrow.with_metadata(
+                {
+                    **(pf.schema_arrow.metadata or {}),
+                    PARQUET_METADATA_KEY: json.dumps(metadata, default=_json_default),
+                }
+            )
+            temp_file = fname + ".tmp"
+            with pq.ParquetWriter(temp_file, schema, write_statistics=True) as writer:
+                for i in range(pf.num_row_groups):  # keep the same row groups
+                    writer.write_table(
+                        pf.read_row_group(i).replace_schema_metadata(schema.metadata)
+                    )
+            pf.close()
+            os.replace(temp_file, fname)
+
+        elif self.engine == "npy":
+            info = self._read_npy_info(fname)
+            info["metadata"].update(metadata)
+            self._write_npy_info(expanduser(fname), info)
+
         else:
             raise NotImplementedError(self.engine)
 
@@ -705,6 +1155,18 @@ class DataFileManager(object):
         elif self.engine == "feather":
             return {}  # no metadata
 
+        elif self.engine == "parquet":
+            import pyarrow.parquet as pq
+
+            schema_metadata = pq.read_schema(expanduser(fname)).metadata or {}
+            if PARQUET_METADATA_KEY in schema_metadata:
+                metadata = json.loads(schema_metadata[PARQUET_METADATA_KEY])
+            else:
+                metadata = {}
+
+        elif self.engine == "npy":
+            metadata = self._read_npy_info(fname)["metadata"]
+
         elif self.engine == "h5py":
             fname = expanduser(fname)
             if key == "default":
@@ -762,7 +1224,7 @@ class DataFileManager(object):
 
         if self.engine == "vaex":
             return vaex.array_types.to_numpy(df)
-        elif self.engine == "feather":
+        elif self.engine in ["feather", "parquet", "npy"]:
             return df.to_numpy()
         else:
             raise NotImplementedError(self.engine)
@@ -788,6 +1250,12 @@ class DataFileManager(object):
         """
         if file.endswith(".feather"):
             engine = "feather"
+        elif file.endswith(".parquet"):
+            engine = "parquet"
+        elif isdir(expanduser(file)) and exists(
+            join(expanduser(file), NPY_METADATA_FILE)
+        ):
+            engine = "npy"
         else:
             # See if it looks like PyTables
             import tables
@@ -813,7 +1281,7 @@ class DataFileManager(object):
         if self.engine == "vaex":
             b = column.isnan()  # TODO: check if can be made faster?
             return b.sum() > 0
-        elif self.engine in ["pytables", "feather"]:
+        elif self.engine in ["pytables", "feather", "parquet", "npy"]:
             return column.hasnans
         else:
             raise NotImplementedError(self.engine)
@@ -850,9 +1318,11 @@ def hdf2df(
     ----------------
     store_kwargs: dict
         arguments forwarded to :py:meth:`~pandas.io.pytables.read_hdf`
-    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'auto'``
+    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'parquet'``, ``'npy'``, ``'auto'``
         which HDF5 library to use. If ``'guess'``, try to guess. Note: ``'vaex'``
-        uses ``'h5py'`` compatible HDF5.
+        uses ``'h5py'`` compatible HDF5. With ``'parquet'``, only the row groups
+        overlapping ``load_wavenum_min, load_wavenum_max`` are read. With ``'npy'``,
+        columns are memory-mapped and sliced without copying.
     output: 'pandas', 'vaex', 'jax'
         format of the output DataFrame. If ``'jax'``, returns a dictionary of
         jax arrays.
@@ -1447,6 +1447,10 @@ class HITRANDatabaseManager(DatabaseManager):
             return [join(self.local_databases, f"{self.molecule}.hdf5")]
         elif self.engine == "pytables":
             return [join(self.local_databases, f"{self.molecule}.h5")]
+        elif self.engine == "parquet":
+            return [join(self.local_databases, f"{self.molecule}.parquet")]
+        elif self.engine == "npy":
+            return [join(self.local_databases, f"{self.molecule}.npydir")]
         else:
             raise NotImplementedError()
 
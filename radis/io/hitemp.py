@@ -64,8 +64,11 @@ def fetch_hitemp(
         if ``True`` clean downloaded cache files after HDF5 are created.
     return_local_path: bool
         if ``True``, also returns the path of the local database file.
-    engine: 'pytables', 'vaex', 'default'
-        which HDF5 library to use to parse local files. If 'default' use the value from ~/radis.json
+    engine: 'pytables', 'vaex', 'parquet', 'npy', 'default'
+        which HDF5 library to use to parse local files. If 'default' use the value from ~/radis.json.
+        With 'parquet', lines are stored in row groups sorted by wavenumber, and
+        only the row groups overlapping ``load_wavenum_min, load_wavenum_max`` are read.
+        With 'npy', columns are memory-mapped and sliced without copying
     output: 'pandas', 'vaex', 'jax'
         format of the output DataFrame. If ``'jax'``, returns a dictionary of
         jax arrays. If ``'vaex'``, output is a :py:class:`vaex.dataframe.DataFrameLocal`
@@ -35,6 +35,12 @@ def npy2df(keywords, verbose=True):
           'El':'PATH/TO/Tdpair.npy'}
 
     See definitions for instance in :py:data:`~radis.api.hitranapi.column_2004`
+
+    See Also
+    --------
+    The ``'npy'`` engine of :py:class:`~radis.api.hdf5.DataFileManager` stores
+    line databases as a directory of memory-mapped .npy columns, sliced by
+    wavenumber without copying.
     """
 
     database = keywords  # this has to change. Now database should be a dictionary (cf Example) # TODO
@@ -3,9 +3,18 @@
 """
 
 # prevent cyclic imports:
-from . import bands, base, broadening, calc, factory, labels, loader, overp
+from . import autotune, bands, base, broadening, calc, factory, labels, loader, overp
+from .broadening import warmup
 from .calc import calc_spectrum
 from .factory import SpectrumFactory
+from .loader import clear_lines_cache, get_lines_cache
 from .overp import LevelsList
 
-__all__ = ["LevelsList", "SpectrumFactory", "calc_spectrum"]
+__all__ = [
+    "LevelsList",
+    "SpectrumFactory",
+    "calc_spectrum",
+    "clear_lines_cache",
+    "get_lines_cache",
+    "warmup",
+]
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Summary
+-------
+
+Self-calibrating choice of the line broadening configuration, used when
+``optimization``, ``broadening_method`` or ``chunksize`` are ``"auto"`` in
+:py:class:`~radis.lbl.factory.SpectrumFactory`.
+
+The broadening step is timed once on this machine, on synthetic lines (see
+:py:func:`~radis.lbl.autotune.calibrate`). The calibration is stored in the
+file ``radis.config["AUTOTUNE_FILE"]`` (default ``~/.radis_autotune.json``)
+and used for every spectrum to predict the time of each configuration from the
+number of lines, the number of spectral points and the size of the LDM
+grid (see :py:func:`~radis.lbl.autotune.predict_broadening_time`). The
+fastest configuration that fits in the available memory is chosen in
+:py:meth:`~radis.lbl.broadening.BroadenFactory._autotune_broadening`.
+
+Routine Listing
+---------------
+
+- :py:func:`~radis.lbl.autotune.calibrate`
+- :py:func:`~radis.lbl.autotune.get_calibration`
+- :py:func:`~radis.lbl.autotune.predict_broadening_time`
+- :py:func:`~radis.lbl.autotune.predict_broadening_memory`
+- :py:func:`~radis.lbl.autotune.get_sparse_points`
+
+----------
+"""
+
+import json
+import os
+import platform
+from time import perf_counter
+from warnings import warn
+
+import numpy as np
+from scipy.optimize import nnls
+
+import radis
+
+# Calibration loaded in this process (read from the calibration file once)
+_calibration = None
+
+
+def _get_machine():
+    """Returns what the calibration depends on : it is recomputed if any of
+    these change"""
+    import numba
+
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numba": numba.__version__,
+        "radis": radis.__version__,
+    }
+
+
+def _get_calibration_file():
+    return os.path.expanduser(radis.config["AUTOTUNE_FILE"])
+
+
+def _get_model(optimization, broadening_method, sparse_ldm):
+    """Name of the time model of a configuration, in the calibration"""
+    if optimization is None:
+        return "lbl_faddeeva" if broadening_method == "faddeeva" else "lbl_voigt"
+    if broadening_method == "fft":
+        return "ldm_fft"
+    return "ldm_voigt_sparse" if sparse_ldm else "ldm_voigt"
+
+
+def get_sparse_points(wL_dat, wG_dat, dxL, dxG, Ngrid, Nbroad):
+    """Expected number of spectral points convolved with the sparse LDM (sum
+    over all LDM cells of the points covered by the lines of the cell and
+    their wings), assuming the lines of a cell are spread uniformly over the
+    spectral range.
+
+    Parameters
+    ----------
+    wL_dat, wG_dat: array
+        Lorentzian and Gaussian FWHM of the lines
+    dxL, dxG: float
+        steps of the logarithmic LDM grid. See
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._init_LDM_axis`
+    Ngrid, Nbroad: int
+        number of points of the spectral range, and of the lineshapes
+    """
+    valid = (wL_dat > 0) & (wG_dat > 0)
+    iL = np.round(np.log(wL_dat[valid]) / dxL).astype(np.int64)
+    iG = np.round(np.log(wG_dat[valid]) / dxG).astype(np.int64)
+    if len(iL) == 0:
+        return 0
+    cells = (iG - iG.min()) * (iL.max() - iL.min() + 1) + (iL - iL.min())
+    Nlines_cells = np.bincount(cells)
+    Nlines_cells = Nlines_cells[Nlines_cells > 0]
+    # each line is distributed on the 4 closest cells
+    return int(4 * (Ngrid * -np.expm1(-Nlines_cells * Nbroad / Ngrid)).sum())
+
+
+def _get_features(optimization, broadening_method, sparse_ldm, size):
+    """Complexity terms of the time model of a configuration. The time is a
+    linear combination of these terms, with coefficients measured by
+    :py:func:`~radis.lbl.autotune.calibrate`"""
+    Nlines, Ngrid, Nbroad, NwGL, Nfft, Nsparse = size
+    if optimization is None:
+        return [Nlines * Nbroad]
+    if broadening_method == "fft":
+        return [Nlines, NwGL * Nfft * np.log2(Nfft)]
+    if sparse_ldm:
+        Npoints = min(Nsparse, NwGL * Ngrid)
+    else:
+        Npoints = NwGL * Ngrid
+    return [Nlines, (Npoints + NwGL * Nbroad) * np.log2(max(Nbroad, 2))]
+
+
+def predict_broadening_time(
+    optimization, broadening_method, sparse_ldm, size, calibration=None
+):
+    """Predicts the time of the line broadening step of a configuration
+
+    Parameters
+    ----------
+    optimization: ``"simple"``, ``"min-RMS"``, ``None``
+    broadening_method: ``"voigt"``, ``"faddeeva"``, ``"convolve"``, ``"fft"``
+    sparse_ldm: bool
+        see :py:class:`~radis.lbl.factory.SpectrumFactory`
+    size: tuple
+        ``(Nlines, Ngrid, Nbroad, NwGL, Nfft, Nsparse)`` : number of lines, of
+        points of the calculation spectral range, of the lineshapes (truncation
+        range), of LDM cells (``NwG x NwL``), of points of the LDM with
+        ``broadening_method='fft'``, and of points convolved with the sparse LDM
+        (see :py:func:`~radis.lbl.autotune.get_sparse_points`)
+    calibration: dict, or ``None``
+        if ``None``, use :py:func:`~radis.lbl.autotune.get_calibration`
+
+    Returns
+    -------
+    float: predicted time (s)
+    """
+    if calibration is None:
+        calibration = get_calibration()
+    coefs = calibration["models"][
+        _get_model(optimization, broadening_method, sparse_ldm)
+    ]
+    time = float(
+        np.dot(coefs, _get_features(optimization, broadening_method, sparse_ldm, size))
+    )
+    if optimization is not None and broadening_method == "faddeeva":
+        # LDM templates are calculated with the exact Voigt profile
+        NwGL, Nbroad = size[3], size[2]
+        models = calibration["models"]
+        time += max(models["lbl_faddeeva"][0] - models["lbl_voigt"][0], 0) * (
+            NwGL * Nbroad
+        )
+    return time
+
+
+def predict_broadening_memory(
+    optimization, broadening_method, sparse_ldm, size, itemsize=8
+):
+    """Predicts the memory (bytes) of the line broadening step of a configuration,
+    on top of the line database.
+
+    Parameters
+    ----------
+    optimization, broadening_method, sparse_ldm, size:
+        see :py:func:`~radis.lbl.autotune.predict_broadening_time`
+    itemsize: int
+        size of the LDM floats (see ``precision`` in
+        :py:class:`~radis.lbl.factory.SpectrumFactory`)
+
+    Returns
+    -------
+    int: memory (bytes). Line-by-line broadening with the lineshape matrix
+    (``broadening_method='convolve'``) can be split in chunks of lines : see
+    ``chunksize`` in :py:class:`~radis.lbl.factory.SpectrumFactory`
+    """
+    Nlines, Ngrid, Nbroad, NwGL, Nfft, Nsparse = size
+    if optimization is None:
+        if broadening_method == "convolve":
+            return 3 * 8 * Nlines * Nbroad  # lineshape matrix
+        return 8 * Ngrid
+    if broadening_method == "fft":
+        # LDM, its Fourier transform, and the templates in Fourier space
+        return int((itemsize + 16) * Nfft * NwGL)
+    if sparse_ldm:
+        return 8 * min(Nsparse, NwGL * Ngrid) + 160 * Nlines
+    return itemsize * (Ngrid + 2) * NwGL
+
+
+def _time_broadening(optimization, broadening_method, sparse_ldm, Nlines, span):
+    """Time the line broadening of ``Nlines`` synthetic lines whose Lorentzian
+    and Gaussian widths spread over a ratio ``span``, with a configuration.
+
+    Returns the time and the ``size`` of the problem (see
+    :py:func:`~radis.lbl.autotune.predict_broadening_time`)"""
+    import pandas as pd
+
+    from radis.lbl.broadening import olivero_1977
+    from radis.lbl.factory import SpectrumFactory
+
+    wmin, wstep = 2000, 0.002
+    sf = SpectrumFactory(
+        wmin,
+        wmin + 10000 * wstep,
+        molecule="CO",
+        wstep=wstep,
+        truncation=None if broadening_method == "fft" else 1,
+        neighbour_lines=0,
+        optimization=optimization,
+        broadening_method=broadening_method,
+        verbose=0,
+        warnings={"AccuracyWarning": "ignore", "PerformanceWarning": "ignore"},
+    )
+    sf._lineshape_cache = None  # time the calculation of templates too
+    sf._reset_profiler(0)
+    sf._reset_references()
+    sf.profiler.start("autotune_calibration", 1)
+    sf.dataframe_type = "pandas"
+    sf.params.sparse_ldm = sf._sparse_ldm = sparse_ldm
+
+    rng = np.random.default_rng(0)
+    hwhm_lorentz = 0.01 * np.exp(rng.uniform(0, np.log(span), Nlines))
+    hwhm_gauss = 0.01 * np.exp(rng.uniform(0, np.log(span), Nlines))
+    df = pd.DataFrame(
+        {
+            "shiftwav": np.sort(rng.uniform(wmin, wmin + 10000 * wstep, Nlines)),
+            "S": rng.lognormal(0, 1, Nlines),
+            "hwhm_lorentz": hwhm_lorentz,
+            "hwhm_gauss": hwhm_gauss,
+            "hwhm_voigt": olivero_1977(2 * hwhm_gauss, 2 * hwhm_lorentz) / 2,
+        }
+    )
+    sf.df1 = df
+    sf._generate_wavenumber_arrays(checks=False)
+
+    t0 = perf_counter()
+    sf._calc_broadening(df)
+    time = perf_counter() - t0
+
+    Ngrid, Nbroad = len(sf.wavenumber_calc), len(sf.wbroad_centered)
+    NwGL = sf.NwG * sf.NwL if optimization is not None else 0
+    Nfft = sf._get_fft_length() if broadening_method == "fft" else 0
+    Nsparse = get_sparse_points(
+        2 * hwhm_lorentz, 2 * hwhm_gauss, sf.params.dxL, sf.params.dxG, Ngrid, Nbroad
+    )
+    return time, (Nlines, Ngrid, Nbroad, NwGL, Nfft, Nsparse)
+
+
+def calibrate(save=True, verbose=True):
+    """Time the line broadening step of all configurations on this machine,
+    and fit the coefficients of their time models (see
+    :py:func:`~radis.lbl.autotune.predict_broadening_time`). Takes a few seconds.
+
+    Parameters
+    ----------
+    save: bool
+        if ``True``, store the calibration in ``radis.config["AUTOTUNE_FILE"]``
+        (default ``~/.radis_autotune.json``), where it is read by the next sessions.
+    verbose: bool
+
+    Returns
+    -------
+    calibration: dict
+        ``{"machine": ..., "models": {name: coefficients}}``
+
+    Examples
+    --------
+    Recalibrate, for instance after a hardware change ::
+
+        from radis.lbl.autotune import calibrate
+        calibrate()
+
+    See Also
+    --------
+    :py:func:`~radis.lbl.autotune.get_calibration`
+    """
+    global _calibration
+
+    if verbose:
+        print("Calibrating the broadening auto-tuner on this machine...")
+
+    # (configuration, [(number of lines, width span), ...]) : the runs of each
+    # model make either the term in lines or the term in LDM cells dominate
+    runs = {
+        "lbl_voigt": ((None, "voigt", False), [(2000, 1)]),
+        "lbl_faddeeva": ((None, "faddeeva", False), [(500, 1)]),
+        "ldm_voigt": (("simple", "voigt", False), [(100000, 1.5), (1000, 20)]),
+        "ldm_voigt_sparse": (("simple", "voigt", True), [(100000, 1.5), (1000, 20)]),
+        "ldm_fft": (("simple", "fft", False), [(100000, 1.5), (1000, 20)]),
+    }
+
+    models = {}
+    for model, (config, sizes) in runs.items():
+        _time_broadening(*config, 100, 1.5)  # compile & load kernels first
+        features, times = [], []
+        for Nlines, span in sizes:
+            time, size = min(_time_broadening(*config, Nlines, span) for _ in range(2))
+            features.append(_get_features(*config, size))
+            times.append(time)
+        models[model] = list(nnls(np.array(features), np.array(times))[0])
+        if verbose >= 2:
+            print(f"... {model}: {models[model]}")
+
+    calibration = {"machine": _get_machine(), "models": models}
+    _calibration = calibration
+
+    if save:
+        try:
+            with open(_get_calibration_file(), "w") as f:
+                json.dump(calibration, f, indent=4)
+        except OSError as err:
+            warn(
+                f"Auto-tuner calibration could not be saved ({err}). It will be "
+                + "recomputed in the next session"
+            )
+        else:
+            if verbose:
+                print(f"Calibration saved in {_get_calibration_file()}")
+
+    return calibration
+
+
+def get_calibration(verbose=True):
+    """Returns the calibration of the auto-tuner : read from
+    ``radis.config["AUTOTUNE_FILE"]``, or computed with
+    :py:func:`~radis.lbl.autotune.calibrate` if the file does not exist or
+    was generated on another machine or version.
+
+    Parameters
+    ----------
+    verbose: bool
+        print a message if the calibration is computed
+    """
+    global _calibration
+
+    if _calibration is not None:
+        return _calibration
+
+    try:
+        with open(_get_calibration_file()) as f:
+            calibration = json.load(f)
+    except (OSError, ValueError):
+        calibration = None
+    if calibration is not None and calibration.get("machine") == _get_machine():
+        _calibration = calibration
+        return calibration
+
+    return calibrate(save=True, verbose=verbose)
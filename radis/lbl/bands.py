@@ -947,18 +947,9 @@ class BandFactory(BroadenFactory):
         for i, (band, dg) in enumerate(gb):
             if optimization in ("simple", "min-RMS"):
                 line_profile_LDM, wL, wG, wL_dat, wG_dat = self._calc_lineshape_LDM(dg)
-                (wavenumber, absorption) = self._apply_lineshape_LDM(
-                    dg.S.values,
-                    line_profile_LDM,
-                    dg.shiftwav.values,
-                    wL,
-                    wG,
-                    wL_dat,
-                    wG_dat,
-                    optimization,
-                )
-                (_, emission) = self._apply_lineshape_LDM(
-                    dg.Ei.values,
+                # absorption and emission distributed on the same LDM
+                (wavenumber, (absorption, emission)) = self._apply_lineshape_LDM(
+                    np.array([dg.S.values, dg.Ei.values]),
                     line_profile_LDM,
                     dg.shiftwav.values,
                     wL,
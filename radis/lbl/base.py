@@ -48,6 +48,14 @@ PRIVATE METHODS - APPLY ENVIRONMENT PARAMETERS
 - :py:meth:`radis.lbl.base.BaseFactory.calc_emission_integral`
 - :py:meth:`radis.lbl.base.BaseFactory._cutoff_linestrength`
 
+Precompiled per-line kernels (all isotopes in a single pass, see
+:py:func:`~radis.lbl.base.get_isotope_lookup`):
+
+- :py:func:`radis.lbl.base._linestrength_eq_jit` : equilibrium linestrength
+- :py:func:`radis.lbl.base._linestrength_eq_batch_jit` : equilibrium linestrength
+  at several temperatures
+- :py:func:`radis.lbl.base._emission_integral_jit` : emission integral
+
 Most methods are written in inherited class with the following inheritance scheme:
 
 :py:class:`~radis.lbl.loader.DatabankLoader` > :py:class:`~radis.lbl.base.BaseFactory` >
@@ -65,9 +73,12 @@ Most methods are written in inherited class with the following inheritance schem
 """
 # TODO: move all CDSD dependant functions _add_Evib123Erot to a specific file for CO2.
 
+import numba
 import numpy as np
 import pandas as pd
 from astropy import units as u
+from joblib import effective_n_jobs
+from numba import float64, int64, jit, prange, types, void
 from numpy import exp, pi
 from psutil import virtual_memory
 
@@ -83,15 +94,15 @@ except ImportError:  # if ran from here
     from radis.lbl.loader import KNOWN_LVLFORMAT, DatabankLoader, df_metadata
 
 from radis.misc.arrays import anynan, anynan_vaex
-from radis.misc.basics import all_in, is_float, transfer_metadata
+from radis.misc.basics import all_in, flatten, is_float, transfer_metadata
 from radis.misc.debug import printdbg
 from radis.misc.log import printwarn
 from radis.misc.plot import fix_style, set_style
 from radis.misc.printer import printg
 from radis.misc.utils import Default, NotInstalled, not_installed_vaex_args
 from radis.misc.warning import OutOfBoundError
-from radis.phys.constants import c_CGS, h_CGS, hc_k
-from radis.phys.convert import cm2J, cm2J_vaex, nm2cm, nm_air2cm
+from radis.phys.constants import c, c_CGS, h, h_CGS, hc_k
+from radis.phys.convert import cm2J_vaex, nm2cm, nm_air2cm
 from radis.phys.units_astropy import convert_and_strip_units
 from radis.spectrum.utils import print_conditions
 
@@ -187,6 +198,13 @@ class BaseFactory(DatabankLoader):
         # so far continuum is not exported by default because rescale functions
         # are not defined yet. #TODO
 
+        # Per-line columns of the previous spectrum, reused if their inputs
+        # are unchanged (see _calc_cached_columns)
+        self._columns_cache = {} if radis.config["LINE_COLUMNS_CACHE"] else None
+
+        # Lines sorted by linestrength (see _get_linestrength_order)
+        self._cutoff_order = None
+
     # %% ======================================================================
     # PUBLIC METHODS
     # ------------------------
@@ -2035,12 +2053,15 @@ class BaseFactory(DatabankLoader):
 
         return None  # dataframe updated directly
 
-    def get_lines_abundance(self, df):
+    def get_lines_abundance(self, df, per_isotope=False):
         """Returns the isotopic abundance of each line in `df`
 
         Parameters
         ----------
         df: dataframe
+        per_isotope: bool
+            if ``True``, return a dictionary ``{iso: abundance}`` instead of a
+            column, if there are several isotopes (see :py:func:`~radis.lbl.base.get_isotope_lookup`)
 
         Returns
         -------
@@ -2073,6 +2094,8 @@ class BaseFactory(DatabankLoader):
                 abundance_dict = {}
                 for iso in iso_set:
                     abundance_dict[iso] = molpar.get(df.attrs["id"], iso, "abundance")
+                if per_isotope:
+                    return abundance_dict
                 return df["iso"].map(abundance_dict)
         else:
             iso = df.attrs["iso"]
@@ -2277,9 +2300,50 @@ class BaseFactory(DatabankLoader):
 
         self.profiler.start("calc_lineshift", 2)
 
+        # Calculate
+        if (
+            self.input.isatom
+            or self.dataframe_type != "pandas"
+            or "shiftwav" not in self.df1.columns
+        ):
+            self._calc_cached_columns(
+                "calc_lineshift",
+                self._get_lineshift_inputs(),
+                self._add_shiftwav,
+                self.df1,
+            )
+        # ... else : already calculated in the same pass as the broadening HWHM,
+        # ... or reused (see BroadenFactory._add_broadening_HWHM_fused)
         df = self.df1
 
-        # Calculate
+        # Sorted lines is needed for sparse wavenumber range algorithm.
+        if self.dataframe_type == "pandas":
+            # (sorting copies all columns : skip if lines are already sorted)
+            if not df.shiftwav.is_monotonic_increasing:
+                df.sort_values("shiftwav", kind="mergesort", inplace=True)
+        elif self.dataframe_type == "vaex":
+            attrs = df.attrs
+            self.df1 = df.sort("shiftwav")
+            self.df1.attrs = attrs
+
+        self.profiler.stop("calc_lineshift", "Calculated lineshift")
+
+        return
+
+    def _get_lineshift_inputs(self):
+        """Returns all inputs the shifted line positions depend on, apart from
+        the line database : ``shiftwav`` calculated for a previous spectrum is
+        reused if they are unchanged (see :py:meth:`~radis.lbl.base.BaseFactory._calc_cached_columns`).
+        Returns ``None`` for atoms, whose shifts depend on the broadening HWHM
+        and are always recalculated"""
+        if self.input.isatom:
+            return None
+        return (self.input.pressure,)
+
+    def _add_shiftwav(self, df):
+        """Add the shifted line positions ``shiftwav`` to ``df``, see
+        :py:meth:`~radis.lbl.base.BaseFactory.calc_lineshift`"""
+
         air_pressure = self.input.pressure / 1.01325  # convert from bar to atm
 
         if self.input.isatom:
@@ -2297,18 +2361,6 @@ class BaseFactory(DatabankLoader):
             )
             df["shiftwav"] = df.wav
 
-        # Sorted lines is needed for sparse wavenumber range algorithm.
-        if self.dataframe_type == "pandas":
-            df.sort_values("shiftwav", kind="mergesort", inplace=True)
-        elif self.dataframe_type == "vaex":
-            attrs = df.attrs
-            self.df1 = df.sort("shiftwav")
-            self.df1.attrs = attrs
-
-        self.profiler.stop("calc_lineshift", "Calculated lineshift")
-
-        return
-
     def calc_S0(self, df):
         """Calculate S0 from A [s-1], the tabulated Einstein coefficient. S0 is
         the part of the linestrength that does not depend on the temperature.
@@ -2470,10 +2522,11 @@ class BaseFactory(DatabankLoader):
             df1.attrs["Q"] = Q
             return Q
 
-    def Qref_Qgas_ratio(self, df1, Tgas, Tref):
+    def Qref_Qgas_ratio(self, df1, Tgas, Tref, per_isotope=False):
         """Calculate Qref/Qgas at temperature ``Tgas``, ``Tref``, for all lines
         of ``df1``. Returns a single value if all lines have the same Qref/Qgas ratio,
-        or a column if they are different
+        or a column if they are different (a dictionary ``{iso: Qref/Qgas}`` if
+        ``per_isotope``, see :py:func:`~radis.lbl.base.get_isotope_lookup`)
 
         See Also
         --------
@@ -2519,6 +2572,8 @@ class BaseFactory(DatabankLoader):
                     Qgas = self._calc_Q(molecule, iso, state, Tgas)
                     Qref = self._calc_Q(molecule, iso, state, Tref)
                     Qref_Qgas_ratio[iso] = Qref / Qgas
+                if per_isotope:
+                    return Qref_Qgas_ratio
                 Qref_Qgas = df1["iso"].map(Qref_Qgas_ratio)
 
         else:
@@ -2530,6 +2585,25 @@ class BaseFactory(DatabankLoader):
             Qref_Qgas = Qref / Qgas
         return Qref_Qgas
 
+    def _run_lines_kernel(self, kernel, parallel_kernel, out, *args):
+        """Run the precompiled per-line ``kernel(out, *args, start, stop)`` on
+        all lines, or ``parallel_kernel(out, *args, nblocks)`` (blocks of lines
+        processed in parallel threads) if ``self.misc.n_jobs`` allows more than
+        one thread.
+
+        See :py:func:`~radis.lbl.base._linestrength_eq_jit`,
+        :py:func:`~radis.lbl.base._linestrength_eq_batch_jit`,
+        :py:func:`~radis.lbl.base._emission_integral_jit`
+        """
+        N = out.shape[-1]  # lines are on the last axis
+        n_threads = min(
+            effective_n_jobs(self.misc.n_jobs), numba.config.NUMBA_NUM_THREADS
+        )
+        if n_threads > 1 and N >= 10 * n_threads:
+            parallel_kernel(out, *args, n_threads)
+        else:
+            kernel(out, *args, 0, N)
+
     def calc_linestrength_eq(self, Tgas):
         """Calculate linestrength at temperature Tgas correcting the database
         linestrength tabulated at temperature :math:`T_{ref}`.
@@ -2588,18 +2662,39 @@ class BaseFactory(DatabankLoader):
             # This calculation is based on equation (A11) in Rothman 1998: "JQSRT, vol.
             # 60, No. 5, pp. 665-710"
 
-            # correct for Partition Function
-            df1["S"] = (
-                df1.int
-                * self.Qref_Qgas_ratio(df1, Tgas, Tref)
-                *
-                # ratio of Boltzmann populations
-                exp(-hc_k * df1.El * (1 / Tgas - 1 / Tref))
-                *
-                # effect of stimulated emission
-                (1 - exp(-hc_k * df1.wav / Tgas))
-                / (1 - exp(-hc_k * df1.wav / Tref))
-            )  # [cm-1/(molecules/cm-2)]
+            if self.dataframe_type == "pandas":
+                # All isotopes in a single pass, see _linestrength_eq_jit
+                iso, Qref_Qgas = get_isotope_lookup(
+                    df1, self.Qref_Qgas_ratio(df1, Tgas, Tref, per_isotope=True)
+                )
+                S = np.empty(len(df1))
+                self._run_lines_kernel(
+                    _linestrength_eq_jit,
+                    _linestrength_eq_parallel_jit,
+                    S,
+                    np.asarray(df1.int, dtype=np.float64),
+                    iso,
+                    Qref_Qgas,
+                    np.asarray(df1.El, dtype=np.float64),
+                    np.asarray(df1.wav, dtype=np.float64),
+                    float(Tgas),
+                    float(Tref),
+                )
+                df1["S"] = S  # [cm-1/(molecules/cm-2)]
+
+            else:
+                # correct for Partition Function
+                df1["S"] = (
+                    df1.int
+                    * self.Qref_Qgas_ratio(df1, Tgas, Tref)
+                    *
+                    # ratio of Boltzmann populations
+                    exp(-hc_k * df1.El * (1 / Tgas - 1 / Tref))
+                    *
+                    # effect of stimulated emission
+                    (1 - exp(-hc_k * df1.wav / Tgas))
+                    / (1 - exp(-hc_k * df1.wav / Tref))
+                )  # [cm-1/(molecules/cm-2)]
 
         else:
             # An alternative strategy is to calculate the linestrength from the
@@ -2624,6 +2719,61 @@ class BaseFactory(DatabankLoader):
 
         return
 
+    def _calc_linestrength_eq_batch(self, df, Tgas):
+        """Calculate the equilibrium linestrength of the lines of ``df`` at ``C``
+        temperatures at once, with the precompiled
+        :py:func:`~radis.lbl.base._linestrength_eq_batch_jit`. Used by
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch`
+
+        Same results as :py:meth:`~radis.lbl.base.BaseFactory.calc_linestrength_eq`
+        at each temperature, for pandas DataFrames with terrestrial abundances
+        and tabulated linestrengths ``int``.
+
+        Parameters
+        ----------
+        df: pandas DataFrame
+            lines
+        Tgas: array   [size C]   (K)
+            gas temperatures
+
+        Returns
+        -------
+        S: 2D array   [shape (C, N)]   [cm-1/(molecules/cm-2)]
+            linestrength of each line, at each temperature
+        """
+
+        Tref = self.input.Tref
+
+        self.profiler.start(
+            "scaled_eq_linestrength", 2, "... Scaling equilibrium linestrength"
+        )
+
+        # ... partition function ratio of each isotope, at each temperature
+        lookups = [
+            get_isotope_lookup(df, self.Qref_Qgas_ratio(df, T, Tref, per_isotope=True))
+            for T in Tgas
+        ]
+        iso = lookups[0][0]
+        Qref_Qgas = np.array([lookup for (_, lookup) in lookups])
+
+        S = np.empty((len(Tgas), len(df)))
+        self._run_lines_kernel(
+            _linestrength_eq_batch_jit,
+            _linestrength_eq_batch_parallel_jit,
+            S,
+            np.asarray(df.int, dtype=np.float64),
+            iso,
+            Qref_Qgas,
+            np.asarray(df.El, dtype=np.float64),
+            np.asarray(df.wav, dtype=np.float64),
+            np.asarray(Tgas, dtype=np.float64),
+            float(Tref),
+        )
+
+        self.profiler.stop("scaled_eq_linestrength", "Scaled equilibrium linestrength")
+
+        return S
+
     # %%
     def calc_populations_eq(self, Tgas):
         """Calculate upper state population for all active transitions in
@@ -3605,6 +3755,30 @@ class BaseFactory(DatabankLoader):
 
         # Calculation
 
+        if self.dataframe_type == "pandas":
+            # All isotopes in a single pass, see _emission_integral_jit
+            if self.input.isatom:
+                iso, abundance = get_isotope_lookup(df, 1.0)
+            else:
+                iso, abundance = get_isotope_lookup(
+                    df, self.get_lines_abundance(df, per_isotope=True)
+                )
+            Ei = np.empty(len(df))
+            self._run_lines_kernel(
+                _emission_integral_jit,
+                _emission_integral_parallel_jit,
+                Ei,
+                np.asarray(df.nu, dtype=np.float64),
+                iso,
+                abundance,
+                np.asarray(df.A, dtype=np.float64),
+                np.asarray(df.wav, dtype=np.float64),
+            )
+            df["Ei"] = Ei  # (mW/sr)
+
+            self.profiler.stop("calc_emission_integral", "calculated emission integral")
+            return
+
         # adim. (#/#) (multiplied by n_tot later)
         n_u = df["nu"]
         # correct for abundance
@@ -3615,10 +3789,7 @@ class BaseFactory(DatabankLoader):
 
         A_ul = df["A"]  # (s-1)
 
-        if self.dataframe_type == "pandas":
-            DeltaE = cm2J(df.wav)  # (cm-1) -> (J)
-        elif self.dataframe_type == "vaex":
-            DeltaE = cm2J_vaex(df.wav)  # (cm-1) -> (J)
+        DeltaE = cm2J_vaex(df.wav)  # (cm-1) -> (J)
         Ei = n_ua * A_ul / 4 / pi * DeltaE  # (W/sr)
 
         Ei *= 1e3  # (W/sr) -> (mW/sr)
@@ -3643,11 +3814,10 @@ class BaseFactory(DatabankLoader):
 
         Notes
         -----
-
-        # TODO:
-
-        turn linestrength cutoff criteria in 'auto' mode that adjusts linestrength
-        calculations based an error percentage criteria
+        If ``self.params.cutoff_error`` is not ``0``, it replaces ``cutoff`` :
+        the weakest lines are discarded as long as the sum of their
+        linestrengths is less than ``cutoff_error`` times the total
+        linestrength. See :py:meth:`~radis.lbl.base.BaseFactory._get_linestrength_order`
         """
 
         # Update defaults
@@ -3656,6 +3826,7 @@ class BaseFactory(DatabankLoader):
 
         # Load variables
         cutoff = self.params.cutoff
+        cutoff_error = self.params.cutoff_error
         verbose = self.verbose
         df = self.df1
 
@@ -3663,15 +3834,31 @@ class BaseFactory(DatabankLoader):
             self._Nlines_cutoff = None
             return
 
-        if cutoff <= 0:
+        if cutoff <= 0 and cutoff_error <= 0:
             self._Nlines_cutoff = 0
             return  # dont update self.df1
 
         self.profiler.start("applied_linestrength_cutoff", 2)
 
         # Cutoff:
-        b = df.S <= cutoff
-        Nlines_cutoff = b.sum()
+        if cutoff_error > 0:
+            # ... discard the weakest lines within the error budget : a slice
+            # ... of the lines sorted by linestrength
+            if self.dataframe_type != "pandas":
+                raise NotImplementedError(
+                    "cutoff_error is only implemented for dataframe_type='pandas'"
+                )
+            S = df.S.values
+            order = self._get_linestrength_order(df)
+            S_cumsum = np.cumsum(S[order])
+            Nlines_cutoff = np.searchsorted(
+                S_cumsum, cutoff_error * S_cumsum[-1], side="right"
+            )
+            b = np.zeros(len(df), dtype=bool)
+            b[order[:Nlines_cutoff]] = True
+        else:
+            b = df.S <= cutoff
+            Nlines_cutoff = b.sum()
 
         # Estimate time gained
         # TODO: Add a better formula to estimate time gained during broadening process
@@ -3690,13 +3877,21 @@ class BaseFactory(DatabankLoader):
                 error_cutoff = df.S[b].sum() / df.S.sum() * 100
 
             if verbose >= 2:
+                if cutoff_error > 0:
+                    criterion = "error budget {0:.2g}%".format(cutoff_error * 100)
+                else:
+                    criterion = "linestrength<{0}cm-1/(#.cm-2)".format(cutoff)
                 print(
-                    "Discarded {0:.2f}% of lines (linestrength<{1}cm-1/(#.cm-2))".format(
-                        Nlines_cutoff / len(df) * 100, cutoff
+                    "Discarded {0:.2f}% of lines ({1})".format(
+                        Nlines_cutoff / len(df) * 100, criterion
                     )
                     + " Estimated error: {0:.2f}%".format(error_cutoff)
                 )
-            if error_cutoff > self.misc.warning_linestrength_cutoff:
+            # (the error is chosen by the user if cutoff_error is given)
+            if (
+                cutoff_error <= 0
+                and error_cutoff > self.misc.warning_linestrength_cutoff
+            ):
                 self.warn(
                     "Estimated error after discarding lines is large: {0:.2f}%".format(
                         error_cutoff
@@ -3721,6 +3916,13 @@ class BaseFactory(DatabankLoader):
             ) from err
 
         # update df1:
+        if Nlines_cutoff == 0:
+            # no line discarded : don't copy the lines
+            self._Nlines_cutoff = 0
+            self.profiler.stop(
+                "applied_linestrength_cutoff", "Applied linestrength cutoff"
+            )
+            return
         if self.dataframe_type == "pandas":
             self.df1 = pd.DataFrame(df[~b])
         elif self.dataframe_type == "vaex":
@@ -3745,6 +3947,82 @@ class BaseFactory(DatabankLoader):
 
         return
 
+    def _get_linestrength_order(self, df):
+        """Returns the indices of the lines of ``df`` sorted by increasing
+        linestrength ``S``, used to discard the weakest lines within an error
+        budget (see ``cutoff_error`` in :py:class:`~radis.lbl.factory.SpectrumFactory`).
+
+        If ``df`` holds all the lines of the line database ``self.df0`` (in the
+        same order), the ordering is calculated once and reused for the next
+        spectra, as long as temperatures are close enough that the linestrength
+        ratio of any two lines changed by less than a factor 2 :
+
+        .. math::
+            \\frac{hc}{k} \\Delta E \\left|\\frac{1}{T}-\\frac{1}{T_{0}}\\right| < \\ln 2
+
+        where :math:`\\Delta E` is the range of lower state energies of the
+        database, and :math:`T_0` the temperatures the ordering was calculated at.
+        The reused ordering may be slightly different from the exact ordering :
+        a few more lines may be kept, but the discarded linestrength is always
+        calculated exactly and never exceeds the error budget.
+
+        Parameters
+        ----------
+        df: pandas DataFrame
+            lines, with linestrength ``S``
+
+        Returns
+        -------
+        order: np.array of int
+            positions of lines in ``df``
+        """
+        df0 = getattr(self, "df0", None)  # (deleted if save_memory)
+        if (
+            df0 is None
+            or len(df) != len(df0)
+            or "El" not in df0
+            or not df.index.equals(df0.index)
+        ):
+            # ex: blocks of lines : sort the lines of this block only
+            self.profiler.start("sort_linestrength", 3)
+            order = np.argsort(df.S.values, kind="stable")
+            self.profiler.stop("sort_linestrength", "Sorted lines by linestrength")
+            return order
+
+        temperatures = np.array(
+            [
+                T
+                for T in flatten(
+                    self.input.Tgas, self.input.get("Tvib"), self.input.get("Trot")
+                )
+                if T is not None
+            ],
+            dtype=float,
+        )
+        entry = self._cutoff_order
+        if (
+            entry is not None
+            and entry["df0"] == (id(df0), len(df0))
+            and len(entry["temperatures"]) == len(temperatures)
+            and (
+                hc_k * entry["dE"] * abs(1 / temperatures - 1 / entry["temperatures"])
+                < np.log(2)
+            ).all()
+        ):
+            return entry["order"]
+
+        self.profiler.start("sort_linestrength", 3)
+        order = np.argsort(df.S.values, kind="stable")
+        self._cutoff_order = {
+            "df0": (id(df0), len(df0)),
+            "temperatures": temperatures,
+            "dE": df0.El.max() - df0.El.min(),
+            "order": order,
+        }
+        self.profiler.stop("sort_linestrength", "Sorted lines by linestrength")
+
+        return order
+
     # %% ======================================================================
     # PRIVATE METHODS - UTILS
     # (cleaning)
@@ -3758,7 +4036,10 @@ class BaseFactory(DatabankLoader):
     def _reinitialize(self):
         """Reinitialize Factory before a new spectrum is calculated. It does:
 
-        - create new line Dataframe ``df1`` that will be scaled later with new populations
+        - create new line Dataframe ``df1`` that will be scaled later with new populations.
+          With pandas, ``df1`` is a shallow copy of ``df0`` : it shares the
+          columns of ``df0`` and only stores the columns calculated for this
+          spectrum (``S``, ``hwhm_voigt``, ``shiftwav``, etc.)
         - clean some objects if needed to save memory
         - delete populations from RovibrationalPartitionFunction objects
 
@@ -3788,7 +4069,14 @@ class BaseFactory(DatabankLoader):
             # Create new line Dataframe
             # ... Operate on a duplicate dataframe to make it possible to do different
             # ... runs without reloading database
-            self.df1 = self.df0.copy()
+            if self.dataframe_type == "pandas":
+                # ... the copy is shallow : input columns are not duplicated in
+                # ... memory. Columns of df1 must therefore never be modified
+                # ... inplace ; new values are stored in new arrays,
+                # ... ex: ``df1["S"] = ...``
+                self.df1 = self.df0.copy(deep=False)
+            else:
+                self.df1 = self.df0.copy()
             self.df1.attrs = self.df0.attrs
 
             # abundance and molar_mass should have been copied even if they are attributes
@@ -3867,6 +4155,187 @@ class BaseFactory(DatabankLoader):
 
         self.profiler.stop("reinitialize", "Reinitialize database")
 
+    def _calc_cached_columns(self, stage, key, calc, *args, **kwargs):
+        """Run the calculation step ``calc(*args, **kwargs)``, that adds
+        per-line columns to ``self.df1``, or reuse the columns it added for a
+        previous spectrum if its inputs are unchanged.
+
+        Columns are reused if the inputs ``key`` of the step are the same, and
+        if ``self.df1`` has the same lines (same index). Only the columns of the
+        last calculation of each step are kept. Reused steps appear as
+        ``cached_<stage>`` in the profiler (see
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.print_perf_profile`) and
+        are counted in ``self.profiler.counters``.
+
+        Parameters
+        ----------
+        stage: str
+            name of the calculation step
+        key: tuple, or ``None``
+            all inputs the columns calculated by ``calc`` depend on, apart from
+            the line database ``self.df0`` itself. If ``None``, columns are
+            always calculated (and not cached).
+        calc: function
+            calculation step
+
+        Examples
+        --------
+        ::
+
+            sf.eq_spectrum(Tgas=1000, pressure=1)
+            sf.eq_spectrum(Tgas=1000, pressure=2)  # linestrength is reused
+            print(sf.profiler.counters)
+            >>> {'columns_cache_hits': 1, 'columns_cache_misses': 2}
+
+        Notes
+        -----
+        The cache is enabled with ``radis.config["LINE_COLUMNS_CACHE"]``, and
+        is cleared every time a new line database is loaded. It is not used
+        with ``save_memory=True``, with ``stream_blocksize``, or if ``dataframe_type``
+        is not ``"pandas"``.
+        """
+        key = self._get_columns_cache_key(key)
+        if key is None:
+            return calc(*args, **kwargs)
+        if self._restore_cached_columns(stage, key):
+            return
+
+        df = self.df1
+        index = df.index
+        columns = set(df.columns)
+        attrs = df.attrs.copy()
+        out = calc(*args, **kwargs)
+        self.profiler.count("columns_cache_misses")
+
+        # Store columns added (arrays are shared with df1, that is never
+        # modified inplace)
+        df = self.df1
+        if not df.index.equals(index):
+            self._columns_cache.pop(stage, None)  # lines were reordered or removed
+            return out
+        self._store_cached_columns(
+            stage,
+            key,
+            {c: df[c].values for c in df.columns if c not in columns},
+            {k: v for k, v in df.attrs.items() if k not in attrs or attrs[k] is not v},
+        )
+        return out
+
+    def _get_columns_cache_key(self, key):
+        """Returns the key under which the columns calculated from inputs ``key``
+        are stored (``key`` and the inputs shared by all steps), or ``None`` if
+        the cache is not used. See
+        :py:meth:`~radis.lbl.base.BaseFactory._calc_cached_columns`"""
+        if (
+            key is None
+            or self._columns_cache is None
+            or self.save_memory
+            or self.misc.stream_blocksize is not None
+            or self.dataframe_type != "pandas"
+            or len(self.df1) == 0
+        ):
+            return None
+
+        # Inputs shared by all steps
+        return (
+            id(self.df0),
+            self.input.Tref,
+            self.params.parsum_mode,
+            self.molparam.terrestrial_abundances,
+        ) + tuple(key)
+
+    def _restore_cached_columns(self, stage, key):
+        """Add the columns stored for step ``stage`` to ``self.df1``, if they
+        were calculated for the same ``key`` (see
+        :py:meth:`~radis.lbl.base.BaseFactory._get_columns_cache_key`) and the
+        same lines. Returns whether they were."""
+        if key is None:
+            return False
+        df = self.df1
+        entry = self._columns_cache.get(stage)
+        if entry is None or entry["key"] != key or not df.index.equals(entry["index"]):
+            return False
+        self.profiler.start("cached_" + stage, 2)
+        for column, values in entry["columns"].items():
+            df[column] = values
+        df.attrs.update(entry["attrs"])
+        self.profiler.count("columns_cache_hits")
+        self.profiler.stop("cached_" + stage, f"Reused {stage} (inputs unchanged)")
+        return True
+
+    def _store_cached_columns(self, stage, key, columns, attrs={}):
+        """Store the ``columns`` (dict of arrays) and ``attrs`` calculated by
+        step ``stage`` for the lines of ``self.df1``, from inputs ``key`` (see
+        :py:meth:`~radis.lbl.base.BaseFactory._get_columns_cache_key`)"""
+        if key is None:
+            return
+        self._columns_cache[stage] = {
+            "key": key,
+            "index": self.df1.index,
+            "columns": columns,
+            "attrs": attrs,
+        }
+
+    def _clear_columns_cache(self):
+        """Clear the per-line columns stored for the previous spectrum, see
+        :py:meth:`~radis.lbl.base.BaseFactory._calc_cached_columns`"""
+        if self._columns_cache is not None:
+            self._columns_cache.clear()
+
+    def _iter_line_blocks(self, blocksize):
+        """Iterate over the line database ``self.df0`` by blocks of ``blocksize``
+        lines, in the order of the database (i.e. by increasing wavenumber for
+        all supported databases).
+
+        Used instead of :py:meth:`~radis.lbl.base.BaseFactory._reinitialize`
+        when spectra are computed by blocks of lines
+        (``SpectrumFactory(stream_blocksize=...)``) : only one block is copied at
+        a time, so the per-line columns calculated afterwards (linestrength,
+        broadening widths, lineshift, etc.) never exist for the whole database
+        at once.
+
+        Blocks are sliced from ``self.df0``, i.e. the line database already
+        loaded : blocks are not read from the database files. The peak memory
+        is the one of ``self.df0``, plus one block with its calculated columns.
+        Streaming from the disk is therefore only implemented for
+        ``memory_mapping_engine='npy'``, with a single database file and all
+        isotopes : the columns of ``self.df0`` are then memory-mapped, the lines
+        of a block are only read from the disk when the block is copied, and
+        the pages of ``self.df0`` read can be released by the operating system.
+        With the other engines (``'pytables'``, ``'vaex'``, ``'feather'``, etc.)
+        the full line database is in memory before the first block.
+
+        Parameters
+        ----------
+        blocksize: int
+            number of lines per block
+
+        Yields
+        ------
+        df1: pandas DataFrame
+            copy of a block of ``self.df0``, with the metadata of ``self.df0``
+        """
+        if self.dataframe_type != "pandas":
+            raise NotImplementedError(
+                "Computing spectra by blocks of lines is only implemented for "
+                + "dataframe_type='pandas'. Got {0}".format(self.dataframe_type)
+            )
+        if not blocksize > 0:
+            raise ValueError(
+                "stream_blocksize should be a positive number of lines. Got {0}".format(
+                    blocksize
+                )
+            )
+        blocksize = int(blocksize)
+
+        df0 = self.df0
+        metadata = [k for k in df_metadata if hasattr(df0, k)]
+        for i in range(0, len(df0), blocksize):
+            df1 = df0.iloc[i : i + blocksize].copy()
+            df1.attrs = df0.attrs.copy()
+            transfer_metadata(df0, df1, metadata)
+            yield df1
+
     def _check_inputs(self, mole_fraction, Tmax):
         """Check spectrum inputs, add warnings if suspicious values.
 
@@ -4215,6 +4684,251 @@ def linestrength_from_Einstein(
     )
 
 
+def get_isotope_lookup(df, values):
+    """Returns an isotope-indexed lookup table of ``values``, to evaluate
+    isotope-dependant quantities of all lines in a single pass.
+
+    Parameters
+    ----------
+    df: pandas DataFrame
+        lines
+    values: float, or dict
+        a single value for all lines, or a dictionary ``{iso: value}``. See for
+        instance :py:meth:`~radis.lbl.base.BaseFactory.Qref_Qgas_ratio` or
+        :py:meth:`~radis.lbl.base.BaseFactory.get_lines_abundance` with
+        ``per_isotope=True``
+
+    Returns
+    -------
+    iso: int64 array   [size N, or 0]
+        isotope of each line (empty array if ``values`` is a single value)
+    lookup: float64 array
+        ``lookup[iso]`` is the value of isotope ``iso`` (``lookup[0]`` if ``iso``
+        is empty)
+    """
+    if not isinstance(values, dict):
+        return np.empty(0, dtype=np.int64), np.array([values], dtype=np.float64)
+    iso = np.asarray(df["iso"], dtype=np.int64)
+    lookup = np.full(max(values) + 1, np.nan)  # nan if an isotope was forgotten
+    for i, v in values.items():
+        lookup[i] = v
+    return iso, lookup
+
+
+_ro_float64_1d = types.Array(float64, 1, "A", readonly=True)
+_ro_float64_2d = types.Array(float64, 2, "A", readonly=True)
+_ro_int64_1d = types.Array(int64, 1, "A", readonly=True)
+
+
+@jit(
+    void(
+        float64[:],
+        _ro_float64_1d,
+        _ro_int64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        float64,
+        float64,
+        int64,
+        int64,
+    ),
+    nopython=True,
+    cache=True,
+)
+def _linestrength_eq_jit(S, int0, iso, Qref_Qgas, El, wav, Tgas, Tref, start, stop):
+    """Equilibrium linestrength of lines ``start`` to ``stop`` (excluded), for
+    all isotopes in a single pass : see
+    :py:meth:`~radis.lbl.base.BaseFactory.calc_linestrength_eq`
+
+    Parameters
+    ----------
+    S: array   [size N]   (updated inplace)
+        linestrength at ``Tgas``
+    int0: array   [size N]
+        linestrength at ``Tref``
+    iso, Qref_Qgas: arrays
+        isotope-indexed lookup of the partition function ratio ``Qref/Qgas``,
+        see :py:func:`~radis.lbl.base.get_isotope_lookup`
+    El, wav: arrays   [size N]
+        lower state energy and wavenumber (cm-1)
+    Tgas, Tref: float   (K)
+    start, stop: int
+        range of lines to calculate
+    """
+    single_iso = len(iso) == 0
+    for i in range(start, stop):
+        Q_ratio = Qref_Qgas[0] if single_iso else Qref_Qgas[iso[i]]
+        S[i] = (
+            int0[i]
+            * Q_ratio
+            # ratio of Boltzmann populations
+            * np.exp(-hc_k * El[i] * (1 / Tgas - 1 / Tref))
+            # effect of stimulated emission
+            * (1 - np.exp(-hc_k * wav[i] / Tgas))
+            / (1 - np.exp(-hc_k * wav[i] / Tref))
+        )
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _linestrength_eq_parallel_jit(
+    S, int0, iso, Qref_Qgas, El, wav, Tgas, Tref, nblocks
+):
+    """Multi-threaded :py:func:`~radis.lbl.base._linestrength_eq_jit` : lines
+    are split in ``nblocks`` contiguous blocks, each calculated by a different
+    thread.
+    """
+    N = len(S)
+    for b in prange(nblocks):
+        _linestrength_eq_jit(
+            S,
+            int0,
+            iso,
+            Qref_Qgas,
+            El,
+            wav,
+            Tgas,
+            Tref,
+            b * N // nblocks,
+            (b + 1) * N // nblocks,
+        )
+
+
+@jit(
+    void(
+        float64[:, :],
+        _ro_float64_1d,
+        _ro_int64_1d,
+        _ro_float64_2d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        float64,
+        int64,
+        int64,
+    ),
+    nopython=True,
+    cache=True,
+)
+def _linestrength_eq_batch_jit(
+    S, int0, iso, Qref_Qgas, El, wav, Tgas, Tref, start, stop
+):
+    """Equilibrium linestrength of lines ``start`` to ``stop`` (excluded) at
+    ``C`` temperatures : same as :py:func:`~radis.lbl.base._linestrength_eq_jit`
+    for each temperature, but the factors that do not depend on temperature
+    are calculated once per line.
+
+    Parameters
+    ----------
+    S: 2D array   [shape (C, N)]   (updated inplace)
+        linestrength at each ``Tgas``
+    int0: array   [size N]
+        linestrength at ``Tref``
+    iso: array
+        see :py:func:`~radis.lbl.base.get_isotope_lookup`
+    Qref_Qgas: 2D array   [shape (C, I)]
+        isotope-indexed lookup of the partition function ratio ``Qref/Qgas``
+        at each ``Tgas``
+    El, wav: arrays   [size N]
+        lower state energy and wavenumber (cm-1)
+    Tgas: array   [size C]   (K)
+    Tref: float   (K)
+    start, stop: int
+        range of lines to calculate
+    """
+    single_iso = len(iso) == 0
+    for i in range(start, stop):
+        # ... linestrength at Tref, without the stimulated emission
+        S_ref = int0[i] / (1 - np.exp(-hc_k * wav[i] / Tref))
+        for k in range(len(Tgas)):
+            Q_ratio = Qref_Qgas[k, 0] if single_iso else Qref_Qgas[k, iso[i]]
+            S[k, i] = (
+                S_ref
+                * Q_ratio
+                # ratio of Boltzmann populations
+                * np.exp(-hc_k * El[i] * (1 / Tgas[k] - 1 / Tref))
+                # effect of stimulated emission
+                * (1 - np.exp(-hc_k * wav[i] / Tgas[k]))
+            )
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _linestrength_eq_batch_parallel_jit(
+    S, int0, iso, Qref_Qgas, El, wav, Tgas, Tref, nblocks
+):
+    """Multi-threaded :py:func:`~radis.lbl.base._linestrength_eq_batch_jit` :
+    lines are split in ``nblocks`` contiguous blocks, each calculated by a
+    different thread.
+    """
+    N = S.shape[1]
+    for b in prange(nblocks):
+        _linestrength_eq_batch_jit(
+            S,
+            int0,
+            iso,
+            Qref_Qgas,
+            El,
+            wav,
+            Tgas,
+            Tref,
+            b * N // nblocks,
+            (b + 1) * N // nblocks,
+        )
+
+
+@jit(
+    void(
+        float64[:],
+        _ro_float64_1d,
+        _ro_int64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        int64,
+        int64,
+    ),
+    nopython=True,
+    cache=True,
+)
+def _emission_integral_jit(Ei, nu, iso, abundance, A, wav, start, stop):
+    """Emission integral (mW/sr) of lines ``start`` to ``stop`` (excluded), for
+    all isotopes in a single pass : see
+    :py:meth:`~radis.lbl.base.BaseFactory.calc_emission_integral`
+
+    Parameters
+    ----------
+    Ei: array   [size N]   (updated inplace)
+        emission integral
+    nu: array   [size N]
+        fraction of the molecule population in the upper state
+    iso, abundance: arrays
+        isotope-indexed lookup of the isotopic abundance, see
+        :py:func:`~radis.lbl.base.get_isotope_lookup`
+    A, wav: arrays   [size N]
+        Einstein coefficient (s-1) and wavenumber (cm-1)
+    start, stop: int
+        range of lines to calculate
+    """
+    single_iso = len(iso) == 0
+    for i in range(start, stop):
+        Ia = abundance[0] if single_iso else abundance[iso[i]]
+        DeltaE = (wav[i] * 100) * (h * c)  # (cm-1) -> (J)
+        Ei[i] = nu[i] * Ia * A[i] / 4 / np.pi * DeltaE * 1e3  # (mW/sr)
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _emission_integral_parallel_jit(Ei, nu, iso, abundance, A, wav, nblocks):
+    """Multi-threaded :py:func:`~radis.lbl.base._emission_integral_jit` : lines
+    are split in ``nblocks`` contiguous blocks, each calculated by a different
+    thread.
+    """
+    N = len(Ei)
+    for b in prange(nblocks):
+        _emission_integral_jit(
+            Ei, nu, iso, abundance, A, wav, b * N // nblocks, (b + 1) * N // nblocks
+        )
+
+
 if __name__ == "__main__":
     from radis.test.lbl.test_base import _run_testcases
 
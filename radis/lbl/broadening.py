@@ -29,6 +29,9 @@ PUBLIC FUNCTIONS - BROADENING
 - :py:func:`radis.lbl.broadening.lorentzian_lineshape`
 - :py:func:`radis.lbl.broadening.voigt_broadening_HWHM`
 - :py:func:`radis.lbl.broadening.voigt_lineshape`
+- :py:func:`radis.lbl.broadening.faddeeva_voigt_lineshape`
+- :py:func:`radis.lbl.broadening.truncate_lineshape`
+- :py:func:`radis.lbl.broadening.warmup`
 
 PRIVATE METHODS - BROADENING
 (all computational-heavy functions: calculates all lines broadening,
@@ -36,7 +39,18 @@ convolve them, apply them on all calculated range)
 
 - :py:func:`radis.lbl.broadening.whiting`
 - :py:func:`radis.lbl.broadening._whiting_jit` : precompiled version
+- :py:func:`radis.lbl.broadening._faddeeva_jit` : precompiled Faddeeva function
+- :py:func:`radis.lbl.broadening._faddeeva_voigt_jit` : precompiled exact Voigt profile
+- :py:func:`radis.lbl.broadening._add_at_LDM_jit` : precompiled LDM line distribution
+- :py:func:`radis.lbl.broadening._voigt_direct_jit` : precompiled line-by-line Voigt
+  broadening, without lineshape matrix
+- :py:func:`radis.lbl.broadening._voigt_direct_parallel_jit` : multi-threaded version
+- :py:func:`radis.lbl.broadening._rough_sum_on_grid_jit` : precompiled projection
+  of lines as rectangles (pseudo-continuum)
+- :py:func:`radis.lbl.broadening._broadening_HWHM_jit` : precompiled HWHM and
+  lineshift of all lines, in a single pass
 - :py:meth:`radis.lbl.broadening.BroadenFactory._calc_broadening_HWHM`
+- :py:meth:`radis.lbl.broadening.BroadenFactory._autotune_broadening`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._voigt_broadening`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._calc_lineshape`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`
@@ -48,6 +62,8 @@ convolve them, apply them on all calculated range)
 - :py:meth:`radis.lbl.broadening.BroadenFactory.calculate_pseudo_continuum`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._add_pseudo_continuum`
 
+LDM lineshape templates are stored in a :py:class:`~radis.lbl.broadening.LineshapeCache`
+(see :py:func:`~radis.lbl.broadening.get_lineshape_cache`)
 
 Notes
 -----
@@ -61,13 +77,19 @@ Formula in docstrings generated with :py:func:`~pytexit.pytexit.py2tex` ::
 
 """
 
+from collections import OrderedDict
+from threading import Lock
 from warnings import warn
 
+import numba
 import numpy as np
-from numba import float64, jit
+from joblib import Parallel, delayed, effective_n_jobs
+from numba import boolean, float32, float64, int32, int64, jit, prange, types, void
 from numpy import arange, exp
 from numpy import log as ln
-from numpy import pi, sin, sqrt, trapz, zeros, zeros_like
+from numpy import pi, sin, sqrt, trapz, zeros
+from psutil import virtual_memory
+from scipy.fft import irfft, next_fast_len, rfft
 from scipy.signal import oaconvolve
 
 import radis
@@ -76,9 +98,8 @@ from radis.lbl.base import BaseFactory
 from radis.misc.arrays import (  # add_at, #cython
     arange_len,
     boolean_array_from_ranges,
-    non_zero_ranges_in_array,
     numpy_add_at,
-    sparse_add_at,
+    sparse_add_at_LDM,
 )
 
 from ..misc.basics import is_float
@@ -766,6 +787,236 @@ def olivero_1977(wg, wl):
     return wv
 
 
+_ro_float64_1d = types.Array(float64, 1, "A", readonly=True)
+_ro_float64_2d = types.Array(float64, 2, "A", readonly=True)
+
+
+@jit(
+    void(
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_2d,
+        _ro_float64_2d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        float64,
+        float64,
+        float64,
+        float64,
+    ),
+    nopython=True,
+    cache=True,
+)
+def _broadening_HWHM_jit(
+    hwhm_lorentz,
+    hwhm_gauss,
+    hwhm_voigt,
+    shiftwav,
+    wav,
+    molar_mass,
+    selbrd,
+    Tdpsel,
+    gamma_diluent,
+    n_diluent,
+    x_diluent,
+    Pshft,
+    Tgas,
+    Tref,
+    pressure_atm,
+    mole_fraction,
+):
+    """Compute the Lorentzian, Gaussian and Voigt HWHM and the shifted line
+    position of all lines in a single pass : equivalent to
+    :py:func:`~radis.lbl.broadening.pressure_broadening_HWHM`,
+    :py:func:`~radis.lbl.broadening.doppler_broadening_HWHM`,
+    :py:func:`~radis.lbl.broadening.olivero_1977` and
+    :py:meth:`~radis.lbl.base.BaseFactory.calc_lineshift`, without temporary
+    arrays of size N (number of lines).
+
+    Parameters
+    ----------
+    hwhm_lorentz, hwhm_gauss: arrays   [size N]   (updated inplace)
+        Lorentzian and Gaussian HWHM
+    hwhm_voigt, shiftwav: arrays   [size N, or 0]   (updated inplace)
+        Voigt HWHM and pressure-shifted line position. Not calculated if of size 0
+    wav, molar_mass: arrays   [size N]
+        line position (cm-1) and molar mass (g/mol) of the line isotope
+    selbrd, Tdpsel: arrays   [size N]
+        self-broadening HWHM coefficient and its temperature dependance
+    gamma_diluent, n_diluent: 2D arrays   [shape (D, N)]
+        broadening HWHM coefficient and its temperature dependance, for each
+        of the ``D`` diluents
+    x_diluent: array   [size D]
+        mole fraction of each diluent
+    Pshft: array   [size N, or 0]
+        pressure-shift coefficient. Only used if ``shiftwav`` is calculated
+    Tgas, Tref: float  (K)
+        gas temperature, and reference temperature of the broadening coefficients
+    pressure_atm: float  (atm)
+    mole_fraction: float   [0-1]
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._add_broadening_HWHM_fused`
+    """
+    ln_Tratio = np.log(Tref / Tgas)  # (Tref/Tgas)**n = exp(n*ln_Tratio)
+    doppler_coeff = np.sqrt(2 * Na * k_b_CGS * Tgas * np.log(2))
+    add_voigt = len(hwhm_voigt) > 0
+    add_shift = len(shiftwav) > 0
+
+    for i in range(len(wav)):
+        # Lorentzian : see pressure_broadening_HWHM
+        # ... (Tref/Tgas)**n calculated once if the diluents and self-broadening
+        # ... have the same temperature dependance (ex: Tdpsel not in database)
+        Tratio_self = np.exp(Tdpsel[i] * ln_Tratio)
+        gamma_lb = 0.0
+        for d in range(len(x_diluent)):
+            if n_diluent[d, i] == Tdpsel[i]:
+                Tratio_diluent = Tratio_self
+            else:
+                Tratio_diluent = np.exp(n_diluent[d, i] * ln_Tratio)
+            gamma_lb += (
+                Tratio_diluent * gamma_diluent[d, i] * pressure_atm * x_diluent[d]
+            )
+        gamma_lb += Tratio_self * (selbrd[i] * pressure_atm * mole_fraction)
+        hwhm_lorentz[i] = gamma_lb
+
+        # Gaussian : see doppler_broadening_HWHM
+        gamma_db = (wav[i] / c_CGS) * doppler_coeff / np.sqrt(molar_mass[i])
+        hwhm_gauss[i] = gamma_db
+
+        # Voigt : see olivero_1977 (in FWHM)
+        if add_voigt:
+            sd = (gamma_lb - gamma_db) / (gamma_lb + gamma_db)
+            hwhm_voigt[i] = (
+                1
+                - 0.18121 * (1 - sd**2)
+                - (0.023665 * np.exp(0.6 * sd) + 0.00418 * np.exp(-1.9 * sd))
+                * np.sin(np.pi * sd)
+            ) * (gamma_lb + gamma_db)
+
+        # Lineshift : see calc_lineshift
+        if add_shift:
+            shiftwav[i] = wav[i] + Pshft[i] * pressure_atm
+
+
+@jit(
+    void(
+        float64[:, :],
+        float64[:, :],
+        float64[:, :],
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_1d,
+        _ro_float64_2d,
+        _ro_float64_2d,
+        _ro_float64_2d,
+        _ro_float64_1d,
+        float64,
+        _ro_float64_1d,
+        _ro_float64_1d,
+    ),
+    nopython=True,
+    cache=True,
+)
+def _broadening_HWHM_batch_jit(
+    hwhm_lorentz,
+    hwhm_gauss,
+    hwhm_voigt,
+    wav,
+    molar_mass,
+    selbrd,
+    Tdpsel,
+    gamma_diluent,
+    n_diluent,
+    x_diluent,
+    Tgas,
+    Tref,
+    pressure_atm,
+    mole_fraction,
+):
+    """Compute the Lorentzian, Gaussian and Voigt HWHM of all lines for ``C``
+    conditions in a single pass over the lines : same as
+    :py:func:`~radis.lbl.broadening._broadening_HWHM_jit` for each condition,
+    but the line parameters are read, and the factors that do not depend on
+    the conditions calculated, once per line.
+
+    Parameters
+    ----------
+    hwhm_lorentz, hwhm_gauss: 2D arrays   [shape (C, N)]   (updated inplace)
+        Lorentzian and Gaussian HWHM
+    hwhm_voigt: 2D array   [shape (C, N), or (C, 0)]   (updated inplace)
+        Voigt HWHM. Not calculated if of size 0
+    wav, molar_mass: arrays   [size N]
+        line position (cm-1) and molar mass (g/mol) of the line isotope
+    selbrd, Tdpsel: arrays   [size N]
+        self-broadening HWHM coefficient and its temperature dependance
+    gamma_diluent, n_diluent: 2D arrays   [shape (D, N)]
+        broadening HWHM coefficient and its temperature dependance, for each
+        of the ``D`` diluents
+    x_diluent: 2D array   [shape (C, D)]
+        mole fraction of each diluent, for each condition
+    Tgas: array   [size C]  (K)
+        gas temperatures
+    Tref: float  (K)
+        reference temperature of the broadening coefficients
+    pressure_atm: array   [size C]  (atm)
+    mole_fraction: array   [size C]   [0-1]
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_broadening_HWHM_batch`
+    """
+    C = len(Tgas)
+    ln_Tratio = np.log(Tref / Tgas)  # (Tref/Tgas)**n = exp(n*ln_Tratio)
+    doppler_coeff = np.sqrt(2 * Na * k_b_CGS * Tgas * np.log(2))
+    add_voigt = hwhm_voigt.shape[1] > 0
+
+    for i in range(len(wav)):
+        # ... condition-independent Doppler factor
+        doppler_line = wav[i] / c_CGS / np.sqrt(molar_mass[i])
+        for c in range(C):
+            # Lorentzian : see pressure_broadening_HWHM
+            # ... (Tref/Tgas)**n calculated once if the diluents and self-broadening
+            # ... have the same temperature dependance (ex: Tdpsel not in database)
+            Tratio_self = np.exp(Tdpsel[i] * ln_Tratio[c])
+            gamma_lb = 0.0
+            for d in range(gamma_diluent.shape[0]):
+                if n_diluent[d, i] == Tdpsel[i]:
+                    Tratio_diluent = Tratio_self
+                else:
+                    Tratio_diluent = np.exp(n_diluent[d, i] * ln_Tratio[c])
+                gamma_lb += (
+                    Tratio_diluent
+                    * gamma_diluent[d, i]
+                    * pressure_atm[c]
+                    * x_diluent[c, d]
+                )
+            gamma_lb += Tratio_self * (selbrd[i] * pressure_atm[c] * mole_fraction[c])
+            hwhm_lorentz[c, i] = gamma_lb
+
+            # Gaussian : see doppler_broadening_HWHM
+            gamma_db = doppler_line * doppler_coeff[c]
+            hwhm_gauss[c, i] = gamma_db
+
+            # Voigt : see olivero_1977 (in FWHM)
+            if add_voigt:
+                sd = (gamma_lb - gamma_db) / (gamma_lb + gamma_db)
+                hwhm_voigt[c, i] = (
+                    1
+                    - 0.18121 * (1 - sd**2)
+                    - (0.023665 * np.exp(0.6 * sd) + 0.00418 * np.exp(-1.9 * sd))
+                    * np.sin(np.pi * sd)
+                ) * (gamma_lb + gamma_db)
+
+
 def voigt_lineshape(w_centered, hwhm_lorentz, hwhm_voigt, jit=True):
     """Calculates Voigt lineshape using the approximation of the Voigt profile
     of [NEQAIR-1996]_, [Whiting-1968]_ that maintains a good accuracy in the far wings.
@@ -830,6 +1081,65 @@ def voigt_lineshape(w_centered, hwhm_lorentz, hwhm_voigt, jit=True):
     return lineshape
 
 
+def faddeeva_voigt_lineshape(w_centered, hwhm_lorentz, hwhm_gauss):
+    """Calculates the Voigt lineshape from the real part of the Faddeeva
+    function :math:`w(z)`, evaluated with the rational approximation of
+    [Weideman-1994]_ (``N=32`` terms, see :py:func:`~radis.lbl.broadening._faddeeva_jit`)
+
+    .. math::
+
+        V(x) = \\frac{\\Re[w(z)]}{\\sigma \\sqrt{2 \\pi}},
+        \\quad z = \\frac{x + i \\gamma}{\\sigma \\sqrt{2}}
+
+    with :math:`\\sigma` the standard deviation of the Gaussian and
+    :math:`\\gamma` the Lorentzian HWHM. Unlike the approximation of
+    :py:func:`~radis.lbl.broadening.voigt_lineshape`, it remains accurate in the
+    line wings : :math:`\\Re[w(z)]` is computed with an absolute error below
+    1e-13, and is never negative.
+
+    Parameters
+    ----------
+    w_centered: 2D array       [one per line: shape W x N]
+        waverange (nm / cm-1) (centered on 0)
+    hwhm_lorentz: array   (cm-1)        [length N]
+        half-width half maximum coefficient (HWHM) for Lorentzian broadening
+    hwhm_gauss: array   (cm-1)        [length N]
+        half-width half maximum coefficient (HWHM) for Gaussian broadening
+
+    Returns
+    -------
+    lineshape: array        [shape W x N]
+        line profile, normalized on ``w_centered``
+
+    References
+    ----------
+    .. [Weideman-1994] `J.A.C. Weideman, "Computation of the Complex Error Function", SIAM J. Numer. Anal. 31 (1994) <https://doi.org/10.1137/0731077>`_
+
+    See Also
+    --------
+    :py:func:`~radis.lbl.broadening.voigt_lineshape`
+    """
+    out_shape = np.broadcast(w_centered, hwhm_lorentz, hwhm_gauss).shape
+
+    # Make (W, N) and (1, N) arrays
+    w_centered = np.asarray(w_centered, dtype=np.float64)
+    w_centered = w_centered.reshape((len(w_centered), -1))
+    N = max(w_centered.shape[1], np.size(hwhm_lorentz), np.size(hwhm_gauss))
+    if w_centered.shape[1] != N:
+        w_centered = np.repeat(w_centered, N, axis=1)
+    hwhm_lorentz, hwhm_gauss = [
+        np.array(np.broadcast_to(np.reshape(hwhm, (1, -1)), (1, N)), dtype=np.float64)
+        for hwhm in (hwhm_lorentz, hwhm_gauss)
+    ]
+
+    lineshape = _faddeeva_voigt_jit(w_centered, hwhm_lorentz, hwhm_gauss)
+
+    # Normalization on the truncated range (as in voigt_lineshape)
+    lineshape /= trapz(lineshape, w_centered, axis=0)
+
+    return lineshape.reshape(out_shape)
+
+
 def voigt_FT(w_lineshape_ft, hwhmG, hwhmL):
     """Fourier Transform of a Voigt lineshape
 
@@ -854,6 +1164,49 @@ def voigt_FT(w_lineshape_ft, hwhmG, hwhmL):
     return IG_FT * IL_FT
 
 
+def truncate_lineshape(lineshape, wstep, truncation_error):
+    """Truncate the wings of a lineshape calculated on a symmetric range
+    centered on 0 (see ``wbroad_centered`` in
+    :py:class:`~radis.lbl.broadening.BroadenFactory`) : keep the smallest
+    centered range such that the discarded wings hold less than ``truncation_error``
+    of the lineshape area.
+
+    Parameters
+    ----------
+    lineshape: array     [odd length]
+        symmetric lineshape, normalized
+    wstep: float (cm-1)
+        spacing of the lineshape
+    truncation_error: float [0-1]
+        maximum fraction of the area in the discarded wings
+
+    Returns
+    -------
+    lineshape: array     [odd length]
+        truncated lineshape, normalized on the truncated range (as in
+        :py:func:`~radis.lbl.broadening.voigt_lineshape`)
+
+    Examples
+    --------
+    Wings of a Lorentzian of HWHM :math:`\\gamma` hold about :math:`2\\gamma/(\\pi t)`
+    of its area outside of :math:`[-t, t]` : with ``truncation_error=1e-4``, lines of
+    HWHM ``1e-4`` cm-1 (low pressure) are truncated at ~0.6 cm-1 instead of the
+    default ``truncation=50`` cm-1.
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`
+    """
+    center = len(lineshape) // 2
+    # Area of both wings outside of the range [center-j, center+j], for all j
+    wings = 2 * np.cumsum(lineshape[:center:-1])[::-1]
+    j = np.argmax(np.append(wings, 0) <= truncation_error * lineshape.sum())
+    if j == center:
+        return lineshape  # no truncation
+    truncated = lineshape[center - j : center + j + 1]
+    return (truncated / trapz(truncated, dx=wstep)).astype(lineshape.dtype)
+
+
 # Pseudo-voigts approximations:
 
 
@@ -959,6 +1312,491 @@ def _whiting_jit(w_centered, wl, wv):
     return lineshape
 
 
+def _weideman_coefficients(N):
+    """Coefficients of the rational approximation of the Faddeeva function of
+    [Weideman-1994]_ with ``N`` terms. Returns ``(L, a)``, with ``a`` sorted
+    by decreasing degree (for Horner evaluation)"""
+    M = 2 * N
+    M2 = 2 * M
+    k = np.arange(-M + 1, M)
+    L = np.sqrt(N / np.sqrt(2))
+    t = L * np.tan(k * pi / M / 2)
+    f = np.concatenate(([0], np.exp(-(t**2)) * (L**2 + t**2)))
+    a = np.real(np.fft.fft(np.fft.fftshift(f))) / M2
+    return L, a[1 : N + 1][::-1].copy()
+
+
+_WEIDEMAN_L, _WEIDEMAN_A = _weideman_coefficients(32)
+
+
+@jit(float64(float64, float64), nopython=True, cache=True)
+def _faddeeva_jit(x, y):
+    """Real part of the Faddeeva function :math:`w(z) = e^{-z^2} \\mathrm{erfc}(-iz)`,
+    :math:`z = x + iy`, for :math:`y \\geq 0` (i.e. the Voigt function
+    :math:`K(x, y)`).
+
+    - for :math:`|z| < 15` : rational approximation of [Weideman-1994]_ with
+      ``N=32`` terms
+    - for :math:`|z| > 15` (line wings) : asymptotic expansion of :math:`w(z)`
+      up to the :math:`1/z^{11}` term
+
+    The absolute error is below 1e-13 (the maximum of the function is 1, at
+    :math:`z=0`). The relative error is therefore only small where the function
+    is not negligible (~1e-10 above 1e-3). Values are clipped to 0, as the
+    rational approximation can return tiny negative values near :math:`y=0`.
+
+    Written in real arithmetic, which is significantly faster than complex
+    numbers in compiled loops.
+    """
+    r2 = x * x + y * y
+    if r2 > 225:  # |z| > 15 : line wings
+        # w(z) = i/(sqrt(pi) z) * (1 + u + 3u^2 + 15u^3 + ...) with u = 1/(2 z^2)
+        r2_inv = 1 / r2
+        a = x * r2_inv  # 1/z = a + ib
+        b = -y * r2_inv
+        ur = 0.5 * (a * a - b * b)
+        ui = a * b
+        sr = 945.0
+        si = 0.0
+        for c in (105.0, 15.0, 3.0, 1.0, 1.0):
+            sr, si = sr * ur - si * ui + c, sr * ui + si * ur
+        return max(-(a * si + b * sr) / sqrt(pi), 0.0)
+
+    # w(z) = 2 p(Z) / (L - iz)^2 + 1 / (sqrt(pi) (L - iz)),  Z = (L + iz) / (L - iz)
+    L = _WEIDEMAN_L
+    d_inv = 1 / ((L + y) ** 2 + x * x)
+    Zr = (L * L - y * y - x * x) * d_inv
+    Zi = 2 * L * x * d_inv
+    pr = 0.0
+    pi_ = 0.0
+    for c in _WEIDEMAN_A:
+        pr, pi_ = pr * Zr - pi_ * Zi + c, pr * Zi + pi_ * Zr
+    qr = (L + y) * d_inv  # 1 / (L - iz)
+    qi = x * d_inv
+    return max(2 * (pr * (qr * qr - qi * qi) - pi_ * 2 * qr * qi) + qr / sqrt(pi), 0.0)
+
+
+@jit(
+    float64[:, :](float64[:, :], float64[:, :], float64[:, :]),
+    nopython=True,
+    cache=True,
+)
+def _faddeeva_voigt_jit(w_centered, hwhm_lorentz, hwhm_gauss):
+    """Voigt lineshape (not normalized on the truncated range) on the
+    ``(W, N)`` array ``w_centered``, for the ``(1, N)`` arrays of Lorentzian
+    and Gaussian HWHM. See :py:func:`~radis.lbl.broadening.faddeeva_voigt_lineshape`
+    """
+    W, N = w_centered.shape
+    sigma_sqrt2_inv = sqrt(ln(2)) / hwhm_gauss[0]  # 1 / (sigma * sqrt(2))
+    y = hwhm_lorentz[0] * sigma_sqrt2_inv
+    norm = sigma_sqrt2_inv / sqrt(pi)
+
+    lineshape = np.empty((W, N))
+    for k in range(W):  # loop in memory order
+        for j in range(N):
+            x = w_centered[k, j] * sigma_sqrt2_inv[j]
+            lineshape[k, j] = _faddeeva_jit(x, y[j]) * norm[j]
+    return lineshape
+
+
+@jit(
+    void(
+        float64[:, :],
+        float64[:, :],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        int64,
+        boolean,
+        int64,
+        int64,
+    ),
+    nopython=True,
+    cache=True,
+)
+def _voigt_direct_jit(
+    sumoflines_calc,
+    I,
+    shiftwav,
+    hwhm_lorentz,
+    hwhm_gauss,
+    hwhm_voigt,
+    wavenumber_calc,
+    wbroad_centered,
+    ioffset,
+    faddeeva,
+    first,
+    step,
+):
+    """Line-by-line Voigt broadening (Whiting approximation, as in
+    :py:func:`~radis.lbl.broadening.voigt_lineshape`, or exact profile as in
+    :py:func:`~radis.lbl.broadening.faddeeva_voigt_lineshape` if ``faddeeva``) without the
+    ``(B, N)`` lineshape matrix of
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape` : the
+    lineshape of each line is evaluated on the fly, normalized, and added
+    directly on the two closest grid points (same projection as
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape`).
+
+    Parameters
+    ----------
+    sumoflines_calc: 2D array   (P, W + 2*ioffset)
+        output, updated in place
+    I: 2D array   (P, N)
+        broadened parameters of the ``N`` lines, ex: ``S`` and ``Ei``
+    shiftwav, hwhm_lorentz, hwhm_gauss, hwhm_voigt: arrays   (N)
+        line positions and HWHM  (cm-1)
+    wavenumber_calc: array  (W)
+        calculation spectral grid
+    wbroad_centered: array  (B)
+        broadening range, centered on 0
+    ioffset: int
+        number of points added on each side of ``wavenumber_calc`` so that
+        truncated lineshapes stay in range
+    faddeeva: bool
+        if ``True``, use the exact Voigt profile, else the Whiting approximation
+    first, step: int
+        only lines ``first::step`` are added. See
+        :py:func:`~radis.lbl.broadening._voigt_direct_parallel_jit`
+    """
+    P, N = I.shape
+    W = len(wavenumber_calc)
+    B = len(wbroad_centered)
+    iwbroad_half = B // 2
+    Wtot = sumoflines_calc.shape[1]
+
+    profile = np.empty(B)
+    # (inputs of _whiting_jit, for one line)
+    w_centered = np.empty((B, 1))
+    w_centered[:, 0] = wbroad_centered
+    wl = np.empty((1, 1))
+    wv = np.empty((1, 1))
+    for i in range(first, N, step):
+        if faddeeva:
+            sigma_sqrt2_inv = sqrt(ln(2)) / hwhm_gauss[i]  # 1 / (sigma * sqrt(2))
+            y = hwhm_lorentz[i] * sigma_sqrt2_inv
+            # ... wbroad_centered is symmetric : evaluate half of the profile
+            for k in range(iwbroad_half + 1):
+                profile[k] = _faddeeva_jit(wbroad_centered[k] * sigma_sqrt2_inv, y)
+                profile[B - 1 - k] = profile[k]
+        else:
+            # Whiting lineshape (FWHM)
+            wl[0, 0] = 2 * hwhm_lorentz[i]
+            wv[0, 0] = 2 * hwhm_voigt[i]
+            profile[:] = _whiting_jit(w_centered, wl, wv)[:, 0]
+        integral = 0.0
+        for k in range(B - 1):
+            integral += (
+                (wbroad_centered[k + 1] - wbroad_centered[k])
+                * (profile[k] + profile[k + 1])
+                / 2
+            )
+
+        # closest grid points, and fraction of intensity on each side
+        il = np.searchsorted(wavenumber_calc, shiftwav[i]) - 1
+        ir = min(il + 1, W - 1)
+        dist_left = shiftwav[i] - wavenumber_calc[il]
+        dist_right = wavenumber_calc[ir] - shiftwav[i]
+        frac_left = dist_right / (dist_left + dist_right)
+        frac_right = dist_left / (dist_left + dist_right)
+        jl = il - iwbroad_half + ioffset
+        jr = ir - iwbroad_half + ioffset
+
+        for p in range(P):
+            Ip = I[p, i] / integral
+            for k in range(B):
+                if 0 <= jl + k < Wtot:
+                    sumoflines_calc[p, jl + k] += frac_left * Ip * profile[k]
+                if 0 <= jr + k < Wtot:
+                    sumoflines_calc[p, jr + k] += frac_right * Ip * profile[k]
+
+
+# Note: compiled on first call (no signature) : loading a parallel function
+# starts the Numba threading layer, which should not happen at import (processes
+# forked afterwards, ex: with multiprocessing, would hang on exit)
+@jit(nopython=True, cache=True, parallel=True)
+def _voigt_direct_parallel_jit(
+    sumofblocks,
+    I,
+    shiftwav,
+    hwhm_lorentz,
+    hwhm_gauss,
+    hwhm_voigt,
+    wavenumber_calc,
+    wbroad_centered,
+    ioffset,
+    faddeeva,
+):
+    """Multi-threaded :py:func:`~radis.lbl.broadening._voigt_direct_jit` :
+    lines are split in ``nblocks = len(sumofblocks)`` interleaved blocks, each
+    summed in its own array ``sumofblocks[b]`` of shape ``(P, W + 2*ioffset)``
+    by a different thread. Arrays have to be summed afterwards.
+    """
+    nblocks = sumofblocks.shape[0]
+    for b in prange(nblocks):
+        _voigt_direct_jit(
+            sumofblocks[b],
+            I,
+            shiftwav,
+            hwhm_lorentz,
+            hwhm_gauss,
+            hwhm_voigt,
+            wavenumber_calc,
+            wbroad_centered,
+            ioffset,
+            faddeeva,
+            b,
+            nblocks,
+        )
+
+
+# LDM line distribution
+
+
+@jit(
+    [
+        void(
+            float_t[:, :, :, :],
+            int32[:],
+            float64[:],
+            int32[:],
+            float64[:],
+            int32[:],
+            float64[:],
+            float_t[:, :],
+            float_t[:],
+            float_t[:],
+            boolean,
+            float64,
+            float64,
+            float64,
+        )
+        for float_t in (float64, float32)
+    ],
+    nopython=True,
+    cache=True,
+)
+def _add_at_LDM_jit(
+    LDM, ki0, tvi, li0, tGi, mi0, tLi, S, wG_dat, wL_dat, min_RMS, dv, dxG, dxL
+):
+    """Distribute all lines on the 2x2x2 bins of the LDM grid in a single pass.
+
+    Equivalent to the 8 :py:func:`~radis.misc.arrays.numpy_add_at` calls of
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`, but
+    the interpolation weights are computed line by line : no temporary array
+    of size N (number of lines) is allocated.
+
+    Parameters
+    ----------
+    LDM: 4D array  (updated inplace)
+        LDM grid, shape ``(Nv, NwG, NwL, P)`` with ``P`` the number of
+        intensities distributed (ex: 2 for absorption and emission). float64,
+        or float32 (then ``S``, ``wG_dat`` and ``wL_dat`` must be float32 too)
+    ki0, li0, mi0: int32 arrays      [size N]
+        index of the closest grid point on the left, for the wavenumber,
+        Gaussian width and Lorentzian width axis. Lines are distributed on
+        ``ki0`` and ``ki0+1`` (same for ``li0``, ``mi0``)
+    tvi, tGi, tLi: arrays            [size N]
+        relative position of the line between ``ki0`` and ``ki0+1`` (same
+        for ``li0``, ``mi0``)
+    S: 2D array                      [shape (N, P)]
+        intensities to distribute (linestrength, and emission integral). All
+        intensities of a line share the same indices and weights
+    wG_dat, wL_dat: arrays           [size N]
+        Gaussian and Lorentzian FWHM of all lines. Only used if ``min_RMS``
+    min_RMS: bool
+        if ``True``, use weights optimized by analytical minimization of the
+        RMS-error. Else, use simple weights.
+    dv, dxG, dxL: float
+        wavenumber step and LDM (log) steps. Only used if ``min_RMS``
+
+    Notes
+    -----
+    Performances:
+
+    on a 50k lines, 3 cm-1 test case the 8 ``np.add.at`` calls and their
+    temporary arrays took ~80% of the ``Distribute lines over LDM`` step.
+
+    See Also
+    --------
+    :py:func:`~radis.misc.arrays.numpy_add_at`
+    """
+
+    # min-RMS constants (see _apply_lineshape_LDM)
+    C1_GG = ((6 * np.pi - 16) / (15 * np.pi - 32)) ** (1 / 1.50)
+    C1_LG = ((6 * np.pi - 16) / 3 * (np.log(2) / (2 * np.pi)) ** 0.5) ** (1 / 2.25)
+    C2_GG = (2 * np.log(2) / 15) ** (1 / 1.50)
+    C2_LG = ((2 * np.log(2)) ** 2 / 15) ** (1 / 2.25)
+    R_Gv = 8 * np.log(2)
+    R_LL = 1.0
+
+    for i in range(len(ki0)):
+        avi = tvi[i]
+        if min_RMS:
+            alpha_i = wL_dat[i] / wG_dat[i]
+            dxvGi = dv / wG_dat[i]
+
+            R_GG = 2 - 1 / (C1_GG + C2_GG * alpha_i ** (2 / 1.50)) ** 1.50
+            R_GL = -2 * np.log(2) * alpha_i**2
+            R_LG = (
+                1
+                / (C1_LG * alpha_i ** (1 / 2.25) + C2_LG * alpha_i ** (4 / 2.25))
+                ** 2.25
+            )
+
+            aGi = tGi[i] + (
+                R_Gv * avi * (avi - 1) * dxvGi**2
+                + R_GG * tGi[i] * (tGi[i] - 1) * dxG**2
+                + R_GL * tLi[i] * (tLi[i] - 1) * dxL**2
+            ) / (2 * dxG)
+            aLi = tLi[i] + (
+                R_LG * tGi[i] * (tGi[i] - 1) * dxG**2
+                + R_LL * tLi[i] * (tLi[i] - 1) * dxL**2
+            ) / (2 * dxL)
+        else:
+            aGi = tGi[i]
+            aLi = tLi[i]
+
+        k0 = ki0[i]
+        l0 = li0[i]
+        m0 = mi0[i]
+
+        for p in range(S.shape[1]):
+            Iv0 = S[i, p] * (1 - avi)
+            Iv1 = S[i, p] * avi
+
+            LDM[k0, l0, m0, p] += Iv0 * (1 - aGi) * (1 - aLi)
+            LDM[k0, l0, m0 + 1, p] += Iv0 * (1 - aGi) * aLi
+            LDM[k0, l0 + 1, m0, p] += Iv0 * aGi * (1 - aLi)
+            LDM[k0, l0 + 1, m0 + 1, p] += Iv0 * aGi * aLi
+            LDM[k0 + 1, l0, m0, p] += Iv1 * (1 - aGi) * (1 - aLi)
+            LDM[k0 + 1, l0, m0 + 1, p] += Iv1 * (1 - aGi) * aLi
+            LDM[k0 + 1, l0 + 1, m0, p] += Iv1 * aGi * (1 - aLi)
+            LDM[k0 + 1, l0 + 1, m0 + 1, p] += Iv1 * aGi * aLi
+
+
+# %% Lineshape cache
+
+
+class LineshapeCache(object):
+    """Least-recently-used cache of the lineshape templates of the LDM, with
+    a memory budget.
+
+    Templates are stored by key ``(broadening_method, wstep, truncation,
+    dxG, iG, dxL, iL)`` where ``iG, iL`` are the indices of the Gaussian and
+    Lorentzian widths on the logarithmic lattice of the LDM ``w = exp(i * dx)``
+    (see :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`).
+    For ``broadening_method='fft'`` the truncation is replaced by the FFT length
+    and the folding threshold (or the template length, if lineshapes are
+    truncated).
+
+    Parameters
+    ----------
+    max_size: float
+        memory budget (MB). Least recently used templates are removed when
+        this size is exceeded.
+
+    Examples
+    --------
+    The cache is created with the :py:class:`~radis.lbl.factory.SpectrumFactory`,
+    depending on ``radis.config["LINESHAPE_CACHE"]`` and
+    ``radis.config["LINESHAPE_CACHE_SIZE"]``. Cache hits and misses of the last
+    spectrum are stored in the profiler ::
+
+        sf.eq_spectrum(Tgas=1000)
+        sf.eq_spectrum(Tgas=1100)
+        print(sf.profiler.counters)
+        >>> {'lineshape_cache_hits': 12, 'lineshape_cache_misses': 2}
+
+    See Also
+    --------
+    :py:func:`~radis.lbl.broadening.get_lineshape_cache`
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0  #: int: current size (bytes)
+        self.hits = 0  #: int: total number of cache hits
+        self.misses = 0  #: int: total number of cache misses
+        self._cache = OrderedDict()
+        self._lock = Lock()  # templates may be accessed from several threads
+
+    def get(self, key):
+        """Returns the template stored under ``key``, or ``None``"""
+        with self._lock:
+            lineshape = self._cache.get(key)
+            if lineshape is None:
+                self.misses += 1
+            else:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return lineshape
+
+    def add(self, key, lineshape):
+        """Stores template ``lineshape`` under ``key``, and removes the least
+        recently used templates if the memory budget is exceeded"""
+        if lineshape.nbytes > self.max_size * 1e6:
+            return
+        lineshape.flags.writeable = False  # shared between spectra
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = lineshape
+            self.size += lineshape.nbytes
+            while self.size > self.max_size * 1e6:
+                _, removed = self._cache.popitem(last=False)
+                self.size -= removed.nbytes
+
+    def clear(self):
+        """Removes all templates"""
+        with self._lock:
+            self._cache.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+
+_process_lineshape_cache = None  # shared by all factories if LINESHAPE_CACHE="process"
+
+
+def get_lineshape_cache(scope, max_size):
+    """Returns the lineshape cache of a new factory
+
+    Parameters
+    ----------
+    scope: ``"factory"``, ``"process"``, or ``False``
+        if ``"factory"``, returns a new cache. If ``"process"``, returns a cache
+        shared by all factories of the Python process. If ``False``, returns ``None``
+        (templates are not cached)
+    max_size: float
+        memory budget (MB) of the cache
+
+    See Also
+    --------
+    :py:class:`~radis.lbl.broadening.LineshapeCache`
+    """
+    global _process_lineshape_cache
+
+    if scope == False:
+        return None
+    elif scope == "factory":
+        return LineshapeCache(max_size)
+    elif scope == "process":
+        if _process_lineshape_cache is None:
+            _process_lineshape_cache = LineshapeCache(max_size)
+        _process_lineshape_cache.max_size = max_size
+        return _process_lineshape_cache
+    else:
+        raise ValueError(
+            "Unexpected value for radis.config['LINESHAPE_CACHE']: {0}. Use 'factory', 'process' or false".format(
+                scope
+            )
+        )
+
+
 # %% Tools
 
 
@@ -1000,6 +1838,17 @@ class BroadenFactory(BaseFactory):
         # # ... else it default to the non-cython version. What was used eventually
         # # ... is stored in self.params.use_cython
 
+        # Engine used to distribute lines on the LDM grid
+        self.add_at_engine = radis.config[
+            "ADD_AT_ENGINE"
+        ]  # default value (read from config file)
+        # ... What was used eventually is stored in self.misc.add_at_used
+
+        # Cache of LDM lineshape templates
+        self._lineshape_cache = get_lineshape_cache(
+            radis.config["LINESHAPE_CACHE"], radis.config["LINESHAPE_CACHE_SIZE"]
+        )
+
         # Predict broadening times (helps trigger warnings for optimization)
         self._broadening_time_ruleofthumb = 1e-7  # s / lines / point
         # Ex: broadening width of 10 cm-1  with resolution 0.01 cm-1:  1000 points
@@ -1028,6 +1877,25 @@ class BroadenFactory(BaseFactory):
 
     # %% Functions to calculate broadening HWHM
 
+    def _get_HWHM_inputs(self):
+        """Returns all inputs the broadening HWHM depend on, apart from the
+        line database : HWHM calculated for a previous spectrum are reused if
+        they are unchanged (see :py:meth:`~radis.lbl.base.BaseFactory._calc_cached_columns`)
+        """
+        return (
+            self.input.Tgas,
+            self.input.pressure,
+            self.input.mole_fraction,
+            tuple(sorted(self._diluent.items())),
+            (
+                "auto"
+                if self._broadening_method == "auto"
+                else self.params.broadening_method
+            ),
+            self.params.lbfunc,
+            radis.config["MISSING_BROAD_COEF"],
+        )
+
     def _calc_broadening_HWHM(self):
         """Calculate broadening HWHM and store in line dataframe (df1).
 
@@ -1071,8 +1939,77 @@ class BroadenFactory(BaseFactory):
         broadening_method = (
             self.params.broadening_method
         )  # Lineshape broadening algorithm
+        if self._broadening_method == "auto":
+            # chosen later, see _autotune_broadening. Any method may be used
+            broadening_method = "auto"
         isneutral = self.input.isneutral
 
+        diluent, diluent_broadening_coeff = self._get_diluent_broadening_coeff(
+            df, diluent
+        )
+
+        if broadening_method not in ["voigt", "faddeeva", "auto", "convolve", "fft"]:
+            raise ValueError(
+                "Unexpected lineshape broadening algorithm : broadening_method={0}".format(
+                    broadening_method
+                )
+            )
+        add_voigt = broadening_method in ["voigt", "faddeeva", "auto"]
+
+        # Get broadenings
+        if (
+            self.dataframe_type == "pandas"
+            and not self.params.lbfunc
+            and not self.input.isatom
+        ):
+            # Adds hwhm_lorentz, hwhm_gauss, hwhm_voigt and shiftwav in a
+            # single pass over all lines:
+            self._add_broadening_HWHM_fused(
+                df,
+                pressure_atm,
+                mole_fraction,
+                Tgas,
+                Tref,
+                diluent,
+                diluent_broadening_coeff,
+                add_voigt,
+            )
+        else:
+            # Adds hwhm_lorentz:
+            self._add_Lorentzian_broadening_HWHM(
+                df,
+                pressure_atm,
+                mole_fraction,
+                Tgas,
+                Tref,
+                diluent,
+                diluent_broadening_coeff,
+                isneutral,
+            )
+            # Add hwhm_gauss:
+            self._add_doppler_broadening_HWHM(df, Tgas)
+            if add_voigt:
+                # Adds hwhm_voigt:
+                df["hwhm_voigt"] = (
+                    olivero_1977(2 * df["hwhm_gauss"], 2 * df["hwhm_lorentz"]) / 2
+                )
+
+        self.profiler.stop("calc_hwhm", "Calculate broadening HWHM")
+
+    def _get_diluent_broadening_coeff(self, df, diluent):
+        """Returns the diluents (checked for atoms) and the broadening
+        coefficients of the lines of ``df`` by each diluent other than air (air
+        coefficients are used if they are missing, depending on
+        ``radis.config["MISSING_BROAD_COEF"]``), see
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_broadening_HWHM`
+
+        Returns
+        -------
+        diluent: dict
+            ``{diluent: mole fraction}``
+        diluent_broadening_coeff: dict
+            ``{"gamma_<diluent>": column, "n_<diluent>": column}``
+        """
         # diluent and their broadening coeff dictionary
         diluent_broadening_coeff = {}
 
@@ -1189,33 +2126,7 @@ class BroadenFactory(BaseFactory):
                             "Tdpair"
                         ]  # note @dev : check it doesn't create a new memory object
 
-        # Get broadenings
-        # Adds hwhm_lorentz:
-        self._add_Lorentzian_broadening_HWHM(
-            df,
-            pressure_atm,
-            mole_fraction,
-            Tgas,
-            Tref,
-            diluent,
-            diluent_broadening_coeff,
-            isneutral,
-        )
-        # Add hwhm_gauss:
-        self._add_doppler_broadening_HWHM(df, Tgas)
-        if broadening_method == "voigt":
-            # Adds hwhm_voigt:
-            df["hwhm_voigt"] = (
-                olivero_1977(2 * df["hwhm_gauss"], 2 * df["hwhm_lorentz"]) / 2
-            )
-        elif broadening_method not in ["convolve", "fft"]:
-            raise ValueError(
-                "Unexpected lineshape broadening algorithm : broadening_method={0}".format(
-                    broadening_method
-                )
-            )
-
-        self.profiler.stop("calc_hwhm", "Calculate broadening HWHM")
+        return diluent, diluent_broadening_coeff
 
     def _calc_min_width(self, df):
         """Calculates the minimum FWHM of the lines
@@ -1305,6 +2216,384 @@ class BroadenFactory(BaseFactory):
 
         return
 
+    def _autotune_broadening(self):
+        """Choose the fastest line broadening configuration for the parameters
+        of :py:class:`~radis.lbl.factory.SpectrumFactory` that are ``"auto"``
+        (``optimization``, ``broadening_method``, ``chunksize``, and the
+        ``SPARSE_WAVERANGE`` key of ``radis.config``), given the number of lines,
+        spectral points and LDM cells of ``self.df1``.
+
+        Times are predicted from a calibration of this machine (see
+        :py:func:`~radis.lbl.autotune.get_calibration`). Configurations that
+        would use more than half of the available memory are discarded. The
+        decision is stored in ``self.misc.autotune``, and therefore in the
+        conditions of the Spectrum.
+
+        Notes
+        -----
+        ``"min-RMS"`` has the same cost as ``"simple"`` and is only used if asked
+        explicitly. If ``truncation`` is not ``None``, ``broadening_method="fft"``
+        uses the same truncated lineshapes as ``"voigt"`` (see
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`) :
+        both candidates give the same spectrum.
+
+        See Also
+        --------
+        :py:func:`~radis.lbl.autotune.predict_broadening_time`
+        """
+        from radis.lbl.autotune import (
+            get_calibration,
+            get_sparse_points,
+            predict_broadening_memory,
+            predict_broadening_time,
+        )
+
+        self.profiler.start("autotune_broadening", 3)
+
+        df = self.df1
+        truncation = self.params.truncation
+
+        if self._optimization == "auto":
+            optimizations = ["simple", None]
+        else:
+            optimizations = [self.params.optimization]
+        if self._broadening_method == "auto":
+            broadening_methods = ["voigt", "fft"]
+        else:
+            broadening_methods = [self.params.broadening_method]
+
+        candidates = []
+        for optimization in optimizations:
+            for broadening_method in broadening_methods:
+                if broadening_method == "fft" and optimization is None:
+                    continue
+                if optimization is not None and truncation is None:
+                    if broadening_method != "fft":
+                        continue
+                if optimization is not None and broadening_method != "fft":
+                    if self._sparse_ldm == "auto":
+                        sparse_ldms = [False, True]
+                    else:
+                        sparse_ldms = [self.params.sparse_ldm]
+                elif self._sparse_ldm == "auto":
+                    sparse_ldms = [False]
+                else:
+                    sparse_ldms = [self.params.sparse_ldm]
+                for sparse_ldm in sparse_ldms:
+                    candidates.append((optimization, broadening_method, sparse_ldm))
+        if not candidates:
+            candidates = [
+                (
+                    self.params.optimization,
+                    self.params.broadening_method,
+                    self.params.sparse_ldm == True,
+                )
+            ]
+
+        # Size of the problem
+        Ngrid = len(self.wavenumber_calc)
+        Nbroad = len(self.wbroad_centered)
+        NwGL = Nsparse = 1
+        if len(df) > 0 and any(c[0] is not None for c in candidates):
+            wL_dat = df.hwhm_lorentz.to_numpy() * 2.000  # FWHM
+            wG_dat = df.hwhm_gauss.to_numpy() * 2.000  # FWHM
+            NwGL = len(self._init_LDM_axis(wL_dat, self.params.dxL)[0]) * len(
+                self._init_LDM_axis(wG_dat, self.params.dxG)[0]
+            )
+            Nsparse = get_sparse_points(
+                wL_dat, wG_dat, self.params.dxL, self.params.dxG, Ngrid, Nbroad
+            )
+        size = (len(df), Ngrid, Nbroad, NwGL, self._get_fft_length(), Nsparse)
+
+        calibration = get_calibration(verbose=self.verbose)
+        itemsize = np.dtype(self.params.precision).itemsize
+        memory_budget = virtual_memory().available / 2
+        times = {c: predict_broadening_time(*c, size, calibration) for c in candidates}
+        fitting = [
+            c
+            for c in candidates
+            if predict_broadening_memory(*c, size, itemsize) <= memory_budget
+        ]
+        if not fitting:
+            fitting = [
+                min(candidates, key=lambda c: predict_broadening_memory(*c, size))
+            ]
+        optimization, broadening_method, sparse_ldm = min(fitting, key=times.get)
+
+        self.params.optimization = optimization
+        self.params.broadening_method = broadening_method
+        if self._sparse_ldm == "auto":
+            self.params.sparse_ldm = sparse_ldm
+        if self._chunksize == "auto":
+            # Only line-by-line broadening with the lineshape matrix needs to be
+            # split in chunks of lines, if the matrix does not fit in memory
+            chunksize = None
+            if optimization is None and (
+                broadening_method not in ["voigt", "faddeeva"]
+                or self.dataframe_type != "pandas"
+            ):
+                if 3 * 8 * len(df) * Nbroad > memory_budget:
+                    chunksize = memory_budget / (3 * 8 * Nbroad) * len(self.wavenumber)
+            self.misc.chunksize = chunksize
+
+        self.misc.autotune = (
+            f"optimization={optimization!r}, broadening_method={broadening_method!r}, "
+            + f"sparse_ldm={self.params.sparse_ldm}, chunksize={self.misc.chunksize}. "
+            + "Predicted times (s): "
+            + ", ".join(
+                f"{c[0]}/{c[1]}{'/sparse' if c[2] and c[0] else ''}: {times[c]:.2g}"
+                for c in candidates
+            )
+        )
+        if self.verbose >= 2:
+            print(f"Auto-tuned broadening: {self.misc.autotune}")
+
+        self.profiler.stop("autotune_broadening", "Chose broadening configuration")
+
+    def _get_self_broadening_coeff(self, df):
+        """Returns the self-broadening HWHM coefficient ``selbrd`` and its
+        temperature dependance ``Tdpsel`` of the lines of ``df``. ``airbrd`` is
+        used if ``selbrd`` is not in the database, and ``Tdpsel`` is ``None``
+        if not in the database (``Tdpair`` is then used, see
+        :py:func:`~radis.lbl.broadening.pressure_broadening_HWHM`)
+        """
+        # Check self broadening temperature-dependance coefficient is here
+        if self.dataframe_type == "pandas":
+            columns = list(df.keys())
+        elif self.dataframe_type == "vaex":
+            columns = df.column_names
+        if not "Tdpsel" in columns:
+            self.warn(
+                "Self-broadening temperature coefficient `Tdpsel` not given in database: used `Tdpair` instead",
+                "MissingSelfBroadeningTdepWarning",
+                level=2,  # only appear if verbose>=2
+            )
+            Tdpsel = None  # will be corrected in pressure_broadening_HWHM()
+        else:
+            Tdpsel = df.Tdpsel
+
+        # Check self broadening is here
+        if not "selbrd" in columns:
+            self.warn(
+                "Self-broadening reference width `selbrd` not given in database: used air broadening reference width `airbrd` instead",
+                "MissingSelfBroadeningWarning",
+                level=2,  # only appear if verbose>=2
+            )
+            selbrd = df.airbrd
+        else:
+            selbrd = df.selbrd
+
+        return selbrd, Tdpsel
+
+    def _add_broadening_HWHM_fused(
+        self,
+        df,
+        pressure_atm,
+        mole_fraction,
+        Tgas,
+        Tref,
+        diluent,
+        diluent_broadening_coeff,
+        add_voigt,
+    ):
+        """Update dataframe with Lorentzian, Gaussian and Voigt HWHM, and with
+        the pressure-shifted line positions, in a single pass over all lines
+        with the precompiled :py:func:`~radis.lbl.broadening._broadening_HWHM_jit`.
+
+        Same results as :py:meth:`~radis.lbl.broadening.BroadenFactory._add_Lorentzian_broadening_HWHM`,
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._add_doppler_broadening_HWHM`
+        and :py:meth:`~radis.lbl.base.BaseFactory.calc_lineshift`, for molecules
+        (without ``lbfunc``) and pandas DataFrames.
+
+        Returns
+        -------
+        None: input pandas Dataframe ``df`` is updated with keys:
+
+            - hwhm_lorentz
+            - hwhm_gauss
+            - hwhm_voigt (if ``add_voigt``)
+            - shiftwav (if ``Pshft`` is in the database, and ``shiftwav`` not
+              already calculated). If the pressure did not change since the
+              previous spectrum, it is reused instead (see
+              :py:meth:`~radis.lbl.base.BaseFactory._calc_cached_columns`)
+        """
+
+        def as_float64(x):
+            return np.asarray(x, dtype=np.float64)
+
+        N = len(df)
+        selbrd, Tdpsel = self._get_self_broadening_coeff(df)
+        if Tdpsel is None:
+            Tdpsel = df.Tdpair
+
+        # Broadening coefficients of all diluents, shape (D, N). See
+        # pressure_broadening_HWHM : air coefficients if missing
+        gamma_diluent = []
+        n_diluent = []
+        for diluent_molecule in diluent:
+            diluent_name = diluent_molecule.lower()
+            gamma_diluent.append(
+                as_float64(
+                    diluent_broadening_coeff.get("gamma_" + diluent_name, df.airbrd)
+                )
+            )
+            n_diluent.append(
+                as_float64(diluent_broadening_coeff.get("n_" + diluent_name, df.Tdpair))
+            )
+        total_mole_fraction = mole_fraction + sum(diluent.values())
+        assert np.isclose(total_mole_fraction, 1)
+
+        molar_mass = self.get_molar_mass(df)
+        if np.ndim(molar_mass) == 0:  # single isotope
+            molar_mass = np.full(N, molar_mass)
+
+        # The shift only depends on pressure : reuse the one of the previous
+        # spectrum if pressure is unchanged (see BaseFactory.calc_lineshift),
+        # else calculate it in the same pass
+        add_shift = "Pshft" in df.columns and "shiftwav" not in df.columns
+        lineshift_key = self._get_columns_cache_key(self._get_lineshift_inputs())
+        if add_shift and df is self.df1:
+            add_shift = not self._restore_cached_columns(
+                "calc_lineshift", lineshift_key
+            )
+
+        hwhm_lorentz = np.empty(N)
+        hwhm_gauss = np.empty(N)
+        hwhm_voigt = np.empty(N if add_voigt else 0)
+        shiftwav = np.empty(N if add_shift else 0)
+        _broadening_HWHM_jit(
+            hwhm_lorentz,
+            hwhm_gauss,
+            hwhm_voigt,
+            shiftwav,
+            as_float64(df.wav),
+            as_float64(molar_mass),
+            as_float64(selbrd),
+            as_float64(Tdpsel),
+            np.array(gamma_diluent).reshape(len(diluent), N),
+            np.array(n_diluent).reshape(len(diluent), N),
+            np.array(list(diluent.values()), dtype=np.float64),
+            as_float64(df.Pshft) if add_shift else np.empty(0),
+            float(Tgas),
+            float(Tref),
+            float(pressure_atm),
+            float(mole_fraction),
+        )
+
+        # Update dataframe
+        df["hwhm_lorentz"] = hwhm_lorentz
+        df["hwhm_gauss"] = hwhm_gauss
+        if add_voigt:
+            df["hwhm_voigt"] = hwhm_voigt
+        if add_shift:
+            df["shiftwav"] = shiftwav
+            if lineshift_key is not None and df is self.df1:
+                self.profiler.count("columns_cache_misses")
+                self._store_cached_columns(
+                    "calc_lineshift", lineshift_key, {"shiftwav": shiftwav}
+                )
+
+        return
+
+    def _calc_broadening_HWHM_batch(self, df, Tgas, pressure, mole_fraction, diluents):
+        """Calculate the Lorentzian, Gaussian and Voigt HWHM of the lines of
+        ``df`` for ``C`` conditions at once, with the precompiled
+        :py:func:`~radis.lbl.broadening._broadening_HWHM_batch_jit`. Used by
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch`
+
+        Same results as :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_broadening_HWHM`
+        for each condition, for molecules (without ``lbfunc``) and pandas DataFrames.
+
+        Parameters
+        ----------
+        df: pandas DataFrame
+            lines
+        Tgas, pressure, mole_fraction: arrays   [size C]
+            gas temperatures (K), pressures (bar) and mole fractions
+        diluents: list of dict
+            ``{diluent: mole fraction}`` of each condition. All conditions
+            must have the same diluents
+
+        Returns
+        -------
+        hwhm_lorentz, hwhm_gauss: 2D arrays   [shape (C, N)]
+        hwhm_voigt: 2D array   [shape (C, N)], or ``None``
+            not calculated if not needed by the broadening method
+        """
+
+        def as_float64(x):
+            return np.asarray(x, dtype=np.float64)
+
+        self.profiler.start("calc_hwhm", 2)
+
+        broadening_method = self.params.broadening_method
+        if self._broadening_method == "auto":
+            # chosen later, see _autotune_broadening. Any method may be used
+            broadening_method = "auto"
+        if broadening_method not in ["voigt", "faddeeva", "auto", "convolve", "fft"]:
+            raise ValueError(
+                "Unexpected lineshape broadening algorithm : broadening_method={0}".format(
+                    broadening_method
+                )
+            )
+        add_voigt = broadening_method in ["voigt", "faddeeva", "auto"]
+
+        diluent, diluent_broadening_coeff = self._get_diluent_broadening_coeff(
+            df, diluents[0]
+        )
+
+        N = len(df)
+        C = len(Tgas)
+        selbrd, Tdpsel = self._get_self_broadening_coeff(df)
+        if Tdpsel is None:
+            Tdpsel = df.Tdpair
+
+        # Broadening coefficients of all diluents, shape (D, N). See
+        # pressure_broadening_HWHM : air coefficients if missing
+        gamma_diluent = []
+        n_diluent = []
+        for diluent_molecule in diluent:
+            diluent_name = diluent_molecule.lower()
+            gamma_diluent.append(
+                as_float64(
+                    diluent_broadening_coeff.get("gamma_" + diluent_name, df.airbrd)
+                )
+            )
+            n_diluent.append(
+                as_float64(diluent_broadening_coeff.get("n_" + diluent_name, df.Tdpair))
+            )
+        x_diluent = np.array(
+            [[d[k] for k in diluent] for d in diluents], dtype=np.float64
+        ).reshape(C, len(diluent))
+
+        molar_mass = self.get_molar_mass(df)
+        if np.ndim(molar_mass) == 0:  # single isotope
+            molar_mass = np.full(N, molar_mass)
+
+        hwhm_lorentz = np.empty((C, N))
+        hwhm_gauss = np.empty((C, N))
+        hwhm_voigt = np.empty((C, N if add_voigt else 0))
+        _broadening_HWHM_batch_jit(
+            hwhm_lorentz,
+            hwhm_gauss,
+            hwhm_voigt,
+            as_float64(df.wav),
+            as_float64(molar_mass),
+            as_float64(selbrd),
+            as_float64(Tdpsel),
+            np.array(gamma_diluent).reshape(len(diluent), N),
+            np.array(n_diluent).reshape(len(diluent), N),
+            x_diluent,
+            as_float64(Tgas),
+            float(self.input.Tref),
+            as_float64(pressure) / 1.01325,  # bar to atm
+            as_float64(mole_fraction),
+        )
+
+        self.profiler.stop("calc_hwhm", "Calculate broadening HWHM")
+
+        return hwhm_lorentz, hwhm_gauss, hwhm_voigt if add_voigt else None
+
     def _add_Lorentzian_broadening_HWHM(
         self,
         df,
@@ -1381,31 +2670,7 @@ class BroadenFactory(BaseFactory):
                 )  # Konjević et al. 2012 §4.1.3.2, neglect stark shift by default
                 wl = gammma_rad + gamma_stark + gamma_vdw
             else:
-                # Check self broadening temperature-dependance coefficient is here
-                if self.dataframe_type == "pandas":
-                    columns = list(df.keys())
-                elif self.dataframe_type == "vaex":
-                    columns = df.column_names
-                if not "Tdpsel" in columns:
-                    self.warn(
-                        "Self-broadening temperature coefficient `Tdpsel` not given in database: used `Tdpair` instead",
-                        "MissingSelfBroadeningTdepWarning",
-                        level=2,  # only appear if verbose>=2
-                    )
-                    Tdpsel = None  # will be corrected in pressure_broadening_HWHM()
-                else:
-                    Tdpsel = df.Tdpsel
-
-                # Check self broadening is here
-                if not "selbrd" in columns:
-                    self.warn(
-                        "Self-broadening reference width `selbrd` not given in database: used air broadening reference width `airbrd` instead",
-                        "MissingSelfBroadeningWarning",
-                        level=2,  # only appear if verbose>=2
-                    )
-                    selbrd = df.airbrd
-                else:
-                    selbrd = df.selbrd
+                selbrd, Tdpsel = self._get_self_broadening_coeff(df)
 
                 # Calculate broadening HWHM
                 wl = pressure_broadening_HWHM(
@@ -1590,7 +2855,9 @@ class BroadenFactory(BaseFactory):
         """Computes voigt broadening over all lines + normalize.
 
         Uses an approximation of the Voigt profile [1]_, [2]_ that maintains a
-        better accuracy in the far wings.
+        better accuracy in the far wings, or the exact Voigt profile computed
+        with the Faddeeva function if ``broadening_method='faddeeva'`` (see
+        :py:func:`~radis.lbl.broadening.faddeeva_voigt_lineshape`).
 
         Exact for a pure Gaussian and pure Lorentzian
 
@@ -1648,7 +2915,20 @@ class BroadenFactory(BaseFactory):
 
         # Calculate broadening for all lines
         # ----------------------------------
-        lineshape = voigt_lineshape(wbroad_centered, hwhm_lorentz, hwhm_voigt, jit=jit)
+        if self.params.broadening_method == "faddeeva":
+            # exact Voigt profile : uses the Gaussian HWHM instead of the Voigt HWHM
+            hwhm_gauss = dg.hwhm_gauss
+            if self.dataframe_type == "pandas" and hasattr(hwhm_gauss, "values"):
+                hwhm_gauss = hwhm_gauss.values.reshape((1, -1))
+            elif self.dataframe_type == "vaex":
+                hwhm_gauss = hwhm_gauss.to_numpy().reshape((1, -1))
+            lineshape = faddeeva_voigt_lineshape(
+                wbroad_centered, hwhm_lorentz, hwhm_gauss
+            )
+        else:
+            lineshape = voigt_lineshape(
+                wbroad_centered, hwhm_lorentz, hwhm_voigt, jit=jit
+            )
 
         return lineshape
 
@@ -1734,7 +3014,7 @@ class BroadenFactory(BaseFactory):
         broadening_method = (
             self.params.broadening_method
         )  # Lineshape broadening algorithm
-        if broadening_method == "voigt":
+        if broadening_method in ["voigt", "faddeeva"]:
             jit = True
             self.profiler.start("voigt_broadening", 3)
             line_profile = self._voigt_broadening(dg, wbroad_centered, jit=jit)
@@ -1777,6 +3057,36 @@ class BroadenFactory(BaseFactory):
 
         return line_profile
 
+    def _init_LDM_axis(self, w_dat, log_p):
+        """Returns widths of the LDM axis, and their index ``i`` on the
+        logarithmic lattice ``w = exp(i * log_p)``. Using a fixed lattice
+        allows to reuse lineshape templates between calculations
+
+        Parameters
+        ----------
+        w_dat: array
+            widths (FWHM) of the lines
+        log_p: float
+            step of the logarithmic lattice, ex: ``self.params.dxL``
+        """
+        w_min = float(w_dat.min())
+        if w_min == 0:
+            self.warn(
+                f"{(w_dat==0).sum()}"
+                + " line(s) had a calculated broadening of 0 cm-1. Check the database. At least this line is faulty: \n\n"
+                + "{}".format(self.df1.iloc[(w_dat == 0).argmax()])
+                + "\n\nIf you want to ignore, use `warnings['ZeroBroadeningWarning'] = 'ignore'`",
+                category="ZeroBroadeningWarning",
+            )
+            w_min = float(w_dat[w_dat > 0].min())
+        w_max = (
+            float(w_dat.max()) + 1e-4
+        )  # Add small number to prevent w_max falling outside of the grid
+        i = np.arange(
+            np.floor(np.log(w_min) / log_p), np.ceil(np.log(w_max) / log_p) + 1
+        ).astype(np.int64)
+        return np.exp(log_p * i), i
+
     def _calc_lineshape_LDM(self, df):
         """Generate the lineshape database using the steps defined by the
         parameters :py:attr:`~radis.lbl.loader.Parameters.dxL` and
@@ -1789,10 +3099,11 @@ class BroadenFactory(BaseFactory):
 
         Returns
         -------
-        line_profile_LDM: dict
-            dictionary of Voigt profile template.
+        line_profile_LDM: dict, or array
+            dictionary of Voigt profile template ``line_profile_LDM[l][m]``.
             If ``self.params.broadening_method == 'fft'``, templates are calculated
-            in Fourier space.
+            in Fourier space, and stacked in a 3D array of shape ``(Nf, NwG, NwL)``
+            (``Nf`` frequencies, see :py:meth:`~radis.lbl.broadening.BroadenFactory._get_fft_length`)
         wL, wG: array
             Lorentzian and Gaussian FWHM in LDM
         wL_dat, wG_dat: array
@@ -1813,23 +3124,6 @@ class BroadenFactory(BaseFactory):
         # Prepare steps for Lineshape database
         # ------------------------------------
 
-        def _init_w_axis(w_dat, log_p):
-            w_min = w_dat.min()
-            if w_min == 0:
-                self.warn(
-                    f"{(w_dat==0).sum()}"
-                    + " line(s) had a calculated broadening of 0 cm-1. Check the database. At least this line is faulty: \n\n"
-                    + "{}".format(self.df1.iloc[(w_min == 0).argmax()])
-                    + "\n\nIf you want to ignore, use `warnings['ZeroBroadeningWarning'] = 'ignore'`",
-                    category="ZeroBroadeningWarning",
-                )
-                w_min = w_dat[w_dat > 0].min()
-            w_max = (
-                w_dat.max() + 1e-4
-            )  # Add small number to prevent w_max falling outside of the grid
-            N = np.ceil((np.log(w_max) - np.log(w_min)) / log_p) + 1
-            return w_min * np.exp(log_p * np.arange(N))
-
         log_pL = self.params.dxL  # LDM user params
         log_pG = self.params.dxG  # LDM user params
 
@@ -1840,17 +3134,38 @@ class BroadenFactory(BaseFactory):
             wL_dat = df.hwhm_lorentz * 2.000  # FWHM
             wG_dat = df.hwhm_gauss * 2.000  # FWHM
 
-        wL = _init_w_axis(wL_dat, log_pL)  # FWHM
+        wL, iL = self._init_LDM_axis(wL_dat, log_pL)  # FWHM
         self.NwL = len(wL)
-        wG = _init_w_axis(wG_dat, log_pG)  # FWHM
+        wG, iG = self._init_LDM_axis(wG_dat, log_pG)  # FWHM
         self.NwG = len(wG)
 
         # Calculate the Lineshape
         # -----------------------
+        # Templates already calculated for the same widths (in a previous
+        # spectrum, or another chunk of lines) are retrieved from the cache.
+        # See LineshapeCache
+
+        cache = self._lineshape_cache
+
+        def get_template(key):
+            if cache is None:
+                return None
+            lineshape = cache.get(key)
+            if lineshape is None:
+                self.profiler.count("lineshape_cache_misses")
+            else:
+                self.profiler.count("lineshape_cache_hits")
+            return lineshape
+
+        def add_template(key, lineshape):
+            if cache is not None:
+                cache.add(key, lineshape)
 
         line_profile_LDM = {}
         broadening_method = self.params.broadening_method
-        if broadening_method == "voigt":
+        wstep = self.params.wstep
+        dtype = np.dtype(self.params.precision)
+        if broadening_method in ["voigt", "faddeeva"]:
             jit = False  # not enough lines to make the just-in-time FORTRAN compilation useful
             wbroad_centered = self.wbroad_centered
 
@@ -1859,72 +3174,193 @@ class BroadenFactory(BaseFactory):
             for l in range(len(wG)):
                 line_profile_LDM[l] = {}
                 for m in range(len(wL)):
-                    wV_ij = olivero_1977(wG[l], wL[m])  # FWHM
-                    lineshape = voigt_lineshape(
-                        wbroad_centered, wL[m] / 2, wV_ij / 2, jit=jit
-                    )  # FWHM > HWHM
+                    key = (
+                        broadening_method,
+                        dtype.name,
+                        wstep,
+                        len(wbroad_centered),
+                        log_pG,
+                        iG[l],
+                        log_pL,
+                        iL[m],
+                    )
+                    lineshape = get_template(key)
+                    if lineshape is None:
+                        if broadening_method == "faddeeva":
+                            lineshape = faddeeva_voigt_lineshape(
+                                wbroad_centered, wL[m] / 2, wG[l] / 2
+                            )  # FWHM > HWHM
+                        else:
+                            wV_ij = olivero_1977(wG[l], wL[m])  # FWHM
+                            lineshape = voigt_lineshape(
+                                wbroad_centered, wL[m] / 2, wV_ij / 2, jit=jit
+                            )  # FWHM > HWHM
+                        lineshape = lineshape.astype(dtype, copy=False)
+                        add_template(key, lineshape)
                     line_profile_LDM[l][m] = lineshape
 
         elif broadening_method == "convolve":
             wbroad_centered = self.wbroad_centered
 
-            IG = [
-                gaussian_lineshape(wbroad_centered, wG[l] / 2) for l in range(len(wG))
-            ]  # FWHM>HWHM
-            IL = [
-                lorentzian_lineshape(wbroad_centered, wL[m] / 2) for m in range(len(wL))
-            ]  # FWHM>HWHM
-            # Non vectorized. See Voigt for vectorized.
+            IG = {}
+            IL = {}
 
             # Get all combinations of Voigt lineshapes
             for l in range(len(wG)):
                 line_profile_LDM[l] = {}
                 for m in range(len(wL)):
-                    lineshape = np.convolve(IL[m], IG[l], mode="same")
-                    lineshape /= np.trapz(lineshape, x=wbroad_centered)
+                    key = (
+                        broadening_method,
+                        dtype.name,
+                        wstep,
+                        len(wbroad_centered),
+                        log_pG,
+                        iG[l],
+                        log_pL,
+                        iL[m],
+                    )
+                    lineshape = get_template(key)
+                    if lineshape is None:
+                        # Non vectorized. See Voigt for vectorized.
+                        if l not in IG:
+                            IG[l] = gaussian_lineshape(
+                                wbroad_centered, wG[l] / 2
+                            )  # FWHM>HWHM
+                        if m not in IL:
+                            IL[m] = lorentzian_lineshape(
+                                wbroad_centered, wL[m] / 2
+                            )  # FWHM>HWHM
+                        lineshape = np.convolve(IL[m], IG[l], mode="same")
+                        lineshape /= np.trapz(lineshape, x=wbroad_centered)
+                        lineshape = lineshape.astype(dtype, copy=False)
+                        add_template(key, lineshape)
                     line_profile_LDM[l][m] = lineshape
 
+        elif broadening_method == "fft" and self.params.truncation is not None:
+            # 'fft' chosen by the auto-tuner with a truncation (see
+            # _autotune_broadening) : the truncated Voigt templates of 'voigt'
+            # are wrapped around the FFT grid and transformed, so the spectrum
+            # is the same as with 'voigt'
+            N_fft = self._get_fft_length()
+            wbroad_centered = self.wbroad_centered
+            K = len(wbroad_centered) // 2
+            line_profile_LDM = np.empty((N_fft // 2 + 1, len(wG), len(wL)), dtype=dtype)
+            for l in range(len(wG)):
+                for m in range(len(wL)):
+                    key = (
+                        broadening_method,
+                        dtype.name,
+                        wstep,
+                        N_fft,
+                        len(wbroad_centered),
+                        log_pG,
+                        iG[l],
+                        log_pL,
+                        iL[m],
+                    )
+                    lineshape_FT = get_template(key)
+                    if lineshape_FT is None:
+                        wV_ij = olivero_1977(wG[l], wL[m])  # FWHM
+                        lineshape = voigt_lineshape(
+                            wbroad_centered, wL[m] / 2, wV_ij / 2, jit=False
+                        )  # FWHM > HWHM
+                        wrapped = np.zeros(N_fft)
+                        wrapped[: K + 1] = lineshape[K:]
+                        wrapped[-K:] = lineshape[:K]
+                        # (real : the lineshape is symmetric)
+                        lineshape_FT = (rfft(wrapped).real * wstep).astype(dtype)
+                        add_template(key, lineshape_FT)
+                    line_profile_LDM[:, l, m] = lineshape_FT
+
         elif broadening_method == "fft":
             # Unlike real space methods ('convolve', 'voigt'), here we calculate
-            # the lineshape on the full spectral range.
-            w = self.wavenumber_calc
-            wstep = self.params.wstep
-            w_lineshape_ft = np.fft.rfftfreq(
-                2 * len(w), wstep
-            )  # TO-DO: add  + self.misc.zero_padding
+            # the lineshape on the full spectral range (including zero-padding).
+            N_fft = self._get_fft_length()
+            w_lineshape_ft = np.fft.rfftfreq(N_fft, wstep)
 
             w_fold = (w_lineshape_ft, w_lineshape_ft[::-1])
 
-            # Get all combinations of Voigt lineshapes (in Fourier space)
+            # All combinations of Voigt lineshapes (in Fourier space) are stacked
+            # in a single array of shape (Nf, NwG, NwL)
+            line_profile_LDM = np.empty(
+                (len(w_lineshape_ft), len(wG), len(wL)), dtype=dtype
+            )
+            keys = {}
+            missing = np.zeros((len(wG), len(wL)), dtype=bool)
             for l in range(len(wG)):
-                line_profile_LDM[l] = {}
                 for m in range(len(wL)):
-
-                    line_profile_LDM[l][m] = voigt_FT(
-                        w_lineshape_ft, wG[l] / 2, wL[m] / 2
+                    keys[l, m] = (
+                        broadening_method,
+                        dtype.name,
+                        wstep,
+                        N_fft,
+                        self.params.folding_thresh,
+                        log_pG,
+                        iG[l],
+                        log_pL,
+                        iL[m],
                     )
-
-                    # Add folding until threshold is reached:
-                    n = 1
-                    while (
-                        voigt_FT(n / (2 * wstep), wG[l] / 2, wL[m] / 2)
+                    lineshape_FT = get_template(keys[l, m])
+                    if lineshape_FT is None:
+                        missing[l, m] = True
+                    else:
+                        line_profile_LDM[:, l, m] = lineshape_FT
+
+            if missing.any():
+                # Calculate all missing lineshapes at once
+                hwhmG = np.broadcast_to(wG[:, None] / 2, missing.shape)[missing]
+                hwhmL = np.broadcast_to(wL[None, :] / 2, missing.shape)[missing]
+                lineshape_FT = voigt_FT(w_lineshape_ft[:, None], hwhmG, hwhmL)
+
+                # Add folding until threshold is reached (for each lineshape):
+                n = 1
+                fold = (
+                    voigt_FT(n / (2 * wstep), hwhmG, hwhmL)
+                    >= self.params.folding_thresh
+                )
+                while fold.any():
+                    lineshape_FT[:, fold] += voigt_FT(
+                        n / (2 * wstep) + w_fold[n & 1][:, None],
+                        hwhmG[fold],
+                        hwhmL[fold],
+                    )
+                    n += 1
+                    fold &= (
+                        voigt_FT(n / (2 * wstep), hwhmG, hwhmL)
                         >= self.params.folding_thresh
-                    ):
-                        line_profile_LDM[l][m] += voigt_FT(
-                            n / (2 * wstep) + w_fold[n & 1], wG[l] / 2, wL[m] / 2
-                        )
-                        n += 1
+                    )
+
+                lineshape_FT /= lineshape_FT[0]
 
-                    line_profile_LDM[l][m] /= line_profile_LDM[l][m][0]
+                line_profile_LDM[:, missing] = lineshape_FT
+                for k, (l, m) in enumerate(zip(*np.nonzero(missing))):
+                    add_template(keys[l, m], lineshape_FT[:, k].astype(dtype))
 
         else:
             raise NotImplementedError(
                 "Broadening method with LDM: {0}".format(broadening_method)
             )
 
+        # Line-dependent truncation : each template is truncated where its
+        # wings hold less than truncation_error of its area (narrow lines get
+        # much shorter templates). Templates are cached before truncation.
+        truncation_error = self.params.truncation_error
+        if truncation_error and broadening_method in ["voigt", "faddeeva", "convolve"]:
+            for l in line_profile_LDM:
+                for m in line_profile_LDM[l]:
+                    line_profile_LDM[l][m] = truncate_lineshape(
+                        line_profile_LDM[l][m], wstep, truncation_error
+                    )
+
         self.profiler.stop(
             "precompute_LDM_lineshapes",
-            f"Precomputed LDM lineshapes ({len(wL) * len(wG)})",
+            f"Precomputed LDM lineshapes ({len(wL) * len(wG)})"
+            + (
+                f" - cache: {self.profiler.counters.get('lineshape_cache_hits', 0)} hits, "
+                + f"{self.profiler.counters.get('lineshape_cache_misses', 0)} misses"
+                if cache is not None
+                else ""
+            ),
         )
 
         return line_profile_LDM, wL, wG, wL_dat, wG_dat
@@ -2125,24 +3561,234 @@ class BroadenFactory(BaseFactory):
                 fr_right * profS
             )
 
-        # Nomenclature for lines above:
-        # - low/high: start/end of a lineshape
-        # - left/right: closest spectral grid point on the left/right
+        # Nomenclature for lines above:
+        # - low/high: start/end of a lineshape
+        # - left/right: closest spectral grid point on the left/right
+
+        self.profiler.stop("aggregate__lines", "Aggregate lines")
+
+        # Get valid range (discard wings of line profiles)
+        sumoflines_calc = sumoflines_calc[ioffset:-ioffset]
+        assert len(sumoflines_calc) == len(wavenumber_calc)
+        # Get valid range (discard neighbour lines)
+        sumoflines = sumoflines_calc[self.woutrange[0] : self.woutrange[1]]
+
+        return wavenumber, sumoflines
+
+    def _get_LBL_n_threads(self):
+        """Number of threads of the direct line-by-line Voigt kernel when all
+        lines are broadened at once : ``self.misc.n_jobs``, within the number of
+        threads available to numba. See
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_LBL`
+
+        Chunks of lines (``chunksize``) are already processed in parallel
+        threads by :py:meth:`~radis.lbl.broadening.BroadenFactory._sum_over_chunks`
+        and use a single-threaded kernel.
+        """
+        n_threads = min(
+            effective_n_jobs(self.misc.n_jobs), numba.config.NUMBA_NUM_THREADS
+        )
+        return max(1, n_threads)
+
+    def _broaden_lines_LBL(self, dg, broadened_params, n_threads=1):
+        """Line-by-line broadening (``optimization=None``) of the lines in
+        ``dg``, applied to each of the ``broadened_params``.
+
+        With ``broadening_method='voigt'`` or ``'faddeeva'``, lineshapes are computed on the fly
+        and summed directly on the spectral grid by the precompiled kernels
+        :py:func:`~radis.lbl.broadening._voigt_direct_jit` (or
+        :py:func:`~radis.lbl.broadening._voigt_direct_parallel_jit` with
+        ``n_threads > 1``) : memory does not scale with the number of lines
+        times the truncation width. Other broadening methods compute the
+        lineshape matrix with
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape` and
+        apply it with :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape`
+
+        Parameters
+        ----------
+        dg: pandas Dataframe    [length ``N``]
+            lines, with ``shiftwav``, ``hwhm_lorentz`` and ``hwhm_voigt`` columns
+        broadened_params: list of arrays   [length ``N``]
+            ex: ``[dg.S.values]``, or ``[dg.S.values, dg.Ei.values]``
+        n_threads: int
+            number of threads of the direct Voigt kernel
+
+        Returns
+        -------
+        wavenumber: array
+            valid calculation wavenumber range
+        sumoflines: list of arrays
+            sum of (broadened_param x line_profile) for each broadened parameter
+        """
+        broadening_method = self.params.broadening_method
+        if (
+            broadening_method not in ["voigt", "faddeeva"]
+            or self.dataframe_type != "pandas"
+        ):
+            line_profile = self._calc_lineshape(dg)  # usually the bottleneck
+            sumoflines = []
+            for broadened_param in broadened_params:
+                (wavenumber, sumoflines_i) = self._apply_lineshape(
+                    broadened_param, line_profile, dg.shiftwav.values
+                )
+                sumoflines.append(sumoflines_i)
+            return wavenumber, sumoflines
+
+        self.profiler.start("voigt_broadening_direct", 3)
+
+        I = np.array(broadened_params, dtype=np.float64)  # shape (P, N)
+        # offset to account for out-of-bound truncation (as in _apply_lineshape)
+        ioffset = arange_len(0, self.truncation, self.params.wstep) + 1
+        args = (
+            I,
+            dg.shiftwav.values.astype(np.float64),
+            dg.hwhm_lorentz.values.astype(np.float64),
+            dg.hwhm_gauss.values.astype(np.float64),
+            dg.hwhm_voigt.values.astype(np.float64),
+            self.wavenumber_calc,
+            self.wbroad_centered,
+            ioffset,
+            broadening_method == "faddeeva",
+        )
+        Wtot = len(self.wavenumber_calc) + 2 * ioffset
+
+        if n_threads > 1:
+            # each thread sums its block of lines in its own array
+            sumofblocks = zeros((n_threads, len(I), Wtot))
+            _voigt_direct_parallel_jit(sumofblocks, *args)
+            sumoflines_calc = sumofblocks.sum(axis=0)
+        else:
+            sumoflines_calc = zeros((len(I), Wtot))
+            _voigt_direct_jit(sumoflines_calc, *args, 0, 1)
+
+        # Get valid range (discard wings of line profiles, and neighbour lines)
+        sumoflines_calc = sumoflines_calc[:, ioffset:-ioffset]
+        sumoflines = sumoflines_calc[:, self.woutrange[0] : self.woutrange[1]]
+
+        self.profiler.stop(
+            "voigt_broadening_direct",
+            f"Calculated and applied Voigt profiles ({n_threads} thread(s))",
+        )
+
+        return self.wavenumber, list(sumoflines)
+
+    def _check_zero_padding(self):
+        """Set ``zero_padding=-1`` to the number of points of the spectral range
+        (see ``zero_padding`` in :py:class:`~radis.lbl.factory.SpectrumFactory`).
+        Larger values are reduced to the number of points of the spectral range,
+        which is enough for a linear convolution, with a warning"""
+        N = len(self.wavenumber_calc)
+        if self.misc.zero_padding > N:
+            self.warn(
+                f"zero_padding={self.misc.zero_padding} is larger than the number "
+                + f"of points of the spectral range ({N}). Using zero_padding={N}, "
+                + "which is enough for a linear convolution",
+                "PerformanceWarning",
+            )
+        if self.misc.zero_padding < 0 or self.misc.zero_padding > N:
+            self.misc.zero_padding = N
+
+    def _get_fft_length(self):
+        """Number of points of the LDM with ``broadening_method='fft'`` :
+        spectral range + zero-padding (see ``zero_padding`` in
+        :py:class:`~radis.lbl.factory.SpectrumFactory`), rounded up to an even,
+        FFT-friendly length (see :py:func:`scipy.fft.next_fast_len`).
+
+        The length must be even for the folding correction of
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`
+        """
+        N = len(self.wavenumber_calc)
+        zero_padding = self.misc.zero_padding
+        if zero_padding < 0 or zero_padding > N:
+            zero_padding = N
+        # at least 1 point of padding : lines are distributed on ki0 and ki0+1
+        zero_padding = max(zero_padding, 1)
+        if self.params.truncation is not None:
+            # truncated lineshapes (see _calc_lineshape_LDM) must not wrap
+            # around the FFT grid onto the other side of the spectral range
+            zero_padding = max(zero_padding, len(self.wbroad_centered) // 2 + 1)
+        return 2 * next_fast_len(-(-(N + zero_padding) // 2), real=True)
+
+    def _get_indices(self, arr_i, axis):
+        pos = np.interp(arr_i, axis, np.arange(axis.size))
+        index = pos.astype(np.int32)
+        return index, index + 1, pos - index
+
+    def _get_LDM_weights(self, S, tvi, tGi, tLi, wG_dat, wL_dat, optimization):
+        """Get the vectorized fractions of each line on the 2x2x2 bins of the
+        LDM grid, and the intensities on the left and right wavenumber points.
+
+        Used by :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+        with the ``"numpy"`` add-at engine, and for sparse LDM. The ``"numba"``
+        engine computes the same weights line by line in
+        :py:func:`~radis.lbl.broadening._add_at_LDM_jit`
+
+        Parameters
+        ----------
+        S: 2D array   (shape (N, P))
+            intensities of the ``P`` channels (ex: absorption and emission)
+
+        Returns
+        -------
+        awV00, awV01, awV10, awV11: arrays  (size N)
+        Iv0, Iv1: 2D arrays  (shape (N, P))
+        """
+        if optimization == "min-RMS":
+
+            dv = self.params.wstep
+            dxvGi = dv / wG_dat
+            dxG = self.params.dxG  # LDM user params
+            dxL = self.params.dxL  # LDM user params
+
+            C1_GG = ((6 * np.pi - 16) / (15 * np.pi - 32)) ** (1 / 1.50)
+            C1_LG = ((6 * np.pi - 16) / 3 * (np.log(2) / (2 * np.pi)) ** 0.5) ** (
+                1 / 2.25
+            )
+            C2_GG = (2 * np.log(2) / 15) ** (1 / 1.50)
+            C2_LG = ((2 * np.log(2)) ** 2 / 15) ** (1 / 2.25)
+
+            alpha_i = wL_dat / wG_dat
+
+            R_Gv = 8 * np.log(2)
+            R_GG = 2 - 1 / (C1_GG + C2_GG * alpha_i ** (2 / 1.50)) ** 1.50
+            R_GL = -2 * np.log(2) * alpha_i**2
+
+            R_LL = 1
+            R_LG = (
+                1
+                / (C1_LG * alpha_i ** (1 / 2.25) + C2_LG * alpha_i ** (4 / 2.25))
+                ** 2.25
+            )
+
+            # Add correction terms:
+            avi = tvi
 
-        self.profiler.stop("aggregate__lines", "Aggregate lines")
+            aGi = tGi + (
+                R_Gv * tvi * (tvi - 1) * dxvGi**2
+                + R_GG * tGi * (tGi - 1) * dxG**2
+                + R_GL * tLi * (tLi - 1) * dxL**2
+            ) / (2 * dxG)
 
-        # Get valid range (discard wings of line profiles)
-        sumoflines_calc = sumoflines_calc[ioffset:-ioffset]
-        assert len(sumoflines_calc) == len(wavenumber_calc)
-        # Get valid range (discard neighbour lines)
-        sumoflines = sumoflines_calc[self.woutrange[0] : self.woutrange[1]]
+            aLi = tLi + (
+                R_LG * tGi * (tGi - 1) * dxG**2 + R_LL * tLi * (tLi - 1) * dxL**2
+            ) / (2 * dxL)
 
-        return wavenumber, sumoflines
+        else:
+            # Simple weights:
+            avi = tvi
+            aGi = tGi
+            aLi = tLi
 
-    def _get_indices(self, arr_i, axis):
-        pos = np.interp(arr_i, axis, np.arange(axis.size))
-        index = pos.astype(np.int32)
-        return index, index + 1, pos - index
+        # ... fractions on LDM grid
+        awV00 = (1 - aGi) * (1 - aLi)
+        awV01 = (1 - aGi) * aLi
+        awV10 = aGi * (1 - aLi)
+        awV11 = aGi * aLi
+
+        Iv0 = S * (1 - avi)[:, None]
+        Iv1 = S * avi[:, None]
+
+        return awV00, awV01, awV10, awV11, Iv0, Iv1
 
     def _apply_lineshape_LDM(
         self,
@@ -2160,16 +3806,21 @@ class BroadenFactory(BaseFactory):
 
         Parameters
         ----------
-        broadened_param: pandas Series (or numpy array)   [size N = number of lines]
+        broadened_param: numpy array   [size N = number of lines, or shape (P, N)]
             Series to apply lineshape to. Typically linestrength `S` for absorption,
-            or `nu * A / 4pi * DeltaE` for emission
-        line_profile_LDM:  dict
+            or `nu * A / 4pi * DeltaE` for emission. If 2D, the ``P`` parameters
+            are distributed on the same LDM (with an extra trailing axis of
+            size ``P``) : indices and weights are computed once, and all
+            channels are convolved with the same lineshapes.
+        line_profile_LDM:  dict, or array
             dict of line profiles ::
 
                 lineshape = line_profile_LDM[gaussian_index][lorentzian_index]
 
             If ``self.params.broadening_method == 'fft'``, templates are given
-            in Fourier space.
+            in Fourier space, as an array ::
+
+                lineshape_FT = line_profile_LDM[:, gaussian_index, lorentzian_index]
 
         shifted_wavenum: (cm-1)     pandas Series (size N = number of lines)
             center wavelength (used to project broadened lineshapes )
@@ -2187,7 +3838,7 @@ class BroadenFactory(BaseFactory):
 
         Returns
         -------
-        sumoflines: array (size W  = size of output wavenumbers)
+        sumoflines: array (size W  = size of output wavenumbers, or shape (P, W))
             sum of (broadened_param x line_profile)
 
         Notes
@@ -2211,26 +3862,29 @@ class BroadenFactory(BaseFactory):
         wavenumber = self.wavenumber  # get vector of wavenumbers (shape W)
         wavenumber_calc = self.wavenumber_calc
         broadening_method = self.params.broadening_method
+        dtype = np.dtype(self.params.precision)  # of LDM and lineshapes
 
         # Get add-at method
-
-        # before v0.15 with Cython
-        # ... 1. allow user to use non-cython method (useful for tests ?)
-        # ... 2. write in the Spectrum object whether Cython was used or not
-        # ...    (either because deactivated, or because not installed)
-        # if self.use_cython and add_at != numpy_add_at:
-        #     _add_at = add_at
-        #     self.misc.add_at_used = "cython"
-        # else:
-        #     _add_at = numpy_add_at
-        #     self.misc.add_at_used = "numpy"
-
-        # after v0.15 without Cython
-        _add_at = numpy_add_at
-        self.misc.add_at_used = "numpy"
+        # ... "numba" : all 8 contributions of each line are distributed on the
+        # ...   LDM in a single pass (no temporary array of size N). See _add_at_LDM_jit
+        # ... "numpy" : weights computed vectorized, then 8 calls to np.add.at
+        if self.add_at_engine == "numba":
+            self.misc.add_at_used = "numba"
+        elif self.add_at_engine == "numpy":
+            _add_at = numpy_add_at
+            self.misc.add_at_used = "numpy"
+        else:
+            raise ValueError(
+                "Unknown add-at engine : {0}. Use 'numba' or 'numpy'. Check radis.config['ADD_AT_ENGINE']".format(
+                    self.add_at_engine
+                )
+            )
 
         # Vectorize the chunk of lines
-        S = broadened_param
+        # ... S has shape (N, P) : P intensities (channels) per line
+        single_channel = np.ndim(broadened_param) == 1
+        S = np.atleast_2d(broadened_param).T
+        P = S.shape[1]
 
         # ---------------------------
         # Apply line profile
@@ -2252,73 +3906,31 @@ class BroadenFactory(BaseFactory):
         elif self.dataframe_type == "pandas":
             li0, li1, tGi = self._get_indices(np.log(wG_dat), np.log(wG))
             mi0, mi1, tLi = self._get_indices(np.log(wL_dat), np.log(wL))
-        # Next assign simple weights:
-        if optimization == "min-RMS":
-
-            dv = self.params.wstep
-            dxvGi = dv / wG_dat
-            dxG = self.params.dxG  # LDM user params
-            dxL = self.params.dxL  # LDM user params
-
-            C1_GG = ((6 * np.pi - 16) / (15 * np.pi - 32)) ** (1 / 1.50)
-            C1_LG = ((6 * np.pi - 16) / 3 * (np.log(2) / (2 * np.pi)) ** 0.5) ** (
-                1 / 2.25
-            )
-            C2_GG = (2 * np.log(2) / 15) ** (1 / 1.50)
-            C2_LG = ((2 * np.log(2)) ** 2 / 15) ** (1 / 2.25)
-
-            alpha_i = wL_dat / wG_dat
-
-            R_Gv = 8 * np.log(2)
-            R_GG = 2 - 1 / (C1_GG + C2_GG * alpha_i ** (2 / 1.50)) ** 1.50
-            R_GL = -2 * np.log(2) * alpha_i**2
-
-            R_LL = 1
-            R_LG = (
-                1
-                / (C1_LG * alpha_i ** (1 / 2.25) + C2_LG * alpha_i ** (4 / 2.25))
-                ** 2.25
+        sparse_ldm = (
+            broadening_method in ["voigt", "faddeeva", "convolve"]
+            and self.params.sparse_ldm == True
+        )
+        # Interpolation weights are computed within the numba kernel, unless
+        # they are needed vectorized (numpy add-at, or sparse LDM)
+        fused_add_at = self.misc.add_at_used == "numba" and not sparse_ldm
+        if not fused_add_at:
+            awV00, awV01, awV10, awV11, Iv0, Iv1 = self._get_LDM_weights(
+                S, tvi, tGi, tLi, wG_dat, wL_dat, optimization
             )
 
-            # Add correction terms:
-            avi = tvi
-
-            aGi = tGi + (
-                R_Gv * tvi * (tvi - 1) * dxvGi**2
-                + R_GG * tGi * (tGi - 1) * dxG**2
-                + R_GL * tLi * (tLi - 1) * dxL**2
-            ) / (2 * dxG)
-
-            aLi = tLi + (
-                R_LG * tGi * (tGi - 1) * dxG**2 + R_LL * tLi * (tLi - 1) * dxL**2
-            ) / (2 * dxL)
-
-        else:
-            # Simple weights:
-            avi = tvi
-            aGi = tGi
-            aLi = tLi
-
-        # ... fractions on LDM grid
-        awV00 = (1 - aGi) * (1 - aLi)
-        awV01 = (1 - aGi) * aLi
-        awV10 = aGi * (1 - aLi)
-        awV11 = aGi * aLi
-
-        Iv0 = S * (1 - avi)
-        Iv1 = S * avi
-
         self.profiler.stop(
             "LDM_closest_matching_line", "Get closest matching line & fraction"
         )
         self.profiler.start("LDM_Distribute_lines", 3)
         # ... Initialize array on which to distribute the lineshapes
-        if broadening_method in ["voigt", "convolve"]:
+        if broadening_method in ["voigt", "faddeeva", "convolve"]:
             if self.params.sparse_ldm == True:
                 # LDM is constructed in a sparse-way later
                 pass
             else:
-                LDM = np.zeros((len(wavenumber_calc) + 2, len(wG), len(wL)))
+                LDM = np.zeros(
+                    (len(wavenumber_calc) + 2, len(wG), len(wL), P), dtype=dtype
+                )
                 # +2 to allocate one empty grid point on each side : case where a line is on the boundary
                 ki0 += 1
                 ki1 += 1
@@ -2328,154 +3940,97 @@ class BroadenFactory(BaseFactory):
                     print(
                         "SPARSE optimization not implemented with 'fft' mode. Use 'voigt' for analytical voigt, or radis.config['SPARSE_WAVERANGE'] = False"
                     )
-            LDM = np.zeros(
-                (
-                    2 * len(wavenumber_calc),  # TO-DO: Add  + self.misc.zero_padding
-                    len(wG),
-                    len(wL),
-                )
-            )
+            LDM = np.zeros((self._get_fft_length(), len(wG), len(wL), P), dtype=dtype)
         else:
             raise NotImplementedError(broadening_method)
 
         # Distribute all line intensities on the 2x2x2 bins.
-        if (
-            broadening_method in ["voigt", "convolve"]
-            and self.params.sparse_ldm == True
-        ):
-
-            import pandas as pd
-
-            df = pd.DataFrame(
-                {
-                    "ki0": ki0,
-                    "li0": li0,
-                    "li1": li1,
-                    "mi0": mi0,
-                    "mi1": mi1,
-                    "Iv0": Iv0,
-                    "Iv1": Iv1,
-                    "awV00": awV00,
-                    "awV01": awV01,
-                    "awV10": awV10,
-                    "awV11": awV11,
-                },
-                copy=False,
-            )
-
-            def get_non_zero_wranges(groupby_parameters, max_range, intensity_weight):
-                """Get coordinates of non-zero wave ranges for all lines
-                that share the same ``groupby_parameters``
-
-                Parameters
-                ----------
-                groupby_parameters: str
-                max_range: int
-
-                Examples
-                --------
-                ::
-                    LDM_ranges_00 = get_non_zero_wranges(groupby_parameters=["li0", "mi0"], max_range=len(wavenumber_calc))
-                """
-                # EP 31/10/21: the for loop over df.groupby is the current bottleneck
-                # (not even the sparse_add_at function !)
-                dgb = df.groupby(groupby_parameters, sort=False)
-                LDM_ranges = {}
-                LDM_reduced = {}
-                for groupby_param, group in dgb:
-                    truncation_pts = int(self.params.truncation // self.params.wstep)
-                    # note: truncation can be unique for each point of the LDM basis
-                    # (allow to have line-dependant truncation, at least as all
-                    # lines with same truncation are grouped together in the LDM basis)
-
-                    ki0 = group.ki0.values
-                    Iv0 = group.Iv0.values
-                    Iv1 = group.Iv1.values
-                    weight = group[intensity_weight].values
-
-                    # build the list of non-empty ranges for all lines with this lineshape :
-                    ranges, I = sparse_add_at(
-                        ki0, Iv0, Iv1, weight, max_range, truncation_pts
-                    )
-
-                    LDM_ranges[groupby_param] = ranges
-
-                    # generate reduced array:
-                    b = boolean_array_from_ranges(ranges, len(I))
-                    I_reduced = I[b]
-                    LDM_reduced[groupby_param] = I_reduced
-
-                return LDM_ranges, LDM_reduced
-
+        if sparse_ldm:
+            # Sort the 4 corner contributions of all lines once, by LDM cell
+            # (l, m) then by wavenumber position, and reduce them per cell in
+            # a single pass. See sparse_add_at_LDM
             w = wavenumber_calc
-
-            LDM_ranges_00, LDM_reduced_00 = get_non_zero_wranges(
-                groupby_parameters=["li0", "mi0"],
-                max_range=len(w),
-                intensity_weight="awV00",
-            )
-            LDM_ranges_01, LDM_reduced_01 = get_non_zero_wranges(
-                groupby_parameters=["li0", "mi1"],
-                max_range=len(w),
-                intensity_weight="awV01",
+            # ... number of points in the wings of the lineshape of each LDM
+            # ... cell (they differ if templates were truncated with truncation_error)
+            truncation_pts = np.full(
+                len(wG) * len(wL),
+                int(self.params.truncation // self.params.wstep),
+                dtype=np.int64,
             )
-            LDM_ranges_10, LDM_reduced_10 = get_non_zero_wranges(
-                groupby_parameters=["li1", "mi0"],
-                max_range=len(w),
-                intensity_weight="awV10",
+            if self.params.truncation_error:
+                for l in range(len(wG)):
+                    for m in range(len(wL)):
+                        truncation_pts[l * len(wL) + m] = min(
+                            truncation_pts[l * len(wL) + m],
+                            len(line_profile_LDM[l][m]) // 2,
+                        )
+
+            cell0 = li0.astype(np.int64) * len(wL) + mi0
+            cells = np.concatenate(
+                (cell0, cell0 + 1, cell0 + len(wL), cell0 + len(wL) + 1)
             )
-            LDM_ranges_11, LDM_reduced_11 = get_non_zero_wranges(
-                groupby_parameters=["li1", "mi1"],
-                max_range=len(w),
-                intensity_weight="awV11",
+            order = np.argsort(cells * len(w) + np.tile(ki0, 4), kind="stable")
+            del cells
+
+            ranges, I = sparse_add_at_LDM(
+                order,
+                ki0,
+                li0,
+                mi0,
+                np.ascontiguousarray(Iv0, dtype=np.float64),
+                np.ascontiguousarray(Iv1, dtype=np.float64),
+                np.vstack((awV00, awV01, awV10, awV11)),
+                len(wL),
+                len(w),
+                truncation_pts,
             )
+            del order
+            I = I.astype(dtype, copy=False)  # shape (sum of ranges, P)
 
-            # Combine all LDM ranges:
-            all_keys = (
-                set(LDM_ranges_00.keys())
-                | set(LDM_ranges_01.keys())
-                | set(LDM_ranges_10.keys())
-                | set(LDM_ranges_11.keys())
-            )
+            # Sparse storage (coordinates & non-zeros ranges) of each LDM cell :
+            offsets = np.concatenate(([0], np.cumsum(ranges[:, 2] - ranges[:, 1])))
+            cells, first = np.unique(ranges[:, 0], return_index=True)
+            last = np.append(first[1:], len(ranges))
             LDM_ranges = {}
             LDM_reduced = {}
-            #  (note : could be combined faster by combining the ranges directly, rather than generating the boolean arrays?)
-            for param in all_keys:
-                b = np.zeros(len(w), dtype=bool)
-                I = np.zeros(len(w))
-                if param in LDM_ranges_00:
-                    bi = boolean_array_from_ranges(LDM_ranges_00[param], len(w))
-                    I[bi] += LDM_reduced_00[param]
-                    b += bi
-                if param in LDM_ranges_01:
-                    bi = boolean_array_from_ranges(LDM_ranges_01[param], len(w))
-                    I[bi] += LDM_reduced_01[param]
-                    b += bi
-                if param in LDM_ranges_10:
-                    bi = boolean_array_from_ranges(LDM_ranges_10[param], len(w))
-                    I[bi] += LDM_reduced_10[param]
-                    b += bi
-                if param in LDM_ranges_11:
-                    bi = boolean_array_from_ranges(LDM_ranges_11[param], len(w))
-                    I[bi] += LDM_reduced_11[param]
-                    b += bi
-
-                # Sparse storage (coordinates & non-zeros ranges) :
-                if b.any():
-                    LDM_ranges[param] = non_zero_ranges_in_array(b)
-                    LDM_reduced[param] = I[b]
+            for cell, r0, r1 in zip(cells, first, last):
+                param = divmod(int(cell), len(wL))
+                LDM_ranges[param] = np.ascontiguousarray(ranges[r0:r1, 1:])
+                LDM_reduced[param] = I[offsets[r0] : offsets[r1]]
+
+        elif fused_add_at:
+            _add_at_LDM_jit(
+                LDM,
+                ki0,
+                np.ascontiguousarray(tvi, dtype=np.float64),
+                li0,
+                np.ascontiguousarray(tGi, dtype=np.float64),
+                mi0,
+                np.ascontiguousarray(tLi, dtype=np.float64),
+                np.ascontiguousarray(S, dtype=LDM.dtype),
+                np.ascontiguousarray(wG_dat, dtype=LDM.dtype),
+                np.ascontiguousarray(wL_dat, dtype=LDM.dtype),
+                optimization == "min-RMS",
+                float(self.params.wstep),
+                float(self.params.dxG),
+                float(self.params.dxL),
+            )
+
+            if broadening_method in ["voigt", "faddeeva", "convolve"]:
+                LDM = LDM[1:-1, :, :]
+                # 1:-1 to remove the empty grid point on each side
 
         else:
-            _add_at(LDM, ki0, li0, mi0, Iv0 * awV00)
-            _add_at(LDM, ki0, li0, mi1, Iv0 * awV01)
-            _add_at(LDM, ki0, li1, mi0, Iv0 * awV10)
-            _add_at(LDM, ki0, li1, mi1, Iv0 * awV11)
-            _add_at(LDM, ki1, li0, mi0, Iv1 * awV00)
-            _add_at(LDM, ki1, li0, mi1, Iv1 * awV01)
-            _add_at(LDM, ki1, li1, mi0, Iv1 * awV10)
-            _add_at(LDM, ki1, li1, mi1, Iv1 * awV11)
-
-            if broadening_method in ["voigt", "convolve"]:
+            _add_at(LDM, ki0, li0, mi0, Iv0 * awV00[:, None])
+            _add_at(LDM, ki0, li0, mi1, Iv0 * awV01[:, None])
+            _add_at(LDM, ki0, li1, mi0, Iv0 * awV10[:, None])
+            _add_at(LDM, ki0, li1, mi1, Iv0 * awV11[:, None])
+            _add_at(LDM, ki1, li0, mi0, Iv1 * awV00[:, None])
+            _add_at(LDM, ki1, li0, mi1, Iv1 * awV01[:, None])
+            _add_at(LDM, ki1, li1, mi0, Iv1 * awV10[:, None])
+            _add_at(LDM, ki1, li1, mi1, Iv1 * awV11[:, None])
+
+            if broadening_method in ["voigt", "faddeeva", "convolve"]:
                 LDM = LDM[1:-1, :, :]
                 # 1:-1 to remove the empty grid point on each side
 
@@ -2487,10 +4042,11 @@ class BroadenFactory(BaseFactory):
 
         # For each value from the LDM, retrieve the lineshape and convolve all
         # corresponding lines with it before summing.
-        if broadening_method in ["voigt", "convolve"]:
+        if broadening_method in ["voigt", "faddeeva", "convolve"]:
 
             # ... Initialize array on which to distribute the lineshapes
-            sumoflines_calc = zeros_like(wavenumber_calc)
+            # ... (all channels are convolved at once)
+            sumoflines_calc = zeros((P, len(wavenumber_calc)))
 
             for l in range(len(wG)):
                 for m in range(len(wL)):
@@ -2499,27 +4055,36 @@ class BroadenFactory(BaseFactory):
                     if self.params.sparse_ldm == True:
                         if (l, m) in LDM_ranges.keys():
                             mask = boolean_array_from_ranges(
-                                LDM_ranges[(l, m)], len(sumoflines_calc)
+                                LDM_ranges[(l, m)], len(wavenumber_calc)
                             )
                             # TAG: RADIS 1.0 paper - This is where the sparse wavenumber range is used
                             # (temporarily Fig. 9 in the RADIS 1.0 paper)
-                            sumoflines_calc[mask] += oaconvolve(
-                                LDM_reduced[(l, m)], lineshape, "same"
+                            sumoflines_calc[:, mask] += oaconvolve(
+                                LDM_reduced[(l, m)].T,
+                                lineshape[None, :],
+                                "same",
+                                axes=1,
                             )
                     else:
                         # TAG: RADIS 1.0 paper - This is where the sparse wavenumber range is used
                         # (temporarily Fig. 9 in the RADIS 1.0 paper)
-                        sumoflines_calc += oaconvolve(LDM[:, l, m], lineshape, "same")
+                        sumoflines_calc += oaconvolve(
+                            LDM[:, l, m].T, lineshape[None, :], "same", axes=1
+                        )
 
         elif broadening_method == "fft":
-            # ... Initialize array in FT space
-            Ildm_FT = 1j * np.zeros(len(line_profile_LDM[0][0]))
-            for l in range(len(wG)):
-                for m in range(len(wL)):
-                    lineshape_FT = line_profile_LDM[l][m]
-                    Ildm_FT += np.fft.rfft(LDM[:, l, m]) * lineshape_FT
+            # Transform all (wG, wL) slices at once (multi-threaded if n_jobs != 1),
+            # multiply by their lineshape and sum in FT space:
+            LDM_FT = rfft(LDM, axis=0, workers=self.misc.n_jobs)
+            del LDM
+            Ildm_FT = np.einsum(
+                "klmp,klm->pk", LDM_FT, line_profile_LDM, dtype=np.complex128
+            )
+            del LDM_FT
             # Back in real space:
-            sumoflines_calc = np.fft.irfft(Ildm_FT)[: len(wavenumber_calc)]
+            sumoflines_calc = irfft(Ildm_FT, n=self._get_fft_length())[
+                :, : len(wavenumber_calc)
+            ]
             sumoflines_calc /= self.params.wstep
 
         else:
@@ -2527,19 +4092,21 @@ class BroadenFactory(BaseFactory):
 
         self.profiler.stop("LDM_convolve", "Convolve and sum on spectral range")
         # Get valid range (discard wings)
-        sumoflines = sumoflines_calc[self.woutrange[0] : self.woutrange[1]]
+        sumoflines = sumoflines_calc[:, self.woutrange[0] : self.woutrange[1]]
 
+        if single_channel:
+            return wavenumber, sumoflines[0]
         return wavenumber, sumoflines
 
     def _broaden_lines(self, df):
         """Divide over chunks not to process to many lines in memory at the
-        same time (note that this is not where the parallelisation is done: all
-        lines are processed on the same core. )
+        same time. Chunks are processed in parallel threads if
+        ``self.misc.n_jobs`` is not 1 (see :py:meth:`~radis.lbl.broadening.BroadenFactory._sum_over_chunks`)
 
         Parameters
         ----------
         self: Factory
-            contains the ``self.misc.chunksize`` parameter
+            contains the ``self.misc.chunksize`` and ``self.misc.n_jobs`` parameters
             contains the ``self.params.optimization`` parameter
         df: DataFrame
             line dataframe
@@ -2605,10 +4172,7 @@ class BroadenFactory(BaseFactory):
         # Get which optimization method to use:
         optimization = self.params.optimization
 
-        if self.misc.zero_padding < 0 or self.misc.zero_padding > len(
-            self.wavenumber_calc
-        ):
-            self.misc.zero_padding = len(self.wavenumber_calc)
+        self._check_zero_padding()
 
         try:
             if chunksize is None:
@@ -2624,9 +4188,8 @@ class BroadenFactory(BaseFactory):
                             )
                         )
 
-                    line_profile = self._calc_lineshape(df)  # usually the bottleneck
-                    (wavenumber, abscoeff) = self._apply_lineshape(
-                        df.S.values, line_profile, df.shiftwav.values
+                    (wavenumber, (abscoeff,)) = self._broaden_lines_LBL(
+                        df, [df.S.values], n_threads=self._get_LBL_n_threads()
                     )
                 elif optimization in ("simple", "min-RMS"):
                     self.reftracker.add(doi["DIT-2020"], "algorithm")
@@ -2684,9 +4247,6 @@ class BroadenFactory(BaseFactory):
                         "PerformanceWarning",
                     )
 
-                abscoeff = zeros_like(self.wavenumber)
-                pb = ProgressBar(N, active=self.verbose)
-
                 if optimization is None:
 
                     # printing estimated time
@@ -2698,22 +4258,13 @@ class BroadenFactory(BaseFactory):
                             )
                         )
 
-                    # Cut lines in smaller bits for better memory handling
-                    if self.dataframe_type == "pandas":
-                        df = df.groupby(arange(len(df)) % N)
-                    elif self.dataframe_type == "vaex":
-                        # idx is added to as vaex don't have index column . Then df is divided into chunks
-                        df["idx"] = vaex.vrange(0, len(df)) % N
-                        df = df.groupby(df.idx)
-
-                    for i, (_, dg) in enumerate(df):
-                        line_profile = self._calc_lineshape(dg)
-                        (wavenumber, absorption) = self._apply_lineshape(
-                            dg.S.values, line_profile, dg.shiftwav.values
+                    def broaden_chunk(dg):
+                        (wavenumber, (abscoeff,)) = self._broaden_lines_LBL(
+                            dg, [dg.S.values]
                         )
-                        abscoeff += absorption
-                        pb.update(i)
-                    pb.done()
+                        return wavenumber, abscoeff
+
+                    (wavenumber, abscoeff) = self._sum_over_chunks(df, N, broaden_chunk)
 
                 elif optimization in ("simple", "min-RMS"):
 
@@ -2721,15 +4272,7 @@ class BroadenFactory(BaseFactory):
                     # Iterating over the chunks of the line database
                     # Using DIT Algorithm calculations for optimized loops
 
-                    # Cut lines in smaller bits for better memory handlin
-                    if self.dataframe_type == "pandas":
-                        df = df.groupby(arange(len(df)) % N)
-                    elif self.dataframe_type == "vaex":
-                        # idx is added to as vaex don't have index column . Then df is divided into chunks
-                        df["idx"] = vaex.vrange(0, len(df)) % N
-                        df = df.groupby(df.idx)
-
-                    for i, (_, dg) in enumerate(df):
+                    def broaden_chunk(dg):
                         (
                             line_profile_LDM,
                             wL_i,
@@ -2737,7 +4280,7 @@ class BroadenFactory(BaseFactory):
                             wL_dat_i,
                             wG_dat_i,
                         ) = self._calc_lineshape_LDM(dg)
-                        (wavenumber, absorption) = self._apply_lineshape_LDM(
+                        return self._apply_lineshape_LDM(
                             dg.S.values,
                             line_profile_LDM,
                             dg.shiftwav.values,
@@ -2747,9 +4290,8 @@ class BroadenFactory(BaseFactory):
                             wG_dat_i,
                             self.params.optimization,
                         )
-                        abscoeff += absorption
-                        pb.update(i)
-                    pb.done()
+
+                    (wavenumber, abscoeff) = self._sum_over_chunks(df, N, broaden_chunk)
                 else:
                     raise ValueError(
                         "Unexpected value for optimization: {0}".format(optimization)
@@ -2777,8 +4319,8 @@ class BroadenFactory(BaseFactory):
 
     def _broaden_lines_noneq(self, df):
         """Divide over chunks not to process to many lines in memory at the
-        same time (note that this is not where the parallelisation is done: all
-        lines are processed on the same core)
+        same time. Chunks are processed in parallel threads if
+        ``self.misc.n_jobs`` is not 1 (see :py:meth:`~radis.lbl.broadening.BroadenFactory._sum_over_chunks`)
 
         See _calc_lineshape for more information
         """
@@ -2800,10 +4342,7 @@ class BroadenFactory(BaseFactory):
                 self.reftracker.add(doi["DIT-2020"], "algorithm")
                 # Use LDM
 
-                if self.misc.zero_padding < 0 or self.misc.zero_padding > len(
-                    self.wavenumber_calc
-                ):
-                    self.misc.zero_padding = len(self.wavenumber_calc)
+                self._check_zero_padding()
 
                 line_profile_LDM, wL, wG, wL_dat, wG_dat = self._calc_lineshape_LDM(df)
                 # printing estimated time
@@ -2814,18 +4353,11 @@ class BroadenFactory(BaseFactory):
                             estimated_time
                         )
                     )
-                (wavenumber, abscoeff) = self._apply_lineshape_LDM(
-                    df.S.values,
-                    line_profile_LDM,
-                    df.shiftwav.values,
-                    wL,
-                    wG,
-                    wL_dat,
-                    wG_dat,
-                    optimization,
-                )
-                (_, emisscoeff) = self._apply_lineshape_LDM(
-                    df.Ei.values,
+                # Absorption and emission are distributed on the same LDM (with
+                # a trailing axis of size 2) : the indices & weights of each line
+                # are computed once, and both are convolved with the same lineshapes.
+                (wavenumber, (abscoeff, emisscoeff)) = self._apply_lineshape_LDM(
+                    np.array([df.S.values, df.Ei.values]),
                     line_profile_LDM,
                     df.shiftwav.values,
                     wL,
@@ -2834,23 +4366,6 @@ class BroadenFactory(BaseFactory):
                     wG_dat,
                     optimization,
                 )
-                # Note @dev: typical results is:
-                # >>> abscoeff:
-                # ... Precomputed LDM lineshapes in 0.0s
-                # ... Initialized vectors in 0.0s
-                # ... Get closest matching line & fraction in 0.3s
-                # ... Distribute lines over LDM 2.1s
-                # ... Convolve and sum on spectral range 0.4s
-                # >>> emisscoeff
-                # ... Initialized vectors in 0.0s
-                # ... Get closest matching line & fraction in 0.2s
-                # ... Distribute lines over LDM 2.1s
-                # ... Convolve and sum on spectral range 0.3s
-                # @EP: #performance.
-                # unlike in the non LDM case, the nonequilibrium case here is ~2x
-                # the equilibrium case: only the closest matching line is common to the
-                # absorption & emission steps. The bottleneck is the distribution
-                # of the line over the LDM, which has to be done for both abscoeff & emisscoeff.
 
             elif optimization is None:
                 # printing estimated time
@@ -2863,12 +4378,10 @@ class BroadenFactory(BaseFactory):
                     )
                 if chunksize is None:
                     # Deal with all lines directly (usually faster)
-                    line_profile = self._calc_lineshape(df)  # usually the bottleneck
-                    (wavenumber, abscoeff) = self._apply_lineshape(
-                        df.S.values, line_profile, df.shiftwav.values
-                    )
-                    (_, emisscoeff) = self._apply_lineshape(
-                        df.Ei.values, line_profile, df.shiftwav.values
+                    (wavenumber, (abscoeff, emisscoeff)) = self._broaden_lines_LBL(
+                        df,
+                        [df.S.values, df.Ei.values],
+                        n_threads=self._get_LBL_n_threads(),
                     )
 
                 elif is_float(chunksize):
@@ -2879,22 +4392,15 @@ class BroadenFactory(BaseFactory):
                     # Too big may be faster but overload memory.
                     # See Performance for more information
 
-                    abscoeff = zeros_like(self.wavenumber)
-                    emisscoeff = zeros_like(self.wavenumber)
-
-                    pb = ProgressBar(N, active=self.verbose)
-                    for i, (_, dg) in enumerate(df.groupby(arange(len(df)) % N)):
-                        line_profile = self._calc_lineshape(dg)
-                        (wavenumber, absorption) = self._apply_lineshape(
-                            dg.S.values, line_profile, dg.shiftwav.values
-                        )
-                        (_, emission) = self._apply_lineshape(
-                            dg.Ei.values, line_profile, dg.shiftwav.values
+                    def broaden_chunk(dg):
+                        (wavenumber, (absorption, emission)) = self._broaden_lines_LBL(
+                            dg, [dg.S.values, dg.Ei.values]
                         )
-                        abscoeff += absorption  #
-                        emisscoeff += emission
-                        pb.update(i)
-                    pb.done()
+                        return wavenumber, absorption, emission
+
+                    (wavenumber, abscoeff, emisscoeff) = self._sum_over_chunks(
+                        df, N, broaden_chunk
+                    )
 
                 else:
                     raise ValueError(
@@ -2921,15 +4427,107 @@ class BroadenFactory(BaseFactory):
 
         return wavenumber, abscoeff, emisscoeff
 
+    def _sum_over_chunks(self, df, N, broaden_chunk):
+        """Split the lines of ``df`` in ``N`` chunks, broaden each chunk with
+        ``broaden_chunk`` and sum the results.
+
+        If ``self.misc.n_jobs`` is not 1, chunks are processed in a pool of
+        threads (the NumPy / numba / :py:func:`~scipy.signal.oaconvolve` work
+        releases the GIL). Each thread sums its own chunks in its own
+        accumulators, which are reduced at the end.
+
+        Parameters
+        ----------
+        df: DataFrame
+            line dataframe
+        N: int
+            number of chunks. Chunk ``i`` contains the lines ``i, i+N, i+2N, ...``
+        broaden_chunk: function
+            ``broaden_chunk(dg)`` returns ``(wavenumber, array1, array2...)``
+            calculated for the lines of chunk ``dg``
+
+        Returns
+        -------
+        wavenumber, array1, array2... : arrays
+            ``array1, array2...`` summed over all chunks
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines`,
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_noneq`
+        """
+
+        n_jobs = min(effective_n_jobs(self.misc.n_jobs), N)
+
+        pb = ProgressBar(N, active=self.verbose)
+
+        if n_jobs == 1 or self.dataframe_type == "vaex":
+            # Cut lines in smaller bits for better memory handling
+            if self.dataframe_type == "pandas":
+                dgb = df.groupby(arange(len(df)) % N)
+            elif self.dataframe_type == "vaex":
+                # idx is added to as vaex don't have index column . Then df is divided into chunks
+                df["idx"] = vaex.vrange(0, len(df)) % N
+                dgb = df.groupby(df.idx)
+
+            sums = None
+            for i, (_, dg) in enumerate(dgb):
+                (wavenumber, *arrays) = broaden_chunk(dg)
+                if sums is None:
+                    sums = arrays
+                else:
+                    for s, a in zip(sums, arrays):
+                        s += a
+                pb.update(i)
+            pb.done()
+
+            return (wavenumber, *sums)
+
+        # Parallel : thread j processes chunks j, j+n_jobs, j+2*n_jobs, ...
+        lock = Lock()
+        done = [0]
+
+        def broaden_chunks(j):
+            sums = None
+            for i in range(j, N, n_jobs):
+                (wavenumber, *arrays) = broaden_chunk(df.iloc[i::N])
+                if sums is None:
+                    sums = [a.copy() for a in arrays]
+                else:
+                    for s, a in zip(sums, arrays):
+                        s += a
+                with lock:
+                    pb.update(done[0])
+                    done[0] += 1
+            return wavenumber, sums
+
+        results = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(broaden_chunks)(j) for j in range(n_jobs)
+        )
+        pb.done()
+
+        # Reduce the accumulators of all threads
+        wavenumber, sums = results[0]
+        for _, sums_j in results[1:]:
+            for s, a in zip(sums, sums_j):
+                s += a
+
+        return (wavenumber, *sums)
+
     # %% Generate absorption profile which includes linebroadening factors
 
-    def _calc_broadening(self):
+    def _calc_broadening(self, df=None):
         """Loop over all lines, calculate lineshape, and returns the sum of
         absorption coefficient k=S*f over all lines.
 
         For non-equilibrium, lineshape is calculated once and applied then
         to calculate absorption and emission coefficient.
 
+        Parameters
+        ----------
+        df: DataFrame, or ``None``
+            lines to broaden. If ``None``, use ``self.df1``
+
         Returns
         -------
         abscoeff:  1/(#.cm-2)
@@ -2946,7 +4544,8 @@ class BroadenFactory(BaseFactory):
           number density (cm-3) to get (cm-1/#) unit.
 
         """
-        df = self.df1
+        if df is None:
+            df = self.df1
 
         self.profiler.start(
             "calc_line_broadening",
@@ -2966,6 +4565,8 @@ class BroadenFactory(BaseFactory):
                 + " may be inverted"
             )
 
+        self._cast_lines_to_precision(df)
+
         (wavenumber, abscoeff) = self._broaden_lines(df)
         self.profiler.stop("calc_line_broadening", "Calculated line broadening")
 
@@ -3016,11 +4617,40 @@ class BroadenFactory(BaseFactory):
                 + " may be inverted"
             )
 
+        self._cast_lines_to_precision(df)
+
         (wavenumber, abscoeff, emisscoeff) = self._broaden_lines_noneq(df)
 
         self.profiler.stop("calc_line_broadening", "Calculated line broadening")
         return wavenumber, abscoeff, emisscoeff
 
+    def _cast_lines_to_precision(self, df):
+        """Cast the line columns used in the broadening step (linestrength,
+        emission integral, widths) to the precision ``self.params.precision``.
+
+        With ``"float32"``, these columns, the LDM array and the lineshape
+        templates take half the memory. Line positions (``shiftwav``) are kept
+        in double precision (a float32 wavenumber is only accurate to ~1e-4 cm-1),
+        and broadened lines are summed in double precision.
+
+        Only used with the LDM (``optimization='simple'`` or ``'min-RMS'``).
+
+        Parameters
+        ----------
+        df: DataFrame
+            line dataframe (modified inplace)
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+        """
+        if self.params.precision == "float64" or self.params.optimization is None:
+            return
+
+        for column in ["S", "Ei", "hwhm_lorentz", "hwhm_gauss", "hwhm_voigt"]:
+            if column in df.columns:
+                df[column] = df[column].astype(self.params.precision)
+
     # %% Functions to calculate semi-continuum
 
     def _find_weak_lines(self, weak_rel_intensity_threshold):
@@ -3295,6 +4925,66 @@ class BroadenFactory(BaseFactory):
         return abscoeff_v
 
 
+@jit(
+    void(
+        float64[:, :],
+        float64[:, :],
+        float64[:],
+        float64[:],
+        int64[:],
+        int64[:],
+        int64[:],
+        int64[:],
+    ),
+    nopython=True,
+    cache=True,
+)
+def _rough_sum_on_grid_jit(
+    rough_spectrum,
+    density,
+    frac_left,
+    frac_right,
+    imin_left,
+    imax_left,
+    imin_right,
+    imax_right,
+):
+    """Sum the densities of all lines on a spectrum, assuming rectangular
+    profiles. Used by :py:func:`~radis.lbl.broadening.project_lines_on_grid` and
+    :py:func:`~radis.lbl.broadening.project_lines_on_grid_noneq`
+
+    Parameters
+    ----------
+    rough_spectrum: 2D array   (P, W+2)
+        output, updated in place. The first and last points collect the out of
+        range intensities
+    density: 2D array   (P, N)
+        densities of the ``N`` lines, ex: linestrength and emission integral
+    frac_left, frac_right: arrays   (N)
+        fraction of each line on its closest grid point on the left / right
+    imin_left, imax_left, imin_right, imax_right: arrays   (N)
+        start / end of the rectangular profile of each line, centered on the
+        closest grid point on the left / right (with the offset of the out of
+        range point)
+
+    Notes
+    -----
+    Performance :
+
+    Test case:  6.5k lines, 18k grid points
+    - standard: 13.6 ms
+    - with @jit: 0.9 ms
+    """
+    for p in range(density.shape[0]):
+        for i in range(density.shape[1]):
+            rough_spectrum[p, imin_left[i] : imax_left[i] + 1] += (
+                frac_left[i] * density[p, i]
+            )
+            rough_spectrum[p, imin_right[i] : imax_right[i] + 1] += (
+                frac_right[i] * density[p, i]
+            )
+
+
 def project_lines_on_grid(df, wavenumber, wstep, dataframe_type="pandas"):
     """Quickly sums all lines on wavespace grid as rectangles of HWHM
     corresponding to ``hwhm_voigt`` and a spectral absorption coefficient value so
@@ -3394,44 +5084,27 @@ def project_lines_on_grid(df, wavenumber, wstep, dataframe_type="pandas"):
         len(wavenumber) - 1
     )
 
-    @jit(float64[:](), nopython=True)
-    def rough_sum_on_grid():
-        """Sum all lines linestrength density on a spectrum."""
-        # Performance
-        # ----------
-        #
-        # Test case:  6.5k lines, 18k grid points
-        # - standard: 13.6 ms
-        # - with @jit: 0.9 ms
-        #
-        # Array size
-        # ----------
-        # rough_spectrum has len_grid+2 because two points are used for out of
-        # range intensities. We crop at the end
-        rough_spectrum = np.zeros(len_grid + 2)
-        for i, (fr_left, fr_right, Iline_density) in enumerate(
-            zip(frac_left, frac_right, S_density_on_grid)
-        ):
-            imin_left = imin_broadened_wav_offset_left[i]
-            imax_left = imax_broadened_wav_offset_left[i]
-            imin_right = imin_broadened_wav_offset_right[i]
-            imax_right = imax_broadened_wav_offset_right[i]
-            rough_spectrum[imin_left : imax_left + 1] += fr_left * Iline_density
-            rough_spectrum[imin_right : imax_right + 1] += fr_right * Iline_density
-
-        # Nomenclature for lines above:
-        # - min/max: start/end of a lineshape
-        # - left/right: closest spectral grid point on the left/right
-
-        # crop out of range points
-        return rough_spectrum[1:-1]
+    # Sum all lines linestrength density on a spectrum
+    # ... rough_spectrum has len_grid+2 because two points are used for out of
+    # ... range intensities. We crop at the end
+    rough_spectrum = np.zeros((1, len_grid + 2))
+    _rough_sum_on_grid_jit(
+        rough_spectrum,
+        np.asarray(S_density_on_grid, dtype=np.float64).reshape(1, -1),
+        np.asarray(frac_left, dtype=np.float64),
+        np.asarray(frac_right, dtype=np.float64),
+        np.asarray(imin_broadened_wav_offset_left, dtype=np.int64),
+        np.asarray(imax_broadened_wav_offset_left, dtype=np.int64),
+        np.asarray(imin_broadened_wav_offset_right, dtype=np.int64),
+        np.asarray(imax_broadened_wav_offset_right, dtype=np.int64),
+    )
+    # crop out of range points
+    k_rough_spectrum = rough_spectrum[0, 1:-1]
 
     # TODO: @dev #performance
     # ... try with k_rough_spectrum.add.at()  ?
     # ... but it probably wont ever be comparable with LDM.
 
-    k_rough_spectrum = rough_sum_on_grid()
-
     return k_rough_spectrum, S_density_on_grid, line2grid_projection_left
 
 
@@ -3552,43 +5225,23 @@ def project_lines_on_grid_noneq(df, wavenumber, wstep, dataframe_type="pandas"):
         len(wavenumber) - 1
     )
 
-    @jit(nopython=True)
-    def rough_sum_on_grid():
-        """Sum all lines linestrength density on a spectrum."""
-        # Performance
-        # ----------
-        #
-        # Test case:  6.5k lines, 18k grid points
-        # - standard: 13.6 ms
-        # - with @jit: 0.9 ms
-        #
-        # Array size
-        # ----------
-        # rough_spectrum has len_grid+2 because two points are used for out of
-        # range intensities. We crop at the end
-        k_rough_spectrum = np.zeros(len_grid + 2)
-        j_rough_spectrum = np.zeros(len_grid + 2)
-        for i in range(len(S_density_on_grid)):
-            imin_left = imin_broadened_wav_offset_left[i]
-            imax_left = imax_broadened_wav_offset_left[i]
-            imin_right = imin_broadened_wav_offset_right[i]
-            imax_right = imax_broadened_wav_offset_right[i]
-            k_rough_spectrum[imin_left : imax_left + 1] += (
-                frac_left[i] * S_density_on_grid[i]
-            )
-            k_rough_spectrum[imin_right : imax_right + 1] += (
-                frac_right[i] * S_density_on_grid[i]
-            )
-            j_rough_spectrum[imin_left : imax_left + 1] += (
-                frac_left[i] * Ei_density_on_grid[i]
-            )
-            j_rough_spectrum[imin_right : imax_right + 1] += (
-                frac_right[i] * Ei_density_on_grid[i]
-            )
-        # crop out of range points
-        return k_rough_spectrum[1:-1], j_rough_spectrum[1:-1]
-
-    k_rough_spectrum, j_rough_spectrum = rough_sum_on_grid()
+    # Sum all lines linestrength and emission densities on a spectrum
+    # ... rough_spectrum has len_grid+2 because two points are used for out of
+    # ... range intensities. We crop at the end
+    rough_spectrum = np.zeros((2, len_grid + 2))
+    _rough_sum_on_grid_jit(
+        rough_spectrum,
+        np.array([S_density_on_grid, Ei_density_on_grid], dtype=np.float64),
+        np.asarray(frac_left, dtype=np.float64),
+        np.asarray(frac_right, dtype=np.float64),
+        np.asarray(imin_broadened_wav_offset_left, dtype=np.int64),
+        np.asarray(imax_broadened_wav_offset_left, dtype=np.int64),
+        np.asarray(imin_broadened_wav_offset_right, dtype=np.int64),
+        np.asarray(imax_broadened_wav_offset_right, dtype=np.int64),
+    )
+    # crop out of range points
+    k_rough_spectrum = rough_spectrum[0, 1:-1]
+    j_rough_spectrum = rough_spectrum[1, 1:-1]
 
     return (
         k_rough_spectrum,
@@ -3599,6 +5252,149 @@ def project_lines_on_grid_noneq(df, wavenumber, wstep, dataframe_type="pandas"):
     )
 
 
+def warmup(parallel=False, verbose=False):
+    """Compile the Numba kernels of the line-by-line calculations, or load
+    them from the on-disk cache of Numba, so that the first spectrum computed in
+    a process does not pay for their compilation.
+
+    Kernels with explicit signatures (all kernels of
+    :py:mod:`radis.lbl.broadening` and :py:mod:`radis.misc.arrays` but the
+    multi-threaded ones and the array helpers
+    :py:func:`~radis.misc.arrays.first_nonnan_index`,
+    :py:func:`~radis.misc.arrays.last_nonnan_index`,
+    :py:func:`~radis.misc.arrays.is_sorted` and
+    :py:func:`~radis.misc.arrays.is_sorted_backward`) are already compiled when
+    RADIS is imported. The array helpers are compiled lazily for the type of
+    their input : they are compiled here for the 1D ``float64`` and ``int64``
+    arrays of the line databases. All kernels are compiled only once per
+    machine, and loaded from the cache in new processes. Call this function
+    once, ex: before starting a pool of worker processes, to make sure the cache
+    is populated.
+
+    Parameters
+    ----------
+    parallel: bool
+        if ``True``, also compile the multi-threaded kernels
+        :py:func:`~radis.lbl.broadening._voigt_direct_parallel_jit`,
+        :py:func:`~radis.lbl.base._linestrength_eq_parallel_jit`,
+        :py:func:`~radis.lbl.base._linestrength_eq_batch_parallel_jit` and
+        :py:func:`~radis.lbl.base._emission_integral_parallel_jit` (used if
+        ``n_jobs`` is not 1). This starts the Numba threading layer : do not
+        fork processes afterwards. Default ``False``
+    verbose: bool
+
+    Returns
+    -------
+    kernels: list of str
+        names of the kernels compiled or loaded
+
+    Examples
+    --------
+    ::
+
+        import radis
+        radis.warmup()
+
+    """
+    from radis.lbl import base
+    from radis.misc import arrays
+
+    kernels = [
+        _whiting_jit,
+        _faddeeva_jit,
+        _faddeeva_voigt_jit,
+        _voigt_direct_jit,
+        _add_at_LDM_jit,
+        _rough_sum_on_grid_jit,
+        _broadening_HWHM_jit,
+        _broadening_HWHM_batch_jit,
+        base._linestrength_eq_jit,
+        base._linestrength_eq_batch_jit,
+        base._emission_integral_jit,
+    ]
+    # ... array helpers without explicit signatures (compiled for their input)
+    lazy_kernels = [
+        arrays.first_nonnan_index,
+        arrays.last_nonnan_index,
+        arrays.is_sorted,
+        arrays.is_sorted_backward,
+    ]
+    for kernel in lazy_kernels:
+        for dtype in [float64, int64]:
+            kernel.compile((dtype[::1],))
+    kernels += lazy_kernels + [
+        arrays.non_zero_values_around,
+        arrays.non_zero_ranges_in_array,
+        arrays.boolean_array_from_ranges,
+        arrays.sparse_add_at,
+        arrays.sparse_add_at_LDM,
+    ]
+    if parallel:
+        _voigt_direct_parallel_jit.compile(
+            (
+                float64[:, :, :],
+                float64[:, :],
+                float64[:],
+                float64[:],
+                float64[:],
+                float64[:],
+                float64[:],
+                float64[:],
+                int64,
+                boolean,
+            )
+        )
+        kernels.append(_voigt_direct_parallel_jit)
+        base._linestrength_eq_parallel_jit.compile(
+            (
+                float64[:],
+                float64[:],
+                int64[:],
+                float64[:],
+                float64[:],
+                float64[:],
+                float64,
+                float64,
+                int64,
+            )
+        )
+        base._linestrength_eq_batch_parallel_jit.compile(
+            (
+                float64[:, :],
+                float64[:],
+                int64[:],
+                float64[:, :],
+                float64[:],
+                float64[:],
+                float64[:],
+                float64,
+                int64,
+            )
+        )
+        base._emission_integral_parallel_jit.compile(
+            (
+                float64[:],
+                float64[:],
+                int64[:],
+                float64[:],
+                float64[:],
+                float64[:],
+                int64,
+            )
+        )
+        kernels += [
+            base._linestrength_eq_parallel_jit,
+            base._linestrength_eq_batch_parallel_jit,
+            base._emission_integral_parallel_jit,
+        ]
+
+    if verbose:
+        for kernel in kernels:
+            print(f"{kernel.__name__}: {len(kernel.signatures)} signature(s) compiled")
+
+    return [kernel.__name__ for kernel in kernels]
+
+
 if __name__ == "__main__":
 
     from radis.test.lbl.test_broadening import _run_testcases
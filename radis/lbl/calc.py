@@ -19,6 +19,7 @@ Routine Listing
 
 from copy import deepcopy
 from os.path import exists
+from time import time
 
 import numpy as np
 
@@ -30,7 +31,7 @@ except ImportError:  # if ran from here
     from radis.lbl.base import get_wavenumber_range
 
 from radis import config
-from radis.misc.basics import all_in
+from radis.misc.basics import all_in, is_float
 from radis.misc.utils import Default
 from radis.spectrum.spectrum import Spectrum
 
@@ -66,6 +67,7 @@ def calc_spectrum(
     use_cached=True,
     mode="cpu",
     export_lines=False,
+    tiles=None,
     verbose=True,
     return_factory=False,
     **kwargs,
@@ -303,6 +305,23 @@ def calc_spectrum(
         To try the GPU code without an actual GPU, you can use ``mode='emulated_gpu'``.
         This will run the GPU equivalent code on the CPU.
         Only ``'cpu'`` is available for atoms.
+    tiles: int, or ``None``
+        if not ``None``, split the spectral range in ``tiles`` contiguous tiles
+        computed in parallel processes, each one loading only the lines within
+        ``truncation`` of the tile. Tiles are then stitched together. Useful for
+        very wide spectral ranges that would not fit in memory (or on one core)
+        otherwise. With ``optimization=None`` the stitched Spectrum is the same as
+        the one computed at once, up to the rounding errors of the spectral grid
+        (~1e-7 relative) ; with the LDM it differs by the LDM interpolation
+        error as the LDM grids of each tile are different.
+        Requires a finite ``truncation`` and a fixed ``wstep``, and is not
+        compatible with ``export_lines`` or ``return_factory``. As new processes
+        are spawned, scripts must be protected with ``if __name__ == "__main__":``.
+        The ``profiler`` of the stitched Spectrum is the one of the first tile ;
+        the profilers of all tiles are stored in its ``tile_profilers`` condition.
+        The numbers of lines (``total_lines``, ``lines_calculated``, etc.) are
+        not in its conditions, as lines near the edges of tiles are computed by
+        2 tiles. Default ``None``
     return_factory: bool
         if ``True``, return the :py:class:`~radis.lbl.factory.SpectrumFactory` that
         computes the spectrum. Useful to access computational parameters, the line database,
@@ -604,6 +623,7 @@ def calc_spectrum(
             verbose=verbose,
             mode=mode,
             export_lines=export_lines,
+            tiles=tiles,
             return_factory=return_factory,
             diluent=diluent_for_this_molecule,
             **kwargs_molecule,
@@ -665,7 +685,9 @@ def _calc_spectrum_one_molecule(
     mode,
     export_lines,
     diluent,
+    tiles=None,
     return_factory=False,
+    _wavenum_calc_range=None,
     **kwargs,
 ) -> Spectrum:
     """See :py:func:`~radis.lbl.calc.calc_spectrum`
@@ -675,7 +697,49 @@ def _calc_spectrum_one_molecule(
     input_wunit: 'nm', 'nm_vac', 'cm-1'
         in which wavespace was the input given before conversion (used to keep
         default plot/get consistent with input units)
+
+    Other Parameters
+    ----------------
+    _wavenum_calc_range: (float, float), or ``None``
+        if not ``None``, only load lines within this range (cm-1). Used to
+        compute tiles, see :py:func:`~radis.lbl.calc._calc_spectrum_tiles`
     """
+    if tiles is not None:
+        if return_factory:
+            raise ValueError("return_factory=True is not compatible with tiles")
+        return _calc_spectrum_tiles(
+            tiles,
+            wavenum_min=wavenum_min,
+            wavenum_max=wavenum_max,
+            input_wunit=input_wunit,
+            Tgas=Tgas,
+            Tvib=Tvib,
+            Trot=Trot,
+            Telec=Telec,
+            pressure=pressure,
+            overpopulation=overpopulation,
+            molecule=molecule,
+            isotope=isotope,
+            mole_fraction=mole_fraction,
+            path_length=path_length,
+            databank=databank,
+            medium=medium,
+            wstep=wstep,
+            truncation=truncation,
+            neighbour_lines=neighbour_lines,
+            cutoff=cutoff,
+            parsum_mode=parsum_mode,
+            optimization=optimization,
+            chunksize=chunksize,
+            broadening_method=broadening_method,
+            name=name,
+            use_cached=use_cached,
+            verbose=verbose,
+            mode=mode,
+            export_lines=export_lines,
+            diluent=diluent,
+            **kwargs,
+        )
 
     # Initialize Factory
     # ------------------
@@ -748,6 +812,9 @@ def _calc_spectrum_one_molecule(
     )
     # Have consistent output units
     sf.input_wunit = input_wunit
+    if _wavenum_calc_range is not None:
+        # only load the lines needed for this tile
+        sf.params.wavenum_min_calc, sf.params.wavenum_max_calc = _wavenum_calc_range
 
     # Checking diluent other than air present
     if isinstance(diluent, str):
@@ -989,6 +1056,152 @@ def _calc_spectrum_one_molecule(
         return s
 
 
+def _calc_spectrum_tiles(tiles, wavenum_min, wavenum_max, **kwargs):
+    """Compute a spectrum by splitting the range ``[wavenum_min, wavenum_max]``
+    in ``tiles`` contiguous tiles of the spectral grid, computed in parallel
+    processes with :py:func:`~radis.lbl.calc._calc_spectrum_one_molecule`,
+    and stitched together.
+
+    Each tile is computed with ``neighbour_lines = truncation + wstep`` (the
+    farthest distance at which a line contributes to a grid point) and
+    only loads the lines within this distance of the tile, clipped to the lines
+    that would be loaded for the full range. Therefore all grid points get the
+    contributions of the same lines as if the full range was computed at once.
+
+    Parameters
+    ----------
+    tiles: int
+        number of tiles
+    wavenum_min, wavenum_max: float  (cm-1)
+        spectral range
+    kwargs: dict
+        arguments of :py:func:`~radis.lbl.calc._calc_spectrum_one_molecule`
+
+    Returns
+    -------
+    Spectrum
+        its ``calculation_time`` is the elapsed time of the whole calculation, and
+        its ``profiler`` the one of the first tile. The profilers of all tiles
+        are stored in ``tile_profilers``. The numbers of lines are not in its
+        conditions (lines in the overlaps are computed by 2 tiles).
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from os import cpu_count
+
+    wstep = kwargs["wstep"]
+    truncation = kwargs["truncation"]
+    neighbour_lines = kwargs["neighbour_lines"]
+    if isinstance(truncation, Default):
+        truncation = truncation.value
+    if kwargs["broadening_method"] == "fft" or truncation is None:
+        raise NotImplementedError(
+            "Spectra cannot be computed by tiles if lineshapes are not truncated "
+            + "(truncation=None, or broadening_method='fft')"
+        )
+    if not is_float(wstep):
+        raise NotImplementedError(
+            f"Spectra cannot be computed by tiles with wstep={wstep}. Use a fixed value"
+        )
+    if kwargs["export_lines"] or kwargs.get("export_populations"):
+        raise NotImplementedError(
+            "export_lines and export_populations are not compatible with tiles"
+        )
+    if kwargs["mode"] != "cpu":
+        raise NotImplementedError("Tiles are only computed with mode='cpu'")
+
+    # Same spectral grid as in SpectrumFactory._generate_wavenumber_arrays
+    wavenumber = np.arange(wavenum_min, wavenum_max + wstep, wstep)
+    # ... at least 2 points per tile
+    tiles = max(1, min(int(tiles), len(wavenumber) // 2))
+    tile_indices = [
+        (i[0], i[-1]) for i in np.array_split(np.arange(len(wavenumber)), tiles)
+    ]
+
+    # Lines loaded for the full range (see SpectrumFactory.__init__)
+    wavenum_min_calc = wavenum_min - neighbour_lines
+    wavenum_max_calc = wavenum_max + neighbour_lines
+    # Farthest contribution of a line : truncation, around its closest grid point
+    tile_neighbour_lines = truncation + wstep
+
+    # Compute
+    t0 = time()
+    # ... processes are spawned rather than forked : forking a process where
+    # Numba threads were started (ex: a previous spectrum) can hang.
+    with ProcessPoolExecutor(
+        max_workers=min(tiles, cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _calc_spectrum_one_molecule,
+                wavenum_min=wavenumber[first],
+                wavenum_max=wavenumber[last],
+                _wavenum_calc_range=(
+                    max(wavenumber[first] - tile_neighbour_lines, wavenum_min_calc),
+                    min(wavenumber[last] + tile_neighbour_lines, wavenum_max_calc),
+                ),
+                **{**kwargs, "neighbour_lines": tile_neighbour_lines},
+            )
+            for (first, last) in tile_indices
+        ]
+        s_tiles = [f.result() for f in futures]
+    calculation_time = time() - t0
+
+    # Stitch tiles
+    quantities = {"wavenumber": wavenumber}
+    for var in s_tiles[0]._q:
+        if var == "wavespace":
+            continue
+        I = []
+        for (first, last), s_tile in zip(tile_indices, s_tiles):
+            # ... tile grids may have 1 more point (rounding errors in arange)
+            w_tile = s_tile._q["wavespace"][: last - first + 1]
+            assert np.allclose(
+                w_tile, wavenumber[first : last + 1], rtol=0, atol=wstep * 1e-3
+            )
+            I.append(s_tile._q[var][: last - first + 1])
+        quantities[var] = np.hstack(I)
+
+    s0 = s_tiles[0]
+    conditions = deepcopy(s0.conditions)
+    conditions.update(
+        {
+            "wavenum_min": wavenum_min,
+            "wavenum_max": wavenum_max,
+            "wavenum_min_calc": wavenum_min_calc,
+            "wavenum_max_calc": wavenum_max_calc,
+            "neighbour_lines": neighbour_lines,
+            "spectral_points": int(wavenum_max_calc - wavenum_min_calc) / wstep,
+            "tiles": tiles,
+            "tile_profilers": [s.conditions.get("profiler") for s in s_tiles],
+        }
+    )
+    if "calculation_time" in conditions:
+        conditions["calculation_time"] = calculation_time
+    # ... line counts are not reported : tiles share the lines of their overlaps
+    for k in [
+        "total_lines",
+        "lines_calculated",
+        "lines_cutoff",
+        "lines_in_continuum",
+    ]:
+        conditions.pop(k, None)
+    for k in ["NwL", "NwG"]:
+        if k in conditions:
+            conditions[k] = max(s.conditions[k] for s in s_tiles)
+
+    return Spectrum(
+        quantities=quantities,
+        conditions=conditions,
+        units=s0.units,
+        cond_units=s0.cond_units,
+        check_wavespace=False,
+        name=s0.name,
+        references=dict(s0.references),
+    )
+
+
 # Function to get diluent(s) for a molecule
 def diluents_for_molecule(mole_fraction, diluent, molecule):
     diluent_for_this_molecule = {}
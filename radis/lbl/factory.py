@@ -35,6 +35,7 @@ the # XXX symbol)*
 PUBLIC METHODS
 
 - :meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`             >>> calc equilibrium spectrum
+- :meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch`       >>> calc equilibrium spectra for a list of conditions
 - :meth:`~radis.lbl.factory.SpectrumFactory.non_eq_spectrum`         >>> calc non equilibrium spectrum
 - :meth:`~radis.lbl.factory.SpectrumFactory.optically_thin_power`    >>> get total power (equilibrium or non eq)
 
@@ -81,6 +82,7 @@ from warnings import warn
 
 import astropy.units as u
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 from numpy import arange, exp, expm1
 from scipy.optimize import OptimizeResult
 
@@ -100,7 +102,7 @@ from radis.db.classes import is_atom, is_neutral
 from radis.misc.basics import flatten, is_float, is_range, list_if_float, round_off
 from radis.misc.utils import Default
 from radis.phys.constants import k_b
-from radis.phys.convert import conv2
+from radis.phys.convert import cm2nm, cm2nm_air, conv2
 from radis.phys.units import convert_universal
 from radis.phys.units_astropy import convert_and_strip_units
 from radis.spectrum.equations import calc_radiance
@@ -190,6 +192,15 @@ class SpectrumFactory(BandFactory):
          typically scale as :math:`~truncation ^2` ). The default ``50`` was
          chosen to maintain a good accuracy, and still exhibit the sub-Lorentzian
          behavior of most lines far (few hundreds :math:`cm^{-1}`) from the line center.
+    truncation_error: float (0-1)
+        if not ``0``, the lineshape of each cell of the Lineshape Database (LDM)
+        is truncated further, where its wings hold less than this fraction of its
+        area (ex: ``1e-4``). Narrow lines (ex: low pressure) then use much
+        shorter lineshapes than ``truncation``, which remains the maximum
+        half-width. Only used with ``optimization='simple'`` or ``'min-RMS'``, and
+        ``broadening_method='voigt'``, ``'faddeeva'`` or ``'convolve'``. See
+        :py:func:`~radis.lbl.broadening.truncate_lineshape`. Default ``0``
+        (all lineshapes truncated at ``truncation``).
     neighbour_lines: float (:math:`cm^{-1}`)
         The calculated spectral range is increased (by ``neighbour_lines`` cm-1
         on each side) to take into account overlaps from out-of-range lines.
@@ -207,6 +218,15 @@ class SpectrumFactory(BandFactory):
         discard linestrengths that are lower that this, to reduce calculation
         times. ``1e-27`` is what is generally used to generate databases such as
         CDSD. If ``0``, no cutoff. Default ``1e-27``.
+    cutoff_error: float (0-1)
+        if not ``0``, discard the weakest lines as long as the sum of their
+        linestrengths is less than this fraction of the total linestrength
+        (ex: ``1e-3`` discards at most 0.1% of the integrated intensity).
+        Replaces ``cutoff``. Lines are sorted by linestrength once for a line
+        database and a range of temperatures, so the lines to discard are
+        found with a binary search. See
+        :py:meth:`~radis.lbl.base.BaseFactory._get_linestrength_order`.
+        Default ``0``.
     parsum_mode: 'full summation', 'tabulation'
         how to compute partition functions, at nonequilibrium or when partition
         function are not already tabulated. ``'full summation'`` : sums over all
@@ -237,19 +257,56 @@ class SpectrumFactory(BandFactory):
         if ``True``, saves details of all calculated lines in Spectrum. This is
         necessary to later use :py:meth:`~radis.spectrum.spectrum.Spectrum.line_survey`,
         but can take some space. Default ``False``.
-    chunksize: int, or ``None``
+    chunksize: int, ``None``, or ``"auto"``
         Splits the lines database in several chunks during calculation, else
         the multiplication of lines over all spectral range takes too much memory
         and slows the system down. Chunksize let you change the default chunk
         size. If ``None``, all lines are processed directly. Usually faster but
-        can create memory problems. Default ``None``
-    optimization : ``"simple"``, ``"min-RMS"``, ``None``
+        can create memory problems. If ``"auto"``, lines are split only if they
+        would not fit in the available memory. Default ``None``
+    n_jobs: int
+        number of threads used to process the chunks of lines in parallel
+        (only used if ``chunksize`` is not ``None``). Each thread sums its chunks
+        in its own arrays, which are added at the end. ``-1`` uses all CPUs,
+        ``-2`` all CPUs but one, etc. (same as :py:class:`joblib.Parallel`).
+        Also used as the number of ``workers`` of the FFT with
+        ``broadening_method='fft'``, and as the number of threads of the
+        line-by-line Voigt kernel with ``optimization=None`` and
+        ``chunksize=None``. Default ``1``
+    precision: ``"float64"``, ``"float32"``
+        precision of the line broadening step with the LDM (``optimization``
+        not ``None``). If ``"float32"``, the linestrengths,
+        emission integrals and widths of the lines, the LDM array and the lineshape
+        templates are stored in single precision, which halves their memory
+        footprint and bandwidth. Line positions and the sum of all
+        broadened lines are kept in double precision. Relative differences with
+        ``"float64"`` are typically below 1e-5. Default ``"float64"``
+    stream_blocksize: int, or ``None``
+        if not ``None``, :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`
+        processes the line database by blocks of ``stream_blocksize`` lines :
+        linestrengths, broadening widths and lineshapes are computed on
+        one block at a time and the absorption coefficients of all blocks are
+        summed. This bounds the memory used by the scaled line database, which
+        is otherwise a full copy of the database with additional columns.
+        It is not an out-of-core calculation : the line database itself
+        (``SpectrumFactory.df0``) is fully loaded in memory before the first
+        block is computed, with all engines (HDF5, vaex, feather, etc.) but
+        ``memory_mapping_engine='npy'``. Only a database fetched from a
+        single ``'npy'`` file, with all isotopes, stays on the disk and is read
+        block by block (see :py:meth:`~radis.lbl.base.BaseFactory._iter_line_blocks`).
+        Not compatible with ``export_lines=True`` or ``wstep='auto'``.
+        Default ``None``
+    optimization : ``"simple"``, ``"min-RMS"``, ``None``, ``"auto"``
         If either ``"simple"`` or ``"min-RMS"`` LDM optimization for lineshape calculation is used:
         - ``"min-RMS"`` : weights optimized by analytical minimization of the RMS-error (See: [Spectral-Synthesis-Algorithm]_)
         - ``"simple"`` : weights equal to their relative position in the grid
 
         If using the LDM optimization, broadening method is automatically set to ``'fft'``.
         If ``None``, no lineshape interpolation is performed and the lineshape of all lines is calculated.
+        If ``"auto"``, ``"simple"`` or ``None`` is chosen for each spectrum, whichever
+        is predicted to be the fastest on this machine (see
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._autotune_broadening`).
+        The choice is stored in ``Spectrum.conditions["autotune"]``.
 
         Refer to [Spectral-Synthesis-Algorithm]_ for more explanation on the LDM method for lineshape interpolation.
 
@@ -269,11 +326,20 @@ class SpectrumFactory(BandFactory):
 
         Range: 0 <= zero_padding <= len(w), or zero_padding = -1
         Default: -1
-    broadening_method: ``"voigt"``, ``"convolve"``, ``"fft"``
+    broadening_method: ``"voigt"``, ``"faddeeva"``, ``"convolve"``, ``"fft"``
         Calculates broadening with a direct voigt approximation ('voigt') or
         by convoluting independently calculated Doppler and collisional
         broadening ('convolve'). First is much faster, 2nd can be used to
-        compare results. This SpectrumFactory parameter can be manually
+        compare results. ``'faddeeva'`` computes the exact Voigt profile from
+        the Faddeeva function (see :py:func:`~radis.lbl.broadening.faddeeva_voigt_lineshape`) :
+        it does not have the error of the Whiting approximation in the line
+        wings. Per point evaluated, it is about 2x slower than ``'voigt'``
+        within a few widths of the line centers, and 1.5 to 2x faster in the far
+        wings. With ``optimization=None`` only half of each (symmetric) lineshape
+        is evaluated : it is then about as fast as ``'voigt'`` (~15% slower) if
+        ``truncation`` is a few line widths, and 2-3x faster if ``truncation``
+        is much larger than the line widths.
+        This SpectrumFactory parameter can be manually
         adjusted a posteriori with::
 
             sf = SpectrumFactory(...)
@@ -286,6 +352,15 @@ class SpectrumFactory(BandFactory):
 
         By default, use ``"fft"`` for any ``optimization``, and ``"voigt"`` if
         optimization is ``None`` .
+
+        If ``"auto"``, ``"voigt"`` or ``"fft"`` is chosen for each spectrum (or
+        once for all spectra of :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch`
+        and all blocks of ``stream_blocksize``), whichever is predicted to be
+        the fastest on this machine (with a ``truncation``, ``"fft"`` uses the
+        same truncated lineshapes as ``"voigt"``), as well as the sparse LDM if the
+        ``SPARSE_WAVERANGE`` key of ``radis.config`` is ``"auto"``. Times are
+        predicted from a calibration made once per machine and stored in
+        ``radis.config["AUTOTUNE_FILE"]`` (see :py:mod:`~radis.lbl.autotune`).
     warnings: bool, or one of ``['warn', 'error', 'ignore']``, dict
         If one of ``['warn', 'error', 'ignore']``, set the default behaviour
         for all warnings. Can also be a dictionary to set specific warnings only.
@@ -422,15 +497,20 @@ class SpectrumFactory(BandFactory):
         isotope="all",
         medium="air",
         truncation=Default(50),
+        truncation_error=0,
         neighbour_lines=0,
         pseudo_continuum_threshold=0,
         self_absorption=True,
         chunksize=None,
+        n_jobs=1,
+        precision="float64",
+        stream_blocksize=None,
         optimization="simple",
         folding_thresh=1e-6,
         zero_padding=-1,
         broadening_method="voigt",
         cutoff=0,
+        cutoff_error=0,
         parsum_mode="full summation",
         verbose=True,
         warnings=True,
@@ -536,9 +616,18 @@ class SpectrumFactory(BandFactory):
         # ... see https://github.com/radis/radis/issues/456
         # (note: may be overwritten by user after Factory creation)
         self.input_wunit = input_wunit
+        self._medium = medium  # to convert the new ranges of _set_wavenumber_range
 
         # Storing inital value of wstep if wstep != "auto"
         self._wstep = wstep
+        # Same for the broadening configuration (can be "auto" : chosen for each
+        # spectrum, see _autotune_broadening)
+        self._optimization = optimization
+        self._broadening_method = broadening_method
+        self._chunksize = chunksize
+        # ... True while the configuration chosen for the first spectrum of a batch
+        # ... (or first block of lines) is kept for the others
+        self._autotune_frozen = False
 
         # Set default variables from config:
         import radis
@@ -630,6 +719,12 @@ class SpectrumFactory(BandFactory):
             # If None, use no cutoff : https://github.com/radis/radis/pull/259
             cutoff = 0
         self.params.cutoff = cutoff
+        if not 0 <= cutoff_error < 1:
+            raise ValueError(
+                "cutoff_error should be a fraction of the total linestrength, "
+                + "in [0-1[. Got {0}".format(cutoff_error)
+            )
+        self.params.cutoff_error = cutoff_error
         self.params.parsum_mode = parsum_mode
 
         # Time Based variables
@@ -657,9 +752,9 @@ class SpectrumFactory(BandFactory):
                     "Lines cannot be truncated with `broadening_method='fft'`. Use `broadening_method='voigt'`"
                 )
         elif (
-            broadening_method == "voigt"
+            broadening_method in ["voigt", "faddeeva"]
             and truncation is None
-            and optimization is not None
+            and optimization not in [None, "auto"]
         ):
             raise NotImplementedError(
                 "Currently `broadening_method='voigt'` doesn't support computation of lineshape on the full spectral range, use `broadening_method='fft'` instead or use a truncation value > 0"
@@ -669,6 +764,12 @@ class SpectrumFactory(BandFactory):
             truncation = truncation.value
 
         self.params.truncation = self.truncation = truncation  # line truncation
+        if not 0 <= truncation_error < 1:
+            raise ValueError(
+                "truncation_error should be a fraction of the lineshape area, "
+                + "in [0-1[. Got {0}".format(truncation_error)
+            )
+        self.params.truncation_error = truncation_error  # LDM lineshapes truncation
         # self.params.truncation is the input, self.truncation will be the value (different from input if input was None)
         self.params.neighbour_lines = neighbour_lines  # including neighbour lines
 
@@ -685,11 +786,22 @@ class SpectrumFactory(BandFactory):
         self.params.broadening_method = broadening_method
         self.params.optimization = optimization
         self.params.folding_thresh = folding_thresh
+        if precision not in ["float64", "float32"]:
+            raise ValueError(
+                "precision must be one of 'float64', 'float32'. Got {0}".format(
+                    precision
+                )
+            )
+        self.params.precision = precision
         self.misc.zero_padding = zero_padding
         self.params.lbfunc = lbfunc
 
         # used to split lines into blocks not too big for memory
         self.misc.chunksize = chunksize
+        # number of threads to process the chunks
+        self.misc.n_jobs = n_jobs
+        # used to compute equilibrium spectra by blocks of lines
+        self.misc.stream_blocksize = stream_blocksize
         # Other parameters:
         self.save_memory = save_memory
         self.autoupdatedatabase = False  # a boolean to automatically store calculated
@@ -747,6 +859,9 @@ class SpectrumFactory(BandFactory):
         diluent=None,
         pressure=None,
         name=None,
+        wmin=None,
+        wmax=None,
+        wunit=Default("cm-1"),
     ) -> Spectrum:
         """Generate a spectrum at equilibrium.
 
@@ -767,6 +882,15 @@ class SpectrumFactory(BandFactory):
             :py:attr:`~radis.lbl.factory.SpectrumFactor.input.pressure` is used.
         name: str
             output Spectrum name (useful in batch)
+        wmin, wmax : ``float`` or `~astropy.units.quantity.Quantity`
+            new spectral range of the factory, for this spectrum and the next
+            ones (same convention as in
+            :py:class:`~radis.lbl.factory.SpectrumFactory`). If ``None``, the
+            current bound is kept. Only the lines of the ranges not loaded yet
+            are read from the line database, see
+            :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`
+        wunit: ``'nm'``, ``'cm-1'``
+            the unit accompanying ``wmin`` and ``wmax``. Default is ``"cm-1"``.
 
         Returns
         -------
@@ -828,6 +952,8 @@ class SpectrumFactory(BandFactory):
             self.input.mole_fraction = mole_fraction
         if pressure is not None:
             self.input.pressure = pressure
+        if wmin is not None or wmax is not None:
+            self._set_wavenumber_range(wmin, wmax, wunit)
         if not is_float(Tgas):
             raise ValueError(
                 "Tgas should be float or Astropy unit. Got {0}".format(Tgas)
@@ -861,38 +987,31 @@ class SpectrumFactory(BandFactory):
         # Check database, reset populations, create line dataframe to be scaled
         # --------------------------------------------------------------------
         self._check_line_databank()
-        self._reinitialize()  # creates scaled dataframe df1 from df0
-
-        # --------------------------------------------------------------------
-
-        # First calculate the linestrength at given temperature
-        self.calc_linestrength_eq(Tgas)  # scales S0 to S (equivalent to S0 in code)
-        self._cutoff_linestrength()
-
-        # ----------------------------------------------------------------------
-
-        # ----------------------------------------------------------------------
-        # Line broadening
 
-        # ... generates molefraction for diluents
-        self._generate_diluent_molefraction(mole_fraction, diluent)
-
-        # ... calculate broadening  HWHM
-        self._calc_broadening_HWHM()
+        if self.misc.stream_blocksize is not None:
+            # Compute the spectrum by blocks of lines, summed afterwards
+            wavenumber, abscoeff_v, I_continuum = self._calc_abscoeff_eq_by_blocks(
+                Tgas, mole_fraction, diluent
+            )
+        else:
+            self._reinitialize()  # creates scaled dataframe df1 from df0
 
-        # Calculate line shift
-        self.calc_lineshift()  # scales wav to shiftwav (equivalent to v0) - done after _calc_broadening_HWHM as atomic lineshift depends on VdW HWHM
+            # --------------------------------------------------------------------
 
-        # ... generates all wstep related entities
-        self._generate_wavenumber_arrays()
+            # First calculate the linestrength at given temperature
+            # ... scales S0 to S (equivalent to S0). Reused if Tgas is unchanged
+            self._calc_cached_columns(
+                "scaled_eq_linestrength", (Tgas,), self.calc_linestrength_eq, Tgas
+            )
+            self._cutoff_linestrength()
 
-        # ... find weak lines and calculate semi-continuum (optional)
-        I_continuum = self.calculate_pseudo_continuum()
-        # ... apply lineshape and get absorption coefficient
-        # ... (this is the performance bottleneck)
-        wavenumber, abscoeff_v = self._calc_broadening()
-        #    :         :
-        #   cm-1    1/(#.cm-2)
+            # ----------------------------------------------------------------------
+            # Line broadening
+            wavenumber, abscoeff_v, I_continuum = self._calc_abscoeff_eq(
+                mole_fraction, diluent
+            )
+            #    :         :
+            #   cm-1    1/(#.cm-2)
 
         # ... add semi-continuum (optional)
         abscoeff_v = self._add_pseudo_continuum(abscoeff_v, I_continuum)
@@ -901,29 +1020,15 @@ class SpectrumFactory(BandFactory):
 
         self.profiler.start("calc_other_spectral_quan", 2)
 
-        # incorporate density of molecules (see equation (A.16) )
-        density = mole_fraction * ((pressure * 1e5) / (k_b * Tgas)) * 1e-6
-        #  :
-        # (#/cm3)
-
-        abscoeff = abscoeff_v * density  # cm-1
-        # ... # TODO: if the code is extended to multi-species, then density has to be added
-        # ... before lineshape broadening (as it would not be constant for all species)
-
-        # get absorbance (technically it's the optical depth `tau`,
-        #                absorbance `A` being `A = tau/ln(10)` )
-        absorbance = abscoeff * path_length
-        # Generate output quantities
-        # transmittance_noslit = exp(-absorbance)
-        # emissivity_noslit = 1 - transmittance_noslit
-        emissivity_noslit = -expm1(-absorbance)  # to handle small values of absorbance
-        transmittance_noslit = (
-            1 - emissivity_noslit
-        )  # still 1 for small values of emissivity_noslit
-        radiance_noslit = calc_radiance(
-            wavenumber, emissivity_noslit, Tgas, unit=self.units["radiance_noslit"]
+        quantities = self._calc_eq_quantities(
+            wavenumber,
+            abscoeff_v,
+            I_continuum,
+            Tgas,
+            mole_fraction,
+            pressure,
+            path_length,
         )
-        assert self.units["abscoeff"] == "cm-1"
 
         self.profiler.stop(
             "calc_other_spectral_quan", "Calculated other spectral quantities"
@@ -980,17 +1085,6 @@ class SpectrumFactory(BandFactory):
         # Get lines (intensities + populations)
         lines = self.get_lines()
 
-        # Spectral quantities
-        quantities = {
-            "wavenumber": wavenumber,
-            "abscoeff": abscoeff,
-            "absorbance": absorbance,
-            "emissivity_noslit": emissivity_noslit,
-            "transmittance_noslit": transmittance_noslit,
-            "radiance_noslit": radiance_noslit,
-        }
-        if I_continuum is not None and self._export_continuum:
-            quantities.update({"abscoeff_continuum": I_continuum * density})
         conditions["default_output_unit"] = self.input_wunit
 
         # Store results in Spectrum class
@@ -1024,6 +1118,618 @@ class SpectrumFactory(BandFactory):
 
         return s
 
+    def _calc_eq_quantities(
+        self,
+        wavenumber,
+        abscoeff_v,
+        I_continuum,
+        Tgas,
+        mole_fraction,
+        pressure,
+        path_length,
+    ):
+        """Get the spectral quantities of an equilibrium spectrum from the sum
+        of the broadened lines ``abscoeff_v`` (pseudo-continuum included).
+
+        Returns
+        -------
+        quantities: dict
+            spectral arrays, as expected by :py:class:`~radis.spectrum.spectrum.Spectrum`
+        """
+        # incorporate density of molecules (see equation (A.16) )
+        density = mole_fraction * ((pressure * 1e5) / (k_b * Tgas)) * 1e-6
+        #  :
+        # (#/cm3)
+
+        abscoeff = abscoeff_v * density  # cm-1
+        # ... # TODO: if the code is extended to multi-species, then density has to be added
+        # ... before lineshape broadening (as it would not be constant for all species)
+
+        # get absorbance (technically it's the optical depth `tau`,
+        #                absorbance `A` being `A = tau/ln(10)` )
+        absorbance = abscoeff * path_length
+        # Generate output quantities
+        # transmittance_noslit = exp(-absorbance)
+        # emissivity_noslit = 1 - transmittance_noslit
+        emissivity_noslit = -expm1(-absorbance)  # to handle small values of absorbance
+        transmittance_noslit = (
+            1 - emissivity_noslit
+        )  # still 1 for small values of emissivity_noslit
+        radiance_noslit = calc_radiance(
+            wavenumber, emissivity_noslit, Tgas, unit=self.units["radiance_noslit"]
+        )
+        assert self.units["abscoeff"] == "cm-1"
+
+        # Spectral quantities
+        quantities = {
+            "wavenumber": wavenumber,
+            "abscoeff": abscoeff,
+            "absorbance": absorbance,
+            "emissivity_noslit": emissivity_noslit,
+            "transmittance_noslit": transmittance_noslit,
+            "radiance_noslit": radiance_noslit,
+        }
+        if I_continuum is not None and self._export_continuum:
+            quantities.update({"abscoeff_continuum": I_continuum * density})
+
+        return quantities
+
+    def _calc_abscoeff_eq(self, mole_fraction, diluent):
+        """Broaden the lines of ``self.df1`` (linestrength already scaled and
+        cut off) and return the absorption coefficient before density scaling.
+
+        Returns
+        -------
+        wavenumber: np.array   (cm-1)
+            valid calculation wavenumber range
+        abscoeff_v: np.array   (1/(#.cm-2))
+            sum of the broadened lines, without the pseudo-continuum
+        I_continuum: np.array, or ``None``
+            pseudo-continuum (``None`` if not used)
+        """
+
+        I_continuum = self._prepare_lines_eq(mole_fraction, diluent)
+        # ... apply lineshape and get absorption coefficient
+        # ... (this is the performance bottleneck)
+        wavenumber, abscoeff_v = self._calc_broadening()
+
+        return wavenumber, abscoeff_v, I_continuum
+
+    def _prepare_lines_eq(self, mole_fraction, diluent, calc_hwhm=True):
+        """Calculate the widths and shifted positions of the lines of ``self.df1``
+        (linestrength already scaled and cut off), the spectral grid, and the
+        pseudo-continuum : everything needed before the lines are broadened.
+
+        Parameters
+        ----------
+        calc_hwhm: bool
+            if ``False``, the broadening HWHM are already in ``self.df1`` (see
+            :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch`)
+
+        Returns
+        -------
+        I_continuum: np.array, or ``None``
+            pseudo-continuum (``None`` if not used)
+        """
+
+        # ... generates molefraction for diluents
+        self._generate_diluent_molefraction(mole_fraction, diluent)
+
+        # ... calculate broadening  HWHM
+        if calc_hwhm:
+            self._calc_cached_columns(
+                "calc_hwhm", self._get_HWHM_inputs(), self._calc_broadening_HWHM
+            )
+
+        # Calculate line shift
+        self.calc_lineshift()  # scales wav to shiftwav (equivalent to v0) - done after _calc_broadening_HWHM as atomic lineshift depends on VdW HWHM
+
+        # ... generates all wstep related entities
+        self._generate_wavenumber_arrays()
+
+        # ... find weak lines and calculate semi-continuum (optional)
+        return self.calculate_pseudo_continuum()
+
+    def _calc_abscoeff_eq_by_blocks(self, Tgas, mole_fraction, diluent):
+        """Same as the linestrength, cutoff and broadening steps of
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`, but computed
+        on blocks of ``self.misc.stream_blocksize`` lines of the database whose
+        absorption coefficients are summed. Only one block of scaled lines is
+        in memory at a time ; the blocks are sliced from ``self.df0``, which is
+        in memory unless memory-mapped with the ``'npy'`` engine. See
+        :py:meth:`~radis.lbl.base.BaseFactory._iter_line_blocks`
+
+        Notes
+        -----
+        The pseudo-continuum, if used, is computed independently on each block.
+
+        Returns
+        -------
+        wavenumber, abscoeff_v, I_continuum: see
+            :py:meth:`~radis.lbl.factory.SpectrumFactory._calc_abscoeff_eq`
+        """
+        if self.misc.export_lines:
+            raise ValueError(
+                "export_lines=True is not compatible with stream_blocksize : "
+                + "the lines are not all kept in memory. Use stream_blocksize=None"
+            )
+        if self._wstep == "auto" or type(self.params.wstep) == list:
+            raise ValueError(
+                "wstep='auto' is not compatible with stream_blocksize as all "
+                + "blocks must share the same spectral grid. Give a value for wstep"
+            )
+
+        cutoff = self.params.cutoff
+        wavenumber = abscoeff_v = I_continuum = None
+        Nlines_calculated = Nlines_cutoff = Nlines_in_continuum = 0
+
+        autotune_frozen = self._autotune_frozen
+        try:
+            for df1 in self._iter_line_blocks(self.misc.stream_blocksize):
+                self.df1 = df1
+
+                self.calc_linestrength_eq(Tgas)
+                if (
+                    cutoff > 0
+                    and self.params.cutoff_error == 0
+                    and not (self.df1.S > cutoff).any()
+                ):
+                    # all lines of this block are discarded
+                    Nlines_cutoff += len(self.df1)
+                    continue
+                self._cutoff_linestrength()
+                Nlines_cutoff += self._Nlines_cutoff or 0
+
+                wavenumber, abscoeff_block, I_continuum_block = self._calc_abscoeff_eq(
+                    mole_fraction, diluent
+                )
+                # the broadening configuration is chosen on the first block only
+                self._autotune_frozen = True
+                Nlines_calculated += self._Nlines_calculated
+                Nlines_in_continuum += self._Nlines_in_continuum
+
+                if abscoeff_v is None:
+                    abscoeff_v = abscoeff_block
+                else:
+                    abscoeff_v += abscoeff_block
+                if I_continuum_block is not None:
+                    if I_continuum is None:
+                        I_continuum = I_continuum_block
+                    else:
+                        I_continuum += I_continuum_block
+        finally:
+            self._autotune_frozen = autotune_frozen
+
+        if abscoeff_v is None:
+            raise AssertionError(
+                f"All lines discarded! Please increase cutoff (currently : {cutoff:.1e})"
+            )
+
+        self._Nlines_calculated = Nlines_calculated
+        self._Nlines_cutoff = Nlines_cutoff
+        self._Nlines_in_continuum = Nlines_in_continuum
+
+        return wavenumber, abscoeff_v, I_continuum
+
+    def eq_spectrum_batch(
+        self,
+        Tgas,
+        mole_fraction=None,
+        path_length=None,
+        diluent=None,
+        pressure=None,
+        name=None,
+    ) -> list:
+        """Generate spectra at equilibrium for a list of conditions, ex: a
+        temperature or pressure sweep, with the lines already loaded in the
+        Factory.
+
+        Gives the same spectra as calling
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` for each
+        condition, but what conditions share is calculated once :
+
+        - the line database is checked, and the spectral grid generated, once
+        - lines are shifted and sorted by position once per pressure
+        - linestrengths and broadening HWHM are calculated for all conditions
+          in a single pass over the lines (arrays of shape (conditions, lines)),
+          with the condition-independent factors calculated once per line
+        - LDM lineshape templates are shared between conditions (see
+          ``lineshape_cache`` in :py:class:`~radis.lbl.factory.SpectrumFactory`)
+
+        The lines of all conditions are then broadened in parallel threads if
+        ``n_jobs`` is not 1 (each condition on one thread), which scales better
+        than parallelizing the broadening of every spectrum one after the other.
+
+        The broadening itself (LDM or line-by-line, and convolution) is still
+        calculated for every condition : the gain over a loop of
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` is significant when
+        there are many lines compared to the number of spectral points (ex: x1.2
+        to x1.4 for 230,000 lines on 30,000 points), and negligible when the
+        broadening dominates (ex: 600 lines on 150,000 points). See the
+        ``radis/test/benchmark/eq_spectrum_batch_vs_loop.py`` benchmark.
+
+        Parameters
+        ----------
+        Tgas: array of float, or `~astropy.units.quantity.Quantity`
+            Gas temperatures (K)
+        mole_fraction: float, or array of float
+            database species mole fraction. If None, Factory mole fraction is used.
+        path_length: float, array of float, or `~astropy.units.quantity.Quantity`
+            slab size (cm). If ``None``, the default Factory
+            :py:attr:`~radis.lbl.factory.SpectrumFactor.input.path_length` is used.
+        diluent: str or dictionary
+            diluent(s) used for all conditions. See
+            :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`
+        pressure: float, array of float, or `~astropy.units.quantity.Quantity`
+            pressure (bar). If ``None``, the default Factory
+            :py:attr:`~radis.lbl.factory.SpectrumFactor.input.pressure` is used.
+        name: str, or list of str
+            output Spectrum names
+
+        ``Tgas``, ``mole_fraction``, ``path_length`` and ``pressure`` are
+        broadcast together : for instance, a list of temperatures and a single
+        pressure.
+
+        Returns
+        -------
+        spectra: list of Spectrum
+            one :class:`~radis.spectrum.spectrum.Spectrum` per condition
+
+        Examples
+        --------
+        ::
+
+            sf = SpectrumFactory(2000, 2300, molecule="CO", wstep=0.01, n_jobs=-1)
+            sf.fetch_databank("hitemp")
+
+            spectra = sf.eq_spectrum_batch(Tgas=np.linspace(300, 3000, 100), pressure=1)
+
+        Notes
+        -----
+        Linestrengths and HWHM are calculated by blocks of conditions, with
+        arrays of at most about 128 MB each. They are calculated for all lines,
+        before the linestrength cutoff : if the cutoff discards most lines, a
+        loop of :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` may
+        be faster. They are calculated condition by condition, as in
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`, for atoms,
+        with ``lbfunc``, or if linestrengths are not scaled from the tabulated
+        linestrengths ``int`` with terrestrial abundances.
+        The LDM indices of the lines depend on the lines kept after the cutoff,
+        and on their widths : they are calculated for every condition.
+
+        Conditions are then computed by groups of ``n_jobs`` conditions : the scaled
+        lines of a group are kept in memory until they are broadened, then
+        released. Memory usage of the scaled lines scales with ``n_jobs``, not
+        with the number of conditions (except with ``export_lines=True``).
+
+        See Also
+        --------
+        :meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`
+        """
+
+        # Check inputs
+        if not self.input.self_absorption:
+            raise ValueError(
+                "Use non_eq_spectrum(Tgas, Tgas) to calculate spectra "
+                + "without self_absorption"
+            )
+        if self.dataframe_type != "pandas":
+            raise NotImplementedError(
+                "eq_spectrum_batch is only implemented for pandas DataFrames"
+            )
+        if self.misc.stream_blocksize is not None:
+            raise NotImplementedError(
+                "eq_spectrum_batch is not compatible with stream_blocksize. "
+                + "Use eq_spectrum"
+            )
+        if self._wstep == "auto" or type(self.params.wstep) == list:
+            raise ValueError(
+                "wstep='auto' is not compatible with eq_spectrum_batch as all "
+                + "spectra share the same spectral grid. Give a value for wstep"
+            )
+
+        # Convert units, and get defaults
+        Tgas = convert_and_strip_units(Tgas, u.K)
+        path_length = convert_and_strip_units(path_length, u.cm)
+        pressure = convert_and_strip_units(pressure, u.bar)
+        if path_length is None:
+            path_length = self.input.path_length
+        if mole_fraction is None:
+            mole_fraction = self.input.mole_fraction
+        if pressure is None:
+            pressure = self.input.pressure
+        try:
+            Tgas, mole_fraction, path_length, pressure = np.broadcast_arrays(
+                *(
+                    np.atleast_1d(np.asarray(x, dtype=float))
+                    for x in (Tgas, mole_fraction, path_length, pressure)
+                )
+            )
+        except ValueError as err:
+            raise ValueError(
+                "Tgas, mole_fraction, path_length and pressure should be floats, "
+                + "or arrays of the same length"
+            ) from err
+        if Tgas.ndim != 1:
+            raise ValueError(f"Expected 1D arrays of conditions. Got {Tgas.shape}")
+        Nc = len(Tgas)
+        if name is None or isinstance(name, str):
+            name = [name] * Nc
+        if len(name) != Nc:
+            raise ValueError(f"Expected {Nc} names. Got {len(name)}")
+        if self.save_memory and Nc > 1:
+            raise ValueError(
+                "save_memory=True deletes the line database after the first "
+                + "spectrum. Use save_memory=False to compute several spectra"
+            )
+
+        verbose = self.verbose
+
+        # New Profiler object
+        self._reset_profiler(verbose)
+
+        # Check variables
+        self._check_inputs(mole_fraction.max(), Tgas.max())
+
+        # %% Start
+        # --------------------------------------------------------------------
+
+        self.profiler.start("spectrum_calculation", 1)
+        self.profiler.start("spectrum_calc_before_obj", 2)
+
+        self._check_line_databank()
+
+        def set_condition(i):
+            self.input.Tgas = float(Tgas[i])
+            self.input.mole_fraction = float(mole_fraction[i])
+            self.input.path_length = float(path_length[i])
+            self.input.pressure = float(pressure[i])
+
+        # Conditions are computed by blocks of conditions : in each block,
+        # linestrengths and broadening HWHM of all lines are calculated at once
+        # for all conditions (arrays of shape (conditions, lines)). Blocks are
+        # then computed by groups of n_jobs conditions : the scaled lines of a
+        # group are broadened in parallel, then released
+        # --------------------------------------------------------------------
+        spectra = [None] * Nc
+        outputs = {}  # condition index: quantities, conditions and lines
+        group_size = effective_n_jobs(self.misc.n_jobs)
+        vectorized = (
+            not self.params.lbfunc
+            and not self.input.isatom
+            and self.molparam.terrestrial_abundances
+            and "int" in self.df0.columns
+        )
+        if vectorized:
+            # ... about 128 MB per array of shape (conditions, lines)
+            block_size = max(group_size, 2**24 // max(len(self.df0), 1))
+        else:
+            block_size = group_size
+        base_lines = None  # all lines, sorted by shifted position
+        base_pressure = None  # pressure of the shifted positions of base_lines
+        autotune_frozen = self._autotune_frozen
+        try:
+            for block_start in range(0, Nc, block_size):
+                block = []  # conditions of the block that must be calculated
+                for i in range(block_start, min(block_start + block_size, Nc)):
+                    set_condition(i)
+                    if self.autoretrievedatabase:
+                        spectra[i] = self._retrieve_from_database()
+                        if spectra[i] is not None:
+                            continue
+                    block.append(i)
+
+                if vectorized and len(block) > 0:
+                    # Lines shifted and sorted once for all conditions at the same
+                    # pressure (reused by the next blocks if the pressure is unchanged)
+                    if base_lines is None or pressure[block[0]] != base_pressure:
+                        set_condition(block[0])
+                        self._reinitialize()  # creates dataframe df1 from df0
+                        self.calc_lineshift()
+                        base_lines = self.df1
+                        base_pressure = pressure[block[0]]
+                    # Linestrength and HWHM of all lines, for all conditions
+                    block_diluents = []
+                    for i in block:
+                        self._generate_diluent_molefraction(mole_fraction[i], diluent)
+                        block_diluents.append(self._diluent)
+                    S_block = self._calc_linestrength_eq_batch(base_lines, Tgas[block])
+                    hwhm_block = self._calc_broadening_HWHM_batch(
+                        base_lines,
+                        Tgas[block],
+                        pressure[block],
+                        mole_fraction[block],
+                        block_diluents,
+                    )
+
+                for group_start in range(0, len(block), group_size):
+                    group = block[group_start : group_start + group_size]
+
+                    # Scale the lines for each condition
+                    lines = {}  # condition index: lines to broaden
+                    I_continuum = {}
+                    # ... condition index: lines calculated, cut off, in continuum
+                    counters = {}
+                    diluents = {}
+                    for k, i in enumerate(group, start=group_start):
+                        set_condition(i)
+                        if vectorized:
+                            # ... scaled lines of condition i (before the cutoff)
+                            self.df1 = base_lines.copy(deep=False)
+                            self.df1.attrs = base_lines.attrs
+                            self.df1["S"] = S_block[k]
+                            for column, hwhm in zip(
+                                ["hwhm_lorentz", "hwhm_gauss", "hwhm_voigt"],
+                                hwhm_block,
+                            ):
+                                if hwhm is not None:
+                                    self.df1[column] = hwhm[k]
+                            if pressure[i] != base_pressure:
+                                # recalculated (and lines sorted) in calc_lineshift
+                                del self.df1["shiftwav"]
+                            self._cutoff_linestrength()
+                            I_continuum[i] = self._prepare_lines_eq(
+                                mole_fraction[i], diluent, calc_hwhm=False
+                            )
+                        else:
+                            self._reinitialize()  # creates scaled dataframe df1 from df0
+                            self._calc_cached_columns(
+                                "scaled_eq_linestrength",
+                                (Tgas[i],),
+                                self.calc_linestrength_eq,
+                                Tgas[i],
+                            )
+                            self._cutoff_linestrength()
+                            I_continuum[i] = self._prepare_lines_eq(
+                                mole_fraction[i], diluent
+                            )
+                        # the broadening configuration is chosen on the first condition only
+                        # (all conditions are broadened with the same one)
+                        self._autotune_frozen = True
+                        lines[i] = self.df1
+                        counters[i] = (
+                            self._Nlines_calculated,
+                            self._Nlines_cutoff,
+                            self._Nlines_in_continuum,
+                        )
+                        diluents[i] = self._diluent
+
+                    # Broaden the lines of all conditions of the group
+                    # ... each condition on one thread (n_jobs is temporarily set to 1
+                    # ... within each condition so chunks / numba threads are not nested)
+                    n_jobs = min(group_size, len(lines))
+                    if n_jobs > 1:
+                        misc_n_jobs = self.misc.n_jobs
+                        self.misc.n_jobs = 1
+                        try:
+                            results = Parallel(n_jobs=n_jobs, prefer="threads")(
+                                delayed(self._calc_broadening)(lines[i]) for i in lines
+                            )
+                        finally:
+                            self.misc.n_jobs = misc_n_jobs
+                    else:
+                        results = [self._calc_broadening(lines[i]) for i in lines]
+                    abscoeff_v = dict(
+                        zip(lines, (abscoeff for (_, abscoeff) in results))
+                    )
+
+                    # Calculate the spectral quantities
+                    for i in lines:
+                        set_condition(i)
+                        (
+                            self._Nlines_calculated,
+                            self._Nlines_cutoff,
+                            self._Nlines_in_continuum,
+                        ) = counters[i]
+                        self.df1 = lines[i]
+
+                        abscoeff_v_i = self._add_pseudo_continuum(
+                            abscoeff_v[i], I_continuum[i]
+                        )
+                        quantities = self._calc_eq_quantities(
+                            self.wavenumber,
+                            abscoeff_v_i,
+                            I_continuum[i],
+                            Tgas[i],
+                            mole_fraction[i],
+                            pressure[i],
+                            path_length[i],
+                        )
+
+                        conditions = self.get_conditions(add_config=True)
+                        conditions.update(
+                            {
+                                "lines_calculated": self._Nlines_calculated,
+                                "lines_cutoff": self._Nlines_cutoff,
+                                "lines_in_continuum": self._Nlines_in_continuum,
+                                "thermal_equilibrium": True,
+                                "diluents": diluents[i],
+                                "radis_version": version,
+                                "spectral_points": (
+                                    int(
+                                        self.params.wavenum_max_calc
+                                        - self.params.wavenum_min_calc
+                                    )
+                                    / self.params.wstep
+                                ),
+                                "default_output_unit": self.input_wunit,
+                            }
+                        )
+                        if self.params.optimization != None:
+                            # (self.NwL, self.NwG may have been set by another thread)
+                            conditions.update(
+                                {
+                                    "NwL": len(
+                                        self._init_LDM_axis(
+                                            lines[i].hwhm_lorentz.values * 2,
+                                            self.params.dxL,
+                                        )[0]
+                                    ),
+                                    "NwG": len(
+                                        self._init_LDM_axis(
+                                            lines[i].hwhm_gauss.values * 2,
+                                            self.params.dxG,
+                                        )[0]
+                                    ),
+                                }
+                            )
+                        outputs[i] = (quantities, conditions, self.get_lines())
+
+                    # Release the scaled lines of the group (unless exported)
+                    del lines, results, abscoeff_v
+
+                # Release the arrays of the block
+                S_block = hwhm_block = None
+        finally:
+            self._autotune_frozen = autotune_frozen
+
+        self.profiler.stop(
+            "spectrum_calc_before_obj", "Spectra calculated (before object generation)"
+        )
+
+        # %% Export
+        # --------------------------------------------------------------------
+
+        self.profiler.start("generate_spectrum_obj", 2)
+        calculation_time = self.profiler.final[list(self.profiler.final)[-1]][
+            "spectrum_calc_before_obj"
+        ] / max(len(outputs), 1)
+        del self.profiler.final[list(self.profiler.final)[-1]][
+            "spectrum_calc_before_obj"
+        ]
+        profiler = dict(self.profiler.final)
+
+        for i, (quantities, conditions, lines_i) in outputs.items():
+            conditions.update(
+                {
+                    "calculation_time": calculation_time,
+                    "profiler": profiler,
+                }
+            )
+            spectra[i] = Spectrum(
+                quantities=quantities,
+                conditions=conditions,
+                populations=None,
+                lines=lines_i,
+                units=self.units,
+                cond_units=self.cond_units,
+                check_wavespace=False,
+                name=name[i],
+                references=dict(self.reftracker),
+            )
+
+            # update database if asked so
+            if self.autoupdatedatabase:
+                self.SpecDatabase.add(spectra[i], if_exists_then="increment")
+
+        if verbose:
+            self.print_conditions(f"Calculated {Nc} Equilibrium Spectra")
+
+        self.profiler.stop("generate_spectrum_obj", "Generated Spectrum objects")
+        self.profiler.stop("spectrum_calculation", f"{Nc} spectra calculated")
+
+        return spectra
+
     def eq_spectrum_gpu(
         self,
         Tgas,
@@ -1513,6 +2219,9 @@ class SpectrumFactory(BandFactory):
         rot_distribution="boltzmann",
         overpopulation=None,
         name=None,
+        wmin=None,
+        wmax=None,
+        wunit=Default("cm-1"),
     ) -> Spectrum:
         """Calculate emission spectrum in non-equilibrium case. Calculates
         absorption with broadened linestrength and emission with broadened
@@ -1556,6 +2265,15 @@ class SpectrumFactory(BandFactory):
                 {level:overpopulation_factor}
         name: str
             output Spectrum name (useful in batch)
+        wmin, wmax : ``float`` or `~astropy.units.quantity.Quantity`
+            new spectral range of the factory, for this spectrum and the next
+            ones (same convention as in
+            :py:class:`~radis.lbl.factory.SpectrumFactory`). If ``None``, the
+            current bound is kept. Only the lines of the ranges not loaded yet
+            are read from the line database, see
+            :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`
+        wunit: ``'nm'``, ``'cm-1'``
+            the unit accompanying ``wmin`` and ``wmax``. Default is ``"cm-1"``.
 
         Returns
         -------
@@ -1635,6 +2353,8 @@ class SpectrumFactory(BandFactory):
             self.input.mole_fraction = mole_fraction
         if pressure is not None:
             self.input.pressure = pressure
+        if wmin is not None or wmax is not None:
+            self._set_wavenumber_range(wmin, wmax, wunit)
         if self.input.isatom:
             self.input.Telec = Telec
             singleTvibmode = True  # to trigger calc_populations_noneq below
@@ -1704,26 +2424,44 @@ class SpectrumFactory(BandFactory):
 
         # ----------------------------------------------------------------------
         # Calculate Populations, Linestrength and Emission Integral
-        if singleTvibmode:
-            self.calc_populations_noneq(
-                Tvib,
-                Trot,
-                Telec,
-                vib_distribution=vib_distribution,
-                rot_distribution=rot_distribution,
-                overpopulation=overpopulation,
-            )
+        def calc_linestrength_noneq():
+            if singleTvibmode:
+                self.calc_populations_noneq(
+                    Tvib,
+                    Trot,
+                    Telec,
+                    vib_distribution=vib_distribution,
+                    rot_distribution=rot_distribution,
+                    overpopulation=overpopulation,
+                )
+            else:
+                self._calc_populations_noneq_multiTvib(
+                    Tvib,
+                    Trot,
+                    vib_distribution=vib_distribution,
+                    rot_distribution=rot_distribution,
+                    overpopulation=overpopulation,
+                )
+
+            self.calc_linestrength_noneq()
+            self.calc_emission_integral()
+
+        # ... reused if temperatures and distributions are unchanged (unless
+        # ... populations of all levels are exported : they are stored in the
+        # ... partition function calculators and must be recalculated)
+        if self.misc.export_populations:
+            key = None
         else:
-            self._calc_populations_noneq_multiTvib(
+            key = (
                 Tvib,
                 Trot,
-                vib_distribution=vib_distribution,
-                rot_distribution=rot_distribution,
-                overpopulation=overpopulation,
+                Telec,
+                vib_distribution,
+                rot_distribution,
+                tuple(sorted((overpopulation or {}).items())),
+                self.misc.export_rovib_fraction,
             )
-
-        self.calc_linestrength_noneq()
-        self.calc_emission_integral()
+        self._calc_cached_columns("noneq_linestrength", key, calc_linestrength_noneq)
 
         # ----------------------------------------------------------------------
         # Cutoff linestrength
@@ -1737,7 +2475,9 @@ class SpectrumFactory(BandFactory):
         self._generate_diluent_molefraction(mole_fraction, diluent)
 
         # ... calculate broadening  HWHM
-        self._calc_broadening_HWHM()
+        self._calc_cached_columns(
+            "calc_hwhm", self._get_HWHM_inputs(), self._calc_broadening_HWHM
+        )
 
         # ----------------------------------------------------------------------
 
@@ -1916,6 +2656,49 @@ class SpectrumFactory(BandFactory):
 
         return s
 
+    def _set_wavenumber_range(self, wmin, wmax, wunit=Default("cm-1")):
+        """Change the spectral range of the factory, for the next spectra.
+
+        The lines of the new range are loaded the next time the line database
+        is checked : only the ranges not loaded yet are read, see
+        :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`
+
+        If one of ``wmin``, ``wmax`` is ``None``, the current bound is kept
+        (converted in the unit of the other one)."""
+        if wmin is None or wmax is None:
+            w = wmax if wmin is None else wmin
+            if isinstance(w, u.Quantity):
+                unit = w.unit
+            else:
+                unit = u.Unit(wunit.value if isinstance(wunit, Default) else wunit)
+            if unit.is_equivalent(u.m):
+                # the lowest wavelength is the highest wavenumber
+                cm2nm_medium = cm2nm_air if self._medium == "air" else cm2nm
+                current = (
+                    cm2nm_medium(self.input.wavenum_max) * u.nm,
+                    cm2nm_medium(self.input.wavenum_min) * u.nm,
+                )
+            else:
+                current = (
+                    self.input.wavenum_min / u.cm,
+                    self.input.wavenum_max / u.cm,
+                )
+            current = [c.to(unit) for c in current]
+            if not isinstance(w, u.Quantity):
+                current = [c.value for c in current]
+            if wmin is None:
+                wmin = current[0]
+            else:
+                wmax = current[1]
+        wavenum_min, wavenum_max = get_wavenumber_range(
+            wmin, wmax, wunit, medium=self._medium
+        )
+        neighbour_lines = self.params.neighbour_lines
+        self.input.wavenum_min = wavenum_min
+        self.input.wavenum_max = wavenum_max
+        self.params.wavenum_min_calc = wavenum_min - neighbour_lines
+        self.params.wavenum_max_calc = wavenum_max + neighbour_lines
+
     def _generate_wavenumber_arrays(self, checks=True):
         """define wavenumber grid vectors
 
@@ -1953,7 +2736,8 @@ class SpectrumFactory(BandFactory):
         truncation = self.params.truncation
         neighbour_lines = self.params.neighbour_lines
 
-        if truncation and neighbour_lines > truncation:
+        # (lines up to truncation + wstep away still contribute to the closest point)
+        if truncation and neighbour_lines > truncation + self.params.wstep:
             self.warn(
                 f"Neighbour lines resolved up to {neighbour_lines} cm-1 away from the spectrum. "
                 + f"But lines are anyway truncated at {truncation:.2f} cm-1. "
@@ -1992,7 +2776,16 @@ class SpectrumFactory(BandFactory):
 
         # Setting wstep to optimal value and rounding it to a degree 3
         if checks:
-            if self._sparse_ldm == "auto":
+            if "auto" in [
+                self._optimization,
+                self._broadening_method,
+                self._chunksize,
+            ]:
+                # choose the fastest configuration (including sparse_ldm if "auto"),
+                # unless already chosen for this batch of spectra or stream of blocks
+                if not self._autotune_frozen:
+                    self._autotune_broadening()
+            elif self._sparse_ldm == "auto":
                 sparsity = len(wavenumber_calc) / len(self.df1)
                 self.params["sparse_ldm"] = (
                     sparsity > 1.0
@@ -2108,7 +2901,7 @@ class SpectrumFactory(BandFactory):
         if optimization in ("simple", "min-RMS"):
             NwL = self.NwL
             NwG = self.NwG
-            if broadening_method == "voigt":
+            if broadening_method in ["voigt", "faddeeva"]:
                 estimated_time = (
                     2.096e-07 * n_lines
                     + 7.185e-09
@@ -2134,7 +2927,7 @@ class SpectrumFactory(BandFactory):
             else:
                 raise NotImplementedError("broadening_method not implemented")
         elif optimization is None:
-            if broadening_method == "voigt":
+            if broadening_method in ["voigt", "faddeeva"]:
                 estimated_time = 6.6487e-08 * n_lines * truncation / wstep
             elif broadening_method == "convolve":  # Not benchmarked
                 estimated_time = (
@@ -28,6 +28,10 @@ PRIVATE METHODS - DATABASE LOADING
 - :py:meth:`radis.lbl.loader.DatabankLoader._build_partition_function_interpolator`
 - :py:meth:`radis.lbl.loader.DatabankLoader._build_partition_function_calculator`
 
+Line databases loaded from the disk are kept in a process-wide
+:py:class:`~radis.lbl.loader.LinesCache` (see :py:func:`~radis.lbl.loader.get_lines_cache`)
+and reused by the next factories.
+
 Most methods are written in inherited class with the following inheritance scheme:
 
 :py:class:`~radis.lbl.loader.DatabankLoader` > :py:class:`~radis.lbl.base.BaseFactory` >
@@ -50,8 +54,10 @@ key in :py:attr:`radis.config`
 # (on the slide bar on the right)
 
 import warnings
+from collections import OrderedDict
 from copy import deepcopy
-from os.path import exists, expanduser, join, splitext
+from os.path import exists, expanduser, getmtime, join, splitext
+from threading import Lock
 from time import time
 from uuid import uuid1
 
@@ -472,9 +478,11 @@ class Parameters(ConditionDict):
         # "add_at_used",
         "broadening_method",
         "truncation",
+        "truncation_error",
         "neighbour_lines",
         "chunksize",
         "cutoff",
+        "cutoff_error",
         "db_use_cached",
         "dbformat",
         "dbpath",
@@ -490,6 +498,7 @@ class Parameters(ConditionDict):
         "parfuncfmt",
         "parfuncpath",
         "parsum_mode",
+        "precision",
         "pseudo_continuum_threshold",
         "sparse_ldm",
         "warning_broadening_threshold",
@@ -507,8 +516,10 @@ class Parameters(ConditionDict):
 
         # Dev: Init here to be found by autocomplete
         self.truncation = None  #: float: cutoff for half-width lineshape calculation (cm-1). Overwritten by SpectrumFactory
+        self.truncation_error = 0  #: float: [0-1] fraction of the area in the wings of LDM lineshapes truncated further than truncation
         self.neighbour_lines = None  #: float: extra range (cm-1) on each side of the spectrum to account for neighbouring lines. Overwritten by SpectrumFactory
         self.cutoff = None  #: float: linestrength cutoff (molecule/cm)
+        self.cutoff_error = 0  #: float: [0-1] maximum fraction of the total linestrength discarded (replaces cutoff if not 0)
         self.broadening_method = ""  #: str:``"voigt"``, ``"convolve"``, ``"fft"``
         self.optimization = None  #: str: ``"simple"``, ``"min-RMS"``, ``None``
         self.db_use_cached = (
@@ -540,6 +551,7 @@ class Parameters(ConditionDict):
         lines because of lineshape broadening. Default ``True``."""
         self.parsum_mode = "full summation"  #: int : "full summation" or "tabulation"  . calculation mode of partition function. See :py:class:`~radis.levels.partfunc.RovibParFuncCalculator`
         self.sparse_ldm = "auto"  #: str: "auto", True, False  . Sparse LDM calculation. See :py:meth:`radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+        self.precision = "float64"  #: str: "float64", "float32" . Precision of line broadening. See :py:meth:`radis.lbl.broadening.BroadenFactory._cast_lines_to_precision`
 
 
 class MiscParams(ConditionDict):
@@ -571,7 +583,10 @@ class MiscParams(ConditionDict):
         "total_lines",
         "zero_padding",
         "memory_mapping_engine",
-        "add_at_used",  # function used in DIT ; a Cython and a pure-Python version exist
+        "n_jobs",
+        "stream_blocksize",
+        "add_at_used",  # function used in DIT ; a numba and a numpy version exist
+        "autotune",
     ]
 
     def __init__(self):
@@ -579,6 +594,8 @@ class MiscParams(ConditionDict):
 
         # Dev: Init here to be found by autocomplete
         self.chunksize = None  #: int: divide line database in chunks of lines
+        self.n_jobs = 1  #: int: number of threads to process chunks of lines. ``-1`` to use all CPUs
+        self.stream_blocksize = None  #: int: compute spectra by blocks of lines. See :py:meth:`~radis.lbl.base.BaseFactory._iter_line_blocks`
         self.export_lines = (
             None  #: bool: export lines in output Spectrum (takes memory!)
         )
@@ -593,11 +610,12 @@ class MiscParams(ConditionDict):
         self.total_lines = 0  #: int : number of lines in database.
         self.memory_mapping_engine = config[
             "MEMORY_MAPPING_ENGINE"
-        ]  # 'pytables', 'vaex', 'feather'
+        ]  # 'pytables', 'vaex', 'feather', 'parquet', 'npy'
 
         self.add_at_used = (
-            ""  # function used in DIT ; a Cython and a pure-Python version exist
+            ""  # function used in DIT ; a numba and a numpy version exist
         )
+        self.autotune = None  #: str: broadening configuration chosen if some parameters are "auto", and predicted times
 
 
 def format_paths(s):
@@ -635,6 +653,238 @@ https://stackoverflow.com/q/13250499/5622825
 """
 
 
+class LinesCache(object):
+    """Least-recently-used cache of the line databases loaded by
+    :py:meth:`~radis.lbl.loader.DatabankLoader.fetch_databank` and
+    :py:meth:`~radis.lbl.loader.DatabankLoader.load_databank`, with a memory
+    budget. A single cache is shared by all factories of the Python process
+    (see :py:func:`~radis.lbl.loader.get_lines_cache`), so that new factories
+    (ex: each :py:func:`~radis.lbl.calc.calc_spectrum` call) do not read the
+    same lines from the disk again.
+
+    Lines are stored by key (database, molecule, isotopes, columns, engine,
+    etc.) and wavenumber range. Any range within a stored range is served from
+    the cache, unless the files they were read from have been modified since.
+    Memory-mapped lines (ex: ``'npy'`` engine) are not cached : they are not
+    read from the disk again anyway, and storing them would copy them in memory.
+
+    Parameters
+    ----------
+    max_size: float
+        memory budget (MB). Least recently used line databases are removed when
+        this size is exceeded.
+
+    Examples
+    --------
+    The cache is enabled with ``radis.config["LINES_CACHE"]`` and its budget
+    set with ``radis.config["LINES_CACHE_SIZE"]`` ::
+
+        from radis import calc_spectrum, get_lines_cache
+
+        calc_spectrum(2000, 2300, molecule="CO", Tgas=1000, databank="hitemp")
+        calc_spectrum(2100, 2200, molecule="CO", Tgas=1500, databank="hitemp")  # no disk access
+
+        cache = get_lines_cache()
+        print(cache.hits, cache.misses)
+        >>> 1 1
+        print(cache.entries())
+        cache.clear()
+
+    See Also
+    --------
+    :py:func:`~radis.lbl.loader.get_lines_cache`,
+    :py:func:`~radis.lbl.loader.clear_lines_cache`
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0  #: int: current size (bytes)
+        self.hits = 0  #: int: total number of cache hits
+        self.misses = 0  #: int: total number of cache misses
+        # (key, wavenum_min, wavenum_max): (df, extras, files modification times)
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, wavenum_min, wavenum_max, inclusive=False):
+        """Returns a copy of the lines of ``key`` within ``wavenum_min`` -
+        ``wavenum_max``, and the dictionary of extra information stored with
+        them, or ``None`` if this range was not loaded.
+
+        Parameters
+        ----------
+        inclusive: bool
+            if ``True``, lines at ``wavenum_min`` and ``wavenum_max`` are returned
+            (as in :py:meth:`~radis.lbl.loader.DatabankLoader.load_databank`), else
+            only the lines strictly within (as in
+            :py:meth:`~radis.lbl.loader.DatabankLoader.fetch_databank`)
+        """
+        with self._lock:
+            # (list : entries of modified files are removed while iterating)
+            for cache_key, (df, extras, mtimes) in list(reversed(self._cache.items())):
+                key_i, wmin_i, wmax_i = cache_key
+                if key_i == key and wmin_i <= wavenum_min and wavenum_max <= wmax_i:
+                    if not all(exists(f) and getmtime(f) == t for f, t in mtimes):
+                        self._remove(cache_key)  # files modified since
+                        continue
+                    self._cache.move_to_end(cache_key)
+                    self.hits += 1
+                    break
+            else:
+                self.misses += 1
+                return None
+
+        # Copy the lines in range (the factory modifies them inplace)
+        if inclusive:
+            b = (df.wav >= wavenum_min) & (df.wav <= wavenum_max)
+        else:
+            b = (df.wav > wavenum_min) & (df.wav < wavenum_max)
+        df = df[b].reset_index(drop=True)
+        return df, dict(extras)
+
+    def add(self, key, wavenum_min, wavenum_max, df, extras={}, files=[]):
+        """Stores a copy of lines ``df`` loaded on ``wavenum_min`` - ``wavenum_max``
+        under ``key``, and removes the least recently used line databases if the
+        memory budget is exceeded. ``df`` is not stored if it is memory-mapped.
+
+        Parameters
+        ----------
+        files: list of str
+            files the lines were read from : the lines are discarded if one of
+            them is modified"""
+        if _is_memory_mapped(df):
+            return
+        size = df.memory_usage(index=False).sum()
+        if size > self.max_size * 1e6:
+            return
+        df = df.copy()
+        mtimes = tuple((f, getmtime(f)) for f in files)
+        with self._lock:
+            for cache_key in list(self._cache):
+                # remove ranges of the same database included in the new one
+                key_i, wmin_i, wmax_i = cache_key
+                if key_i == key and wavenum_min <= wmin_i and wmax_i <= wavenum_max:
+                    self._remove(cache_key)
+            self._cache[(key, wavenum_min, wavenum_max)] = (df, dict(extras), mtimes)
+            self.size += size
+            while self.size > self.max_size * 1e6:
+                self._remove(next(iter(self._cache)))
+
+    def _remove(self, cache_key):
+        df, _, _ = self._cache.pop(cache_key)
+        self.size -= df.memory_usage(index=False).sum()
+
+    def entries(self):
+        """Returns the content of the cache, from the least to the most recently
+        used
+
+        Returns
+        -------
+        list of dict
+            key, wavenumber range, number of lines and size (MB) of each entry
+        """
+        with self._lock:
+            return [
+                {
+                    "key": key,
+                    "wavenum_min": wmin,
+                    "wavenum_max": wmax,
+                    "lines": len(df),
+                    "size (MB)": df.memory_usage(index=False).sum() * 1e-6,
+                }
+                for (key, wmin, wmax), (df, _, _) in self._cache.items()
+            ]
+
+    def clear(self):
+        """Removes all line databases"""
+        with self._lock:
+            self._cache.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+
+def _is_memory_mapped(df):
+    """Returns whether a column of DataFrame ``df`` is memory-mapped"""
+    for column in df.columns:
+        values = df[column].to_numpy()
+        if isinstance(values, np.memmap) or isinstance(values.base, np.memmap):
+            return True
+    return False
+
+
+_process_lines_cache = None  # shared by all factories
+
+
+def get_lines_cache():
+    """Returns the line database cache shared by all factories of the Python
+    process, or ``None`` if ``radis.config["LINES_CACHE"]`` is ``False``. Its
+    memory budget is ``radis.config["LINES_CACHE_SIZE"]`` (MB).
+
+    See Also
+    --------
+    :py:class:`~radis.lbl.loader.LinesCache`, :py:func:`~radis.lbl.loader.clear_lines_cache`
+    """
+    global _process_lines_cache
+
+    if not config["LINES_CACHE"]:
+        return None
+    if _process_lines_cache is None:
+        _process_lines_cache = LinesCache(config["LINES_CACHE_SIZE"])
+    _process_lines_cache.max_size = config["LINES_CACHE_SIZE"]
+    return _process_lines_cache
+
+
+def clear_lines_cache():
+    """Removes all line databases from the process-wide cache. Call it if you
+    modify the database files on the disk.
+
+    See Also
+    --------
+    :py:class:`~radis.lbl.loader.LinesCache`, :py:func:`~radis.lbl.loader.get_lines_cache`
+    """
+    if _process_lines_cache is not None:
+        _process_lines_cache.clear()
+
+
+def _get_missing_ranges(ranges, wavenum_min, wavenum_max):
+    """Returns the parts of ``wavenum_min - wavenum_max`` not covered by the
+    (sorted, non overlapping) wavenumber ranges ``ranges``.
+
+    Examples
+    --------
+    ::
+
+        _get_missing_ranges([(2000, 2100)], 2050, 2300)
+        >>> [(2100, 2300)]
+    """
+    missing = []
+    start = wavenum_min
+    for wmin, wmax in ranges:
+        if wmax <= start:
+            continue
+        if wmin >= wavenum_max:
+            break
+        if wmin > start:
+            missing.append((start, wmin))
+        start = max(start, wmax)
+    if start < wavenum_max:
+        missing.append((start, wavenum_max))
+    return missing
+
+
+def _merge_ranges(ranges):
+    """Returns the union of wavenumber ranges ``ranges``, as a sorted list of
+    non overlapping ranges"""
+    merged = []
+    for wmin, wmax in sorted(ranges):
+        if merged and wmin <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], wmax))
+        else:
+            merged.append((wmin, wmax))
+    return merged
+
+
 class DatabankLoader(object):
     """
     .. inheritance-diagram:: radis.lbl.factory.SpectrumFactory
@@ -665,15 +915,26 @@ class DatabankLoader(object):
         "_Nlines_cutoff",
         "_Nlines_in_continuum",
         "_autoretrieveignoreconditions",
+        "_autotune_frozen",
+        "_broadening_method",
         "_broadening_time_ruleofthumb",
+        "_chunksize",
+        "_columns_cache",
+        "_cutoff_order",
         "_databank_args",
         "_databank_kwargs",
         "_diluent",
         "_export_continuum",
         "_id",
+        "_lineshape_cache",
+        "_loaded_lines",
+        "_loading_range",
+        "_medium",
         "_neighbour_lines",
+        "_optimization",
         "_sparse_ldm",
         "_wstep",
+        "add_at_engine",
         "autoretrievedatabase",
         "autoupdatedatabase",
         "cond_units",
@@ -805,6 +1066,12 @@ class DatabankLoader(object):
         self._databank_args = []
         self._databank_kwargs = {}
 
+        # How the lines of df0 were loaded, and on which wavenumber ranges (to
+        # load only the missing lines if the range changes).
+        # See _update_databank_range
+        self._loaded_lines = None
+        self._loading_range = False
+
         self._autoretrieveignoreconditions = []  # HACK. See _retrieve_from_database
 
         # Molecular parameters
@@ -980,6 +1247,7 @@ class DatabankLoader(object):
 
         # Delete database
         self.df0 = None  # type : pd.DataFrame
+        self._loaded_lines = None
         self._reset_references()  # bibliographic references
 
     def columns_list_to_load(self, load_columns_type):
@@ -1086,9 +1354,11 @@ class DatabankLoader(object):
             will be left untouched.
         db_use_cached: bool, or ``'regen'``
             use cached
-        memory_mapping_engine: ``'pytables'``, ``'vaex'``, ``'feather'``
+        memory_mapping_engine: ``'pytables'``, ``'vaex'``, ``'feather'``, ``'parquet'``, ``'npy'``
             which library to use to read HDF5 files (they are incompatible: ``'pytables'`` is
-            row-major while ``'vaex'`` is column-major) or other memory-mapping formats
+            row-major while ``'vaex'`` is column-major) or other memory-mapping formats.
+            With ``'parquet'``, only the row groups overlapping the spectral range are read.
+            With ``'npy'``, columns are memory-mapped and sliced without copying
             If ``'default'``, use the value from ~/radis.json `["MEMORY_MAPPING_ENGINE"]`
         parallel: bool
             if ``True``, uses joblib.parallel to load database with multiple processes
@@ -1119,6 +1389,12 @@ class DatabankLoader(object):
         :py:func:`~radis.io.hitemp.fetch_hitemp`
         HITEMP files are generated in a ~/.radisdb database.
 
+        If the spectral range of the factory changed since the lines were
+        loaded (ex: ``sf.eq_spectrum(..., wmin=, wmax=)``), calling
+        :py:meth:`~radis.lbl.loader.DatabankLoader.fetch_databank` again with the
+        same arguments only loads the lines of the missing ranges. See
+        :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`
+
         See Also
         --------
         :meth:`~radis.lbl.loader.DatabankLoader.load_databank`,
@@ -1133,6 +1409,12 @@ class DatabankLoader(object):
         # | metadata to ensures that it is redownloaded if necessary.
         # | see implementation in load_databank.
 
+        # Lines already loaded with the same arguments, on another range ?
+        load_kwargs = {k: v for k, v in locals().items() if k != "self"}
+        if self._can_extend_databank("fetch_databank", load_kwargs):
+            self._update_databank_range()
+            return
+
         # Check inputs
         if source == "astroquery":
             warnings.warn(
@@ -1257,7 +1539,44 @@ class DatabankLoader(object):
         # ---------------------
         self._reset_references()  # bibliographic references
 
-        if source == "hitran":
+        # Lines already loaded by a previous factory of this process ?
+        lines_cache = get_lines_cache() if output == "pandas" else None
+        cached = None
+        if lines_cache is not None and db_use_cached != "regen":
+            # (the files are not known before fetching : they are checked
+            # for modifications when the lines are retrieved, see LinesCache.get)
+            cache_key = (
+                "fetch_databank",
+                source,
+                database,
+                molecule,
+                isotope,
+                None if columns is None else tuple(sorted(columns)),
+                memory_mapping_engine,
+                local_databases,
+                parse_local_global_quanta,
+                drop_non_numeric,
+                repr(extra_params),
+                db_use_cached,
+            )
+            cached = lines_cache.get(cache_key, wavenum_min, wavenum_max)
+        partition_function_exomol = None
+        parfuncpath = None
+
+        if cached is not None:
+            df, extras = cached
+            self.params.dbpath = extras["dbpath"]
+            self.input.isotope = extras["isotope"]
+            for ref, whys in extras["references"].items():
+                for why in whys:
+                    self.reftracker.add(ref, why)
+            partition_function_exomol = extras["partition_function_exomol"]
+            if extras["parfuncpath"] is not None and not parfunc:  # Kurucz
+                self.params.parfuncpath = parfunc = format_paths(extras["parfuncpath"])
+            if self.verbose >= 2:
+                printg(f"Loaded {len(df):,d} lines of {molecule} from the lines cache")
+
+        elif source == "hitran":
             self.reftracker.add(doi["HITRAN-2020"], "line database")  # [HITRAN-2020]_
 
             if database == "full":
@@ -1594,7 +1913,14 @@ class DatabankLoader(object):
 
         # Always sort line database by wavenumber (required to SPARSE_WAVERANGE mode)
         if output == "pandas":
-            df.sort_values("wav", kind="mergesort", ignore_index=True, inplace=True)
+            wav = df["wav"].to_numpy()
+            if np.all(wav[1:] >= wav[:-1]):
+                # ex: 'parquet' or 'npy' databases; avoid copying all columns
+                # (reset_index copies them, and 'npy' columns would not be
+                # memory-mapped anymore)
+                df.index = pd.RangeIndex(len(df))
+            else:
+                df.sort_values("wav", kind="mergesort", ignore_index=True, inplace=True)
         elif output == "vaex":
             try:
                 attrs = df.attrs
@@ -1609,26 +1935,50 @@ class DatabankLoader(object):
         # ------------------------------------
         # (note : this is now done in 'fetch_hitemp' before saving to the disk)
         # spectroscopic quantum numbers will be needed for nonequilibrium calculations, and line survey.
-        if parse_local_global_quanta and "locu" in df and source != "geisa":
-            df = parse_local_quanta(
-                df, molecule, verbose=self.verbose, dataframe_type=output
-            )
-        if (
-            parse_local_global_quanta and "globu" in df and source != "geisa"
-        ):  # spectroscopic quantum numbers will be needed for nonequilibrium calculations :
-            df = parse_global_quanta(
-                df, molecule, verbose=self.verbose, dataframe_type=output
-            )
+        if cached is None:  # (lines in cache are already post-processed)
+            if parse_local_global_quanta and "locu" in df and source != "geisa":
+                df = parse_local_quanta(
+                    df, molecule, verbose=self.verbose, dataframe_type=output
+                )
+            if (
+                parse_local_global_quanta and "globu" in df and source != "geisa"
+            ):  # spectroscopic quantum numbers will be needed for nonequilibrium calculations :
+                df = parse_global_quanta(
+                    df, molecule, verbose=self.verbose, dataframe_type=output
+                )
 
-        # Remove non numerical attributes
-        if drop_non_numeric:
-            if "branch" in df:
-                replace_PQR_with_m101(df)
-            df = drop_object_format_columns(df, verbose=self.verbose)
+            # Remove non numerical attributes
+            if drop_non_numeric:
+                if "branch" in df:
+                    replace_PQR_with_m101(df)
+                df = drop_object_format_columns(df, verbose=self.verbose)
+
+        if lines_cache is not None and cached is None and db_use_cached != "regen":
+            lines_cache.add(
+                cache_key,
+                wavenum_min,
+                wavenum_max,
+                df,
+                {
+                    "dbpath": self.params.dbpath,
+                    "isotope": self.input.isotope,
+                    "references": dict(self.reftracker),
+                    "partition_function_exomol": partition_function_exomol,
+                    "parfuncpath": parfuncpath,
+                },
+                files=[f for f in self.params.dbpath.split(",") if exists(f)],
+            )
 
         self.df0 = df  # type : pd.DataFrame
+        self._clear_columns_cache()  # columns calculated from the previous database
+        self._cutoff_order = None
         self.misc.total_lines = len(df)  # will be stored in Spectrum metadata
 
+        if self._loading_range:  # only the lines are needed, see _load_lines_range
+            self._remove_unecessary_columns(df, output)
+            return
+        self._set_loaded_lines("fetch_databank", load_kwargs, wavenum_min, wavenum_max)
+
         # %% Init Partition functions (with energies)
         # ------------
 
@@ -1766,6 +2116,13 @@ class DatabankLoader(object):
                 if using ``'equilibrium'``, not all parameters will be available
                 for a Spectrum :py:func:`~radis.spectrum.spectrum.Spectrum.line_survey`.
 
+        Notes
+        -----
+        If the spectral range of the factory changed since the lines were
+        loaded (ex: ``sf.eq_spectrum(..., wmin=, wmax=)``), calling
+        :py:meth:`~radis.lbl.loader.DatabankLoader.load_databank` again with the
+        same arguments only loads the lines of the missing ranges. See
+        :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`
 
         See Also
         --------
@@ -1779,6 +2136,12 @@ class DatabankLoader(object):
         ----------
         .. [1] `HAPI: The HITRAN Application Programming Interface <http://hitran.org/hapi>`_
         """
+        # Lines already loaded with the same arguments, on another range ?
+        load_kwargs = {k: v for k, v in locals().items() if k != "self"}
+        if self._can_extend_databank("load_databank", load_kwargs):
+            self._update_databank_range()
+            return
+
         # %% Check inputs
         # ---------
 
@@ -1851,8 +2214,19 @@ class DatabankLoader(object):
             include_neighbouring_lines=include_neighbouring_lines,
             output=output,
         )
+        self._clear_columns_cache()  # columns calculated from the previous database
+        self._cutoff_order = None
         self.misc.total_lines = len(self.df0)  # will be stored in Spectrum metadata
 
+        if self._loading_range:  # only the lines are needed, see _load_lines_range
+            return
+        self._set_loaded_lines(
+            "load_databank",
+            load_kwargs,
+            *self._get_load_range(include_neighbouring_lines),
+            inclusive=True,
+        )
+
         if "molecule" in self.df0.attrs:
             self.input.species = self.df0.attrs["molecule"]
         else:
@@ -2285,11 +2659,16 @@ class DatabankLoader(object):
             else:
                 raise AttributeError("Load databank first (.load_databank())")
 
+        # Load the lines of the new spectral range, if it changed
+        self._update_databank_range()
+
         #        # Reset index
         #        #    (cost ~ 1 ms but is needed if the user manually edited the database
         #        #    in between the load_database() and the calculation command
         if self.dataframe_type == "pandas":
-            self.df0.reset_index(inplace=True, drop=True)  # drop: don't add old index
+            # (same as reset_index(drop=True) but without copying the columns,
+            # that may be memory-mapped)
+            self.df0.index = pd.RangeIndex(len(self.df0))
         # Finally commented: code may crash if users edit the database manually
         # (ex: modify broadening coefficients) and forgot to reset the index,
         # but that's for advanced users anyway. The cost (time+dont know what
@@ -2333,6 +2712,210 @@ class DatabankLoader(object):
 
         self.profiler.stop("check_line_databank", "Check line databank")
 
+    def _get_load_range(self, include_neighbouring_lines=True):
+        """Returns the wavenumber range on which lines are loaded (cm-1)"""
+        if include_neighbouring_lines:
+            return self.params.wavenum_min_calc, self.params.wavenum_max_calc
+        else:
+            return self.input.wavenum_min, self.input.wavenum_max
+
+    def _set_loaded_lines(
+        self, method, load_kwargs, wavenum_min, wavenum_max, inclusive=False
+    ):
+        """Store how the lines of :py:attr:`~radis.lbl.loader.DatabankLoader.df0`
+        were loaded, so that only the lines of the missing ranges are loaded if
+        the spectral range changes. See
+        :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`
+
+        Parameters
+        ----------
+        method: ``'fetch_databank'``, ``'load_databank'``
+        load_kwargs: dict
+            arguments of ``method``
+        wavenum_min, wavenum_max: float (cm-1)
+            range of the lines loaded
+        inclusive: bool
+            if ``True``, lines at ``wavenum_min`` and ``wavenum_max`` were loaded
+            (as in :py:meth:`~radis.lbl.loader.DatabankLoader.load_databank`),
+            else only the lines strictly within (as in
+            :py:meth:`~radis.lbl.loader.DatabankLoader.fetch_databank`)
+        """
+        self._loaded_lines = {
+            "method": method,
+            "kwargs": load_kwargs,
+            "key": repr(sorted(load_kwargs.items())),
+            "inclusive": inclusive,
+            "ranges": [(wavenum_min, wavenum_max)],  # all ranges loaded
+            "range": (wavenum_min, wavenum_max),  # range of df0
+            "lines": None,  # all lines loaded, if not df0
+        }
+
+    def _can_extend_databank(self, method, load_kwargs):
+        """Returns whether lines already loaded by ``method(**load_kwargs)`` can
+        be completed with the lines of the current spectral range, instead of
+        reloading everything"""
+        loaded = self._loaded_lines
+        return (
+            loaded is not None
+            and not self._loading_range
+            and self.df0 is not None
+            and self.dataframe_type == "pandas"
+            and loaded["method"] == method
+            and loaded["key"] == repr(sorted(load_kwargs.items()))
+            and loaded["range"]
+            != self._get_load_range(loaded["kwargs"]["include_neighbouring_lines"])
+        )
+
+    def _update_databank_range(self):
+        """Make sure :py:attr:`~radis.lbl.loader.DatabankLoader.df0` contains the
+        lines of the current spectral range, if it changed since the lines were
+        loaded (ex: ``sf.eq_spectrum(..., wmin=, wmax=)``).
+
+        All ranges loaded are kept in memory : only the lines of the ranges not
+        loaded yet are read from the line database (with the arguments of the
+        last :py:meth:`~radis.lbl.loader.DatabankLoader.fetch_databank` or
+        :py:meth:`~radis.lbl.loader.DatabankLoader.load_databank` call), and
+        merged by increasing wavenumber.
+
+        Notes
+        -----
+        If :py:attr:`~radis.lbl.loader.DatabankLoader.df0` is reduced to a
+        smaller range, it is a copy of the lines loaded : changes made to it
+        manually are lost the next time the range changes.
+
+        With ``dataframe_type != "pandas"``, all lines are reloaded.
+        """
+        loaded = self._loaded_lines
+        if loaded is None:
+            return
+        wavenum_min, wavenum_max = self._get_load_range(
+            loaded["kwargs"]["include_neighbouring_lines"]
+        )
+        if loaded["range"] == (wavenum_min, wavenum_max):
+            return
+        if self.dataframe_type != "pandas":
+            getattr(self, loaded["method"])(**loaded["kwargs"])
+            return
+
+        inclusive = loaded["inclusive"]
+        lines = self.df0 if loaded["lines"] is None else loaded["lines"]
+        ranges = loaded["ranges"]
+        bounds = {w for r in ranges for w in r}
+
+        # Load the lines of the ranges not loaded yet
+        parts = []
+        for wmin, wmax in _get_missing_ranges(ranges, wavenum_min, wavenum_max):
+            if not inclusive:
+                # include the lines at the bounds of the ranges already loaded
+                # (not loaded, as only lines strictly within a range are)
+                if wmin in bounds:
+                    wmin = np.nextafter(wmin, -np.inf)
+                if wmax in bounds:
+                    wmax = np.nextafter(wmax, np.inf)
+            df = self._load_lines_range(wmin, wmax)
+            if df is not None:
+                # ... without the lines loaded already
+                wav = df["wav"].to_numpy()
+                b = np.zeros(len(df), dtype=bool)
+                for rmin, rmax in ranges:
+                    if inclusive:
+                        b |= (wav >= rmin) & (wav <= rmax)
+                    else:
+                        b |= (wav > rmin) & (wav < rmax)
+                parts.append(df[~b])
+            ranges = _merge_ranges(ranges + [(wmin, wmax)])
+
+        if parts:
+            frames = [lines] + parts
+            attrs = {}
+            for df in frames:
+                attrs.update(df.attrs)
+            # ... metadata stored as attributes if they are unique (ex: "iso"),
+            # ... but they may not be on all ranges
+            for k in df_metadata:
+                if any(k in df.columns for df in frames):
+                    for df in frames:
+                        if k not in df.columns:
+                            df[k] = df.attrs[k]
+                    attrs.pop(k, None)
+            lines = pd.concat(frames, ignore_index=True)
+            lines.sort_values("wav", kind="mergesort", ignore_index=True, inplace=True)
+            lines.attrs = attrs
+            self._remove_unecessary_columns(lines)
+            if self.verbose >= 2:
+                printg(
+                    "Loaded {0:,d} lines on new ranges ({1:,d} lines in total)".format(
+                        sum(len(df) for df in parts), len(lines)
+                    )
+                )
+
+        # Lines of the current range (sorted by wavenumber)
+        wav = lines["wav"].to_numpy()
+        if inclusive:
+            i0 = np.searchsorted(wav, wavenum_min, side="left")
+            i1 = np.searchsorted(wav, wavenum_max, side="right")
+        else:
+            i0 = np.searchsorted(wav, wavenum_min, side="right")
+            i1 = np.searchsorted(wav, wavenum_max, side="left")
+        if i1 - i0 == len(lines):
+            self.df0 = lines
+            loaded["lines"] = None
+        else:
+            self.df0 = lines.iloc[i0:i1].reset_index(drop=True)
+            self.df0.attrs = dict(lines.attrs)
+            loaded["lines"] = lines
+        loaded["ranges"] = ranges
+        loaded["range"] = (wavenum_min, wavenum_max)
+
+        self._clear_columns_cache()  # columns calculated from the previous database
+        self._cutoff_order = None
+        self.misc.total_lines = len(self.df0)  # will be stored in Spectrum metadata
+
+        if len(self.df0) == 0:
+            raise EmptyDatabaseError(
+                "No lines in range {0:.2f}-{1:.2f} cm-1".format(
+                    wavenum_min, wavenum_max
+                )
+            )
+
+    def _load_lines_range(self, wavenum_min, wavenum_max):
+        """Returns the lines of ``wavenum_min - wavenum_max``, loaded with the
+        arguments of the last :py:meth:`~radis.lbl.loader.DatabankLoader.fetch_databank`
+        or :py:meth:`~radis.lbl.loader.DatabankLoader.load_databank` call, or
+        ``None`` if there are no lines. The state of the factory is unchanged.
+
+        See :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`"""
+        loaded = self._loaded_lines
+        load_kwargs = dict(loaded["kwargs"])
+        if load_kwargs.get("db_use_cached") == "regen":
+            load_kwargs["db_use_cached"] = True  # regenerated already
+
+        df0 = self.df0
+        references = dict(self.reftracker)
+        input_range = self.input.wavenum_min, self.input.wavenum_max
+        calc_range = self.params.wavenum_min_calc, self.params.wavenum_max_calc
+        warning = self.warnings["OutOfRangeLinesWarning"]
+        self.input.wavenum_min = self.params.wavenum_min_calc = wavenum_min
+        self.input.wavenum_max = self.params.wavenum_max_calc = wavenum_max
+        self.warnings["OutOfRangeLinesWarning"] = "ignore"  # (small ranges)
+        self._loading_range = True
+        try:
+            getattr(self, loaded["method"])(**load_kwargs)
+            df = self.df0
+        except EmptyDatabaseError:
+            df = None
+        finally:
+            self._loading_range = False
+            self.warnings["OutOfRangeLinesWarning"] = warning
+            self.input.wavenum_min, self.input.wavenum_max = input_range
+            self.params.wavenum_min_calc, self.params.wavenum_max_calc = calc_range
+            self.df0 = df0
+            self._loaded_lines = loaded
+            for ref, whys in references.items():
+                for why in whys:
+                    self.reftracker.add(ref, why)
+        return df
+
     def _load_databank(
         self,
         database,
@@ -2621,7 +3204,39 @@ class DatabankLoader(object):
         # end subroutine load_and_concat
         # --------------------------------------
 
-        df = load_and_concat(database, output=output)
+        # Lines already loaded by a previous factory of this process ?
+        lines_cache = get_lines_cache() if output == "pandas" else None
+        cached = None
+        if lines_cache is not None and db_use_cached != "regen":
+            cache_key = (
+                "load_databank",
+                tuple((f, getmtime(f)) for f in database),  # files modified ?
+                dbformat,
+                None if columns is None else tuple(sorted(columns)),
+                drop_columns if isinstance(drop_columns, str) else tuple(drop_columns),
+                self.input.isotope,
+            )
+            cached = lines_cache.get(
+                cache_key, wavenum_min, wavenum_max, inclusive=True
+            )
+
+        if cached is not None:
+            df, extras = cached
+            for ref, whys in extras["references"].items():
+                for why in whys:
+                    self.reftracker.add(ref, why)
+            if self.verbose >= 2:
+                printg(f"Loaded {len(df):,d} lines from the lines cache")
+        else:
+            df = load_and_concat(database, output=output)
+            if lines_cache is not None and db_use_cached != "regen":
+                lines_cache.add(
+                    cache_key,
+                    wavenum_min,
+                    wavenum_max,
+                    df,
+                    {"references": dict(self.reftracker)},
+                )
 
         # Final checks
 
@@ -2767,7 +3382,7 @@ class DatabankLoader(object):
                     + "calculates them independently then use MergeSlabs"
                 )
             if output == "pandas":
-                df.drop("id", axis=1, inplace=True)
+                del df["id"]  # (drop() would copy all columns)
             elif output == "vaex":
                 df.drop("id", inplace=True)
             else:
@@ -2786,7 +3401,7 @@ class DatabankLoader(object):
 
             if len(isotope_set) == 1:
                 if output == "pandas":
-                    df.drop("iso", axis=1, inplace=True)
+                    del df["iso"]
                 elif output == "vaex":
                     df.drop("iso", inplace=True)
                 else:
@@ -3133,6 +3748,7 @@ class DatabankLoader(object):
             molecule = get_molecule_identifier(molecule)
 
         self.molparam.terrestrial_abundances = False
+        self._clear_columns_cache()  # linestrengths depend on abundances
 
         if isinstance(isotope, int):
             self.molparam.df.loc[(molecule, isotope), "abundance"] = abundance
@@ -26,6 +26,8 @@ Functions to deal with numpy arrays:
 - :py:func:`~radis.misc.arrays.count_nans`
 - :py:func:`~radis.misc.arrays.logspace`
 - :py:func:`~radis.misc.arrays.numpy_add_at`
+- :py:func:`~radis.misc.arrays.sparse_add_at`
+- :py:func:`~radis.misc.arrays.sparse_add_at_LDM`
 
 
 
@@ -358,7 +360,7 @@ def anynan_vaex(a):
     return not (a.countnan() == 0)
 
 
-@numba.njit
+@numba.njit(cache=True)
 def first_nonnan_index(a):
     """Returns index of first non-nan value in ``a``
 
@@ -375,7 +377,7 @@ def first_nonnan_index(a):
     return None
 
 
-@numba.njit
+@numba.njit(cache=True)
 def last_nonnan_index(a):
     """Returns index of first non-nan value in ``a``
 
@@ -392,7 +394,7 @@ def last_nonnan_index(a):
     return None
 
 
-@numba.njit
+@numba.njit(cache=True)
 def is_sorted(a):
     """Returns whether ``a`` is sorted in ascending order.
 
@@ -409,7 +411,7 @@ def is_sorted(a):
     return True
 
 
-@numba.njit
+@numba.njit(cache=True)
 def is_sorted_backward(a):
     """Returns whether ``a`` is sorted in descending order.
 
@@ -774,6 +776,119 @@ def sparse_add_at(ki0, Iv0, Iv1, weight, max_range, truncation_pts):
     return np.array(L), I
 
 
+@numba.njit(
+    numba.types.Tuple((int64[:, :], float64[:, :]))(
+        int64[:],
+        int32[:],
+        int32[:],
+        int32[:],
+        float64[:, :],
+        float64[:, :],
+        float64[:, :],
+        int64,
+        int64,
+        int64[:],
+    ),
+    cache=True,
+)
+def sparse_add_at_LDM(
+    order, ki0, li0, mi0, Iv0, Iv1, awV, NwL, max_range, truncation_pts
+):
+    """Distribute line intensities ``Iv0`` and ``Iv1`` at position ``ki0`` and
+    ``ki0+1`` on the 4 ``(l, m)`` corners of a sparse LDM, and return the
+    non-zero ranges of each LDM cell with the intensities on these ranges.
+
+    Vectorized equivalent of calling :py:func:`~radis.misc.arrays.sparse_add_at`
+    for each group of lines that share the same corner, for the 4 corners.
+
+    Parameters
+    ----------
+    order: int64 array      [size 4N]
+        indices of the 4N line contributions, sorted by LDM cell then by
+        wavenumber position. Contribution ``j`` is the corner ``j // N`` of
+        line ``j % N`` ; corners are ordered ``(li0, mi0), (li0, mi1), (li1, mi0), (li1, mi1)``.
+        An LDM cell ``(l, m)`` has index ``l * NwL + m``
+    ki0, li0, mi0: int32 arrays     [size N]
+        index of the closest grid point on the left, for each axis of the LDM
+    Iv0, Iv1: float64 arrays        [shape (N, P)]
+        intensities on the ``ki0`` and ``ki0+1`` wavenumber points, for each
+        of the ``P`` channels (ex: absorption and emission)
+    awV: float64 array      [shape (4, N)]
+        fraction of each line on each of the 4 corners
+    NwL: int
+        number of Lorentzian widths in the LDM
+    max_range: int
+        number of wavenumber points
+    truncation_pts: int64 array     [size NwG * NwL]
+        number of points of the lineshape wings, for each LDM cell : ranges
+        extend ``truncation_pts[cell]`` around each line of the cell
+
+    Returns
+    -------
+    ranges: int64 array     [shape (R, 3)]
+        ``(cell, start, stop)`` of the non-zero, non-overlapping ranges, sorted
+        by cell then by start.
+    I: float64 array        [shape (sum of ranges, P)]
+        intensities on all ranges, concatenated in the same order as ``ranges``
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+    """
+    N = len(ki0)
+
+    # First pass : count ranges
+    R = 0
+    cell_prev = -1
+    end_prev = -1
+    for j in range(len(order)):
+        c, i = order[j] // N, order[j] % N
+        cell = (li0[i] + c // 2) * NwL + mi0[i] + c % 2
+        n = truncation_pts[cell]
+        start = max(ki0[i] - n, 0)
+        if cell != cell_prev or start > end_prev:
+            R += 1
+        cell_prev = cell
+        end_prev = min(ki0[i] + 2 + n, max_range)
+
+    # Second pass : get ranges
+    ranges = np.empty((R, 3), dtype=np.int64)
+    r = -1
+    for j in range(len(order)):
+        c, i = order[j] // N, order[j] % N
+        cell = (li0[i] + c // 2) * NwL + mi0[i] + c % 2
+        n = truncation_pts[cell]
+        start = max(ki0[i] - n, 0)
+        end = min(ki0[i] + 2 + n, max_range)
+        if r == -1 or cell != ranges[r, 0] or start > ranges[r, 2]:
+            r += 1
+            ranges[r, 0] = cell
+            ranges[r, 1] = start
+        ranges[r, 2] = end
+
+    # Position of each range in the concatenated intensity array
+    offsets = np.zeros(R + 1, dtype=np.int64)
+    for r in range(R):
+        offsets[r + 1] = offsets[r] + ranges[r, 2] - ranges[r, 1]
+
+    # Third pass : sum intensities (equivalent of "add-at")
+    P = Iv0.shape[1]
+    I = np.zeros((offsets[R], P))
+    r = 0
+    for j in range(len(order)):
+        c, i = order[j] // N, order[j] % N
+        cell = (li0[i] + c // 2) * NwL + mi0[i] + c % 2
+        while cell != ranges[r, 0] or ki0[i] >= ranges[r, 2]:
+            r += 1
+        pos = offsets[r] + ki0[i] - ranges[r, 1]
+        for p in range(P):
+            I[pos, p] += Iv0[i, p] * awV[c, i]
+            if ki0[i] + 1 < max_range:
+                I[pos + 1, p] += Iv1[i, p] * awV[c, i]
+
+    return ranges, I
+
+
 if __name__ == "__main__":
     import pytest
 
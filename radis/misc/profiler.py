@@ -12,12 +12,14 @@ Routine Listing
 - :meth:`~radis.misc.profiler.Profiler.start`
 - :meth:`~radis.misc.profiler.Profiler.add_time`
 - :meth:`~radis.misc.profiler.Profiler.stop`
+- :meth:`~radis.misc.profiler.Profiler.count`
 - :meth:`~radis.misc.profiler.Profiler._print`
 
 -------------------------------------------------------------------------------
 """
 
 from collections import OrderedDict
+from threading import Lock, get_ident
 from time import perf_counter
 
 from radis.misc.printer import printg
@@ -30,6 +32,11 @@ class Profiler(object):
 
     It also hold functions to print all the entities based on verbose value.
 
+    Steps can be profiled from several threads at the same time (for instance,
+    chunks broadened in parallel, see ``n_jobs`` in
+    :py:class:`~radis.lbl.factory.SpectrumFactory`) : times of a same step
+    are then summed over all threads.
+
     See Also
     --------
 
@@ -46,9 +53,11 @@ class Profiler(object):
         self.verbose = verbose
         self.final = OrderedDict()
         self.relative_time_percentage = {}
+        self.counters = {}
+        self._lock = Lock()
 
     # Creates profiler dictionary structure
-    def add_entry(self, dictionary, key, verbose, count):
+    def add_entry(self, dictionary, key, verbose, count, path=None):
         if count == verbose:
             if key in dictionary:
                 return
@@ -57,22 +66,49 @@ class Profiler(object):
 
             return
 
-        self.add_entry(dictionary[list(dictionary)[-1]], key, verbose, count + 1)
+        parent = self._get_parent(dictionary, count, path)
+        if isinstance(dictionary[parent], float):
+            # parent step already completed once (ex: spectra computed in a loop)
+            dictionary[parent] = {"value": dictionary[parent]}
+        self.add_entry(dictionary[parent], key, verbose, count + 1, path)
+
+    def _get_parent(self, dictionary, count, path):
+        """Key of ``dictionary`` under which steps of lower levels are stored :
+        the step of level ``count`` given in ``path`` if any, else the last one"""
+        if path is not None and path[count - 1] in dictionary:
+            return path[count - 1]
+        return list(dictionary)[-1]
+
+    def _get_path(self, verbose_level):
+        """Steps currently running (in any thread) of level lower than
+        ``verbose_level`` : the most recently started one for each level"""
+        path = []
+        for level in range(1, verbose_level):
+            running = [
+                (items["start_time"], key)
+                for (_, key), items in self.initial.items()
+                if items["verbose_level"] == level
+            ]
+            path.append(max(running)[1] if running else None)
+        return path
 
     def start(self, key, verbose_level, optional=""):
         if __debug__:
-            self.initial[key] = {
-                "start_time": perf_counter(),
-                "verbose_level": verbose_level,
-            }
+            with self._lock:
+                path = self._get_path(verbose_level)
+                self.initial[(get_ident(), key)] = {
+                    "start_time": perf_counter(),
+                    "verbose_level": verbose_level,
+                    "path": path,
+                }
 
-            self.add_entry(self.final, key, verbose_level, 1)
+                self.add_entry(self.final, key, verbose_level, 1, path)
 
         if len(optional) != 0 and self.verbose >= verbose_level:
             print(optional)
 
     # Adds time calculated for each key in profiler
-    def add_time(self, dictionary, key, verbose, count, time_calculated):
+    def add_time(self, dictionary, key, verbose, count, time_calculated, path=None):
         if count == verbose:
             executed_more_than_once = 0  # Checks if input key was executed before
 
@@ -103,19 +139,32 @@ class Profiler(object):
             return
 
         self.add_time(
-            dictionary[list(dictionary)[-1]], key, verbose, count + 1, time_calculated
+            dictionary[self._get_parent(dictionary, count, path)],
+            key,
+            verbose,
+            count + 1,
+            time_calculated,
+            path,
         )
 
     def stop(self, key, details):
         if __debug__:
-            items = self.initial.pop(key)
-            time_calculated = perf_counter() - items["start_time"]
+            with self._lock:
+                items = self.initial.pop((get_ident(), key))
+                time_calculated = perf_counter() - items["start_time"]
 
-            if items["verbose_level"] == 1:
-                # Profiler ends; Deserializing to Dictionary format
-                self.final = dict(self.final)
+                if items["verbose_level"] == 1:
+                    # Profiler ends; Deserializing to Dictionary format
+                    self.final = dict(self.final)
 
-            self.add_time(self.final, key, items["verbose_level"], 1, time_calculated)
+                self.add_time(
+                    self.final,
+                    key,
+                    items["verbose_level"],
+                    1,
+                    time_calculated,
+                    items["path"],
+                )
 
             if self.verbose >= items["verbose_level"]:
                 self._print(
@@ -124,6 +173,11 @@ class Profiler(object):
                     time_calculated=time_calculated,
                 )
 
+    # Counts events (ex: cache hits) during Spectrum calculation
+    def count(self, key, n=1):
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + n
+
     def _print(self, verbose_level, details, time_calculated):
 
         if verbose_level == 1:
@@ -6,6 +6,8 @@
 
 """
 
+import numpy as np
+
 
 def convert_and_strip_units(quantity, output_unit=None, digit=10):
     """Strips units and return the numerical value.
@@ -63,7 +65,10 @@ def convert_and_strip_units(quantity, output_unit=None, digit=10):
             )
 
         if digit:
-            quantity = round(quantity, digit)
+            if isinstance(quantity, np.ndarray):  # array of quantities
+                quantity = np.round(quantity, digit)
+            else:
+                quantity = round(quantity, digit)
 
     return quantity
 
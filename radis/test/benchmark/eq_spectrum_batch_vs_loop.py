@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch`
+against :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` called in a
+loop, for a temperature sweep.
+
+Notes
+-----
+
+``eq_spectrum_batch`` shares between all conditions what does not depend on
+them : lines are shifted and sorted once per pressure, and linestrengths and
+broadening HWHM are calculated for all conditions in a single pass over the
+lines. The broadening itself (LDM and FFT convolution) is still calculated
+for every condition : there is a gain only when the number of lines is large
+compared to the number of spectral points.
+
+The line-heavy case uses the lines of the HITRAN-CO-TEST database replicated
+at random positions, so that it runs without downloading any database.
+
+
+Typical results on a 1-CPU machine (20 temperatures, best of 3 runs ; run
+to run differences are about 10%)::
+
+    >>> HITRAN-CO-TEST (573 lines, 150,001 points)
+    >>> eq_spectrum loop: 2.07s
+    >>> eq_spectrum_batch: 2.27s (x0.9)
+    >>> Line-heavy (229,200 lines, 30,002 points)
+    >>> eq_spectrum loop: 1.84s
+    >>> eq_spectrum_batch: 1.36s (x1.4)
+
+
+-------------------------------------------------------------------------------
+
+"""
+
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from radis import SpectrumFactory
+from radis.test.utils import setup_test_line_databases
+
+
+def benchmark(sf, Tgas, name, repeat=3):
+    """Compare eq_spectrum in a loop and eq_spectrum_batch on the lines of
+    Factory ``sf`` (best time of ``repeat`` runs), and check that they give the
+    same spectra"""
+
+    # compile & warm up
+    sf.eq_spectrum(Tgas[0])
+    sf.eq_spectrum_batch(Tgas[:2])
+
+    t_loop = t_batch = np.inf
+    for _ in range(repeat):
+        t0 = perf_counter()
+        spectra_loop = [sf.eq_spectrum(T) for T in Tgas]
+        t_loop = min(t_loop, perf_counter() - t0)
+
+        t0 = perf_counter()
+        spectra_batch = sf.eq_spectrum_batch(Tgas)
+        t_batch = min(t_batch, perf_counter() - t0)
+
+    for s, s_batch in zip(spectra_loop, spectra_batch):
+        assert np.allclose(s.get("abscoeff")[1], s_batch.get("abscoeff")[1])
+
+    print(
+        "{0} ({1:,} lines, {2:,} points)".format(
+            name, len(sf.df0), len(spectra_loop[0].get_wavenumber())
+        )
+    )
+    print("eq_spectrum loop: {0:.2f}s".format(t_loop))
+    print("eq_spectrum_batch: {0:.2f}s (x{1:.1f})".format(t_batch, t_loop / t_batch))
+
+
+if __name__ == "__main__":
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    Tgas = np.linspace(500, 2400, 20)
+    warnings = {
+        "AccuracyWarning": "ignore",
+        "HighTemperatureWarning": "ignore",
+        "MissingSelfBroadeningWarning": "ignore",
+        "PerformanceWarning": "ignore",
+    }
+
+    # Few lines, many spectral points : the broadening dominates
+    sf = SpectrumFactory(
+        2000,
+        2300,
+        wstep=0.002,
+        isotope="1,2,3",
+        mole_fraction=0.1,
+        path_length=1,
+        pressure=1,
+        truncation=5,
+        verbose=0,
+        warnings=warnings,
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    benchmark(sf, Tgas, "HITRAN-CO-TEST")
+
+    # Many lines : lines of HITRAN-CO-TEST replicated at random positions
+    sf = SpectrumFactory(
+        2000,
+        2300,
+        wstep=0.01,
+        isotope="1,2,3",
+        mole_fraction=0.1,
+        path_length=1,
+        pressure=1,
+        truncation=5,
+        verbose=0,
+        warnings=warnings,
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    df0 = sf.df0
+    rng = np.random.default_rng(0)
+    df = pd.concat([df0] * 400, ignore_index=True)
+    df["wav"] = df["wav"].to_numpy() + rng.uniform(-0.5, 0.5, len(df))
+    df = df[(df.wav > 1995) & (df.wav < 2305)].sort_values("wav", ignore_index=True)
+    df.attrs = dict(df0.attrs)
+    sf.df0 = df
+    benchmark(sf, Tgas, "Line-heavy")
@@ -16,6 +16,10 @@ try:
     import vaex
 except ImportError:
     vaex = NotInstalled(*not_installed_vaex_args)
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = NotInstalled("pyarrow")
 
 
 @pytest.mark.fast
@@ -81,6 +85,223 @@ def test_hdf5_io_engines(*args, **kwargs):
     assert list(manager.get_columns("test_pytables.h5")) == ["a", "b"]
 
 
+@pytest.mark.fast
+@pytest.mark.skipif(isinstance(pq, NotInstalled), reason="pyarrow not available")
+def test_parquet_engine(*args, **kwargs):
+    """Test the 'parquet' engine of :py:class:`radis.api.hdf5.DataFileManager` :
+    lines written by batches are combined sorted by wavenumber, and only the
+    row groups overlapping the requested range are read"""
+    import os
+    from os.path import exists
+    from tempfile import gettempdir
+
+    import numpy as np
+    import pandas as pd
+
+    import radis
+    from radis.api.hdf5 import _parquet_row_groups
+
+    file = os.path.join(gettempdir(), "test_radis_lines.parquet")
+    if exists(file):
+        os.remove(file)
+
+    # Test data : 3 batches of lines, parsed in increasing wavenumber order
+    rng = np.random.default_rng(0)
+    wav = np.sort(rng.uniform(2000, 2300, 3000))
+    df0 = pd.DataFrame(
+        {
+            "wav": wav,
+            "int": rng.uniform(0, 1, len(wav)),
+            "iso": rng.integers(1, 4, len(wav)),
+        }
+    )
+    metadata0 = {"wavenumber_min": wav[0], "wavenumber_max": wav[-1]}
+
+    PARQUET_ROW_GROUP_SIZE = radis.config["PARQUET_ROW_GROUP_SIZE"]
+    radis.config["PARQUET_ROW_GROUP_SIZE"] = 100
+    try:
+        manager = DataFileManager(engine="parquet")
+        for batch in np.array_split(np.arange(len(wav)), 3):
+            # (lines of each batch shuffled : sorted at writing)
+            manager.write(file, df0.iloc[rng.permutation(batch)], append=True)
+        manager.combine_temp_batch_files(file)
+        manager.add_metadata(file, metadata0)
+    finally:
+        radis.config["PARQUET_ROW_GROUP_SIZE"] = PARQUET_ROW_GROUP_SIZE
+
+    assert DataFileManager.guess_engine(file) == "parquet"
+    assert list(manager.get_columns(file)) == ["wav", "int", "iso"]
+    assert manager.read_metadata(file) == metadata0
+    df = manager.read(file)
+    assert (df == df0).all().all()
+    assert pq.read_metadata(file).num_row_groups == 30
+
+    # Only the row groups overlapping the range are read
+    bounds = dict(lower_bound=[("wav", 2100)], upper_bound=[("wav", 2110)])
+    assert len(_parquet_row_groups(pq.read_metadata(file), **bounds)) <= 3
+    df = manager.load(file, columns=["int"], within=[("iso", "1,2")], **bounds)
+    b = (df0.wav > 2100) & (df0.wav < 2110) & df0.iso.isin([1, 2])
+    assert list(df.columns) == ["int"]
+    assert np.array_equal(df["int"], df0["int"][b])
+
+    # hdf2df : check consistency with metadata
+    df = hdf2df(file, load_wavenum_min=2100, load_wavenum_max=2110)
+    assert df.wav.min() > 2100 and df.wav.max() < 2110
+    assert df.attrs["wavenumber_max"] == wav[-1]
+
+    os.remove(file)
+
+
+@pytest.mark.fast
+def test_npy_engine(*args, **kwargs):
+    """Test the 'npy' engine of :py:class:`radis.api.hdf5.DataFileManager` :
+    lines written by batches are combined sorted by wavenumber, and columns are
+    memory-mapped and sliced without copying"""
+
+    import os
+    import shutil
+    from os.path import exists
+    from tempfile import gettempdir
+
+    import numpy as np
+    import pandas as pd
+
+    file = os.path.join(gettempdir(), "test_radis_lines.npydir")
+
+    # Test data
+    rng = np.random.default_rng(0)
+    wav = np.sort(rng.uniform(2000, 2300, 3000))
+    df0 = pd.DataFrame(
+        {
+            "wav": wav,
+            "int": rng.uniform(0, 1, len(wav)),
+            "iso": rng.integers(1, 4, len(wav)),
+            "branch": rng.choice(["P", "Q", "R"], len(wav)).astype(object),
+        }
+    )
+    metadata0 = {"wavenumber_min": wav[0], "wavenumber_max": wav[-1]}
+
+    manager = DataFileManager(engine="npy")
+    # batches in increasing (copied in place) or random (sorted in memory) order
+    for batches in [
+        np.array_split(np.arange(len(wav)), 3),
+        np.array_split(rng.permutation(len(wav)), 3),
+    ]:
+        if exists(file):
+            shutil.rmtree(file)
+        for batch in batches:
+            manager.write(file, df0.iloc[batch], append=True)
+        manager.combine_temp_batch_files(file)
+        manager.add_metadata(file, metadata0)
+
+        assert DataFileManager.guess_engine(file) == "npy"
+        assert list(manager.get_columns(file)) == ["wav", "int", "iso", "branch"]
+        assert manager.read_metadata(file) == metadata0
+        df = manager.read(file)
+        assert (df == df0).all().all()
+
+    # Range selected by binary search : columns are views of the files
+    bounds = dict(lower_bound=[("wav", 2100)], upper_bound=[("wav", 2110)])
+    df = manager.load(file, columns=["wav", "int"], **bounds)
+    b = (df0.wav > 2100) & (df0.wav < 2110)
+    assert list(df.columns) == ["wav", "int"]
+    assert np.array_equal(df["int"], df0["int"][b])
+    assert isinstance(df["wav"].to_numpy().base, np.memmap)
+    df["int"] *= 2  # copy-on-write : the file is unchanged
+    assert np.array_equal(manager.read(file, columns=["int"])["int"], df0["int"])
+
+    df = manager.load(file, columns=["int"], within=[("iso", "1,2")], **bounds)
+    assert np.array_equal(df["int"], df0["int"][b & df0.iso.isin([1, 2])])
+
+    # hdf2df : check consistency with metadata
+    df = hdf2df(file, load_wavenum_min=2100, load_wavenum_max=2110)
+    assert df.wav.min() > 2100 and df.wav.max() < 2110
+    assert df.attrs["wavenumber_max"] == wav[-1]
+    del df
+
+    shutil.rmtree(file)
+
+
+@pytest.mark.fast
+def test_multifile_load(*args, **kwargs):
+    """Test that :py:meth:`radis.api.dbmanager.DatabaseManager.load` reads the
+    files of a database split in several files in parallel threads (except
+    PyTables files, read sequentially), and gives the same lines as a
+    sequential read"""
+
+    import os
+    import shutil
+    import threading
+    from tempfile import gettempdir
+
+    import numpy as np
+    import pandas as pd
+
+    from radis import config
+    from radis.api.dbmanager import DatabaseManager, concat_columns
+
+    local_databases = os.path.join(gettempdir(), "test_radis_multifile")
+
+    # Record the threads where files are read
+    threads = set()
+    DataFileManager_load = DataFileManager.load
+
+    def load(self, *args, **kwargs):
+        threads.add(threading.get_ident())
+        return DataFileManager_load(self, *args, **kwargs)
+
+    for engine, ext in [("pytables", ".h5"), ("npy", ".npydir")]:
+        mdb = DatabaseManager(
+            "TEST-MULTIFILE", "CO2", local_databases, engine=engine, verbose=False
+        )
+
+        # Test data : a database split in 4 files
+        rng = np.random.default_rng(0)
+        local_files = []
+        df_all = []
+        for i in range(4):
+            wav = np.sort(rng.uniform(2000 + 100 * i, 2100 + 100 * i, 1000))
+            df = pd.DataFrame(
+                {"wav": wav, "int": rng.uniform(0, 1, len(wav)), "iso": i % 2 + 1}
+            )
+            local_file = os.path.join(local_databases, f"lines_{i}{ext}")
+            mdb.get_datafile_manager().write(local_file, df, append=False)
+            local_files.append(local_file)
+            df_all.append(df)
+        df0 = pd.concat(df_all, ignore_index=True)
+
+        DATABASE_LOAD_N_JOBS = config["DATABASE_LOAD_N_JOBS"]
+        DataFileManager.load = load
+        try:
+            bounds = dict(lower_bound=[("wav", 2150)], upper_bound=[("wav", 2350)])
+            b = (df0.wav > 2150) & (df0.wav < 2350)
+            for n_jobs in [1, 3]:
+                config["DATABASE_LOAD_N_JOBS"] = n_jobs
+                threads.clear()
+                df = mdb.load(local_files, columns=["wav", "int", "iso"], **bounds)
+                assert (df == df0[b].reset_index(drop=True)).all().all()
+                assert df.index.is_unique
+                assert df.dtypes["iso"] == df0.dtypes["iso"]
+                if n_jobs == 1 or engine == "pytables":  # (not thread-safe)
+                    assert threads == {threading.get_ident()}
+        finally:
+            DataFileManager.load = DataFileManager_load
+            config["DATABASE_LOAD_N_JOBS"] = DATABASE_LOAD_N_JOBS
+            for local_file in local_files:
+                if engine == "npy":
+                    shutil.rmtree(local_file)
+                else:
+                    os.remove(local_file)
+
+    # Different dtypes are promoted, extension dtypes use pd.concat
+    df = concat_columns([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [0.5]})])
+    assert df.a.dtype == np.float64 and list(df.a) == [1, 2, 0.5]
+    df = concat_columns(
+        [pd.DataFrame({"a": ["P"]}, dtype="category"), pd.DataFrame({"a": ["R"]})]
+    )
+    assert list(df.a) == ["P", "R"] and list(df.index) == [0, 1]
+
+
 @pytest.mark.needs_connection
 def test_local_hdf5_lines_loading(*args, **kwargs):
     """
@@ -129,4 +350,7 @@ def test_local_hdf5_lines_loading(*args, **kwargs):
 
 if __name__ == "__main__":
     test_hdf5_io_engines()
+    test_parquet_engine()
+    test_npy_engine()
+    test_multifile_load()
     test_local_hdf5_lines_loading()
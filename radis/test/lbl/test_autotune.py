@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Test the auto-tuner of the broadening configuration (``optimization="auto"``,
+``broadening_method="auto"``, ``chunksize="auto"``)
+
+See :py:mod:`radis.lbl.autotune`
+"""
+
+import os
+from os.path import join
+from tempfile import gettempdir
+
+import numpy as np
+import pytest
+
+import radis
+from radis.lbl import SpectrumFactory, autotune
+from radis.misc.printer import printm
+from radis.test.utils import setup_test_line_databases
+
+
+@pytest.mark.fast
+def test_autotune_calibration(verbose=True, *args, **kwargs):
+    """Test the calibration is stored in ``radis.config["AUTOTUNE_FILE"]`` and
+    read back, and that predicted times grow with the number of lines"""
+
+    calibration_file = join(gettempdir(), "radis_autotune_test.json")
+    if os.path.exists(calibration_file):
+        os.remove(calibration_file)
+
+    AUTOTUNE_FILE = radis.config["AUTOTUNE_FILE"]
+    calibration0 = autotune._calibration
+    try:
+        radis.config["AUTOTUNE_FILE"] = calibration_file
+
+        calibration = autotune.calibrate(save=True, verbose=verbose)
+        assert os.path.exists(calibration_file)
+
+        # read from file, not recomputed
+        autotune._calibration = None
+        assert autotune.get_calibration(verbose=False) == calibration
+
+        for config in [
+            (None, "voigt", False),
+            ("simple", "voigt", False),
+            ("simple", "voigt", True),
+            ("simple", "fft", False),
+        ]:
+            size = (1000, 10001, 501, 20, 20000, 200000)
+            size_more_lines = (100000, 10001, 501, 20, 20000, 2000000)
+            t = autotune.predict_broadening_time(*config, size, calibration)
+            assert 0 < t
+            assert t <= autotune.predict_broadening_time(
+                *config, size_more_lines, calibration
+            )
+    finally:
+        radis.config["AUTOTUNE_FILE"] = AUTOTUNE_FILE
+        autotune._calibration = calibration0
+        if os.path.exists(calibration_file):
+            os.remove(calibration_file)
+
+
+@pytest.mark.fast
+def test_autotune_spectrum(verbose=True, *args, **kwargs):
+    """Test that ``optimization="auto"`` and ``broadening_method="auto"`` choose
+    the fastest configuration of the calibration, log it in the Spectrum
+    conditions, and give the same spectrum as this configuration"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    # Fake calibrations : line-by-line broadening is either very cheap, or very
+    # expensive, compared to the LDM ; and the LDM with 'fft' is either very
+    # cheap, or very expensive, compared to 'voigt'
+    models = {
+        "lbl_faddeeva": [1e-7],
+        "ldm_voigt": [1e-7, 1e-8],
+        "ldm_voigt_sparse": [1e-7, 1e-8],
+    }
+    calibration0 = autotune._calibration
+    SPARSE_WAVERANGE = radis.config["SPARSE_WAVERANGE"]
+    try:
+        for lbl_voigt, ldm_fft, expected in [
+            (1e-15, [1e-3, 1e-3], (None, "voigt")),
+            (1e-3, [1e-3, 1e-3], ("simple", "voigt")),
+            (1e-3, [1e-15, 1e-15], ("simple", "fft")),
+        ]:
+            autotune._calibration = {
+                "machine": autotune._get_machine(),
+                "models": {"lbl_voigt": [lbl_voigt], "ldm_fft": ldm_fft, **models},
+            }
+            sf, s = _calc_spectrum("auto", "auto", chunksize="auto")
+            if verbose:
+                printm(s.conditions["autotune"])
+            assert s.conditions["optimization"] == expected[0]
+            assert s.conditions["broadening_method"] == expected[1]
+            assert s.conditions["chunksize"] is None
+            assert "Predicted times" in s.conditions["autotune"]
+            assert sf._optimization == "auto"  # still auto for next spectra
+
+            # Compare with the configuration chosen ('fft' uses the same
+            # truncated lineshapes as 'voigt')
+            radis.config["SPARSE_WAVERANGE"] = s.conditions["sparse_ldm"]
+            _, s_ref = _calc_spectrum(expected[0], "voigt")
+            radis.config["SPARSE_WAVERANGE"] = SPARSE_WAVERANGE
+            assert np.allclose(
+                s.get("abscoeff")[1], s_ref.get("abscoeff")[1], rtol=1e-10
+            )
+            assert s_ref.conditions["autotune"] is None
+    finally:
+        autotune._calibration = calibration0
+        radis.config["SPARSE_WAVERANGE"] = SPARSE_WAVERANGE
+
+
+@pytest.mark.fast
+def test_autotune_once_per_batch(verbose=True, *args, **kwargs):
+    """Test that the broadening configuration is chosen once for all the
+    conditions of :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch`,
+    and for all the blocks of lines of ``stream_blocksize``"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    calls = []
+    autotune_broadening = SpectrumFactory._autotune_broadening
+
+    def _autotune_broadening(self):
+        calls.append(len(self.df1))
+        return autotune_broadening(self)
+
+    SpectrumFactory._autotune_broadening = _autotune_broadening
+    try:
+        sf = _calc_spectrum("auto", "auto", Tgas=None)[0]
+        spectra = sf.eq_spectrum_batch(Tgas=[700, 1500, 2500])
+        assert len(calls) == 1
+        assert len(set(s.conditions["autotune"] for s in spectra)) == 1
+        assert sf._autotune_frozen is False  # tuned again for the next batch
+
+        del calls[:]
+        sf, s = _calc_spectrum("auto", "auto", stream_blocksize=100)
+        assert len(calls) == 1
+        assert calls[0] <= 100
+        assert sf._autotune_frozen is False
+        if verbose:
+            printm(s.conditions["autotune"])
+    finally:
+        SpectrumFactory._autotune_broadening = autotune_broadening
+
+
+def _calc_spectrum(optimization, broadening_method, Tgas=1500, **kwargs):
+    sf = SpectrumFactory(
+        wavenum_min=2140,
+        wavenum_max=2160,
+        mole_fraction=0.1,
+        path_length=1,
+        wstep=0.002,
+        pressure=1,
+        truncation=5,
+        isotope="1",
+        optimization=optimization,
+        broadening_method=broadening_method,
+        verbose=False,
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+            "GaussianBroadeningWarning": "ignore",
+        },
+        **kwargs,
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    if Tgas is None:
+        return sf, None
+    return sf, sf.eq_spectrum(Tgas=Tgas)
+
+
+def _run_testcases(verbose=True, *args, **kwargs):
+
+    test_autotune_calibration(verbose=verbose, *args, **kwargs)
+    test_autotune_spectrum(verbose=verbose, *args, **kwargs)
+    test_autotune_once_per_batch(verbose=verbose, *args, **kwargs)
+
+    return True
+
+
+if __name__ == "__main__":
+    printm("test_autotune: ", _run_testcases(verbose=True))
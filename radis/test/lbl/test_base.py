@@ -17,6 +17,7 @@ from radis.lbl.base import get_wavenumber_range
 from radis.misc.printer import printm
 from radis.misc.progress_bar import ProgressBar
 from radis.misc.utils import Default
+from radis.phys.constants import hc_k
 from radis.test.utils import setup_test_line_databases
 
 
@@ -824,6 +825,222 @@ def test_input_wunit(plot=True, *args, **kwargs):
     )
 
 
+@pytest.mark.fast
+def test_reinitialize_shallow_copy(verbose=True, *args, **kwargs):
+    """Check that the scaled line database ``df1`` shares the input columns of
+    ``df0`` (no copy), and that calculating spectra does not modify ``df0``"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2000,
+        wavenum_max=2300,
+        wstep=0.01,
+        cutoff=0,
+        isotope="1,2",
+        truncation=5,
+        verbose=verbose,
+    )
+    sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+    sf.load_databank("HITRAN-CO-TEST", load_columns="noneq")
+    df0 = sf.df0.copy()
+
+    s = sf.eq_spectrum(1000, pressure=1)
+    if sf.df1.shiftwav.is_monotonic_increasing:  # not sorted, see calc_lineshift
+        assert np.shares_memory(sf.df1.wav.values, sf.df0.wav.values)
+    assert "S" in sf.df1 and "S" not in sf.df0
+
+    sf.eq_spectrum(2000, pressure=10)
+    sf.non_eq_spectrum(2000, 300)
+    # noneq energies are added to df0 on purpose; input columns are untouched
+    assert sf.df0[df0.columns].equals(df0)
+    s2 = sf.eq_spectrum(1000, pressure=1)
+    assert (s2.get("abscoeff")[1] == s.get("abscoeff")[1]).all()
+
+
+@pytest.mark.fast
+def test_columns_cache(verbose=True, *args, **kwargs):
+    """Check that per-line columns of the previous spectrum are reused when
+    their inputs are unchanged, and that spectra are unchanged
+
+    See :py:meth:`~radis.lbl.base.BaseFactory._calc_cached_columns`"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    spectra = {}
+    for cache in [False, True]:
+        radis.config["LINE_COLUMNS_CACHE"] = cache
+        try:
+            sf = SpectrumFactory(
+                wavenum_min=2000,
+                wavenum_max=2300,
+                wstep=0.01,
+                cutoff=1e-25,
+                isotope="1,2",
+                truncation=5,
+                mole_fraction=0.1,
+                path_length=1,
+                verbose=verbose,
+            )
+        finally:
+            radis.config["LINE_COLUMNS_CACHE"] = True
+        sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+        sf.warnings["HighTemperatureWarning"] = "ignore"
+        sf.load_databank("HITRAN-CO-TEST", load_columns="noneq")
+
+        spectra[cache] = [
+            sf.eq_spectrum(1000, pressure=1),
+            sf.eq_spectrum(1000, pressure=2),  # linestrength reused
+            sf.eq_spectrum(1000, pressure=2, mole_fraction=0.2),  # + lineshift
+        ]
+        if cache:
+            assert sf.profiler.counters["columns_cache_hits"] == 2  # S, shiftwav
+            assert sf.profiler.counters["columns_cache_misses"] == 1  # HWHM
+            assert (
+                "cached_scaled_eq_linestrength"
+                in sf.profiler.final["spectrum_calculation"]
+            )
+        spectra[cache].append(sf.eq_spectrum(1500, pressure=2, mole_fraction=0.2))
+        if cache:
+            assert sf.profiler.counters["columns_cache_hits"] == 1  # shiftwav
+            assert sf.profiler.counters["columns_cache_misses"] == 2  # S, HWHM
+        spectra[cache] += [
+            sf.non_eq_spectrum(2000, 1000, pressure=1),
+            sf.non_eq_spectrum(2000, 1000, pressure=2),  # populations reused
+        ]
+        if cache:
+            assert sf.profiler.counters["columns_cache_hits"] == 1
+            # a new database clears the cache
+            sf.load_databank("HITRAN-CO-TEST", load_columns="noneq")
+            spectra[cache].append(sf.non_eq_spectrum(2000, 1000, pressure=2))
+            assert "columns_cache_hits" not in sf.profiler.counters
+        else:
+            spectra[cache].append(spectra[cache][-1])
+
+    for s_ref, s in zip(spectra[False], spectra[True]):
+        assert s.compare_with(s_ref, spectra_only=True, plot=False, rtol=1e-14)
+
+
+@pytest.mark.fast
+def test_cutoff_error(verbose=True, *args, **kwargs):
+    """Check that lines discarded with ``cutoff_error`` never exceed the error
+    budget, and that the linestrength ordering is reused for close temperatures
+
+    See :py:meth:`~radis.lbl.base.BaseFactory._get_linestrength_order`"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    factories = {}
+    for cutoff_error in [0, 1e-3]:
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            wstep=0.01,
+            cutoff_error=cutoff_error,
+            isotope="1,2",
+            truncation=5,
+            verbose=verbose,
+        )
+        sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+        sf.warnings["HighTemperatureWarning"] = "ignore"
+        sf.load_databank("HITRAN-CO-TEST")
+        factories[cutoff_error] = sf
+    sf_ref, sf = factories[0], factories[1e-3]
+
+    for Tgas in [1000, 1010, 3000]:
+        order = sf._cutoff_order
+        sf.eq_spectrum(Tgas)
+        sorted_lines = sf._cutoff_order is not order
+        assert sorted_lines == (Tgas != 1010)  # ordering reused at 1010 K
+
+        # Compare with all lines, sorted at this temperature
+        sf_ref.eq_spectrum(Tgas)
+        S_all = np.sort(sf_ref.df1.S.values)
+        Nlines_optimal = np.searchsorted(
+            np.cumsum(S_all), 1e-3 * S_all.sum(), side="right"
+        )
+        assert 1 - sf.df1.S.sum() / S_all.sum() <= 1e-3
+        assert sf._Nlines_cutoff + len(sf.df1) == len(S_all)
+        if sorted_lines:
+            assert sf._Nlines_cutoff == Nlines_optimal
+        else:
+            assert sf._Nlines_cutoff > 0.9 * Nlines_optimal
+
+    with pytest.raises(ValueError):
+        SpectrumFactory(2000, 2300, cutoff_error=1, verbose=False)
+
+
+@pytest.mark.fast
+def test_linestrength_kernels(verbose=True, *args, **kwargs):
+    """Check the precompiled linestrength and emission integral kernels against
+    the vectorized expressions, for several isotopes, serial and multi-threaded
+
+    See :py:func:`~radis.lbl.base._linestrength_eq_jit` and
+    :py:func:`~radis.lbl.base._emission_integral_jit`"""
+    from radis.lbl.base import (
+        _emission_integral_jit,
+        _emission_integral_parallel_jit,
+        _linestrength_eq_jit,
+        _linestrength_eq_parallel_jit,
+        get_isotope_lookup,
+    )
+    from radis.phys.convert import cm2J
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2000,
+        wavenum_max=2300,
+        wstep=0.01,
+        isotope="1,2,3",
+        truncation=5,
+        mole_fraction=0.1,
+        path_length=1,
+        verbose=verbose,
+    )
+    sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+    sf.warnings["HighTemperatureWarning"] = "ignore"
+    sf.load_databank("HITRAN-CO-TEST", load_columns="noneq")
+    Tgas, Tref = 1500, sf.input.Tref
+
+    sf.eq_spectrum(Tgas)
+    df = sf.df1
+    assert len(df.iso.unique()) == 3
+    S_ref = (
+        df.int
+        * sf.Qref_Qgas_ratio(df, Tgas, Tref)
+        * np.exp(-hc_k * df.El * (1 / Tgas - 1 / Tref))
+        * (1 - np.exp(-hc_k * df.wav / Tgas))
+        / (1 - np.exp(-hc_k * df.wav / Tref))
+    )
+    assert np.allclose(df.S, S_ref, rtol=1e-14, atol=0)
+
+    sf.non_eq_spectrum(2000, Tgas)
+    df = sf.df1
+    Ei_ref = df.nu * sf.get_lines_abundance(df) * df.A / 4 / np.pi * cm2J(df.wav)
+    assert np.allclose(df.Ei, Ei_ref * 1e3, rtol=1e-14, atol=0)  # (mW/sr)
+
+    # Multi-threaded versions, on contiguous blocks of lines
+    iso, Qref_Qgas = get_isotope_lookup(
+        df, sf.Qref_Qgas_ratio(df, Tgas, Tref, per_isotope=True)
+    )
+    args = (df.int.values, iso, Qref_Qgas, df.El.values, df.wav.values, Tgas, Tref)
+    S, S_parallel = np.empty(len(df)), np.empty(len(df))
+    _linestrength_eq_jit(S, *args, 0, len(df))
+    _linestrength_eq_parallel_jit(S_parallel, *args, 3)
+    assert np.array_equal(S, S_parallel)
+
+    iso, abundance = get_isotope_lookup(
+        df, sf.get_lines_abundance(df, per_isotope=True)
+    )
+    args = (df.nu.values, iso, abundance, df.A.values, df.wav.values)
+    Ei, Ei_parallel = np.empty(len(df)), np.empty(len(df))
+    _emission_integral_jit(Ei, *args, 0, len(df))
+    _emission_integral_parallel_jit(Ei_parallel, *args, 3)
+    assert np.array_equal(Ei, Ei_parallel)
+    assert np.array_equal(Ei, df.Ei)
+
+
 def _run_testcases(verbose=True, plot=True):
 
     # test_input_wunit()
@@ -834,6 +1051,10 @@ def _run_testcases(verbose=True, plot=True):
     # test_optically_thick_limit_1iso(plot=plot, verbose=verbose)
     test_optically_thick_limit_2iso(plot=plot, verbose=verbose)
     # test_get_wavenumber_range()
+    test_reinitialize_shallow_copy(verbose=verbose)
+    test_columns_cache(verbose=verbose)
+    test_cutoff_error(verbose=verbose)
+    test_linestrength_kernels(verbose=verbose)
 
 
 if __name__ == "__main__":
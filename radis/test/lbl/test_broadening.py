@@ -13,6 +13,7 @@ We're looking at CO(0->1) line 'R1' at 2150.86 cm-1
 from os.path import dirname, join
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 from numpy import isclose
 
@@ -427,6 +428,10 @@ def test_broadening_LDM_FT(verbose=True, plot=False, *args, **kwargs):
         s_ldm_fft.conditions["calculation_time"]
     )
 
+    # LDM , with Fourier, multi-threaded FFT
+    sf.misc.n_jobs = 2
+    s_ldm_fft_threads = sf.eq_spectrum(Tgas=T)
+
     # Compare
     res = get_residual(s_ldm, s_ldm_fft, "abscoeff")
 
@@ -439,6 +444,203 @@ def test_broadening_LDM_FT(verbose=True, plot=False, *args, **kwargs):
         plt.legend()
 
     assert res < 5e-6
+    assert get_residual(s_ldm_fft, s_ldm_fft_threads, "abscoeff") < 1e-12
+
+
+@pytest.mark.fast
+def test_broadening_LDM_add_at_engines(verbose=True, plot=False, *args, **kwargs):
+    """
+    Test the fused numba kernel that distributes lines on the LDM grid
+    against the vectorized numpy version (8 ``np.add.at`` calls).
+
+    Ensures that results are the same for simple and min-RMS weights, in
+    real and Fourier space.
+    """
+
+    if plot:  # Make sure matplotlib is interactive so that test are not stuck in pytest
+        plt.ion()
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2140,
+        wavenum_max=2160,
+        mole_fraction=1,
+        path_length=1,
+        wstep=0.002,
+        pressure=1,
+        truncation=5,
+        neighbour_lines=5,
+        isotope="1",
+        verbose=False,
+        optimization="simple",
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+            "GaussianBroadeningWarning": "ignore",
+        },
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    # dense LDM (the sparse LDM always uses vectorized weights)
+    sf._sparse_ldm = False
+    sf.params.sparse_ldm = False
+
+    for optimization, broadening_method in [
+        ("simple", "voigt"),
+        ("min-RMS", "voigt"),
+        ("min-RMS", "fft"),
+    ]:
+        sf.params.optimization = optimization
+        sf.params.broadening_method = broadening_method
+
+        sf.add_at_engine = "numpy"
+        s_numpy = sf.eq_spectrum(Tgas=3000)
+        assert sf.misc.add_at_used == "numpy"
+        assert s_numpy.conditions["add_at_used"] == "numpy"
+
+        sf.add_at_engine = "numba"
+        s_numba = sf.eq_spectrum(Tgas=3000)
+        assert sf.misc.add_at_used == "numba"
+        assert s_numba.conditions["add_at_used"] == "numba"
+
+        res = get_residual(s_numpy, s_numba, "abscoeff")
+        if verbose:
+            print(optimization, broadening_method, "residual:", res)
+        if plot:
+            plot_diff(s_numpy, s_numba, "abscoeff")
+
+        assert res < 1e-12
+
+
+@pytest.mark.fast
+def test_broadening_LDM_lineshape_cache(verbose=True, *args, **kwargs):
+    """
+    Test that LDM lineshape templates are reused between spectra, and that
+    spectra are the same with and without the cache.
+    """
+    from radis.lbl.broadening import LineshapeCache, get_lineshape_cache
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2140,
+        wavenum_max=2160,
+        mole_fraction=1,
+        path_length=1,
+        wstep=0.002,
+        pressure=1,
+        truncation=5,
+        isotope="1",
+        verbose=False,
+        optimization="simple",
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+            "GaussianBroadeningWarning": "ignore",
+        },
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    assert isinstance(sf._lineshape_cache, LineshapeCache)  # default : "factory"
+
+    for broadening_method in ["voigt", "convolve", "fft"]:
+        sf.params.broadening_method = broadening_method
+        if broadening_method == "fft":
+            sf.params.truncation = None
+        sf._lineshape_cache = LineshapeCache(100)
+
+        sf.eq_spectrum(Tgas=1000)
+        assert sf.profiler.counters.get("lineshape_cache_hits", 0) == 0
+        # Temperature sweep : same widths are reused
+        s = sf.eq_spectrum(Tgas=1010)
+        hits = sf.profiler.counters.get("lineshape_cache_hits", 0)
+        if verbose:
+            print(broadening_method, sf.profiler.counters)
+        assert hits > 0
+
+        sf._lineshape_cache = None
+        s_nocache = sf.eq_spectrum(Tgas=1010)
+        assert "lineshape_cache_hits" not in sf.profiler.counters
+        assert "lineshape_cache_misses" not in sf.profiler.counters
+        assert get_residual(s, s_nocache, "abscoeff") < 1e-14
+
+    # Memory budget is respected :
+    cache = LineshapeCache(1e-3)  # 1 kB
+    for i in range(10):
+        cache.add(i, np.ones(40))  # 320 bytes
+    assert len(cache) == 3 and cache.size <= 1e3
+    assert cache.get(0) is None and cache.get(9) is not None
+
+    # Shared between factories :
+    assert get_lineshape_cache("process", 10) is get_lineshape_cache("process", 10)
+    assert get_lineshape_cache("factory", 10) is not get_lineshape_cache("factory", 10)
+    assert get_lineshape_cache(False, 10) is None
+
+
+@pytest.mark.fast
+def test_broadening_LDM_float32(verbose=True, plot=False, *args, **kwargs):
+    """
+    Accuracy check of the single precision mode (``precision="float32"``)
+    against double precision, for the different LDM methods.
+
+    Typical relative residuals are ~1e-10 (linestrengths and widths are only
+    stored in float32 ; line positions and the sum of all lines are kept in float64)
+    """
+
+    if plot:  # Make sure matplotlib is interactive so that test are not stuck in pytest
+        plt.ion()
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    for broadening_method, sparse_ldm in [
+        ("voigt", True),
+        ("voigt", False),
+        ("fft", False),
+    ]:
+        spectra = {}
+        for precision in ["float64", "float32"]:
+            sf = SpectrumFactory(
+                wavenum_min=2000,
+                wavenum_max=2300,
+                mole_fraction=1,
+                path_length=1,
+                wstep=0.002,
+                pressure=1,
+                truncation=None if broadening_method == "fft" else 5,
+                isotope="1",
+                verbose=False,
+                optimization="min-RMS",
+                broadening_method=broadening_method,
+                precision=precision,
+                warnings={
+                    "MissingSelfBroadeningWarning": "ignore",
+                    "NegativeEnergiesWarning": "ignore",
+                    "HighTemperatureWarning": "ignore",
+                    "GaussianBroadeningWarning": "ignore",
+                },
+            )
+            sf._sparse_ldm = sparse_ldm
+            sf.params.sparse_ldm = sparse_ldm
+            sf.load_databank("HITRAN-CO-TEST")
+            spectra[precision] = sf.eq_spectrum(Tgas=1500)
+            assert sf.df1.S.dtype == precision
+            assert sf.df1.shiftwav.dtype == "float64"
+
+        s64, s32 = spectra["float64"], spectra["float32"]
+        assert s32.conditions["precision"] == "float32"
+        assert s32.get("abscoeff")[1].dtype == "float64"
+
+        res = get_residual(s64, s32, "abscoeff")
+        if verbose:
+            print(broadening_method, "sparse" if sparse_ldm else "", "residual:", res)
+        if plot:
+            plot_diff(s64, s32, "abscoeff")
+
+        assert res < 1e-8
+
+    with pytest.raises(ValueError):
+        SpectrumFactory(wavenum_min=2000, wavenum_max=2300, precision="float16")
 
 
 # @pytest.mark.fast #not fast, Nicolas Minesi 08/04/2024
@@ -732,6 +934,40 @@ def test_broadening_warnings(*args, **kwargs):
         )
 
 
+@pytest.mark.fast
+def test_zero_padding_warning(*args, **kwargs):
+    """Test a ``zero_padding`` larger than the spectral range is not silently
+    reduced (see :py:meth:`~radis.lbl.broadening.BroadenFactory._check_zero_padding`)
+    """
+    from radis.misc.warning import PerformanceWarning
+
+    sf = SpectrumFactory(
+        wavenum_min=2000,
+        wavenum_max=2010,
+        wstep=0.01,
+        truncation=None,
+        optimization="simple",
+        broadening_method="fft",
+        isotope="1",
+        verbose=False,
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+        },
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    s_ref = sf.eq_spectrum(Tgas=1000)
+    N = len(sf.wavenumber_calc)
+    assert sf.misc.zero_padding == N
+
+    sf.misc.zero_padding = 10 * N
+    with pytest.warns(PerformanceWarning, match="zero_padding"):
+        s = sf.eq_spectrum(Tgas=1000)
+    assert sf.misc.zero_padding == N
+    assert np.allclose(s.get("abscoeff")[1], s_ref.get("abscoeff")[1])
+
+
 # @pytest.mark.needs_config_file
 # @pytest.mark.needs_db_HITEMP_CO2_DUNHAM
 @pytest.mark.needs_connection
@@ -1005,6 +1241,603 @@ def test_broadening_chunksize_eq(verbose=True, plot=False, *args, **kwargs):
             )
 
 
+@pytest.mark.fast
+def test_broadening_chunksize_n_jobs(verbose=True, plot=False, *args, **kwargs):
+    """
+    Test that chunks of lines broadened in parallel threads (``n_jobs``)
+    give the same spectra as chunks broadened sequentially, and as no chunks.
+    """
+    if plot:  # Make sure matplotlib is interactive so that test are not stuck in pytest
+        plt.ion()
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2140,
+        wavenum_max=2160,
+        pressure=1,
+        isotope="1",
+        truncation=5,
+        neighbour_lines=5,
+        path_length=0.1,
+        mole_fraction=1e-3,
+        wstep=0.002,
+        verbose=False,
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+            "GaussianBroadeningWarning": "ignore",
+        },
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+
+    for optimization in [None, "simple"]:
+        sf.params["optimization"] = optimization
+        sf.misc["chunksize"] = None
+        s_no_chunk = sf.eq_spectrum(Tgas=2000)
+
+        sf.misc["chunksize"] = 1e5  # ~10 chunks
+        sf.misc["n_jobs"] = 1
+        s_chunk = sf.eq_spectrum(Tgas=2000)
+
+        sf.misc["n_jobs"] = 4
+        s_chunk_threads = sf.eq_spectrum(Tgas=2000)
+        assert s_chunk_threads.c["n_jobs"] == 4
+
+        res = get_residual(s_no_chunk, s_chunk_threads, "abscoeff")
+        res_threads = get_residual(s_chunk, s_chunk_threads, "abscoeff")
+        if verbose:
+            print(f"optimization = {optimization} : residuals {res}, {res_threads}")
+        if plot:
+            plot_diff(s_chunk, s_chunk_threads, "abscoeff")
+
+        assert res < 1e-6
+        assert res_threads < 1e-12
+
+    # Non-equilibrium (chunks are only used without LDM)
+    sf.params["optimization"] = None
+    sf.misc["n_jobs"] = 1
+    s_chunk = sf.non_eq_spectrum(Tvib=2000, Trot=1000)
+    sf.misc["n_jobs"] = 4
+    s_chunk_threads = sf.non_eq_spectrum(Tvib=2000, Trot=1000)
+    assert get_residual(s_chunk, s_chunk_threads, "abscoeff") < 1e-12
+    assert get_residual(s_chunk, s_chunk_threads, "emisscoeff") < 1e-12
+
+
+@pytest.mark.fast
+def test_broadening_stream_blocksize(verbose=True, plot=False, *args, **kwargs):
+    """
+    Test that spectra computed by blocks of lines (``stream_blocksize``) are
+    the same as spectra computed on the full line database at once.
+    """
+    if plot:  # Make sure matplotlib is interactive so that test are not stuck in pytest
+        plt.ion()
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2000,
+        wavenum_max=2300,
+        pressure=1,
+        path_length=0.1,
+        mole_fraction=1e-3,
+        wstep=0.01,
+        cutoff=1e-21,
+        verbose=False,
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+            "GaussianBroadeningWarning": "ignore",
+            "LinestrengthCutoffWarning": "ignore",
+        },
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+
+    for optimization in [None, "simple"]:
+        sf.params["optimization"] = optimization
+        sf.misc["stream_blocksize"] = None
+        s_full = sf.eq_spectrum(Tgas=1500)
+
+        sf.misc["stream_blocksize"] = 50  # ~10 blocks
+        s_blocks = sf.eq_spectrum(Tgas=1500)
+
+        res = get_residual(s_full, s_blocks, "abscoeff")
+        if verbose:
+            print(f"optimization = {optimization} : residual {res}")
+        if plot:
+            plot_diff(s_full, s_blocks, "abscoeff")
+
+        # some blocks are fully discarded by the cutoff: check line counts
+        for k in ["lines_calculated", "lines_cutoff"]:
+            assert s_full.c[k] == s_blocks.c[k]
+        assert s_blocks.c["lines_cutoff"] > 0
+        assert res < 1e-6
+
+    # Lines cannot be exported
+    sf.misc["export_lines"] = True
+    with pytest.raises(ValueError):
+        sf.eq_spectrum(Tgas=1500)
+
+
+@pytest.mark.fast
+def test_broadening_stream_blocksize_memory_mapped(verbose=True, *args, **kwargs):
+    """
+    Test that a line database memory-mapped with the 'npy' engine is not
+    copied when spectra are computed by blocks of lines (``stream_blocksize``) :
+    only the blocks are.
+    """
+    import os
+    import shutil
+    from tempfile import gettempdir
+
+    from radis.api.hdf5 import DataFileManager
+    from radis.api.tools import drop_object_format_columns
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2000,
+        wavenum_max=2300,
+        pressure=1,
+        path_length=0.1,
+        mole_fraction=1e-3,
+        wstep=0.01,
+        verbose=False,
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+            "GaussianBroadeningWarning": "ignore",
+        },
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    s_full = sf.eq_spectrum(Tgas=1500)
+
+    # Memory-map the same lines, and post-process them as in fetch_databank
+    file = os.path.join(gettempdir(), "test_radis_stream_blocksize.npydir")
+    manager = DataFileManager(engine="npy")
+    manager.write(file, sf.df0)
+    df = manager.load(file, lower_bound=[("wav", 1000)], upper_bound=[("wav", 3000)])
+    df.attrs = dict(sf.df0.attrs)
+    drop_object_format_columns(df, verbose=False)
+    sf._remove_unecessary_columns(df)
+
+    def is_memory_mapped(df):
+        return all(isinstance(df[c].to_numpy().base, np.memmap) for c in df.columns)
+
+    assert is_memory_mapped(df)
+
+    sf.df0 = df
+    sf.misc["stream_blocksize"] = 50  # ~10 blocks
+    s_blocks = sf.eq_spectrum(Tgas=1500)
+    assert is_memory_mapped(sf.df0)
+    blocks = list(sf._iter_line_blocks(50))
+    assert not any(is_memory_mapped(df1) for df1 in blocks)
+    assert sum(len(df1) for df1 in blocks) == len(sf.df0)
+
+    res = get_residual(s_full, s_blocks, "abscoeff")
+    if verbose:
+        print(f"residual {res}")
+    assert res < 1e-6
+
+    del df, blocks
+    sf.df0 = None
+    shutil.rmtree(file)
+
+
+@pytest.mark.fast
+def test_voigt_direct_kernel(*args, **kwargs):
+    """
+    Test that the direct line-by-line Voigt kernels used with ``optimization=None``
+    give the same result as the lineshape matrix of
+    :py:func:`~radis.lbl.broadening.voigt_lineshape` projected on the
+    spectral grid.
+    """
+    from radis.lbl.broadening import (
+        _voigt_direct_jit,
+        _voigt_direct_parallel_jit,
+        faddeeva_voigt_lineshape,
+        olivero_1977,
+        voigt_lineshape,
+    )
+
+    rng = np.random.default_rng(0)
+    wstep = 0.01
+    wavenumber_calc = np.arange(2000, 2010 + wstep / 2, wstep)
+    wbroad_centered = np.linspace(-1, 1, 201)
+    ioffset = 101
+    N = 50
+    I = rng.random((2, N))
+    shiftwav = rng.uniform(2001, 2009, N)
+    hwhm_lorentz = rng.uniform(0.01, 0.1, N)
+    hwhm_gauss = rng.uniform(0.01, 0.1, N)
+    hwhm_voigt = olivero_1977(2 * hwhm_gauss, 2 * hwhm_lorentz) / 2
+
+    # Reference : lineshape matrix, projected on the 2 closest grid points
+    w_centered = np.outer(wbroad_centered, np.ones(N))
+    il = np.searchsorted(wavenumber_calc, shiftwav) - 1
+    frac_left = (wavenumber_calc[il + 1] - shiftwav) / wstep
+
+    for faddeeva in [False, True]:
+        if faddeeva:
+            line_profile = faddeeva_voigt_lineshape(
+                w_centered, hwhm_lorentz.reshape((1, -1)), hwhm_gauss.reshape((1, -1))
+            )
+        else:
+            line_profile = voigt_lineshape(
+                w_centered, hwhm_lorentz.reshape((1, -1)), hwhm_voigt.reshape((1, -1))
+            )
+        ref = np.zeros((2, len(wavenumber_calc) + 2 * ioffset))
+        for i in range(N):
+            jl = il[i] - 100 + ioffset
+            for j, frac in [(jl, frac_left[i]), (jl + 1, 1 - frac_left[i])]:
+                ref[:, j : j + 201] += frac * np.outer(I[:, i], line_profile[:, i])
+
+        args = (
+            I,
+            shiftwav,
+            hwhm_lorentz,
+            hwhm_gauss,
+            hwhm_voigt,
+            wavenumber_calc,
+            wbroad_centered,
+            ioffset,
+            faddeeva,
+        )
+        out = np.zeros_like(ref)
+        _voigt_direct_jit(out, *args, 0, 1)
+        assert np.allclose(out, ref, rtol=1e-10, atol=0)
+
+        out_blocks = np.zeros((3,) + ref.shape)
+        _voigt_direct_parallel_jit(out_blocks, *args)
+        assert np.allclose(out_blocks.sum(axis=0), ref, rtol=1e-10, atol=0)
+
+
+@pytest.mark.fast
+def test_faddeeva_voigt_lineshape(*args, **kwargs):
+    """
+    Test the exact Voigt profile of ``broadening_method='faddeeva'`` against
+    :py:func:`scipy.special.voigt_profile`, including in the line wings where
+    the Whiting approximation of ``broadening_method='voigt'`` is less accurate.
+    """
+    from scipy.special import voigt_profile, wofz
+
+    from radis.lbl.broadening import (
+        _faddeeva_jit,
+        faddeeva_voigt_lineshape,
+        olivero_1977,
+        voigt_lineshape,
+    )
+
+    # Faddeeva function, near the line center and in the wings (|z| > 15)
+    rng = np.random.default_rng(0)
+    z = rng.uniform(-50, 50, 1000) + 1j * rng.uniform(1e-3, 30, 1000)
+    w = np.array([_faddeeva_jit(zi.real, zi.imag) for zi in z])
+    assert np.allclose(w, wofz(z).real, rtol=1e-8, atol=0)
+
+    # ... absolute accuracy, and no negative values near y = 0
+    x, y = np.meshgrid(np.linspace(0, 30, 601), [0, 1e-12, 1e-6, 1e-3, 0.1, 10])
+    w = np.array([_faddeeva_jit(xi, yi) for xi, yi in zip(x.flat, y.flat)])
+    assert np.abs(w - wofz(x + 1j * y).real.flatten()).max() < 1e-13
+    assert w.min() >= 0
+
+    # Normalized Voigt profile
+    x = np.linspace(-20, 20, 4001)
+    hwhm_lorentz, hwhm_gauss = 0.1, 0.2
+    ref = voigt_profile(x, hwhm_gauss / np.sqrt(2 * np.log(2)), hwhm_lorentz)
+    ref /= np.trapz(ref, x)
+    lineshape = faddeeva_voigt_lineshape(x, hwhm_lorentz, hwhm_gauss)
+    assert np.allclose(lineshape, ref, rtol=1e-10, atol=0)
+
+    hwhm_voigt = olivero_1977(2 * hwhm_gauss, 2 * hwhm_lorentz) / 2
+    lineshape_whiting = voigt_lineshape(x, hwhm_lorentz, hwhm_voigt, jit=False)
+    assert abs(lineshape_whiting[0] / ref[0] - 1) > 1e-2  # error in the wings
+
+
+@pytest.mark.fast
+def test_broadening_faddeeva(verbose=True, plot=False, *args, **kwargs):
+    """
+    Test that ``broadening_method='faddeeva'`` gives the same spectra
+    with and without LDM, and is close to ``broadening_method='voigt'``.
+    """
+    if plot:  # Make sure matplotlib is interactive so that test are not stuck in pytest
+        plt.ion()
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    s = {}
+    for broadening_method in ["voigt", "faddeeva"]:
+        for optimization in [None, "simple"]:
+            sf = SpectrumFactory(
+                wavenum_min=2140,
+                wavenum_max=2160,
+                pressure=1,
+                path_length=0.1,
+                mole_fraction=1e-3,
+                wstep=0.002,
+                truncation=5,
+                broadening_method=broadening_method,
+                optimization=optimization,
+                verbose=False,
+                warnings={
+                    "MissingSelfBroadeningWarning": "ignore",
+                    "NegativeEnergiesWarning": "ignore",
+                    "HighTemperatureWarning": "ignore",
+                    "GaussianBroadeningWarning": "ignore",
+                },
+            )
+            sf.load_databank("HITRAN-CO-TEST")
+            s[broadening_method, optimization] = sf.eq_spectrum(Tgas=1500)
+
+    res_LDM = get_residual(s["faddeeva", None], s["faddeeva", "simple"], "abscoeff")
+    res_whiting = get_residual(s["faddeeva", None], s["voigt", None], "abscoeff")
+    if verbose:
+        print(f"Residual LDM : {res_LDM}, Whiting approximation : {res_whiting}")
+    if plot:
+        plot_diff(s["faddeeva", None], s["voigt", None], "abscoeff")
+    assert res_LDM < 1e-5
+    assert res_whiting < 1e-3
+
+
+@pytest.mark.fast
+def test_truncation_error(verbose=True, plot=False, *args, **kwargs):
+    """
+    Test that ``truncation_error`` shortens the LDM lineshape templates
+    while keeping their area, and gives spectra close to the full truncation.
+    """
+    from radis.lbl.broadening import lorentzian_lineshape, truncate_lineshape
+
+    if plot:  # Make sure matplotlib is interactive so that test are not stuck in pytest
+        plt.ion()
+
+    # Discarded wings of a Lorentzian hold no more than the error budget
+    wstep = 0.001
+    x = np.arange(-5, 5 + wstep / 2, wstep)
+    lineshape = lorentzian_lineshape(x, 0.01)
+    lineshape /= np.trapz(lineshape, dx=wstep)
+    truncated = truncate_lineshape(lineshape, wstep, 1e-3)
+    assert len(truncated) % 2 == 1
+    assert len(truncated) < len(lineshape)
+    N = (len(lineshape) - len(truncated)) // 2
+    assert np.trapz(lineshape[N:-N], dx=wstep) >= 1 - 1e-3 - 1e-6
+    assert np.isclose(np.trapz(truncated, dx=wstep), 1)
+    assert truncate_lineshape(lineshape, wstep, 0) is lineshape
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    for broadening_method in ["voigt", "convolve"]:
+        s = {}
+        for truncation_error in [0, 1e-4]:
+            sf = SpectrumFactory(
+                wavenum_min=2140,
+                wavenum_max=2160,
+                pressure=0.01,
+                path_length=0.1,
+                mole_fraction=1e-3,
+                wstep=0.002,
+                truncation=5,
+                truncation_error=truncation_error,
+                broadening_method=broadening_method,
+                optimization="simple",
+                verbose=False,
+                warnings={
+                    "MissingSelfBroadeningWarning": "ignore",
+                    "NegativeEnergiesWarning": "ignore",
+                    "HighTemperatureWarning": "ignore",
+                    "GaussianBroadeningWarning": "ignore",
+                },
+            )
+            sf.load_databank("HITRAN-CO-TEST")
+            s[truncation_error] = sf.eq_spectrum(Tgas=1500)
+
+        _, k_ref = s[0].get("abscoeff", wunit="cm-1")
+        _, k = s[1e-4].get("abscoeff", wunit="cm-1")
+        if verbose:
+            print(
+                f"{broadening_method}: max relative difference "
+                + f"{abs(k - k_ref).max() / k_ref.max():.1e}"
+            )
+        if plot:
+            plot_diff(s[0], s[1e-4], "abscoeff")
+        assert abs(k - k_ref).max() < 1e-3 * k_ref.max()
+        assert np.isclose(k.sum(), k_ref.sum(), rtol=1e-4)
+
+    with pytest.raises(ValueError):
+        SpectrumFactory(2140, 2160, truncation_error=1, verbose=False)
+
+
+@pytest.mark.fast
+def test_project_lines_on_grid(*args, **kwargs):
+    """Test the rough projection of lines used by the pseudo-continuum, with
+    the precompiled kernel :py:func:`~radis.lbl.broadening._rough_sum_on_grid_jit`
+    (compiled once, not at every call)"""
+    import pandas as pd
+
+    from radis.lbl.broadening import (
+        _rough_sum_on_grid_jit,
+        project_lines_on_grid,
+        project_lines_on_grid_noneq,
+    )
+
+    wstep = 0.01
+    wavenumber = np.arange(2000, 2010 + wstep / 2, wstep)
+    rng = np.random.default_rng(0)
+    N = 100
+    df = pd.DataFrame(
+        {
+            "shiftwav": rng.uniform(2000.5, 2009.5, N),
+            "S": rng.uniform(0.5, 1, N).astype(np.float32),
+            "hwhm_voigt": rng.uniform(0.01, 0.2, N),
+        }
+    )
+    df["Ei"] = 2 * df.S
+
+    k, S_density, iwav = project_lines_on_grid(df, wavenumber, wstep)
+    k2, j2, S_density2, Ei_density, iwav2 = project_lines_on_grid_noneq(
+        df, wavenumber, wstep
+    )
+    assert np.allclose(k, k2) and np.allclose(j2, 2 * k)
+    assert (iwav == iwav2).all()
+
+    # Compare with rectangles summed in Python
+    k_ref = np.zeros(len(wavenumber) + 2)
+    ihwhm = np.asarray(2 * df.hwhm_voigt.values // wstep, dtype=np.int64)
+    for i, w in enumerate(df.shiftwav.values):
+        il = np.searchsorted(wavenumber, w) - 1
+        ir = min(il + 1, len(wavenumber) - 1)
+        frac_left = (wavenumber[ir] - w) / (wavenumber[ir] - wavenumber[il])
+        for i0, frac in [(il, frac_left), (ir, 1 - frac_left)]:
+            imin = min(max(i0 - ihwhm[i], -1), len(wavenumber)) + 1
+            imax = min(max(i0 + ihwhm[i], -1), len(wavenumber)) + 1
+            k_ref[imin : imax + 1] += frac * S_density[i]
+    assert np.allclose(k, k_ref[1:-1])
+
+    assert len(_rough_sum_on_grid_jit.signatures) == 1  # never recompiled
+
+
+@pytest.mark.fast
+def test_warmup(*args, **kwargs):
+    """Test :py:func:`~radis.lbl.broadening.warmup` lists the precompiled kernels"""
+    import radis
+    from radis.lbl import base, broadening
+    from radis.misc import arrays
+
+    kernels = radis.warmup()
+    assert "_rough_sum_on_grid_jit" in kernels
+    assert "_voigt_direct_parallel_jit" not in kernels  # only with parallel=True
+
+    # All kernels listed are compiled (including the lazily compiled ones)
+    for name in kernels:
+        for module in [broadening, base, arrays]:
+            if hasattr(module, name):
+                assert len(getattr(module, name).signatures) > 0, name
+                break
+        else:
+            raise AssertionError(f"{name} not found")
+
+
+@pytest.mark.fast
+def test_LDM_joint_channels(*args, **kwargs):
+    """Test that absorption and emission distributed on the same LDM (one call
+    of :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+    with a 2D ``broadened_param``) give the same result as 2 separate calls,
+    for the dense, sparse and FFT LDM"""
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    N = 2000
+    df = pd.DataFrame(
+        {
+            "shiftwav": rng.uniform(2000, 2010, N),
+            "S": rng.random(N),
+            "Ei": rng.random(N),
+            "hwhm_lorentz": rng.uniform(0.01, 0.1, N),
+            "hwhm_gauss": rng.uniform(0.001, 0.005, N),
+        }
+    )
+    df["hwhm_voigt"] = df.hwhm_lorentz + df.hwhm_gauss
+
+    for broadening_method, sparse_ldm, truncation in [
+        ("voigt", False, 1),
+        ("voigt", True, 1),
+        ("fft", False, None),
+    ]:
+        sf = SpectrumFactory(
+            2000,
+            2010,
+            wstep=0.002,
+            truncation=truncation,
+            pressure=1,
+            optimization="min-RMS",
+            broadening_method=broadening_method,
+            verbose=False,
+        )
+        sf._reset_profiler(0)
+        sf._reset_references()
+        sf.profiler.start("test_LDM_joint_channels", 1)
+        sf.dataframe_type = "pandas"
+        sf.df1 = df
+        sf._generate_wavenumber_arrays(checks=False)
+        sf.params.sparse_ldm = sparse_ldm
+        sf.misc.zero_padding = len(sf.wavenumber_calc)
+
+        line_profile_LDM, *LDM_args = sf._calc_lineshape_LDM(df)
+        LDM_args = (df.shiftwav.values, *LDM_args, "min-RMS")
+        _, k = sf._apply_lineshape_LDM(df.S.values, line_profile_LDM, *LDM_args)
+        _, j = sf._apply_lineshape_LDM(df.Ei.values, line_profile_LDM, *LDM_args)
+        _, kj = sf._apply_lineshape_LDM(
+            np.array([df.S.values, df.Ei.values]), line_profile_LDM, *LDM_args
+        )
+        assert kj.shape == (2, len(k))
+        assert np.allclose(kj[0], k, rtol=1e-12, atol=0)
+        assert np.allclose(kj[1], j, rtol=1e-12, atol=0)
+
+
+@pytest.mark.fast
+def test_broadening_HWHM_fused(verbose=True, *args, **kwargs):
+    """Test the HWHM and lineshift calculated in a single pass by
+    :py:func:`~radis.lbl.broadening._broadening_HWHM_jit` against the
+    vectorized :py:func:`~radis.lbl.broadening.pressure_broadening_HWHM`,
+    :py:func:`~radis.lbl.broadening.doppler_broadening_HWHM` and
+    :py:func:`~radis.lbl.broadening.olivero_1977`, with several diluents"""
+    from radis.lbl.broadening import (
+        doppler_broadening_HWHM,
+        olivero_1977,
+        pressure_broadening_HWHM,
+    )
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    Tgas = 1500
+    pressure = 2  # bar
+    diluent = {"air": 0.5, "CO2": 0.4}
+    sf = SpectrumFactory(
+        2100,
+        2200,
+        mole_fraction=0.1,
+        diluent=diluent,
+        pressure=pressure,
+        wstep=0.002,
+        isotope="1,2,3",
+        verbose=False,
+        warnings={
+            "MissingSelfBroadeningWarning": "ignore",
+            "NegativeEnergiesWarning": "ignore",
+            "HighTemperatureWarning": "ignore",
+            "GaussianBroadeningWarning": "ignore",
+        },
+    )
+    sf.load_databank("HITRAN-CO-TEST")
+    # fake CO2 broadening coefficients (not in the test database)
+    sf.df0["gamma_co2"] = 1.3 * sf.df0.airbrd
+    sf.df0["n_co2"] = 0.8 * sf.df0.Tdpair
+    sf.eq_spectrum(Tgas=Tgas)
+    df = sf.df1
+
+    pressure_atm = pressure / 1.01325
+    hwhm_lorentz = pressure_broadening_HWHM(
+        df.airbrd,
+        df.selbrd,
+        df.Tdpair,
+        None,
+        pressure_atm,
+        0.1,
+        Tgas,
+        sf.input.Tref,
+        diluent,
+        {"gamma_co2": df.gamma_co2, "n_co2": df.n_co2},
+    )
+    hwhm_gauss = doppler_broadening_HWHM(df.wav, sf.get_molar_mass(df), Tgas)
+    assert np.allclose(df.hwhm_lorentz, hwhm_lorentz, rtol=1e-12)
+    assert np.allclose(df.hwhm_gauss, hwhm_gauss, rtol=1e-12)
+    assert np.allclose(
+        df.hwhm_voigt, olivero_1977(2 * hwhm_gauss, 2 * hwhm_lorentz) / 2, rtol=1e-12
+    )
+    assert np.allclose(df.shiftwav, df.wav + df.Pshft * pressure_atm, rtol=1e-14)
+
+
 # @pytest.mark.fast #not fast due to connection, Nicolas Minesi 08/04/2024
 def test_non_air_diluent(verbose=True, plot=False, *args, **kwargs):
     """Test collisional broadening by other species than air and self (resonant)
@@ -1133,9 +1966,22 @@ def _run_testcases(plot=False, verbose=True, *args, **kwargs):
     test_broadening_methods_different_wstep(plot=plot, verbose=verbose, *args, **kwargs)
     test_broadening_LDM(plot=plot, verbose=verbose, *args, **kwargs)
     test_broadening_LDM_FT(plot=plot, verbose=3, *args, **kwargs)
+    test_broadening_LDM_add_at_engines(plot=plot, verbose=verbose, *args, **kwargs)
+    test_broadening_LDM_lineshape_cache(verbose=verbose, *args, **kwargs)
+    test_broadening_LDM_float32(plot=plot, verbose=verbose, *args, **kwargs)
     test_broadening_LDM_noneq(plot=plot, verbose=verbose, *args, **kwargs)
     test_truncations_and_neighbour_lines(*args, **kwargs)
     test_broadening_chunksize_eq(plot=plot, verbose=verbose, *args, **kwargs)
+    test_broadening_chunksize_n_jobs(plot=plot, verbose=verbose, *args, **kwargs)
+    test_broadening_stream_blocksize(plot=plot, verbose=verbose, *args, **kwargs)
+    test_voigt_direct_kernel(*args, **kwargs)
+    test_faddeeva_voigt_lineshape(*args, **kwargs)
+    test_broadening_faddeeva(plot=plot, verbose=verbose, *args, **kwargs)
+    test_truncation_error(plot=plot, verbose=verbose, *args, **kwargs)
+    test_project_lines_on_grid(*args, **kwargs)
+    test_warmup(*args, **kwargs)
+    test_LDM_joint_channels(*args, **kwargs)
+    test_broadening_HWHM_fused(verbose=verbose, *args, **kwargs)
 
     # Test warnings
     test_broadening_warnings(*args, **kwargs)
@@ -948,6 +948,55 @@ def test_diluent_invalid(verbose=True, plot=False, *args, **kwargs):
     )
 
 
+@pytest.mark.fast
+def test_calc_spectrum_tiles(verbose=True, plot=False, *args, **kwargs):
+    """Check that a spectrum computed by tiles in parallel processes is the
+    same as the one computed at once"""
+    from radis.test.utils import setup_test_line_databases
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    kwargs_calc = dict(
+        wavenum_min=2000,
+        wavenum_max=2300,
+        molecule="CO",
+        isotope="1,2",
+        Tgas=1000,
+        databank="HITRAN-CO-TEST",
+        wstep=0.01,
+        truncation=5,
+        verbose=False,
+    )
+
+    # (differences come from rounding errors on the spectral grid of each tile,
+    # and from the different LDM grids of each tile)
+    for optimization, rtol in [(None, 1e-6), ("simple", 1e-5)]:
+        s = calc_spectrum(optimization=optimization, **kwargs_calc)
+        s_tiles = calc_spectrum(optimization=optimization, tiles=3, **kwargs_calc)
+
+        if verbose:
+            printm(f"optimization={optimization}: {s_tiles.c['tiles']} tiles")
+        if plot:
+            from radis import plot_diff
+
+            plot_diff(s, s_tiles, "abscoeff")
+
+        assert s_tiles.c["tiles"] == 3
+        assert len(s_tiles.c["tile_profilers"]) == 3
+        assert "lines_calculated" not in s_tiles.c  # not double counted
+        s_tiles.print_perf_profile()
+        assert np.array_equal(s.get_wavenumber(), s_tiles.get_wavenumber())
+        for var in ["abscoeff", "emisscoeff"]:
+            I = s.get(var, wunit="cm-1")[1]
+            assert np.allclose(
+                s_tiles.get(var, wunit="cm-1")[1], I, rtol=rtol, atol=rtol * I.max()
+            )
+
+    # Not compatible with non-truncated lineshapes
+    with pytest.raises(NotImplementedError):
+        calc_spectrum(tiles=2, **{**kwargs_calc, "truncation": None})
+
+
 def test_diluents_for_molecule():
 
     from radis.lbl.calc import diluents_for_molecule
@@ -1000,6 +1049,7 @@ def _run_testcases(plot=True, verbose=True, warnings=True, *args, **kwargs):
 
     test_check_wavelength_range()
     test_non_air_diluent_calc()
+    test_calc_spectrum_tiles()
     test_diluents_for_molecule()
 
     return True
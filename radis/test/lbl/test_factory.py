@@ -734,6 +734,54 @@ def test_vaex_and_pandas_spectrum():
     assert np.allclose(s_vaex.get("absorbance"), s_pd.get("absorbance"), equal_nan=True)
 
 
+@pytest.mark.fast
+def test_eq_spectrum_batch(verbose=True, *args, **kwargs):
+    """Check that spectra computed with
+    :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum_batch` are the
+    same as spectra computed with :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`
+    in a loop, in serial and in parallel"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    Tgas = [500, 1000, 1500, 2000]
+    pressure = [0.5, 1, 0.5, 1]
+
+    for optimization in [None, "simple"]:
+        for n_jobs in [1, 3]:  # (conditions computed by groups of n_jobs)
+            sf = SpectrumFactory(
+                wavenum_min=2000,
+                wavenum_max=2300,
+                isotope="1,2",
+                wstep=0.01,
+                truncation=5,
+                mole_fraction=0.1,
+                optimization=optimization,
+                n_jobs=n_jobs,
+                verbose=False,
+            )
+            sf.warnings["HighTemperatureWarning"] = "ignore"
+            sf.load_databank("HITRAN-CO-TEST")
+
+            spectra = sf.eq_spectrum_batch(Tgas=Tgas * u.K, pressure=pressure)
+            assert len(spectra) == len(Tgas)
+
+            for T, p, s_batch in zip(Tgas, pressure, spectra):
+                s = sf.eq_spectrum(Tgas=T, pressure=p)
+                assert s_batch.c["Tgas"] == T
+                assert s_batch.c["pressure"] == p
+                assert s_batch.c["lines_calculated"] == s.c["lines_calculated"]
+                assert s_batch.c.get("NwL") == s.c.get("NwL")
+                for var in ["abscoeff", "radiance_noslit"]:
+                    assert np.allclose(s_batch.get(var)[1], s.get(var)[1])
+
+    if verbose:
+        printm("eq_spectrum_batch gives the same spectra as eq_spectrum")
+
+    # Conditions must have the same length
+    with pytest.raises(ValueError):
+        sf.eq_spectrum_batch(Tgas=[500, 1000, 1500], pressure=[1, 2])
+
+
 #%%
 @pytest.mark.skipif(isinstance(vaex, NotInstalled), reason="Vaex not available")
 def test_vaex_and_pandas_spectrum_noneq():
@@ -235,6 +235,181 @@ def test_custom_abundance(verbose=True, plot=False, *args, **kwargs):
     assert s.compare_with((3 * s3.take("abscoeff")), "abscoeff", rtol=0.5e-2, plot=True)
 
 
+@pytest.mark.fast
+def test_lines_cache(verbose=True, *args, **kwargs):
+    """Test that line databases are reused by new factories of the process, for
+    any range within a loaded range, and that spectra are unchanged
+
+    See :py:class:`~radis.lbl.loader.LinesCache`"""
+    import numpy as np
+
+    from radis.lbl.loader import clear_lines_cache, get_lines_cache
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    def calc_spectrum(wmin, wmax):
+        sf = SpectrumFactory(
+            wavenum_min=wmin,
+            wavenum_max=wmax,
+            wstep=0.01,
+            isotope="1,2",
+            truncation=5,
+            mole_fraction=0.1,
+            path_length=1,
+            verbose=verbose,
+        )
+        sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+        sf.warnings["HighTemperatureWarning"] = "ignore"
+        sf.load_databank("HITRAN-CO-TEST")
+        return sf, sf.eq_spectrum(1000)
+
+    LINES_CACHE_SIZE = config["LINES_CACHE_SIZE"]
+    clear_lines_cache()
+    try:
+        config["LINES_CACHE"] = False
+        _, s_ref = calc_spectrum(2100, 2200)
+        assert get_lines_cache() is None
+
+        config["LINES_CACHE"] = True
+        cache = get_lines_cache()
+        hits, misses = cache.hits, cache.misses
+        sf1, _ = calc_spectrum(2000, 2300)
+        assert (cache.hits, cache.misses) == (hits, misses + 1)
+        assert len(cache) == 1 and cache.entries()[0]["lines"] == len(sf1.df0)
+
+        # A range within : from the cache, lines are copied
+        sf2, s = calc_spectrum(2100, 2200)
+        assert (cache.hits, cache.misses) == (hits + 1, misses + 1)
+        assert s.compare_with(s_ref, spectra_only=True, plot=False, rtol=1e-14)
+        assert sf2.df0.wav.min() > sf2.params.wavenum_min_calc
+        assert sf2.df0.wav.max() < sf2.params.wavenum_max_calc
+        sf2.df0["int"] *= 2
+        sf3, _ = calc_spectrum(2100, 2200)
+        assert np.array_equal(sf3.df0["int"], sf2.df0["int"] / 2)
+
+        # Not stored if larger than the memory budget
+        clear_lines_cache()
+        assert len(cache) == 0
+        config["LINES_CACHE_SIZE"] = 1e-3  # MB
+        calc_spectrum(2000, 2300)
+        assert len(cache) == 0
+    finally:
+        config["LINES_CACHE"] = True
+        config["LINES_CACHE_SIZE"] = LINES_CACHE_SIZE
+
+
+@pytest.mark.fast
+def test_lines_cache_files(*args, **kwargs):
+    """Test that :py:class:`~radis.lbl.loader.LinesCache` discards the lines
+    whose files were modified, and does not store memory-mapped lines"""
+    import os
+    import shutil
+    from tempfile import gettempdir
+
+    import numpy as np
+    import pandas as pd
+
+    from radis.api.hdf5 import DataFileManager
+    from radis.lbl.loader import LinesCache
+
+    file = os.path.join(gettempdir(), "test_radis_lines_cache.npydir")
+    df = pd.DataFrame({"wav": np.linspace(2000, 2300, 100), "int": 1.0})
+    manager = DataFileManager(engine="npy")
+    manager.write(file, df)
+
+    cache = LinesCache(max_size=100)
+    cache.add("key", 2000, 2300, df, files=[file])
+    assert cache.get("key", 2100, 2200) is not None
+    os.utime(file, (0, 0))  # file modified
+    assert cache.get("key", 2100, 2200) is None
+    assert len(cache) == 0
+
+    df_mmap = manager.load(file)
+    cache.add("key", 2000, 2300, df_mmap, files=[file])
+    assert len(cache) == 0
+
+    # Only the entries of the modified file are discarded (e.g. CO and CO2
+    # lines are cached, and the CO2 file is regenerated)
+    file2 = os.path.join(gettempdir(), "test_radis_lines_cache_2.npydir")
+    manager.write(file2, df)
+    cache.add("key", 2000, 2300, df, files=[file])
+    cache.add("key2", 2000, 2300, df, files=[file2])
+    os.utime(file2, (0, 0))  # file of the most recent entry modified
+    assert cache.get("key2", 2100, 2200) is None
+    assert len(cache) == 1
+    assert cache.get("key", 2100, 2200) is not None
+
+    del df_mmap
+    shutil.rmtree(file)
+    shutil.rmtree(file2)
+
+
+@pytest.mark.fast
+def test_incremental_range(verbose=True, *args, **kwargs):
+    """Test that changing the spectral range of a factory only loads the lines
+    of the new ranges, and gives the same lines and spectra as a new factory
+
+    See :py:meth:`~radis.lbl.loader.DatabankLoader._update_databank_range`"""
+    import astropy.units as u
+    import numpy as np
+
+    from radis.phys.convert import nm_air2cm
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    def new_factory(wmin, wmax):
+        sf = SpectrumFactory(
+            wavenum_min=wmin,
+            wavenum_max=wmax,
+            wstep=0.01,
+            isotope="1,2,3",
+            truncation=5,
+            neighbour_lines=5,
+            mole_fraction=0.1,
+            path_length=1,
+            verbose=verbose,
+        )
+        sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+        sf.warnings["HighTemperatureWarning"] = "ignore"
+        sf.warnings["OutOfRangeLinesWarning"] = "ignore"
+        sf.load_databank("HITRAN-CO-TEST")
+        return sf
+
+    sf = new_factory(2000, 2100)
+    w_edge = sf.df0.wav.iloc[150]  # a line at the edge of a range (below)
+
+    for wmin, wmax, ranges in [
+        (2050, 2300, [(1995, 2305)]),  # extended
+        (2100, 2150, [(1995, 2305)]),  # reduced : nothing to load
+        (1990, w_edge - 5, [(1985, 2305)]),
+        (w_edge + 5, 2200, [(1985, 2305)]),
+    ]:
+        s = sf.eq_spectrum(1000, wmin=wmin, wmax=wmax)
+        assert sf._loaded_lines["ranges"] == ranges
+        sf_ref = new_factory(wmin, wmax)
+        assert np.array_equal(sf.df0.wav, sf_ref.df0.wav)
+        assert set(sf.df0.columns) == set(sf_ref.df0.columns)
+        assert s.conditions["wavenum_min"] == wmin
+        assert s.compare_with(
+            sf_ref.eq_spectrum(1000), spectra_only=True, plot=False, rtol=1e-14
+        )
+
+    # A new load with the same arguments only loads the missing ranges
+    sf._set_wavenumber_range(2000, 2310)
+    sf.load_databank("HITRAN-CO-TEST")
+    assert sf._loaded_lines["ranges"] == [(1985, 2315)]
+    assert np.array_equal(sf.df0.wav, new_factory(2000, 2310).df0.wav)
+
+    # Only one bound given : the other one is kept
+    sf.eq_spectrum(1000, wmin=2050)
+    assert (sf.input.wavenum_min, sf.input.wavenum_max) == (2050, 2310)
+    sf.eq_spectrum(1000, wmax=2200 / u.cm)
+    assert (sf.input.wavenum_min, sf.input.wavenum_max) == (2050, 2200)
+    sf.eq_spectrum(1000, wmax=4700, wunit="nm")  # ... lowest wavenumber
+    assert np.isclose(sf.input.wavenum_min, nm_air2cm(4700))
+    assert np.isclose(sf.input.wavenum_max, 2200)
+
+
 @pytest.mark.needs_connection
 @pytest.mark.download_large_databases
 @pytest.mark.skipif(isinstance(vaex, NotInstalled), reason="Vaex not available")
@@ -448,6 +623,9 @@ def _run_testcases(verbose=True, plot=False):
     # test_ignore_cached_files()
     # test_ignore_irrelevant_files(verbose=verbose)
     # test_custom_abundance()
+    test_lines_cache(verbose=verbose)
+    test_lines_cache_files()
+    test_incremental_range(verbose=verbose)
     test_vaex_and_pandas_dataframe_fetch_databank()
     # test_vaex_and_pandas_dataframe_load_databank()
 
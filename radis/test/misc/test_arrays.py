@@ -90,6 +90,34 @@ def test_nonnan_index(*args, **kwargs):
     assert last_nonnan_index(a) == None  # len(a)-1
 
 
+@pytest.mark.fast
+def test_sorted_nonnan_dtypes(*args, **kwargs):
+    """Test the sorted/non-nan helpers accept read-only and integer arrays
+    (ex: arrays of a read-only Spectrum passed to
+    :py:func:`~radis.misc.signal.resample_even`)"""
+    from radis.misc.signal import resample_even
+
+    for dtype in [np.float64, np.float32, np.int64, np.int32, np.uint32, np.uint8]:
+        a = np.arange(10, dtype=dtype)
+        a.flags.writeable = False
+        assert is_sorted(a)
+        assert not is_sorted_backward(a)
+        assert is_sorted_backward(a[::-1])
+    for dtype in [np.float64, np.float32]:
+        a = np.arange(10, dtype=dtype)
+        a[0] = np.nan
+        a.flags.writeable = False
+        assert first_nonnan_index(a) == 1
+        assert last_nonnan_index(a) == 9
+
+    x = np.linspace(0, 1, 100)
+    y = np.exp(-((x - 0.5) ** 2) / 0.01)
+    x.flags.writeable = False
+    y.flags.writeable = False
+    x_new, y_new = resample_even(x, y, print_conservation=False)
+    assert np.allclose(np.trapz(y_new, x_new), np.trapz(y, x), rtol=1e-3)
+
+
 @pytest.mark.fast
 def test_find_first(*args, **kwargs):
 
@@ -367,6 +395,64 @@ def test_non_zero_values_around(*args, **kwargs):
     ).all()
 
 
+def test_sparse_add_at_LDM(*args, **kwargs):
+    """Compare the sorted, single-pass sparse LDM reduction with a dense LDM
+    filled with :py:func:`~radis.misc.arrays.numpy_add_at`, for 2 channels
+    (ex: absorption and emission) distributed at once"""
+    from radis.misc.arrays import (
+        boolean_array_from_ranges,
+        numpy_add_at,
+        sparse_add_at_LDM,
+    )
+
+    rng = np.random.default_rng(0)
+    N, Nw, NwG, NwL = 200, 1000, 3, 4
+    ki0 = np.sort(rng.integers(0, Nw - 1, N)).astype(np.int32)
+    li0 = rng.integers(0, NwG - 1, N).astype(np.int32)
+    mi0 = rng.integers(0, NwL - 1, N).astype(np.int32)
+    Iv0, Iv1 = rng.random((N, 2)), rng.random((N, 2))
+    awV = rng.random((4, N))
+
+    # Reference
+    LDM = np.zeros((Nw + 1, NwG, NwL, 2))
+    for c, (dl, dm) in enumerate([(0, 0), (0, 1), (1, 0), (1, 1)]):
+        numpy_add_at(LDM, ki0, li0 + dl, mi0 + dm, Iv0 * awV[c][:, None])
+        numpy_add_at(LDM, ki0 + 1, li0 + dl, mi0 + dm, Iv1 * awV[c][:, None])
+    LDM = LDM[:-1]
+
+    cell0 = li0.astype(np.int64) * NwL + mi0
+    cells = np.concatenate((cell0, cell0 + 1, cell0 + NwL, cell0 + NwL + 1))
+    order = np.argsort(cells * Nw + np.tile(ki0, 4), kind="stable")
+    # different number of points in the lineshape wings, for each LDM cell
+    n = rng.integers(0, 10, NwG * NwL)
+    ranges, I = sparse_add_at_LDM(order, ki0, li0, mi0, Iv0, Iv1, awV, NwL, Nw, n)
+
+    # ranges are sorted and do not overlap
+    assert (np.diff(ranges[:, 0]) >= 0).all()
+    same_cell = np.diff(ranges[:, 0]) == 0
+    assert (ranges[1:, 1][same_cell] > ranges[:-1, 2][same_cell]).all()
+    assert len(I) == (ranges[:, 2] - ranges[:, 1]).sum()
+
+    offset = 0
+    LDM_sparse = np.zeros_like(LDM)
+    for cell, start, stop in ranges:
+        l, m = divmod(cell, NwL)
+        LDM_sparse[start:stop, l, m] = I[offset : offset + stop - start]
+        offset += stop - start
+    assert np.allclose(LDM_sparse, LDM)
+
+    # all non-zero values are within the ranges, with n points around
+    for cell in np.unique(ranges[:, 0]):
+        l, m = divmod(cell, NwL)
+        b = boolean_array_from_ranges(
+            np.ascontiguousarray(ranges[ranges[:, 0] == cell, 1:]), Nw
+        )
+        assert (LDM[~b, l, m] == 0).all()
+        nonzero = np.nonzero(LDM[:, l, m, 0])[0]
+        assert b[np.clip(nonzero - n[cell], 0, Nw - 1)].all()
+        assert b[np.clip(nonzero + n[cell], 0, Nw - 1)].all()
+
+
 if __name__ == "__main__":
 
     pytest.main(["test_arrays.py", "-s"])  # -s for showing console output